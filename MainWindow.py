@@ -1,21 +1,31 @@
 from components.StatusBar import StatusBar
-from helpers.cncWorkerMonitor import CncWorkerMonitor
-from PyQt5.QtGui import QCloseEvent, QResizeEvent, QShowEvent
+from containers.ViewStack import ViewStack
+from config import DB_NOTIFICATIONS, DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_POOL_TIMEOUT, \
+    DB_POOL_RECYCLE
+from helpers.logsRotator import LogsRotator
+from PyQt5.QtCore import QTimer
+from PyQt5.QtGui import QCloseEvent, QPaintEvent, QResizeEvent, QShowEvent
 from PyQt5.QtWidgets import QMainWindow, QMessageBox, QApplication
+from typing import Optional, TYPE_CHECKING
 from views.MainMenu import MainMenu
 
+if TYPE_CHECKING:
+    from helpers.cncWorkerMonitor import CncWorkerMonitor   # pragma: no cover
+    from helpers.dbNotifications import DbChangesListener   # pragma: no cover
+    from helpers.workerHealthProbe import WorkerHealthProbe   # pragma: no cover
+
 
 class MainWindow(QMainWindow):
     def __init__(self, parent=None):
         super(MainWindow, self).__init__(parent)
 
-        self.setCentralWidget(MainMenu(self))
+        # Views are kept after leaving them
+        self.views = ViewStack(self)
+        self.setCentralWidget(self.views)
+        self.views.showView(MainMenu)
         self.setWindowTitle("CNC admin")
         self.setStyleSheet("background-color:#666666;")
 
-        # CNC tasks monitor
-        self.worker_monitor = CncWorkerMonitor()
-
         # UI components
         self.status_bar = StatusBar(self)
         self.setStatusBar(self.status_bar)
@@ -24,15 +34,16 @@ class MainWindow(QMainWindow):
         # Initial status
         self.status_bar.updateWorkerStatus('DESCONECTADO')
         self.status_bar.updateDeviceStatus('---')
-        if CncWorkerMonitor.is_worker_on():
-            self.status_bar.updateDeviceStatus('HABILITADO')
-            self.status_bar.updateWorkerStatus('CONECTADO')
-            if CncWorkerMonitor.is_worker_running():
-                self.status_bar.updateDeviceStatus('TRABAJANDO...')
 
-        # Signals and slots
-        self.worker_monitor.task_finished.connect(self.on_task_finished)
-        self.worker_monitor.task_failed.connect(self.on_task_failed)
+        # The logs file is rotated while the app is open
+        self.logs_rotator = LogsRotator()
+
+        # Background services start after the first paint (see paintEvent),
+        # they and their dependencies are not even imported before it
+        self.services_started = False
+        self.worker_monitor: Optional['CncWorkerMonitor'] = None
+        self.worker_health: Optional['WorkerHealthProbe'] = None
+        self.db_changes: Optional['DbChangesListener'] = None
 
     # UI
 
@@ -54,11 +65,10 @@ class MainWindow(QMainWindow):
     # Navigation
 
     def changeView(self, widget):
-        self.centralWidget().deleteLater()
-        self.setCentralWidget(widget(self))
+        self.views.showView(widget)
 
     def backToMenu(self):
-        self.setCentralWidget(MainMenu(self))
+        self.views.showView(MainMenu)
 
     # Events
 
@@ -71,7 +81,12 @@ class MainWindow(QMainWindow):
         )
 
         if confirmation == QMessageBox.Yes:
-            self.centralWidget().closeEvent(event)
+            self.views.closeViews(event)
+            if self.worker_health:
+                self.worker_health.stop()
+            self.logs_rotator.stop()
+            if self.db_changes:
+                self.db_changes.stop()
             event.accept()
         else:
             event.ignore()
@@ -89,8 +104,46 @@ class MainWindow(QMainWindow):
     def showEvent(self, _: QShowEvent) -> None:
         self.showMaximized()
 
+    def paintEvent(self, event: QPaintEvent) -> None:
+        super().paintEvent(event)
+
+        # Services start once the first frame is done, so they never delay it
+        if not self.services_started:
+            self.services_started = True
+            QTimer.singleShot(0, self.startServices)
+
     # Slots
 
+    def on_worker_health_changed(self, worker_on: bool, worker_running: bool):
+        if not worker_on:
+            self.status_bar.updateWorkerStatus('DESCONECTADO')
+            self.status_bar.updateDeviceStatus('---')
+            return
+
+        self.status_bar.updateWorkerStatus('CONECTADO')
+        if worker_running:
+            self.status_bar.updateDeviceStatus('TRABAJANDO...')
+            return
+        if self.worker_monitor and self.worker_monitor.is_device_enabled():
+            self.status_bar.updateDeviceStatus('HABILITADO')
+            return
+        # The task finished while the device was disabled
+        self.status_bar.updateDeviceStatus('DESHABILITADO')
+
+    def on_db_changed(self, table: str, operation: str, row_id: int):
+        # Hidden views only take note of it, to refresh when shown again
+        for view in self.views.views.values():
+            apply_change = getattr(view, 'applyChange', None)
+            if apply_change:
+                apply_change(table, operation, row_id)
+
+    def on_db_reconnected(self):
+        # Changes made while disconnected were not notified
+        for view in self.views.views.values():
+            refresh_layout = getattr(view, 'refreshLayout', None)
+            if refresh_layout:
+                refresh_layout()
+
     def on_task_finished(self):
         self.status_bar.updateDeviceStatus('DESHABILITADO')
         self.status_bar.setEnableBtnVisible(True)
@@ -117,12 +170,51 @@ class MainWindow(QMainWindow):
 
     # Other methods
 
+    def startServices(self):
+        """Starts the background services. They are imported here, so Celery
+        and the database drivers are not loaded before the first frame.
+        """
+        from helpers.cncWorkerMonitor import CncWorkerMonitor
+        from helpers.dbSession import configure_engine
+        from helpers.workerHealthProbe import WorkerHealthProbe
+
+        # Connections to the database are pooled
+        configure_engine(DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_POOL_TIMEOUT, DB_POOL_RECYCLE)
+
+        # CNC tasks monitor
+        self.worker_monitor = CncWorkerMonitor()
+        self.worker_monitor.task_finished.connect(self.on_task_finished)
+        self.worker_monitor.task_failed.connect(self.on_task_failed)
+
+        # Worker availability is checked in background
+        self.worker_health = WorkerHealthProbe()
+        self.worker_health.health_changed.connect(self.on_worker_health_changed)
+        self.worker_health.start()
+
+        self.logs_rotator.start()
+
+        if DB_NOTIFICATIONS:
+            from helpers.catalogCache import CatalogCache
+            from helpers.dbNotifications import DbChangesListener
+
+            # Changes made in the database by other panels
+            self.db_changes = DbChangesListener()
+            self.db_changes.changed.connect(CatalogCache.on_db_changed)
+            self.db_changes.changed.connect(self.on_db_changed)
+            self.db_changes.reconnected.connect(CatalogCache.on_db_reconnected)
+            self.db_changes.reconnected.connect(self.on_db_reconnected)
+            self.db_changes.start()
+
     def startWorkerMonitor(self, task_worker_id: str):
+        if not self.worker_monitor:
+            return
         self.status_bar.updateDeviceStatus('TRABAJANDO...')
         self.worker_monitor.start_task_monitor(task_worker_id)
         self.status_bar.setTemporalStatusMessage('Iniciado el monitor del worker')
 
     def enable_device(self):
+        if not self.worker_monitor:
+            return
         self.worker_monitor.set_device_enabled(True)
         self.status_bar.setEnableBtnVisible(False)
         self.status_bar.updateDeviceStatus('HABILITADO')
@@ -0,0 +1,233 @@
+"""Benchmark of the cold start of the app.
+
+Starts the app in a new interpreter, the same way as `main.py` does, under
+`python -X importtime` and the offscreen platform of Qt. Then, it reports the
+time spent importing modules, with the slowest ones, and the time until the
+first frame of the main window is painted, and checks that both are within
+the budget.
+
+It also checks that the views of the menu and the background services are
+neither imported nor started before the first frame.
+
+Usage:
+    python -m benchmarks.cold_start [--import-budget-ms MS] [--frame-budget-ms MS]
+        [--top N] [--depth N]
+"""
+
+import argparse
+import json
+import os
+from pathlib import Path
+import re
+import subprocess
+import sys
+import time
+from typing_extensions import TypedDict
+
+PROJECT_DIR = Path(__file__).parent.parent
+DEFAULT_IMPORT_BUDGET = 3000.0  # milliseconds
+DEFAULT_FRAME_BUDGET = 5000.0   # milliseconds, since the interpreter starts
+DEFAULT_TOP = 15
+DEFAULT_DEPTH = 2
+STARTUP_TIMEOUT = 60    # seconds
+
+# Views which are imported when they are opened from the menu
+MENU_VIEWS = [
+    'views.ControlView',
+    'views.FilesView',
+    'views.InventoryView',
+    'views.MonitorView',
+    'views.TasksView',
+    'views.UsersView'
+]
+
+# Modules of the background services and the database, which are imported
+# when the services start
+SERVICE_MODULES = [
+    'celery',
+    'core.database',
+    'helpers.catalogCache',
+    'helpers.cncWorkerMonitor',
+    'helpers.dbNotifications',
+    'helpers.workerHealthProbe',
+    'sqlalchemy',
+    'views.BaseListView'
+]
+
+# Starts the app and quits once the first frame of the main window is painted
+STARTUP_SCRIPT = """
+import json
+from main import create_app
+from PyQt5.QtCore import QEvent, QObject, QTimer
+import sys
+import time
+
+
+class FirstFrame(QObject):
+    def __init__(self, window):
+        super().__init__()
+        self.window = window
+        self.painted = False
+
+    def eventFilter(self, watched, event):
+        if watched is self.window and event.type() == QEvent.Paint and not self.painted:
+            self.painted = True
+            # Zero timers run once the whole frame is painted
+            QTimer.singleShot(0, self.report)
+        return False
+
+    def report(self):
+        print(json.dumps({
+            'first_frame': time.time(),
+            'modules': list(sys.modules),
+            'services_started': self.window.worker_health is not None
+        }))
+        app.exit(0)
+
+
+app, window = create_app(sys.argv)
+first_frame = FirstFrame(window)
+window.installEventFilter(first_frame)
+app.exec()
+"""
+
+ImportTime = TypedDict('ImportTime', {
+    'module': str,
+    'level': int,           # 0 for the modules imported by the app itself
+    'self': float,          # milliseconds
+    'cumulative': float     # milliseconds
+})
+
+StartupResult = TypedDict('StartupResult', {
+    'import_time': float,   # milliseconds
+    'first_frame': float,   # milliseconds
+    'imports': list[ImportTime],
+    'imported_views': list[str],
+    'imported_services': list[str],
+    'services_started': bool
+})
+
+
+def parse_import_times(output: str) -> list[ImportTime]:
+    """Returns the imports reported by `-X importtime`. The cumulative time
+    of each one includes the ones of its dependencies, which are reported
+    before it with a higher level.
+    """
+    imports: list[ImportTime] = []
+    for line in output.splitlines():
+        match = re.match(r'^import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)$', line)
+        if not match:
+            continue
+        imports.append({
+            'module': match.group(4),
+            'level': len(match.group(3)) // 2,
+            'self': int(match.group(1)) / 1000,
+            'cumulative': int(match.group(2)) / 1000
+        })
+    return imports
+
+
+def start_app() -> StartupResult:
+    """Starts the app in a new interpreter and returns its startup times.
+    """
+    environment = dict(os.environ, QT_QPA_PLATFORM='offscreen')
+
+    start = time.time()
+    process = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', STARTUP_SCRIPT],
+        cwd=PROJECT_DIR,
+        env=environment,
+        capture_output=True,
+        text=True,
+        timeout=STARTUP_TIMEOUT
+    )
+    if process.returncode != 0:
+        raise RuntimeError(f'The app failed to start:\n{process.stderr}')
+
+    report = json.loads(process.stdout.strip().splitlines()[-1])
+    imports = parse_import_times(process.stderr)
+    return {
+        'import_time': sum(entry['cumulative'] for entry in imports if entry['level'] == 0),
+        'first_frame': (report['first_frame'] - start) * 1000,
+        'imports': imports,
+        'imported_views': [name for name in MENU_VIEWS if name in report['modules']],
+        'imported_services': [name for name in SERVICE_MODULES if name in report['modules']],
+        'services_started': report['services_started']
+    }
+
+
+def check(result: StartupResult, import_budget: float, frame_budget: float) -> list[str]:
+    """Returns the reasons why the startup is not acceptable, if any.
+    """
+    errors = []
+    if result['import_time'] > import_budget:
+        errors.append(
+            f"Imports took {result['import_time']:.0f} ms, over the budget of "
+            f'{import_budget:.0f} ms'
+        )
+    if result['first_frame'] > frame_budget:
+        errors.append(
+            f"The first frame took {result['first_frame']:.0f} ms, over the budget of "
+            f'{frame_budget:.0f} ms'
+        )
+    if result['imported_views']:
+        errors.append(
+            f"Views imported before the first frame: {', '.join(result['imported_views'])}"
+        )
+    if result['imported_services']:
+        errors.append(
+            f"Services imported before the first frame: {', '.join(result['imported_services'])}"
+        )
+    if result['services_started']:
+        errors.append('Background services started before the first frame')
+    return errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark of the cold start of the app')
+    parser.add_argument(
+        '--import-budget-ms',
+        type=float,
+        default=DEFAULT_IMPORT_BUDGET,
+        help='Maximum time spent importing modules, in milliseconds'
+    )
+    parser.add_argument(
+        '--frame-budget-ms',
+        type=float,
+        default=DEFAULT_FRAME_BUDGET,
+        help='Maximum time until the first frame is painted, in milliseconds'
+    )
+    parser.add_argument(
+        '--top',
+        type=int,
+        default=DEFAULT_TOP,
+        help='Amount of slowest imports to show'
+    )
+    parser.add_argument(
+        '--depth',
+        type=int,
+        default=DEFAULT_DEPTH,
+        help='Maximum level of the imports to show, 0 for the ones of the app itself'
+    )
+    args = parser.parse_args()
+
+    result = start_app()
+    slowest = sorted(
+        [entry for entry in result['imports'] if entry['level'] <= args.depth],
+        key=lambda entry: entry['cumulative'],
+        reverse=True
+    )
+    print('Slowest imports:')
+    for entry in slowest[:args.top]:
+        print(f"  {entry['module']}: {entry['cumulative']:.1f} ms")
+    print(f"Imports: {result['import_time']:.0f} ms")
+    print(f"First frame: {result['first_frame']:.0f} ms")
+
+    errors = check(result, args.import_budget_ms, args.frame_budget_ms)
+    for error in errors:
+        print(error)
+    sys.exit(1 if errors else 0)
+
+
+if __name__ == '__main__':
+    main()
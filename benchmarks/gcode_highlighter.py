@@ -0,0 +1,179 @@
+"""Benchmark of the G-code syntax highlighter.
+
+Highlights a large G-code file with the previous highlighter, which ran one
+regular expression per token type over each line, and with the current
+single-pass one. Then, it checks that both produce the same formatting.
+
+Usage:
+    python -m benchmarks.gcode_highlighter [path/to/file.gcode] [--lines N]
+"""
+
+import argparse
+from components.CodeEditor import GCodeHighlighter
+import os
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QColor, QFont, QSyntaxHighlighter, QTextCharFormat, QTextDocument
+from PyQt5.QtWidgets import QApplication, QPlainTextEdit
+import random
+import re
+import sys
+import time
+
+SAMPLE_LINES = [
+    'G21 (units in mm)',
+    'G90',
+    'M3 S12000',
+    'G0 Z5.000',
+    'N10 G01 X{x} Y{y} F800',
+    'G1 X{x} Y{y} Z-0.500',
+    'G02 X{x} Y{y} I-1.250 J0.750',
+    'G03 X{x} Y{y} R2.5',
+    'G4 P0.5',
+    'T2 M6 ; tool change',
+    '(roughing pass, X{x} Y{y})',
+    '$H',
+    '$J=G91 X{x} F500',
+    'M30',
+]
+
+
+class LegacyGCodeHighlighter(QSyntaxHighlighter):
+    """Previous implementation of GCodeHighlighter, kept as reference."""
+    def __init__(self, editor: QPlainTextEdit):
+        super().__init__(editor)
+
+        self._mappings: dict[str, QTextCharFormat] = {}
+        self.setDocument(editor.document())
+        self.setup()
+
+    def add_mapping(self, pattern, format):
+        self._mappings[pattern] = format
+
+    def highlightBlock(self, text):
+        for pattern, format in self._mappings.items():
+            for match in re.finditer(pattern, text):
+                start, end = match.span()
+                self.setFormat(start, end - start, format)
+
+    def setup(self):
+        mword_format = QTextCharFormat()
+        mword_format.setFontWeight(QFont.Bold)
+        mword_format.setForeground(Qt.green)
+        self.add_mapping(r'[Mm]\d{1,2}(?=\s|$)', mword_format)
+
+        gword_format = QTextCharFormat()
+        gword_format.setFontWeight(QFont.Bold)
+        gword_format.setForeground(Qt.blue)
+        self.add_mapping(r'[Gg]\d{1,2}(?=\s|$)', gword_format)
+
+        comment_format = QTextCharFormat()
+        comment_format.setForeground(QColor("#117506"))
+        self.add_mapping(r'\(.+\)', comment_format)
+        self.add_mapping(r';.+$', comment_format)
+
+        speed_feed_format = QTextCharFormat()
+        speed_feed_format.setForeground(Qt.blue)
+        self.add_mapping(r'([Ss])\s?\d+', speed_feed_format)
+        self.add_mapping(r'([EeFf])\s?\.?\d+(\.\d*)?', speed_feed_format)
+
+        program_format = QTextCharFormat()
+        program_format.setForeground(QColor("#69ad4c"))
+        self.add_mapping(r'^[N]\d+', program_format)
+
+        xyz_format = QTextCharFormat()
+        xyz_format.setForeground(QColor("#b0791a"))
+        self.add_mapping(r'[XxYyZz]\s?\-?\d*\.?\d+\.?', xyz_format)
+
+        ijk_format = QTextCharFormat()
+        ijk_format.setForeground(QColor("#d4490d"))
+        self.add_mapping(r'[IiJjKk]\s?\-?\d*\.?\d+\.?', ijk_format)
+
+        params_format = QTextCharFormat()
+        params_format.setForeground(QColor("#8b4cad"))
+        self.add_mapping(r'[R]\s?\-?\d*\.?\d+\.?', params_format)
+        self.add_mapping(r'[P]\s?\d?\.?\d+\.?', params_format)
+        self.add_mapping(r'[T]\s?\d+', params_format)
+
+        grbl_format = QTextCharFormat()
+        grbl_format.setFontWeight(QFont.Bold)
+        grbl_format.setForeground(Qt.gray)
+        self.add_mapping(r'^\$[a-zA-Z\$#]', grbl_format)
+
+
+def generate_gcode(lines: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    content = []
+    for _ in range(lines):
+        line = rng.choice(SAMPLE_LINES)
+        x = round(rng.uniform(-100, 100), 3)
+        y = round(rng.uniform(-100, 100), 3)
+        content.append(line.format(x=x, y=y))
+    return '\n'.join(content)
+
+
+def get_formats(document: QTextDocument) -> list[list[tuple[int, int, QTextCharFormat]]]:
+    """Returns the formats applied to each block of the document.
+    """
+    formats = []
+    block = document.firstBlock()
+    while block.isValid():
+        formats.append([
+            (format_range.start, format_range.length, format_range.format)
+            for format_range in block.layout().formats()
+        ])
+        block = block.next()
+    return formats
+
+
+def highlight(content: str, highlighter_class) -> tuple[float, list]:
+    """Highlights the whole content and returns the elapsed time, in seconds,
+    and the resulting formats.
+    """
+    editor = QPlainTextEdit()
+    editor.setPlainText(content)
+    start = time.perf_counter()
+    highlighter = highlighter_class(editor)
+    highlighter.rehighlight()
+    elapsed = time.perf_counter() - start
+    # The formats are cleared when the highlighter is destroyed
+    return elapsed, get_formats(editor.document())
+
+
+def run(content: str) -> int:
+    legacy_time, legacy_formats = highlight(content, LegacyGCodeHighlighter)
+    current_time, current_formats = highlight(content, GCodeHighlighter)
+
+    mismatches = [
+        index + 1 for index, (legacy, current) in enumerate(zip(legacy_formats, current_formats))
+        if legacy != current
+    ]
+
+    print(f'Lines: {len(legacy_formats)}')
+    print(f'Previous highlighter: {legacy_time:.3f} s')
+    print(f'Current highlighter: {current_time:.3f} s ({legacy_time / current_time:.1f}x)')
+    if mismatches:
+        print(f'Formatting differs in {len(mismatches)} lines, first: {mismatches[:10]}')
+        return 1
+    print('Formatting is identical')
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark of the G-code syntax highlighter')
+    parser.add_argument('file', nargs='?', help='G-code file to highlight')
+    parser.add_argument('--lines', type=int, default=200000, help='Lines of generated G-code')
+    args = parser.parse_args()
+
+    if args.file:
+        with open(args.file, 'r') as file:
+            content = file.read()
+    else:
+        content = generate_gcode(args.lines)
+
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    app = QApplication(sys.argv)  # noqa: F841
+    sys.exit(run(content))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,269 @@
+"""Benchmark of the queries of the tasks queue.
+
+Seeds a temporary schema of a local PostgreSQL database with a large amount of
+tasks, creates the indexes of the tasks table defined in `rpi/db_schema.sql`
+and runs the queries of tasks which the app and the worker use. Then, it checks
+that their plans never read the whole tasks table and that their latencies are
+within the budget.
+
+The schema is removed at the end, so the database of development can be used.
+
+Usage:
+    python -m benchmarks.task_queries [--url postgresql://...] [--tasks N]
+        [--budget-ms MS] [--without-indexes]
+"""
+
+import argparse
+from core.database.base import Session as SessionLocal
+from core.database.models import Base, File, Material, Task, Tool, User, \
+    TASK_CANCELLED_STATUS, TASK_FAILED_STATUS, TASK_FINISHED_STATUS, TASK_INITIAL_STATUS, \
+    TASK_IN_PROGRESS_STATUS, TASK_ON_HOLD_STATUS
+from core.database.repositories.taskRepository import TaskRepository
+from datetime import datetime, timedelta
+from helpers.pagination import get_tasks_page
+import os
+from pathlib import Path
+import random
+import re
+import statistics
+from sqlalchemy import create_engine, event, insert, select, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+import sys
+import time
+from typing import Any, Callable, Iterator
+
+SCHEMA_FILE = Path(__file__).parent.parent / 'rpi' / 'db_schema.sql'
+BENCHMARK_SCHEMA = f'benchmark_task_queries_{os.getpid()}'
+DEFAULT_TASKS = 100000
+DEFAULT_BUDGET = 5.0    # milliseconds, for the 95th percentile
+USERS = 20
+ASSETS = 10     # Files, tools and materials
+BATCH_SIZE = 5000
+REPETITIONS = 50
+
+# Most tasks of a long running queue are already done
+STATUS_WEIGHTS = {
+    TASK_FINISHED_STATUS: 70,
+    TASK_CANCELLED_STATUS: 10,
+    TASK_FAILED_STATUS: 5,
+    TASK_INITIAL_STATUS: 7,
+    TASK_ON_HOLD_STATUS: 7,
+    TASK_IN_PROGRESS_STATUS: 1,
+}
+
+QueryCase = tuple[str, Callable[[Session], Any]]
+
+
+def get_task_indexes() -> list[str]:
+    """Returns the statements which create the indexes of the tasks table,
+    as defined by the migrations.
+    """
+    with open(SCHEMA_FILE, 'r') as schema:
+        content = schema.read()
+    return re.findall(r'^CREATE INDEX \w+ ON tasks .+;$', content, re.MULTILINE)
+
+
+def create_schema(url: str) -> Engine:
+    """Creates the tables in an empty schema, and returns an engine
+    whose connections use it.
+    """
+    with create_engine(url).begin() as connection:
+        connection.execute(text(f'CREATE SCHEMA {BENCHMARK_SCHEMA}'))
+
+    engine = create_engine(url, connect_args={'options': f'-csearch_path={BENCHMARK_SCHEMA}'})
+    Base.metadata.create_all(engine)
+    return engine
+
+
+def drop_schema(url: str):
+    with create_engine(url).begin() as connection:
+        connection.execute(text(f'DROP SCHEMA IF EXISTS {BENCHMARK_SCHEMA} CASCADE'))
+
+
+def seed(session: Session, tasks: int, rng: random.Random):
+    users = [
+        User(name=f'user-{index}', email=f'user-{index}@benchmark.com', password='password',
+             role='admin')
+        for index in range(USERS)
+    ]
+    session.add_all(users)
+    session.flush()
+
+    files = [
+        File(user_id=users[index % USERS].id, file_name=f'file-{index}', file_hash=f'hash-{index}')
+        for index in range(ASSETS)
+    ]
+    tools = [Tool(name=f'tool-{index}', description='Benchmark tool') for index in range(ASSETS)]
+    materials = [
+        Material(name=f'material-{index}', description='Benchmark material')
+        for index in range(ASSETS)
+    ]
+    session.add_all(files + tools + materials)
+    session.flush()
+
+    statuses = list(STATUS_WEIGHTS)
+    weights = list(STATUS_WEIGHTS.values())
+    start = datetime.now() - timedelta(days=365)
+    for batch_start in range(0, tasks, BATCH_SIZE):
+        rows = [
+            {
+                'user_id': rng.choice(users).id,
+                'file_id': rng.choice(files).id,
+                'tool_id': rng.choice(tools).id,
+                'material_id': rng.choice(materials).id,
+                'name': f'task-{index}',
+                'note': '',
+                'status': rng.choices(statuses, weights)[0],
+                'priority': rng.randint(0, 5),
+                'created_at': start + timedelta(minutes=5 * index),
+            }
+            for index in range(batch_start, min(batch_start + BATCH_SIZE, tasks))
+        ]
+        session.execute(insert(Task), rows)
+    session.commit()
+
+
+def get_cases(user_id: int, middle_id: int) -> list[QueryCase]:
+    """Returns the queries of tasks which the app and the worker use: the pages
+    of TasksView and the lookups of the queue.
+    """
+    return [
+        ('First page of tasks of the user', lambda session: get_tasks_page(session, user_id)),
+        (
+            'Next page of tasks of the user',
+            lambda session: get_tasks_page(session, user_id, middle_id)
+        ),
+        (
+            'Previous page of tasks of the user',
+            lambda session: get_tasks_page(session, user_id, before=middle_id)
+        ),
+        ('Next task of the worker', lambda session: TaskRepository(session).get_next_task()),
+        (
+            'Pending tasks in the queue',
+            lambda session: TaskRepository(session).are_there_pending_tasks()
+        ),
+        (
+            'Tasks in progress',
+            lambda session: TaskRepository(session).are_there_tasks_in_progress()
+        ),
+    ]
+
+
+def capture_statements(engine: Engine, session: Session, run: Callable[[Session], Any]):
+    """Runs the query and returns the SQL statements it executed, with their parameters.
+    """
+    statements: list[tuple[str, Any]] = []
+
+    def on_execute(connection, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    event.listen(engine, 'before_cursor_execute', on_execute)
+    try:
+        run(session)
+    finally:
+        event.remove(engine, 'before_cursor_execute', on_execute)
+    return statements
+
+
+def iterate_plan(node: dict) -> Iterator[dict]:
+    yield node
+    for child in node.get('Plans', []):
+        yield from iterate_plan(child)
+
+
+def explain(session: Session, statement: str, parameters: Any) -> list[dict]:
+    """Returns the nodes of the plan of the statement.
+    """
+    connection = session.connection()
+    result = connection.exec_driver_sql(f'EXPLAIN (FORMAT JSON) {statement}', parameters)
+    plan = result.scalar_one()[0]['Plan']
+    return list(iterate_plan(plan))
+
+
+def measure(session: Session, run: Callable[[Session], Any]) -> tuple[float, float]:
+    """Returns the median and the 95th percentile of the latency of the query,
+    in milliseconds.
+    """
+    run(session)    # Warm up
+    latencies = []
+    for _ in range(REPETITIONS):
+        start = time.perf_counter()
+        run(session)
+        latencies.append((time.perf_counter() - start) * 1000)
+        session.expunge_all()
+    percentiles = statistics.quantiles(latencies, n=20)
+    return statistics.median(latencies), percentiles[-1]
+
+
+def run(engine: Engine, budget: float) -> int:
+    with Session(engine) as session:
+        user_id = session.execute(select(Task.user_id).limit(1)).scalar_one()
+        task_ids = list(session.scalars(
+            select(Task.id).where(Task.user_id == user_id).order_by(Task.id)
+        ))
+        middle_id = task_ids[len(task_ids) // 2]
+
+        failures = 0
+        for name, case in get_cases(user_id, middle_id):
+            sequential_scan = False
+            indexes: set[str] = set()
+            for statement, parameters in capture_statements(engine, session, case):
+                for node in explain(session, statement, parameters):
+                    if node.get('Relation Name') != Task.__tablename__:
+                        continue
+                    if node['Node Type'] == 'Seq Scan':
+                        sequential_scan = True
+                    if 'Index Name' in node:
+                        indexes.add(node['Index Name'])
+            session.expunge_all()
+
+            median, p95 = measure(session, case)
+            passed = not sequential_scan and p95 <= budget
+            failures += 0 if passed else 1
+
+            print(f'{name}: median {median:.2f} ms, p95 {p95:.2f} ms', end='')
+            print(f" - indexes: {', '.join(sorted(indexes)) or 'none'}", end='')
+            print('' if passed else (' - SEQUENTIAL SCAN' if sequential_scan else ' - OVER BUDGET'))
+    return 1 if failures else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark of the queries of the tasks queue')
+    parser.add_argument('--url', help='PostgreSQL database, by default the one of the app')
+    parser.add_argument('--tasks', type=int, default=DEFAULT_TASKS, help='Amount of tasks')
+    parser.add_argument(
+        '--budget-ms',
+        type=float,
+        default=DEFAULT_BUDGET,
+        help='Maximum 95th percentile of the latency of each query, in milliseconds'
+    )
+    parser.add_argument(
+        '--without-indexes',
+        action='store_true',
+        help='Skip the indexes of the tasks, to compare the results'
+    )
+    args = parser.parse_args()
+
+    url = args.url or SessionLocal.kw['bind'].url.render_as_string(hide_password=False)
+    engine = create_schema(url)
+    try:
+        print(f'Seeding {args.tasks} tasks...')
+        with Session(engine) as session:
+            seed(session, args.tasks, random.Random(0))
+
+        with engine.begin() as connection:
+            if not args.without_indexes:
+                for statement in get_task_indexes():
+                    connection.execute(text(statement))
+            connection.execute(text('ANALYZE'))
+
+        result = run(engine, args.budget_ms)
+    finally:
+        engine.dispose()
+        drop_schema(url)
+    sys.exit(result)
+
+
+if __name__ == '__main__':
+    main()
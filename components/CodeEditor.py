@@ -1,93 +1,149 @@
 from components.text.IndexedTextEdit import IndexedTextEdit
-from PyQt5.QtCore import Qt
+from helpers.mappedTextFile import MappedTextFile
+import os
+from PyQt5.QtCore import Qt, pyqtSignal
 from PyQt5.QtGui import QColor, QTextFormat, QSyntaxHighlighter, QTextCharFormat, \
     QFont, QTextBlock
 from PyQt5.QtWidgets import QPushButton, QFileDialog, QMessageBox, \
     QPlainTextEdit, QTextEdit
 import re
+import shutil
+import threading
+from typing import Optional
+
+# Large-file mode
+LARGE_FILE_SIZE = 5 * 1024 * 1024   # bytes
+WINDOW_LINES = 2000
+
+# Every G-code word starts with a different letter, so at most one
+# alternative matches at a given position and words never overlap
+GCODE_WORDS_PATTERN = re.compile(
+    r'(?P<mword>[Mm]\d{1,2}(?=\s|$))'
+    r'|(?P<gword>[Gg]\d{1,2}(?=\s|$))'
+    r'|(?P<speed>[Ss]\s?\d+)'
+    r'|(?P<feed>[EeFf]\s?\.?\d+(?:\.\d*)?)'
+    r'|(?P<line_number>^N\d+)'
+    r'|(?P<xyz>[XxYyZz]\s?\-?\d*\.?\d+\.?)'
+    r'|(?P<ijk>[IiJjKk]\s?\-?\d*\.?\d+\.?)'
+    r'|(?P<radius>R\s?\-?\d*\.?\d+\.?)'
+    r'|(?P<dwell_time>P\s?\d?\.?\d+\.?)'
+    r'|(?P<tool>T\s?\d+)'
+)
+COMMENT_PATTERNS = [re.compile(r'\(.+\)'), re.compile(r';.+$')]
+GRBL_COMMAND_PATTERN = re.compile(r'^\$[a-zA-Z\$#]')
+
+# Words which are not highlighted inside comments
+COMMENTABLE_WORDS = ('mword', 'gword')
 
 
 class GCodeHighlighter(QSyntaxHighlighter):
+    """Highlights each line with a single scan of a precompiled pattern.
+    Comments are highlighted first, so the words inside them keep their format,
+    except for the M and G words, and GRBL commands ($X, $H...) go last.
+    """
     def __init__(self, editor: QPlainTextEdit):
         super().__init__(editor)
 
-        self._mappings: dict[str, QTextCharFormat] = {}
+        self._formats: dict[str, QTextCharFormat] = {}
         self.setDocument(editor.document())
         self.setup()
 
-    def add_mapping(self, pattern, format):
-        self._mappings[pattern] = format
+    def add_format(self, group: str, format: QTextCharFormat):
+        self._formats[group] = format
 
     def highlightBlock(self, text):
-        for pattern, format in self._mappings.items():
-            for match in re.finditer(pattern, text):
-                start, end = match.span()
-                self.setFormat(start, end - start, format)
+        comments = []
+        if '(' in text or ';' in text:
+            comment_format = self._formats['comment']
+            for pattern in COMMENT_PATTERNS:
+                match = pattern.search(text)
+                if match:
+                    start, end = match.span()
+                    comments.append((start, end))
+                    self.setFormat(start, end - start, comment_format)
+
+        for match in GCODE_WORDS_PATTERN.finditer(text):
+            group = match.lastgroup
+            start, end = match.span()
+            commented = any(c_start <= start < c_end for c_start, c_end in comments)
+            if commented and group in COMMENTABLE_WORDS:
+                continue
+            self.setFormat(start, end - start, self._formats[group])
+
+        if text.startswith('$'):
+            match = GRBL_COMMAND_PATTERN.match(text)
+            if match:
+                self.setFormat(0, match.end(), self._formats['grbl'])
 
     def setup(self):
         mword_format = QTextCharFormat()
         mword_format.setFontWeight(QFont.Bold)
         mword_format.setForeground(Qt.green)
-        mword_pattern = r'[Mm]\d{1,2}(?=\s|$)'
-        self.add_mapping(mword_pattern, mword_format)
+        self.add_format('mword', mword_format)
 
         gword_format = QTextCharFormat()
         gword_format.setFontWeight(QFont.Bold)
         gword_format.setForeground(Qt.blue)
-        gword_pattern = r'[Gg]\d{1,2}(?=\s|$)'
-        self.add_mapping(gword_pattern, gword_format)
+        self.add_format('gword', gword_format)
 
         comment_format = QTextCharFormat()
         comment_format.setForeground(QColor("#117506"))
-        self.add_mapping(r'\(.+\)', comment_format)
-        self.add_mapping(r';.+$', comment_format)
+        self.add_format('comment', comment_format)
 
         speed_feed_format = QTextCharFormat()
         speed_feed_format.setForeground(Qt.blue)
-        speed_pattern = r'([Ss])\s?\d+'
-        feed_pattern = r'([EeFf])\s?\.?\d+(\.\d*)?'
-        self.add_mapping(speed_pattern, speed_feed_format)
-        self.add_mapping(feed_pattern, speed_feed_format)
+        self.add_format('speed', speed_feed_format)
+        self.add_format('feed', speed_feed_format)
 
         program_format = QTextCharFormat()
         program_format.setForeground(QColor("#69ad4c"))
-        line_number_pattern = r'^[N]\d+'
-        self.add_mapping(line_number_pattern, program_format)
+        self.add_format('line_number', program_format)
 
         xyz_format = QTextCharFormat()
         xyz_format.setForeground(QColor("#b0791a"))
-        xyz_pattern = r'[XxYyZz]\s?\-?\d*\.?\d+\.?'
-        self.add_mapping(xyz_pattern, xyz_format)
+        self.add_format('xyz', xyz_format)
 
         ijk_format = QTextCharFormat()
         ijk_format.setForeground(QColor("#d4490d"))
-        ijk_pattern = r'[IiJjKk]\s?\-?\d*\.?\d+\.?'
-        self.add_mapping(ijk_pattern, ijk_format)
+        self.add_format('ijk', ijk_format)
 
         params_format = QTextCharFormat()
         params_format.setForeground(QColor("#8b4cad"))
-        radius_pattern = r'[R]\s?\-?\d*\.?\d+\.?'
-        dwell_time_pattern = r'[P]\s?\d?\.?\d+\.?'
-        tool_pattern = r'[T]\s?\d+'
-        self.add_mapping(radius_pattern, params_format)
-        self.add_mapping(dwell_time_pattern, params_format)
-        self.add_mapping(tool_pattern, params_format)
+        self.add_format('radius', params_format)
+        self.add_format('dwell_time', params_format)
+        self.add_format('tool', params_format)
 
         grbl_format = QTextCharFormat()
         grbl_format.setFontWeight(QFont.Bold)
         grbl_format.setForeground(Qt.gray)
-        grbl_pattern = r'^\$[a-zA-Z\$#]'
-        self.add_mapping(grbl_pattern, grbl_format)
+        self.add_format('grbl', grbl_format)
 
 
 class CodeEditor(IndexedTextEdit):
+    """G-code editor with line numbers and syntax highlighting.
+
+    Files bigger than LARGE_FILE_SIZE are opened in a read-only large-file mode:
+    the file is memory-mapped and only a window of WINDOW_LINES lines around
+    the visible ones is loaded in the editor, which moves while scrolling.
+    Only the first window is indexed before showing the file, the rest of the
+    index is built in a background thread.
+    """
+    large_file_indexed = pyqtSignal()
+
     def __init__(self, parent=None):
+        # Used to calculate the width of the index area, during initialization
+        self.large_file: Optional[MappedTextFile] = None
         super(CodeEditor, self).__init__(parent)
 
         # State variables
         self.modified = False
         self.file_path = ''
 
+        # Large-file mode
+        self.window_start = 0
+        self.window_end = 0
+        self._loading_window = False
+
         # Custom UI management
         self.highlighter = GCodeHighlighter(self)
         self.executedLines = 0
@@ -95,6 +151,8 @@ class CodeEditor(IndexedTextEdit):
         # Custom events
         self.textChanged.connect(self.set_modified)
         self.cursorPositionChanged.connect(self.highlightCurrentLine)
+        self.verticalScrollBar().valueChanged.connect(self.scroll_window)
+        self.large_file_indexed.connect(self.on_large_file_indexed)
 
         # Apply custom styles
         self.setStyleSheet("background-color: 'white';")
@@ -120,8 +178,10 @@ class CodeEditor(IndexedTextEdit):
         if self.modified and not self.ask_to_save_changes():
             return
 
+        self.close_large_file()
         self.setPlainText('')
         self.modified = False
+        self.file_path = ''
 
     # Server FS + DB methods
 
@@ -157,9 +217,13 @@ class CodeEditor(IndexedTextEdit):
             "G code files (*.txt *.gcode *.nc)"
         )
         if file_path:
-            with open(file_path, "r") as content:
-                self.setPlainText(content.read())
-                self.modified = False
+            if os.path.getsize(file_path) >= LARGE_FILE_SIZE:
+                self.open_large_file(file_path)
+            else:
+                self.close_large_file()
+                with open(file_path, "r") as content:
+                    self.setPlainText(content.read())
+                    self.modified = False
             self.file_path = file_path
 
     def export_file(self) -> bool:
@@ -169,6 +233,10 @@ class CodeEditor(IndexedTextEdit):
         if not self.file_path:
             return self.export_file_as()
 
+        # Large files can't be modified
+        if self.large_file:
+            return True
+
         content = self.toPlainText()
         with open(self.file_path, "w") as file:
             file.write(content)
@@ -186,6 +254,11 @@ class CodeEditor(IndexedTextEdit):
             "G code files (*.txt *.gcode *.nc)"
         )
         if file_path:
+            if self.large_file:
+                shutil.copyfile(self.large_file.file_path, file_path)
+                self.file_path = file_path
+                return True
+
             content = self.toPlainText()
             with open(file_path, "w") as file:
                 file.write(content)
@@ -218,11 +291,117 @@ class CodeEditor(IndexedTextEdit):
             return False
         return True
 
+    # Large-file mode
+
+    def open_large_file(self, file_path: str):
+        """Opens the file in the read-only large-file mode.
+        """
+        self.close_large_file()
+        self.large_file = MappedTextFile(file_path)
+        self.setReadOnly(True)
+        self.load_window(0)
+        self.updateIndexAreaWidth(0)
+
+        threading.Thread(
+            target=self.index_large_file,
+            args=(self.large_file,),
+            daemon=True
+        ).start()
+
+    def index_large_file(self, large_file: MappedTextFile):
+        """Completes the index of the file, it runs in a background thread.
+        """
+        large_file.build_index()
+        if large_file.is_indexed():
+            try:
+                self.large_file_indexed.emit()
+            except RuntimeError:
+                # The editor was deleted meanwhile
+                pass
+
+    def close_large_file(self):
+        """Leaves the large-file mode, if active.
+        """
+        if not self.large_file:
+            return
+
+        self.large_file.close()
+        self.large_file = None
+        self.window_start = 0
+        self.window_end = 0
+        self.setReadOnly(False)
+
+    def is_large_file(self) -> bool:
+        return self.large_file is not None
+
+    def load_window(self, start: int):
+        """Loads in the editor the lines of the file in range [start, start + WINDOW_LINES).
+        """
+        if not self.large_file:
+            return
+
+        self.large_file.index_lines(start + WINDOW_LINES)
+        total = self.large_file.line_count()
+        start = min(max(start, 0), max(total - WINDOW_LINES, 0))
+        end = min(start + WINDOW_LINES, total)
+
+        self._loading_window = True
+        self.window_start = start
+        self.window_end = end
+        self.setPlainText(self.large_file.read_lines(start, end))
+        self.modified = False
+        self._loading_window = False
+
+    def scroll_window(self, value: int):
+        """Moves the window of loaded lines when scrolling to any of its edges,
+        keeping the same lines on screen.
+        """
+        if not self.large_file or self._loading_window:
+            return
+
+        scrollbar = self.verticalScrollBar()
+        at_top = value == scrollbar.minimum() and self.window_start > 0
+        at_bottom = (
+            value == scrollbar.maximum() and
+            self.window_end < self.large_file.line_count()
+        )
+        if not (at_top or at_bottom):
+            return
+
+        first_line = self.window_start + self.firstVisibleBlock().blockNumber()
+        self.load_window(first_line - WINDOW_LINES // 2)
+
+        self._loading_window = True
+        scrollbar.setValue(first_line - self.window_start)
+        self._loading_window = False
+
+    def on_large_file_indexed(self):
+        # The amount of lines is known, so is the width of the index area
+        self.updateIndexAreaWidth(0)
+        self.indexArea.update()
+
+    def setReadOnly(self, readOnly: bool):
+        # Large files can't be edited
+        super().setReadOnly(readOnly or self.large_file is not None)
+
     # UI methods
 
+    def line_count(self) -> int:
+        """Returns the amount of lines in the file, including the ones
+        not loaded in the editor in large-file mode.
+        """
+        if self.large_file:
+            return self.large_file.line_count()
+        return self.blockCount()
+
+    def line_number(self, block: QTextBlock) -> int:
+        """Returns the number of the line (1-indexed) in the file.
+        """
+        return self.window_start + block.blockNumber() + 1
+
     def indexAreaWidth(self):
         digits = 1
-        count = max(1.0, self.blockCount())
+        count = max(1.0, self.line_count())
         while count >= 10:
             count /= 10
             digits += 1
@@ -230,11 +409,11 @@ class CodeEditor(IndexedTextEdit):
         return space
 
     def setIndex(self, block: QTextBlock) -> str:
-        return str(block.blockNumber() + 1)
+        return str(self.line_number(block))
 
     def setIndexPenColor(self, block: QTextBlock) -> QColor:
         # Font color for lines yet to be executed
-        if block.blockNumber() + 1 > self.executedLines:
+        if self.line_number(block) > self.executedLines:
             return QColor(Qt.black)
 
         # Font color for already executed lines
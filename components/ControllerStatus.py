@@ -1,9 +1,9 @@
-from core.database.base import Session as SessionLocal
-from core.database.repositories.toolRepository import ToolRepository
 from core.grbl.types import Status
+from helpers.catalogCache import CatalogCache, CatalogItem
 from helpers.utils import applyStylesheet
 from PyQt5.QtWidgets import QLabel, QHBoxLayout, QVBoxLayout, QWidget
 from PyQt5.QtCore import Qt
+from typing import Optional
 
 
 class ControllerStatus(QWidget):
@@ -12,6 +12,8 @@ class ControllerStatus(QWidget):
     def __init__(self, parent=None):
         super(ControllerStatus, self).__init__(parent)
         self.tool_index = 0
+        self.mpos = {'x': 0.0, 'y': 0.0, 'z': 0.0}
+        self.wpos = {'x': 0.0, 'y': 0.0, 'z': 0.0}
         self.setup_ui()
 
     def setup_ui(self):
@@ -59,10 +61,20 @@ class ControllerStatus(QWidget):
         applyStylesheet(self, __file__, 'ControllerStatus.qss')
 
     def set_status(self, status: Status):
-        self.status.setText(status['activeState'].upper())
-        self.x_pos.setText(f"X: {status['mpos']['x']} ({status['wpos']['x']})")
-        self.y_pos.setText(f"Y: {status['mpos']['y']} ({status['wpos']['y']})")
-        self.z_pos.setText(f"Z: {status['mpos']['z']} ({status['wpos']['z']})")
+        """Updates the widgets affected by the given status fields,
+        which may be only the ones that changed.
+        """
+        if 'activeState' in status:
+            self.status.setText(status['activeState'].upper())
+
+        if 'mpos' not in status and 'wpos' not in status:
+            return
+
+        self.mpos = status.get('mpos', self.mpos)
+        self.wpos = status.get('wpos', self.wpos)
+        self.x_pos.setText(f"X: {self.mpos['x']} ({self.wpos['x']})")
+        self.y_pos.setText(f"Y: {self.mpos['y']} ({self.wpos['y']})")
+        self.z_pos.setText(f"Z: {self.mpos['z']} ({self.wpos['z']})")
 
     def set_tool(self, tool_index: int):
         if self.tool_index == tool_index:
@@ -70,16 +82,18 @@ class ControllerStatus(QWidget):
 
         try:
             tool_info = self._get_tool_info(tool_index)
-            self.tool.setText(f'Tool: {tool_index} ({tool_info.name})')
         except Exception:
             return
+        if not tool_info:
+            return
 
+        self.tool.setText(f'Tool: {tool_index} ({tool_info["name"]})')
         self.tool_index = tool_index
 
-    def _get_tool_info(self, tool_index: int):
-        with SessionLocal() as db_session:
-            repository = ToolRepository(db_session)
-            return repository.get_tool_by_id(tool_index)
+    def _get_tool_info(self, tool_index: int) -> Optional[CatalogItem]:
+        # Never query the database from the GUI thread: until the tools are
+        # loaded in background, the tool is not updated
+        return CatalogCache.get_tool(tool_index)
 
     def set_feedrate(self, feedrate: float):
         self.feedrate.setText(f'Feed rate: {feedrate}')
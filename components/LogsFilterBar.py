@@ -0,0 +1,73 @@
+from helpers.logsIndex import LOG_LEVELS, LogsFilter
+from PyQt5.QtCore import pyqtSignal
+from PyQt5.QtWidgets import QComboBox, QHBoxLayout, QLineEdit, QPushButton, QWidget
+
+
+class LogsFilterBar(QWidget):
+    """Inputs to filter the logs by level and type, and to search words in them.
+    """
+    filter_changed = pyqtSignal(object)
+
+    def __init__(self, parent=None):
+        super(LogsFilterBar, self).__init__(parent)
+        self.setup_ui()
+
+    def setup_ui(self):
+        layout = QHBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        self.setLayout(layout)
+
+        self.level = QComboBox()
+        self.level.addItem('Todos los niveles', None)
+        for level in LOG_LEVELS:
+            self.level.addItem(level, level)
+        self.level.currentIndexChanged.connect(self.apply)
+        layout.addWidget(self.level)
+
+        self.log_type = QComboBox()
+        self.set_types([])
+        self.log_type.currentIndexChanged.connect(self.apply)
+        layout.addWidget(self.log_type)
+
+        self.search = QLineEdit()
+        self.search.setPlaceholderText('Buscar, por ejemplo: ALARM:2, error:20, $H')
+        self.search.returnPressed.connect(self.apply)
+        layout.addWidget(self.search)
+
+        self.btn_search = QPushButton('Buscar')
+        self.btn_search.clicked.connect(self.apply)
+        layout.addWidget(self.btn_search)
+
+        self.btn_clear = QPushButton('Limpiar')
+        self.btn_clear.clicked.connect(self.clear)
+        layout.addWidget(self.btn_clear)
+
+    def set_types(self, types: list[str]):
+        """Updates the available options of log types, keeping the selected one.
+        """
+        selected = self.log_type.currentData()
+        self.log_type.blockSignals(True)
+        self.log_type.clear()
+        self.log_type.addItem('Todos los tipos', None)
+        for log_type in types:
+            self.log_type.addItem(log_type, log_type)
+        self.log_type.setCurrentIndex(max(self.log_type.findData(selected), 0))
+        self.log_type.blockSignals(False)
+
+    def get_filter(self) -> LogsFilter:
+        return LogsFilter(
+            level=self.level.currentData(),
+            log_type=self.log_type.currentData(),
+            text=self.search.text()
+        )
+
+    def apply(self):
+        self.filter_changed.emit(self.get_filter())
+
+    def clear(self):
+        for widget in (self.level, self.log_type):
+            widget.blockSignals(True)
+            widget.setCurrentIndex(0)
+            widget.blockSignals(False)
+        self.search.clear()
+        self.apply()
@@ -1,13 +1,43 @@
+from config import appConfig
 from core.grbl.grblController import GrblController
 from helpers.utils import applyStylesheet
+from PyQt5.QtGui import QTextCursor
 from PyQt5.QtWidgets import QLineEdit, QPlainTextEdit, QVBoxLayout, QWidget
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QTimer
+
+# Constants
+FRAME_INTERVAL = 16     # miliseconds
+DEFAULT_MAX_LINES = 1000
+ACKNOWLEDGEMENT = 'ok'
 
 
 class Terminal(QWidget):
+    """Shows the messages from the GRBL device and allows to send commands.
+
+    The output works as a ring buffer: only the last `max_lines` lines are kept,
+    and the received lines are appended in batches, at most once per frame.
+    Optionally, consecutive 'ok' responses are collapsed into a single line
+    with a counter.
+    """
     def __init__(self, grbl_controller: GrblController, parent=None):
         super(Terminal, self).__init__(parent)
         self.grbl_controller = grbl_controller
+
+        # Output buffer
+        self.max_lines = appConfig.get_int(
+            'interface.control.terminal',
+            'maxlines',
+            DEFAULT_MAX_LINES
+        )
+        self.collapse_ok = appConfig.get_bool('interface.control.terminal', 'collapseok', False)
+        self._pending: list[str] = []
+        self._ok_count = 0
+
+        self.flush_timer = QTimer(self)
+        self.flush_timer.setSingleShot(True)
+        self.flush_timer.setInterval(FRAME_INTERVAL)
+        self.flush_timer.timeout.connect(self.flush)
+
         self.setup_ui()
 
     def setup_ui(self):
@@ -18,6 +48,9 @@ class Terminal(QWidget):
         # Widget configuration
         self.display_screen = QPlainTextEdit()
         self.display_screen.setReadOnly(True)
+        self.display_screen.setUndoRedoEnabled(False)
+        # The last block is always empty, after the last line break
+        self.display_screen.setMaximumBlockCount(self.max_lines + 1)
         layout.addWidget(self.display_screen)
 
         self.input = QLineEdit()
@@ -28,7 +61,82 @@ class Terminal(QWidget):
         applyStylesheet(self, __file__, 'Terminal.qss')
 
     def display_text(self, text):
-        self.display_screen.insertPlainText(text + '\n')
+        self.display_lines([text])
+
+    def display_lines(self, lines: list[str]):
+        """Queues a batch of lines, to be shown in the next frame.
+        """
+        if not lines:
+            return
+        self._pending.extend(lines)
+        if not self.flush_timer.isActive():
+            self.flush_timer.start()
+
+    def set_collapse_ok(self, collapse: bool):
+        self.collapse_ok = collapse
+        self._ok_count = 0
+
+    def _collapse_lines(self, lines: list[str]) -> tuple[list[str], bool]:
+        """Replaces runs of 'ok' lines with a counter.
+        Returns the resulting lines and whether the first one replaces the last
+        line in the screen, because it continues a run of 'ok's.
+        """
+        result: list[str] = []
+        replace_last = False
+
+        for line in lines:
+            if line.strip() != ACKNOWLEDGEMENT:
+                self._ok_count = 0
+                result.append(line)
+                continue
+
+            self._ok_count += 1
+            if self._ok_count == 1:
+                result.append(line)
+                continue
+
+            counter = f'{ACKNOWLEDGEMENT} (x{self._ok_count})'
+            if result:
+                result[-1] = counter
+            else:
+                replace_last = True
+                result.append(counter)
+
+        return result, replace_last
+
+    def flush(self):
+        """Appends the pending lines to the screen with a single edit of the document.
+        """
+        self.flush_timer.stop()
+        if not self._pending:
+            return
+
+        lines = self._pending
+        self._pending = []
+        replace_last = False
+        if self.collapse_ok:
+            lines, replace_last = self._collapse_lines(lines)
+
+        # Only follow the output when the user didn't scroll up
+        scrollbar = self.display_screen.verticalScrollBar()
+        pinned = scrollbar.value() == scrollbar.maximum()
+
+        cursor = QTextCursor(self.display_screen.document())
+        cursor.movePosition(QTextCursor.End)
+        if replace_last:
+            cursor.movePosition(QTextCursor.PreviousBlock, QTextCursor.KeepAnchor)
+        cursor.insertText('\n'.join(lines) + '\n')
+
+        if pinned:
+            scrollbar.setValue(scrollbar.maximum())
+
+    def clear(self):
+        self._pending = []
+        self._ok_count = 0
+        self.display_screen.clear()
+
+    def set_input_enabled(self, enable: bool = True):
+        self.input.setEnabled(enable)
 
     def send_line(self):
         line = self.input.text()
@@ -1,5 +1,6 @@
 from PyQt5.QtWidgets import QWidget, QLabel, QHBoxLayout, QVBoxLayout, QPushButton
 from PyQt5.QtCore import Qt
+from containers.PagedList import PagedList
 from helpers.utils import applyStylesheet
 from typing import Callable, TYPE_CHECKING
 
@@ -48,14 +49,20 @@ class Card(QWidget):
         self.layout_buttons.addWidget(button)
 
     def getView(self) -> 'BaseListView':
-        """Get the view containing this card.
+        """Get the view containing this card. Cards of lists are placed
+        inside a PagedList, whose parent is the view.
         """
+        widget = self.parent()
+        while widget is not None:
+            if isinstance(widget, PagedList):
+                return widget.parent()  # type: ignore
+            widget = widget.parent()
         return self.parent()  # type: ignore
 
     def getWindow(self) -> 'MainWindow':
         """Get the application's main window.
         """
-        return self.parent().parent()  # type: ignore
+        return self.window()  # type: ignore
 
     # Notifications
 
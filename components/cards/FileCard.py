@@ -6,6 +6,7 @@ from core.database.models import File
 from core.database.repositories.fileRepository import DuplicatedFileNameError
 from core.utils.files import InvalidFile, FileSystemError
 from core.utils.fileManager import FileManager
+from helpers.catalogCache import CatalogCache, FILES_CATALOG
 from helpers.utils import needs_confirmation
 
 
@@ -55,6 +56,7 @@ class FileCard(Card):
                 str(error)
             )
         else:
+            CatalogCache.invalidate(FILES_CATALOG)
             self.getView().refreshLayout()
 
     @needs_confirmation('¿Realmente desea eliminar el archivo?', 'Eliminar archivo')
@@ -72,4 +74,5 @@ class FileCard(Card):
                 str(error)
             )
         else:
+            CatalogCache.invalidate(FILES_CATALOG)
             self.getView().refreshLayout()
@@ -1,8 +1,9 @@
 from components.cards.Card import Card
 from components.dialogs.MaterialDataDialog import MaterialDataDialog
-from core.database.base import Session as SessionLocal
 from core.database.models import Material
 from core.database.repositories.materialRepository import MaterialRepository
+from helpers.catalogCache import CatalogCache, MATERIALS_CATALOG
+from helpers.dbSession import session_scope
 from helpers.utils import needs_confirmation
 
 
@@ -27,27 +28,29 @@ class MaterialCard(Card):
 
         name, description = materialDialog.getInputs()
         try:
-            db_session = SessionLocal()
-            repository = MaterialRepository(db_session)
-            repository.update_material(self.material.id, name, description)
+            with session_scope() as db_session:
+                repository = MaterialRepository(db_session)
+                repository.update_material(self.material.id, name, description)
         except Exception as error:
             self.showError(
                 'Error de base de datos',
                 str(error)
             )
             return
+        CatalogCache.invalidate(MATERIALS_CATALOG)
         self.getView().refreshLayout()
 
     @needs_confirmation('¿Realmente desea eliminar el material?', 'Eliminar material')
     def removeMaterial(self):
         try:
-            db_session = SessionLocal()
-            repository = MaterialRepository(db_session)
-            repository.remove_material(self.material.id)
+            with session_scope() as db_session:
+                repository = MaterialRepository(db_session)
+                repository.remove_material(self.material.id)
         except Exception as error:
             self.showError(
                 'Error de base de datos',
                 str(error)
             )
             return
+        CatalogCache.invalidate(MATERIALS_CATALOG)
         self.getView().refreshLayout()
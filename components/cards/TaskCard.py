@@ -4,7 +4,6 @@ from components.dialogs.TaskCancelDialog import TaskCancelDialog
 from components.dialogs.TaskDataDialog import TaskDataDialog
 from components.TaskProgress import TaskProgress
 from config import USER_ID
-from core.database.base import Session as SessionLocal
 from core.database.models import Task, TASK_DEFAULT_PRIORITY, TASK_FINISHED_STATUS, \
     TASK_CANCELLED_STATUS, TASK_ON_HOLD_STATUS, TASK_INITIAL_STATUS, \
     TASK_FAILED_STATUS, TASK_APPROVED_STATUS, TASK_IN_PROGRESS_STATUS
@@ -12,9 +11,11 @@ from core.database.repositories.taskRepository import TaskRepository
 from core.utils.storage import get_value_from_id, get_value, set_value
 from core.worker import WORKER_REQUEST_KEY, WORKER_PAUSE_REQUEST, WORKER_RESUME_REQUEST, \
     WORKER_IS_PAUSED_KEY
-from helpers.cncWorkerMonitor import CncWorkerMonitor
+from helpers.cncWorkerMonitor import CncWorkerMonitor, WorkerSnapshot, WorkerTaskState
+from helpers.dbSession import session_scope
 from helpers.utils import needs_confirmation, send_task_to_worker
 from PyQt5.QtWidgets import QSizePolicy, QPushButton
+from typing import Optional
 
 
 class TaskCard(Card):
@@ -25,7 +26,8 @@ class TaskCard(Card):
             files=[],
             tools=[],
             materials=[],
-            parent=None
+            parent=None,
+            worker_snapshot: Optional[WorkerSnapshot] = None
     ):
         super(TaskCard, self).__init__(parent)
 
@@ -34,6 +36,8 @@ class TaskCard(Card):
         self.files = files
         self.tools = tools
         self.materials = materials
+        # State in the worker, queried by the view for all its cards
+        self.worker_snapshot = worker_snapshot
         self.setup_ui()
 
         # Set "status" dynamic property for styling
@@ -44,7 +48,7 @@ class TaskCard(Card):
     def setup_ui(self):
         self.paused = False
         if self.task.status == TASK_IN_PROGRESS_STATUS:
-            self.paused = not not get_value(WORKER_IS_PAUSED_KEY)
+            self.paused = self.is_worker_paused()
 
         self.setup_buttons(self.task.status)
 
@@ -59,15 +63,12 @@ class TaskCard(Card):
         self.check_task_status()
 
     def check_task_status(self):
-        # Check if it has a worker task ID
-        task_worker_id = get_value_from_id('task', self.task.id)
-        if not task_worker_id:
+        worker_state = self.get_worker_state()
+        if not worker_state:
             return
 
-        # Get status in worker
-        task_state: AsyncResult = AsyncResult(task_worker_id)
-        task_info = task_state.info
-        task_status = task_state.status
+        task_info = worker_state['info']
+        task_status = worker_state['status']
 
         if task_status == 'PROGRESS' and self.task.status == TASK_IN_PROGRESS_STATUS:
             self.show_task_progress(task_info)
@@ -75,6 +76,26 @@ class TaskCard(Card):
         if task_status == 'FAILURE':
             self.show_task_failure(task_info)
 
+    def is_worker_paused(self) -> bool:
+        if self.worker_snapshot is not None:
+            return self.worker_snapshot['paused']
+        return not not get_value(WORKER_IS_PAUSED_KEY)
+
+    def get_worker_state(self) -> Optional[WorkerTaskState]:
+        """Returns the state of the task in the worker, if it was sent to it.
+        """
+        if self.worker_snapshot is not None:
+            return self.worker_snapshot['states'].get(self.task.id)
+
+        # Check if it has a worker task ID
+        task_worker_id = get_value_from_id('task', self.task.id)
+        if not task_worker_id:
+            return None
+
+        # Get status in worker
+        task_state: AsyncResult = AsyncResult(task_worker_id)
+        return {'status': task_state.status, 'info': task_state.info}
+
     def show_task_progress(self, task_info):
         sent_lines = task_info.get('sent_lines')
         processed_lines = task_info.get('processed_lines')
@@ -142,18 +163,18 @@ class TaskCard(Card):
 
         file_id, tool_id, material_id, name, note = taskDialog.getInputs()
         try:
-            db_session = SessionLocal()
-            repository = TaskRepository(db_session)
-            repository.update_task(
-                self.task.id,
-                self.task.user_id,
-                file_id,
-                tool_id,
-                material_id,
-                name,
-                note,
-                TASK_DEFAULT_PRIORITY
-            )
+            with session_scope() as db_session:
+                repository = TaskRepository(db_session)
+                repository.update_task(
+                    self.task.id,
+                    self.task.user_id,
+                    file_id,
+                    tool_id,
+                    material_id,
+                    name,
+                    note,
+                    TASK_DEFAULT_PRIORITY
+                )
         except Exception as error:
             self.showError(
                 'Error de base de datos',
@@ -165,9 +186,9 @@ class TaskCard(Card):
     @needs_confirmation('¿Realmente desea eliminar la tarea?', 'Eliminar tarea')
     def removeTask(self):
         try:
-            db_session = SessionLocal()
-            repository = TaskRepository(db_session)
-            repository.remove_task(self.task.id)
+            with session_scope() as db_session:
+                repository = TaskRepository(db_session)
+                repository.remove_task(self.task.id)
         except Exception as error:
             self.showError(
                 'Error de base de datos',
@@ -200,14 +221,14 @@ class TaskCard(Card):
         cancellation_reason: str = ''
     ):
         try:
-            db_session = SessionLocal()
-            repository = TaskRepository(db_session)
-            repository.update_task_status(
-                self.task.id,
-                new_status,
-                USER_ID,
-                cancellation_reason
-            )
+            with session_scope() as db_session:
+                repository = TaskRepository(db_session)
+                repository.update_task_status(
+                    self.task.id,
+                    new_status,
+                    USER_ID,
+                    cancellation_reason
+                )
         except Exception as error:
             self.showError(
                 'Error de base de datos',
@@ -222,16 +243,16 @@ class TaskCard(Card):
 
         file_id, tool_id, material_id, name, note = taskDialog.getInputs()
         try:
-            db_session = SessionLocal()
-            repository = TaskRepository(db_session)
-            repository.create_task(
-                self.task.user_id,
-                file_id,
-                tool_id,
-                material_id,
-                name,
-                note
-            )
+            with session_scope() as db_session:
+                repository = TaskRepository(db_session)
+                repository.create_task(
+                    self.task.user_id,
+                    file_id,
+                    tool_id,
+                    material_id,
+                    name,
+                    note
+                )
         except Exception as error:
             self.showError(
                 'Error de base de datos',
@@ -1,8 +1,9 @@
 from components.cards.Card import Card
 from components.dialogs.ToolDataDialog import ToolDataDialog
-from core.database.base import Session as SessionLocal
 from core.database.models import Tool
 from core.database.repositories.toolRepository import ToolRepository
+from helpers.catalogCache import CatalogCache, TOOLS_CATALOG
+from helpers.dbSession import session_scope
 from helpers.utils import needs_confirmation
 
 
@@ -27,27 +28,29 @@ class ToolCard(Card):
 
         name, description = toolDialog.getInputs()
         try:
-            db_session = SessionLocal()
-            repository = ToolRepository(db_session)
-            repository.update_tool(self.tool.id, name, description)
+            with session_scope() as db_session:
+                repository = ToolRepository(db_session)
+                repository.update_tool(self.tool.id, name, description)
         except Exception as error:
             self.showError(
                 'Error de base de datos',
                 str(error)
             )
             return
+        CatalogCache.invalidate(TOOLS_CATALOG)
         self.getView().refreshLayout()
 
     @needs_confirmation('¿Realmente desea eliminar la herramienta?', 'Eliminar herramienta')
     def removeTool(self):
         try:
-            db_session = SessionLocal()
-            repository = ToolRepository(db_session)
-            repository.remove_tool(self.tool.id)
+            with session_scope() as db_session:
+                repository = ToolRepository(db_session)
+                repository.remove_tool(self.tool.id)
         except Exception as error:
             self.showError(
                 'Error de base de datos',
                 str(error)
             )
             return
+        CatalogCache.invalidate(TOOLS_CATALOG)
         self.getView().refreshLayout()
@@ -1,8 +1,8 @@
 from components.cards.Card import Card
 from components.dialogs.UserDataDialog import UserDataDialog
-from core.database.base import Session as SessionLocal
 from core.database.models import User
 from core.database.repositories.userRepository import UserRepository
+from helpers.dbSession import session_scope
 from helpers.utils import needs_confirmation
 
 
@@ -27,9 +27,9 @@ class UserCard(Card):
 
         name, email, _, role = userDialog.getInputs()
         try:
-            db_session = SessionLocal()
-            repository = UserRepository(db_session)
-            repository.update_user(self.user.id, name, email, role)
+            with session_scope() as db_session:
+                repository = UserRepository(db_session)
+                repository.update_user(self.user.id, name, email, role)
         except Exception as error:
             self.showError(
                 'Error de base de datos',
@@ -41,9 +41,9 @@ class UserCard(Card):
     @needs_confirmation('¿Realmente desea eliminar el usuario?', 'Eliminar usuario')
     def removeUser(self):
         try:
-            db_session = SessionLocal()
-            repository = UserRepository(db_session)
-            repository.remove_user(self.user.id)
+            with session_scope() as db_session:
+                repository = UserRepository(db_session)
+                repository.remove_user(self.user.id)
         except Exception as error:
             self.showError(
                 'Error de base de datos',
@@ -0,0 +1,61 @@
+from containers.WidgetsHList import WidgetsHList
+from helpers.logsIndex import LOG_LEVELS, LogsFilter
+from PyQt5.QtWidgets import QCheckBox, QComboBox, QDateTimeEdit, QDialog, \
+    QDialogButtonBox, QFormLayout
+from PyQt5.QtCore import QDateTime, Qt
+
+DATETIME_FORMAT = 'dd/MM/yyyy HH:mm'
+
+
+class LogsExportDialog(QDialog):
+    def __init__(self, parent=None):
+        super(LogsExportDialog, self).__init__(parent)
+
+        layout = QFormLayout(self)
+
+        self.level = QComboBox(self)
+        self.level.addItem('Todos', None)
+        for level in LOG_LEVELS:
+            self.level.addItem(level, level)
+        layout.addRow('Nivel', self.level)
+
+        now = QDateTime.currentDateTime()
+        self.check_since, self.since = self.create_datetime_input(now.addDays(-1))
+        layout.addRow('Desde', WidgetsHList([self.check_since, self.since]))
+        self.check_until, self.until = self.create_datetime_input(now)
+        layout.addRow('Hasta', WidgetsHList([self.check_until, self.until]))
+
+        self.compress = QCheckBox('Comprimir (gzip)', self)
+        layout.addRow(self.compress)
+
+        buttonBox = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        buttonBox.accepted.connect(self.accept)
+        buttonBox.rejected.connect(self.reject)
+        layout.addWidget(buttonBox)
+
+        layout.setAlignment(Qt.AlignCenter)
+        self.setLayout(layout)
+
+        self.setWindowTitle('Exportar registro de actividad')
+
+    def create_datetime_input(self, value: QDateTime) -> tuple[QCheckBox, QDateTimeEdit]:
+        """Creates a datetime input, only enabled while its checkbox is checked.
+        """
+        check = QCheckBox(self)
+        input = QDateTimeEdit(value, self)
+        input.setDisplayFormat(DATETIME_FORMAT)
+        input.setCalendarPopup(True)
+        input.setEnabled(False)
+        check.toggled.connect(input.setEnabled)
+        return check, input
+
+    def getInputs(self) -> tuple[LogsFilter, bool]:
+        since = until = None
+        # The inputs have a precision of minutes
+        if self.check_since.isChecked():
+            since = self.since.dateTime().toPyDateTime().replace(second=0, microsecond=0)
+        if self.check_until.isChecked():
+            until = self.until.dateTime().toPyDateTime().replace(second=59, microsecond=0)
+
+        logs_filter = LogsFilter(level=self.level.currentData(), since=since, until=until)
+        return logs_filter, self.compress.isChecked()
@@ -0,0 +1,163 @@
+from array import array
+from core.utils.logs import Log
+from helpers.logsReader import LogEntry
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, Qt
+from PyQt5.QtGui import QColor
+from typing import Any, Optional
+
+# Columns
+COLUMN_DATETIME = 0
+COLUMN_LEVEL = 1
+COLUMN_TYPE = 2
+COLUMN_MESSAGE = 3
+HEADERS = ['Fecha', 'Nivel', 'Tipo', 'Mensaje']
+
+# Font color for each log level
+LEVEL_COLORS = {
+    'WARNING': QColor(Qt.darkYellow),
+    'ERROR': QColor(Qt.red),
+    'CRITICAL': QColor(Qt.darkRed),
+}
+
+
+class LogsTableModel(QAbstractTableModel):
+    """Table of logs, stored by column to keep memory usage low:
+    levels and types are stored as indexes in a table of known values,
+    and the offsets of the logs in the file in a compact array.
+
+    Rows are always inserted and removed in batches.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        self.offsets = array('Q')
+        self.times: list[str] = []
+        self.levels = array('B')
+        self.types = array('H')
+        self.messages: list[str] = []
+
+        # Known values of levels and types, the first one means no value
+        self._level_names: list[str] = ['']
+        self._type_names: list[Optional[str]] = [None]
+
+    # Model interface
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self.messages)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(HEADERS)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+
+        row = index.row()
+        if role == Qt.DisplayRole:
+            column = index.column()
+            if column == COLUMN_DATETIME:
+                return self.times[row]
+            if column == COLUMN_LEVEL:
+                return self._level_names[self.levels[row]]
+            if column == COLUMN_TYPE:
+                return self._type_names[self.types[row]]
+            return self.messages[row]
+
+        if role == Qt.ForegroundRole:
+            return LEVEL_COLORS.get(self._level_names[self.levels[row]])
+
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return HEADERS[section]
+        return None
+
+    # Data management
+
+    def _intern(self, names: list, value) -> int:
+        try:
+            return names.index(value)
+        except ValueError:
+            names.append(value)
+            return len(names) - 1
+
+    def _columns(self, entries: list[LogEntry]) -> tuple[array, list[str], array, array, list[str]]:
+        offsets = array('Q', (offset for offset, _ in entries))
+        times = [log[0] for _, log in entries]
+        levels = array('B', (self._intern(self._level_names, log[1]) for _, log in entries))
+        types = array('H', (self._intern(self._type_names, log[2]) for _, log in entries))
+        messages = [log[3] for _, log in entries]
+        return offsets, times, levels, types, messages
+
+    def append(self, entries: list[LogEntry]):
+        """Adds a batch of logs at the end of the table.
+        """
+        if not entries:
+            return
+
+        offsets, times, levels, types, messages = self._columns(entries)
+        first = self.rowCount()
+        self.beginInsertRows(QModelIndex(), first, first + len(entries) - 1)
+        self.offsets.extend(offsets)
+        self.times.extend(times)
+        self.levels.extend(levels)
+        self.types.extend(types)
+        self.messages.extend(messages)
+        self.endInsertRows()
+
+    def prepend(self, entries: list[LogEntry]):
+        """Adds a batch of logs at the start of the table.
+        """
+        if not entries:
+            return
+
+        offsets, times, levels, types, messages = self._columns(entries)
+        self.beginInsertRows(QModelIndex(), 0, len(entries) - 1)
+        self.offsets[:0] = offsets
+        self.times[:0] = times
+        self.levels[:0] = levels
+        self.types[:0] = types
+        self.messages[:0] = messages
+        self.endInsertRows()
+
+    def remove(self, first: int, count: int):
+        """Removes a batch of `count` logs, starting from row `first`.
+        """
+        last = min(first + count, self.rowCount())
+        if first >= last:
+            return
+
+        self.beginRemoveRows(QModelIndex(), first, last - 1)
+        del self.offsets[first:last]
+        del self.times[first:last]
+        del self.levels[first:last]
+        del self.types[first:last]
+        del self.messages[first:last]
+        self.endRemoveRows()
+
+    def clear(self):
+        self.beginResetModel()
+        self.offsets = array('Q')
+        self.times = []
+        self.levels = array('B')
+        self.types = array('H')
+        self.messages = []
+        self.endResetModel()
+
+    # Getters
+
+    def get_log(self, row: int) -> Log:
+        return (
+            self.times[row],
+            self._level_names[self.levels[row]],
+            self._type_names[self.types[row]],
+            self.messages[row]
+        )
+
+    def get_offset(self, row: int) -> int:
+        return self.offsets[row]
@@ -1,88 +1,263 @@
-from components.text.IndexedTextEdit import IndexedTextEdit
+from components.models.LogsTableModel import LogsTableModel, COLUMN_MESSAGE
 from config import GRBL_LOGS_FILE
-from core.utils.logs import Log, LogsInterpreter, LogFileWatcher
-import csv
-import os
-from PyQt5.QtCore import Qt, QObject, QThread, pyqtSignal
-from PyQt5.QtGui import QColor, QTextBlock
-import shutil
-import time
+from helpers.logsArchive import LogsArchive, RotatedLogsReader
+from helpers.logsIndex import LogsFilter, LogsIndex
+from helpers.logsReader import LogEntry
+from helpers.logsTailer import BATCH_SIZE, LogsTailer
+from PyQt5.QtCore import QModelIndex, QObject, QThread, pyqtSignal
+from PyQt5.QtGui import QShowEvent
+from PyQt5.QtWidgets import QAbstractItemView, QHeaderView, QTableView
+import threading
 from typing import Optional
 
 # Constants
-LOGS_POLL = 0.10  # seconds
+WAIT_TIMEOUT = 1.0  # seconds, just in case a change is missed
+INITIAL_LOGS = 1000
+PAGE_SIZE = 1000
+MAX_LOGS = 100000
+ROW_PADDING = 4     # pixels
+# Archives whose logs are indexed one by one, older ones are summarized
+INDEXED_ARCHIVES = 1
 
 
 class Worker(QObject):
-    new_log = pyqtSignal(object)
+    """Follows the logs file from its own thread, blocking until it changes
+    and emitting the new logs in batches, along with the offset after them.
 
-    def __init__(self):
+    It also keeps `index` up to date: first, it indexes the logs previous to
+    the ones it follows and then, every new batch before emitting it.
+    The logs file may be rotated meanwhile (see LogsRotator), and only the
+    logs of the last INDEXED_ARCHIVES archives and the logs file are kept
+    in the index one by one (see compact_index).
+
+    While paused, it waits on a condition variable instead of polling.
+    """
+    new_logs = pyqtSignal(list, int)
+
+    def __init__(self, index: LogsIndex):
         super().__init__()
-        self.watcher = LogFileWatcher(GRBL_LOGS_FILE)
+        self.index = index
+        self.archive = LogsArchive(GRBL_LOGS_FILE)
+        self.tailer: Optional[LogsTailer] = None
+        self.offset = 0
+        self._condition = threading.Condition()
         self._running = False
         self._paused = False
 
-    def run(self):
-        if not os.path.exists(GRBL_LOGS_FILE):
-            return
-
-        tc = time.time()  # last time GRBL info was queried
-        self._running = True
-        self.logs = self.watcher.watch()
-
-        while self._running:
-            if self._paused:
-                continue
-
-            t = time.time()
+    def reset(self, offset: int):
+        """Prepares the worker to follow the logs file from the given offset.
+        """
+        with self._condition:
+            self.offset = offset
+            self._running = True
+            self._paused = False
 
-            # Check for new logs?
-            if t - tc > LOGS_POLL:
-                try:
-                    log = next(self.logs)
-                except StopIteration:
-                    time.sleep(0.1)
-                    continue
-                else:
-                    # Emit new message signal
-                    self.new_log.emit(log)
-                    tc = t
+    def run(self):
+        self.tailer = LogsTailer(GRBL_LOGS_FILE, self.offset)
+        self.index_history(self.offset)
+
+        while self._wait_until_resumed():
+            # Start again if the file was truncated or replaced
+            if self.tailer.reader.size() < self.index.end:
+                self.index.clear()
+
+            entries, self.offset = self.tailer.read_new(BATCH_SIZE)
+            if entries:
+                self.index.add(entries, self.offset)
+                self.compact_index()
+                self.new_logs.emit(entries, self.offset)
+            # Keep reading while there are pending logs
+            if len(entries) < BATCH_SIZE:
+                self.tailer.wait(WAIT_TIMEOUT)
+
+        self.tailer.close()
+        self.tailer = None
+
+    def index_history(self, offset: int):
+        """Indexes the logs which are not indexed yet, up to the given offset.
+        """
+        reader = RotatedLogsReader(GRBL_LOGS_FILE, self.archive)
+        if reader.size() < self.index.end:
+            self.index.clear()
+
+        while self.index.end < offset and self._wait_until_resumed():
+            entries, end = reader.read_after(self.index.end, BATCH_SIZE)
+            if not entries:
+                return
+            self.index.add(entries, end)
+            self.compact_index()
+
+    def compact_index(self):
+        """Summarizes the indexed logs of the archives older than the last
+        INDEXED_ARCHIVES ones, so the size of the index stays bounded.
+        """
+        self.archive.reload()
+        segments = self.archive.segments
+        for segment in segments[:max(len(segments) - INDEXED_ARCHIVES, 0)]:
+            end = segment['start'] + segment['size']
+            if self.index.start < end <= self.index.end:
+                self.index.summarize(end)
+
+    def _wait_until_resumed(self) -> bool:
+        """Blocks while the worker is paused.
+        Returns False when the worker was stopped.
+        """
+        with self._condition:
+            self._condition.wait_for(lambda: not self._running or not self._paused)
+            return self._running
 
     def stop(self):
-        self.watcher.stop_watching()
-        self._running = False
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
+        tailer = self.tailer
+        if tailer:
+            tailer.wake()
 
     def pause(self):
-        if self._running:
-            self._paused = True
+        with self._condition:
+            if self._running:
+                self._paused = True
 
     def resume(self):
-        if self._running:
-            self._paused = False
+        with self._condition:
+            if self._running:
+                self._paused = False
+                self._condition.notify_all()
 
     def toggle_paused(self):
-        if self._running:
-            self._paused = not self._paused
-
-
-class LogsViewer(IndexedTextEdit):
+        with self._condition:
+            if self._running:
+                self._paused = not self._paused
+                self._condition.notify_all()
+
+
+class LogsSearch(QObject):
+    """Looks for the logs which match a filter from its own thread, so the GUI
+    never waits for the logs file, and emits the newest MAX_LOGS matches at once.
+
+    The candidates found in the index are checked from the newest ones, and
+    then the logs of the summarized archives which may have matches.
+    Only the result of the last search is emitted.
+    """
+    found = pyqtSignal(int, list)   # search ID, matches
+
+    def __init__(self, index: LogsIndex, parent=None):
+        super().__init__(parent)
+        self.index = index
+        self.reader = RotatedLogsReader(GRBL_LOGS_FILE)
+        self.search_id = 0
+        self.search_thread: Optional[threading.Thread] = None
+
+    def start(self, logs_filter: LogsFilter) -> int:
+        """Starts looking for the logs indexed so far which match the filter.
+        Returns the offset after them.
+        """
+        self.search_id += 1
+        end = self.index.end
+        self.search_thread = threading.Thread(
+            target=self.run,
+            args=(self.search_id, logs_filter, end),
+            daemon=True
+        )
+        self.search_thread.start()
+        return end
+
+    def cancel(self):
+        self.search_id += 1
+
+    def is_cancelled(self, search_id: int) -> bool:
+        return search_id != self.search_id
+
+    def run(self, search_id: int, logs_filter: LogsFilter, end: int):
+        offsets = [offset for offset in self.index.search(logs_filter) if offset < end]
+
+        # Not every candidate matches, so check them from the newest ones
+        # until there are enough matches
+        batches: list[list[LogEntry]] = []
+        found = 0
+        batch_end = len(offsets)
+        while batch_end > 0 and found < MAX_LOGS:
+            if self.is_cancelled(search_id):
+                return
+            start = max(batch_end - BATCH_SIZE, 0)
+            batch = [
+                entry for entry in self.reader.read_at(offsets[start:batch_end])
+                if logs_filter.matches(entry[1])
+            ]
+            batches.append(batch)
+            found += len(batch)
+            batch_end = start
+
+        for summary in reversed(self.index.search_summaries(logs_filter)):
+            if found >= MAX_LOGS:
+                break
+            batch = self.scan(search_id, logs_filter, summary['start'], summary['end'])
+            batches.append(batch)
+            found += len(batch)
+
+        if self.is_cancelled(search_id):
+            return
+        entries = [entry for batch in reversed(batches) for entry in batch][-MAX_LOGS:]
+        try:
+            self.found.emit(search_id, entries)
+        except RuntimeError:
+            # The viewer was deleted during the search
+            pass
+
+    def scan(
+        self,
+        search_id: int,
+        logs_filter: LogsFilter,
+        start: int,
+        end: int
+    ) -> list[LogEntry]:
+        """Returns the logs between the given offsets which match the filter.
+        """
+        matches: list[LogEntry] = []
+        position = start
+        while position < end and not self.is_cancelled(search_id):
+            entries, position = self.reader.read_after(position, BATCH_SIZE)
+            if not entries:
+                break
+            matches.extend(
+                entry for entry in entries
+                if entry[0] < end and logs_filter.matches(entry[1])
+            )
+        return matches
+
+
+class LogsViewer(QTableView):
+    """Shows the GRBL logs, starting from the last INITIAL_LOGS ones.
+
+    Older logs are loaded in pages when scrolling to the top, and newer ones
+    when scrolling to the bottom or when they are added to the file.
+    At most MAX_LOGS logs are kept in memory, discarding the farthest ones
+    from the visible area.
+    """
     def __init__(self, parent=None):
         super(LogsViewer, self).__init__(parent)
 
-        self.setReadOnly(True)
         self.setStyleSheet("background-color: 'white';")
 
         # Log file management
-        self.logs = LogsInterpreter().interpret_file(
-            GRBL_LOGS_FILE
-        )
+        self.reader = RotatedLogsReader(GRBL_LOGS_FILE)
+        self.index = LogsIndex()
+        self.logs = LogsTableModel(self)
+        self.logs_filter: Optional[LogsFilter] = None
+        self.window_end = 0
+        self.at_end = True
+        self._loading = False
 
         # UI
         self.setup_ui()
+        self.verticalScrollBar().valueChanged.connect(self.on_scroll)
 
         # Thread configuration
         self.logs_thread: Optional[QThread] = None
-        self.logs_worker = Worker()
+        self.logs_worker = Worker(self.index)
+        self.logs_search = LogsSearch(self.index, self)
+        self.logs_search.found.connect(self.on_logs_found)
 
     # Thread control methods
 
@@ -96,6 +271,7 @@ class LogsViewer(IndexedTextEdit):
         self.logs_worker.toggle_paused()
 
     def stop(self):
+        self.logs_search.cancel()
         if not self.logs_thread:
             return
         self.logs_worker.stop()
@@ -103,54 +279,218 @@ class LogsViewer(IndexedTextEdit):
         self.logs_thread.wait()
 
     def start(self):
+        # Follow the logs from the last loaded one
+        self.logs_worker.reset(self.window_end)
         # Create a QThread object
         self.logs_thread = QThread(self)
         # Move worker to the thread
         self.logs_worker.moveToThread(self.logs_thread)
         # Connect signals and slots
         self.logs_thread.started.connect(self.logs_worker.run)
-        self.logs_worker.new_log.connect(self.add_log)
+        self.logs_worker.new_logs.connect(self.add_logs)
         # Start the thread
         self.logs_thread.start()
 
-    # File system methods
+    # UI methods
 
-    def export_logs(self, output_path: str):
-        """Saves the current text to the selected file, or a new one.
+    def setup_ui(self):
+        self.setModel(self.logs)
+        self.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.setWordWrap(False)
+        self.setShowGrid(False)
+
+        # Every row has the same height, so there is no need to measure them
+        vertical_header = self.verticalHeader()
+        vertical_header.hide()
+        vertical_header.setSectionResizeMode(QHeaderView.Fixed)
+        vertical_header.setDefaultSectionSize(self.fontMetrics().height() + ROW_PADDING)
+
+        horizontal_header = self.horizontalHeader()
+        horizontal_header.setSectionResizeMode(QHeaderView.Interactive)
+        horizontal_header.setStretchLastSection(True)
+        self.resizeColumnToContents(COLUMN_MESSAGE)
+        self.doubleClicked.connect(self.show_in_context)
+
+        self.load_last()
+
+    def load_last(self):
+        entries, self.window_end = self.reader.read_last(INITIAL_LOGS)
+        self.append_entries(entries)
+        self.at_end = True
+        self.scrollToBottom()
+
+    def append_entries(self, entries: list[LogEntry]):
+        """Shows the logs after the last loaded one, discarding
+        the oldest ones when exceeding MAX_LOGS.
         """
-        if output_path.endswith('.csv'):
-            with open(output_path, "w", newline='') as outfile:
-                csv_writer = csv.writer(outfile, delimiter=";")
-                csv_writer.writerow(["DATETIME", "LEVEL", "TYPE", "Message"])
-                for log in self.logs:
-                    csv_writer.writerow([log[0], log[1], log[2], log[3]])
+        if not entries:
             return
 
-        # As a plain text file
-        shutil.copy(GRBL_LOGS_FILE, output_path)
+        scrollbar = self.verticalScrollBar()
+        pinned = scrollbar.value() == scrollbar.maximum()
 
-    # UI methods
+        self._loading = True
+        self.logs.append(entries)
 
-    def setup_ui(self):
-        for log in self.logs:
-            message = log[-1]
-            self.appendPlainText(message)
-
-    def add_log(self, log: Log):
-        self.logs.append(log)
-        message = log[-1]
-        self.appendPlainText(message)
-
-    def indexAreaWidth(self):
-        space = 3 + self.fontMetrics().width('99/99/9999 99:99:99')
-        return space
-
-    def setIndex(self, block: QTextBlock) -> str:
-        line_number = block.blockNumber()
-        if not self.logs:
-            return ''
-        time = self.logs[line_number][0]
-        return time
-
-    def setIndexPenColor(self, _) -> QColor:
-        return QColor(Qt.black)
+        excess = self.logs.rowCount() - MAX_LOGS
+        if excess > 0:
+            value = scrollbar.value()
+            self.logs.remove(0, excess)
+            scrollbar.setValue(value - excess)
+
+        if pinned:
+            self.scrollToBottom()
+        self._loading = False
+
+    def prepend_entries(self, entries: list[LogEntry]):
+        """Shows the logs before the first loaded one, discarding
+        the newest ones when exceeding MAX_LOGS.
+        """
+        if not entries:
+            return
+
+        scrollbar = self.verticalScrollBar()
+        value = scrollbar.value()
+
+        self._loading = True
+        self.logs.prepend(entries)
+
+        excess = self.logs.rowCount() - MAX_LOGS
+        if excess > 0:
+            self.window_end = self.logs.get_offset(MAX_LOGS)
+            self.at_end = False
+            self.logs.remove(MAX_LOGS, excess)
+
+        # Keep the same logs on screen
+        scrollbar.setValue(value + len(entries))
+        self._loading = False
+
+    def load_older(self):
+        if not self.logs.rowCount() or self.logs.get_offset(0) == 0:
+            return
+        self.prepend_entries(self.reader.read_before(self.logs.get_offset(0), PAGE_SIZE))
+
+    def load_newer(self):
+        # Reload the last logs if the file was truncated or replaced
+        if self.reader.size() < self.window_end:
+            self.clear_logs()
+            self.load_last()
+            return
+
+        entries, self.window_end = self.reader.read_after(self.window_end, PAGE_SIZE)
+        self.at_end = len(entries) < PAGE_SIZE
+        self.append_entries(entries)
+
+    def clear_logs(self):
+        self._loading = True
+        self.logs.clear()
+        self.window_end = 0
+        self.at_end = True
+        self._loading = False
+
+    def showEvent(self, event: QShowEvent):
+        super().showEvent(event)
+        # Start from the newest logs
+        if self.at_end:
+            self.scrollToBottom()
+
+    def on_scroll(self, value: int):
+        # Every match is loaded when filtering
+        if self._loading or self.logs_filter:
+            return
+
+        scrollbar = self.verticalScrollBar()
+        if value == scrollbar.minimum():
+            self.load_older()
+        elif value == scrollbar.maximum() and not self.at_end:
+            self.load_newer()
+
+    def add_logs(self, entries: list[LogEntry], end: int):
+        """Shows a batch of logs added to the file, unless the user is looking at
+        older logs, in which case they are loaded when scrolling down.
+        """
+        if not self.at_end or not entries:
+            return
+
+        if self.logs_filter:
+            # Logs before the window end are shown by the search
+            logs_filter = self.logs_filter
+            start = self.window_end
+            self.window_end = end
+            self.append_entries([
+                entry for entry in entries
+                if entry[0] >= start and logs_filter.matches(entry[1])
+            ])
+            return
+
+        # The loaded logs and the new ones are not contiguous
+        if entries[0][0] != self.window_end:
+            self.load_latest()
+            return
+
+        self.window_end = end
+        self.append_entries(entries)
+
+    def load_latest(self):
+        """Loads the logs after the last loaded one, up to the end of the file.
+        """
+        for _ in range(MAX_LOGS // PAGE_SIZE):
+            self.load_newer()
+            if self.at_end:
+                return
+
+        # Too many new logs, go straight to the last ones
+        self.clear_logs()
+        self.load_last()
+
+    # Search
+
+    def set_filter(self, logs_filter: Optional[LogsFilter]):
+        """Shows only the logs which match the filter, which are looked for
+        in background (see LogsSearch). An empty filter shows every log again.
+        """
+        if not logs_filter or logs_filter.is_empty():
+            self.logs_search.cancel()
+            self.logs_filter = None
+            self.clear_logs()
+            self.load_last()
+            return
+
+        self.logs_filter = logs_filter
+        self.clear_logs()
+        # New logs are filtered as they are added, while searching the previous ones
+        self.window_end = self.logs_search.start(logs_filter)
+
+    def on_logs_found(self, search_id: int, entries: list[LogEntry]):
+        if self.logs_search.is_cancelled(search_id):
+            return
+
+        # Logs added during the search go after the ones found
+        self._loading = True
+        self.logs.prepend(entries)
+        excess = self.logs.rowCount() - MAX_LOGS
+        if excess > 0:
+            self.logs.remove(0, excess)
+        self._loading = False
+        self.scrollToBottom()
+
+    def show_in_context(self, index: QModelIndex):
+        """Stops filtering and shows the selected log among its neighbours.
+        """
+        if not self.logs_filter or not index.isValid():
+            return
+
+        offset = self.logs.get_offset(index.row())
+        self.logs_search.cancel()
+        self.logs_filter = None
+        self.clear_logs()
+
+        previous = self.reader.read_before(offset, PAGE_SIZE // 2)
+        entries, self.window_end = self.reader.read_after(offset, PAGE_SIZE // 2)
+        self.at_end = self.window_end >= self.reader.complete_size()
+        self.append_entries(previous + entries)
+
+        row = len(previous)
+        self.scrollTo(self.logs.index(row, 0), QAbstractItemView.PositionAtCenter)
+        self.selectRow(row)
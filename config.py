@@ -16,6 +16,14 @@ appConfig.load_config()
 USER_ID = appConfig.get_int('general', 'userid', 0)
 SERIAL_PORT = appConfig.get_str('serial', 'port', '')
 SERIAL_BAUDRATE = appConfig.get_int('serial', 'baudrate', 115200)
+STREAMING_MODE = appConfig.get_str('serial', 'streamingmode', 'timed')
+LOGS_MAX_SIZE = appConfig.get_int('logs', 'maxsizemb', 10) * 1024 * 1024
+LOGS_DAILY_ROTATION = appConfig.get_bool('logs', 'dailyrotation', True)
+DB_POOL_SIZE = appConfig.get_int('database', 'poolsize', 5)
+DB_MAX_OVERFLOW = appConfig.get_int('database', 'maxoverflow', 5)
+DB_POOL_TIMEOUT = appConfig.get_int('database', 'pooltimeout', 10)
+DB_POOL_RECYCLE = appConfig.get_int('database', 'poolrecycle', 1800)
+DB_NOTIFICATIONS = appConfig.get_bool('database', 'notifications', True)
 
 
 # Utility functions
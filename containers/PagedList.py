@@ -0,0 +1,84 @@
+from PyQt5.QtCore import pyqtSignal, Qt, QTimer
+from PyQt5.QtWidgets import QFrame, QScrollArea, QVBoxLayout, QWidget
+from typing import Optional
+
+# Constants
+FETCH_MARGIN = 200  # pixels
+
+
+class PagedList(QScrollArea):
+    """Scrollable list of widgets, which asks for more of them with `fetch_more`
+    when it's scrolled near its end, or when its widgets don't fill it, and with
+    `fetch_previous` when it's scrolled near its start.
+    """
+    fetch_more = pyqtSignal()
+    fetch_previous = pyqtSignal()
+
+    def __init__(self, parent=None):
+        super(PagedList, self).__init__(parent)
+
+        self.setWidgetResizable(True)
+        self.setFrameShape(QFrame.NoFrame)
+
+        content = QWidget()
+        self.items_layout = QVBoxLayout(content)
+        self.items_layout.setAlignment(Qt.AlignTop)
+        self.items_layout.setContentsMargins(0, 0, 0, 0)
+        self.setWidget(content)
+
+        # Widget to keep in place while the layout is updated (see keep_position)
+        self._anchor: Optional[tuple[QWidget, int]] = None
+
+        self.verticalScrollBar().valueChanged.connect(self.on_scroll)
+        self.verticalScrollBar().rangeChanged.connect(self.on_range_changed)
+
+    def check_fetch_more(self):
+        """Asks for more widgets if the list is scrolled near its end,
+        which is always the case while its widgets don't fill it.
+        """
+        self.on_scroll(self.verticalScrollBar().value())
+
+    def keep_position(self, widget: QWidget):
+        """Keeps the widget at the same position on screen once the layout is
+        updated, while other widgets are added or removed before it.
+        """
+        self._anchor = (widget, widget.y() - self.verticalScrollBar().value())
+        QTimer.singleShot(0, self.restore_position)
+
+    def restore_position(self):
+        if not self._anchor:
+            return
+        widget, position = self._anchor
+        self._anchor = None
+        try:
+            self.verticalScrollBar().setValue(widget.y() - position)
+        except RuntimeError:
+            # The widget was removed meanwhile
+            pass
+        self.check_fetch_more()
+
+    # EVENTS
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.check_fetch_more()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.check_fetch_more()
+
+    # SLOTS
+
+    def on_scroll(self, value: int):
+        # The position is not final until the layout is updated
+        if self._anchor:
+            return
+        maximum = self.verticalScrollBar().maximum()
+        if value >= maximum - FETCH_MARGIN:
+            self.fetch_more.emit()
+        # Only when the widgets fill the list, so it doesn't fetch in both directions
+        if maximum > 0 and value <= FETCH_MARGIN:
+            self.fetch_previous.emit()
+
+    def on_range_changed(self, minimum: int, maximum: int):
+        self.check_fetch_more()
@@ -0,0 +1,66 @@
+from PyQt5.QtGui import QCloseEvent
+from PyQt5.QtWidgets import QStackedWidget, QWidget
+from typing import Optional, TYPE_CHECKING
+from views.BaseView import BaseView
+
+if TYPE_CHECKING:
+    from MainWindow import MainWindow   # pragma: no cover
+
+
+class ViewStack(QStackedWidget):
+    """Stack of the views of the window, which keeps the views already
+    constructed, so going back to them doesn't construct them again.
+
+    Only the current view is active: the previous one is deactivated before
+    showing another one, and each view is activated when it's shown again
+    (see BaseView.activate and BaseView.deactivate).
+    """
+    def __init__(self, parent: 'MainWindow'):
+        super(ViewStack, self).__init__(parent)
+        self.views: dict[type, QWidget] = {}
+
+    def showView(self, view_class: type) -> QWidget:
+        """Shows the view of the given class, constructing it only if it
+        isn't cached or it can't be reused.
+        """
+        view = self.views.get(view_class)
+        if isinstance(view, BaseView) and not view.canReuse():
+            self.removeView(view_class)
+            view = None
+
+        current = self.currentWidget()
+        if view is not None and view is current:
+            return view
+        if isinstance(current, BaseView):
+            current.deactivate()
+
+        if view is None:
+            # Views find the window through their parent while they are constructed
+            view = view_class(self.window())
+            self.views[view_class] = view
+            self.addWidget(view)
+
+        self.setCurrentWidget(view)
+        if isinstance(view, BaseView):
+            view.activate()
+        return view
+
+    def getView(self, view_class: type) -> Optional[QWidget]:
+        return self.views.get(view_class)
+
+    def removeView(self, view_class: type):
+        view = self.views.pop(view_class, None)
+        if view is None:
+            return
+        if isinstance(view, BaseView) and view is self.currentWidget():
+            view.deactivate()
+        view.close()
+        self.removeWidget(view)
+        view.deleteLater()
+
+    def closeViews(self, event: QCloseEvent):
+        """Notifies all the views that the window is closed,
+        so they release their resources.
+        """
+        for view in self.views.values():
+            view.closeEvent(event)
@@ -0,0 +1,203 @@
+from config import USER_ID
+from core.database.models import File, Material, Tool
+from core.database.repositories.fileRepository import FileRepository
+from core.database.repositories.materialRepository import MaterialRepository
+from core.database.repositories.toolRepository import ToolRepository
+from helpers.dbSession import session_scope
+from helpers.itemsLoader import executor
+from sqlalchemy.orm import Session
+import threading
+from typing import Callable, Optional
+from typing_extensions import TypedDict
+
+# Constants
+FILES_CATALOG = 'files'
+MATERIALS_CATALOG = 'materials'
+TOOLS_CATALOG = 'tools'
+
+# Catalog of the items of each table, to invalidate it when they change
+CATALOG_TABLES = {
+    File.__tablename__: FILES_CATALOG,
+    Material.__tablename__: MATERIALS_CATALOG,
+    Tool.__tablename__: TOOLS_CATALOG
+}
+
+CatalogItem = TypedDict('CatalogItem', {
+    'id': int,
+    'name': str,
+    'description': str
+})
+
+
+def load_files(db_session: Session) -> list[CatalogItem]:
+    repository = FileRepository(db_session)
+    return [
+        {
+            'id': file.id,
+            'name': file.file_name,
+            'description': ''
+        } for file in repository.get_all_files_from_user(USER_ID)
+    ]
+
+
+def load_materials(db_session: Session) -> list[CatalogItem]:
+    repository = MaterialRepository(db_session)
+    return [
+        {
+            'id': material.id,
+            'name': material.name,
+            'description': material.description
+        } for material in repository.get_all_materials()
+    ]
+
+
+def load_tools(db_session: Session) -> list[CatalogItem]:
+    repository = ToolRepository(db_session)
+    return [
+        {
+            'id': tool.id,
+            'name': tool.name,
+            'description': tool.description
+        } for tool in repository.get_all_tools()
+    ]
+
+
+class CatalogCache:
+    """In-process cache of the names and descriptions of the tools, materials
+    and files of the user, shared by all the widgets.
+
+    Each catalog is loaded from the database the first time it's needed, and
+    kept until it's invalidated by a change in its entities (see `invalidate`).
+    It can be used from any thread, but the GUI thread must only use the
+    methods which never query the database (see `get_cached`).
+    """
+    # CLASS ATTRIBUTES
+    loaders: dict[str, Callable[[Session], list[CatalogItem]]] = {
+        FILES_CATALOG: load_files,
+        MATERIALS_CATALOG: load_materials,
+        TOOLS_CATALOG: load_tools
+    }
+    catalogs: dict[str, list[CatalogItem]] = {}
+    # Invalidations of each catalog, to discard loads which started before them
+    versions: dict[str, int] = {}
+    # Versions of the catalogs being loaded in background
+    warming: dict[str, int] = {}
+    lock = threading.Lock()
+
+    # STATIC METHODS
+
+    @classmethod
+    def get(cls, catalog: str, db_session: Optional[Session] = None) -> list[CatalogItem]:
+        """Returns the items of the catalog, loading it with the given session
+        (or a new one) if it's not cached.
+        """
+        with cls.lock:
+            if catalog in cls.catalogs:
+                return cls.catalogs[catalog]
+            version = cls.versions.get(catalog, 0)
+
+        if db_session:
+            items = cls.loaders[catalog](db_session)
+        else:
+            with session_scope() as new_session:
+                items = cls.loaders[catalog](new_session)
+
+        with cls.lock:
+            if cls.versions.get(catalog, 0) == version:
+                cls.catalogs[catalog] = items
+        return items
+
+    @classmethod
+    def get_cached(cls, catalog: str) -> Optional[list[CatalogItem]]:
+        """Returns the items of the catalog only if it's cached, so it never
+        queries the database. Otherwise, it starts loading the catalog in
+        background (see `warm`) and returns None.
+        """
+        with cls.lock:
+            items = cls.catalogs.get(catalog)
+        if items is None:
+            cls.warm(catalog)
+        return items
+
+    @classmethod
+    def get_item(
+        cls,
+        catalog: str,
+        item_id: int,
+        db_session: Optional[Session] = None
+    ) -> Optional[CatalogItem]:
+        return cls.find_item(cls.get(catalog, db_session), item_id)
+
+    @classmethod
+    def get_files(cls, db_session: Optional[Session] = None) -> list[CatalogItem]:
+        return cls.get(FILES_CATALOG, db_session)
+
+    @classmethod
+    def get_materials(cls, db_session: Optional[Session] = None) -> list[CatalogItem]:
+        return cls.get(MATERIALS_CATALOG, db_session)
+
+    @classmethod
+    def get_tools(cls, db_session: Optional[Session] = None) -> list[CatalogItem]:
+        return cls.get(TOOLS_CATALOG, db_session)
+
+    @classmethod
+    def get_tool(cls, tool_id: int) -> Optional[CatalogItem]:
+        """Returns the tool only if the tools are cached (see `get_cached`).
+        """
+        return cls.find_item(cls.get_cached(TOOLS_CATALOG) or [], tool_id)
+
+    @classmethod
+    def warm(cls, catalog: str):
+        """Loads the catalog in background, unless it's cached or already loading.
+        """
+        with cls.lock:
+            # Loads which started before an invalidation are discarded
+            version = cls.versions.get(catalog, 0)
+            if catalog in cls.catalogs or cls.warming.get(catalog) == version:
+                return
+            cls.warming[catalog] = version
+        executor.submit(cls._warm, catalog, version)
+
+    @classmethod
+    def _warm(cls, catalog: str, version: int):
+        # Failed loads are retried the next time the catalog is needed
+        try:
+            cls.get(catalog)
+        finally:
+            with cls.lock:
+                if cls.warming.get(catalog) == version:
+                    del cls.warming[catalog]
+
+    @classmethod
+    def invalidate(cls, catalog: Optional[str] = None):
+        """Removes the catalog from the cache, or all of them if none is given,
+        so they are loaded again the next time they are needed.
+        """
+        with cls.lock:
+            for name in [catalog] if catalog else list(cls.loaders):
+                cls.catalogs.pop(name, None)
+                cls.versions[name] = cls.versions.get(name, 0) + 1
+
+    @classmethod
+    def on_db_changed(cls, table: str, operation: str, row_id: int):
+        """Invalidates the catalog of the table changed in the database, if any
+        (see DbChangesListener), and loads it again in background.
+        """
+        catalog = CATALOG_TABLES.get(table)
+        if catalog:
+            cls.invalidate(catalog)
+            cls.warm(catalog)
+
+    @classmethod
+    def on_db_reconnected(cls):
+        # Changes made while disconnected were not notified
+        cls.invalidate()
+        for catalog in cls.loaders:
+            cls.warm(catalog)
+
+    @staticmethod
+    def find_item(items: list[CatalogItem], item_id: int) -> Optional[CatalogItem]:
+        for item in items:
+            if item['id'] == item_id:
+                return item
+        return None
@@ -1,56 +1,235 @@
 from celery.result import AsyncResult
 from core.cncworker.app import app
+from core.utils.storage import get_value, get_value_from_id
+from core.worker import WORKER_IS_PAUSED_KEY
 from functools import reduce
 from PyQt5.QtCore import pyqtSignal, QObject, QTimer
+import threading
+import time
+from typing import Any, Optional
+from typing_extensions import TypedDict
 
 # Constants
 STATUS_POLL = 100  # miliseconds
+SUBSCRIPTION_TIMEOUT = 1.0  # seconds
+
+
+WorkerHealth = TypedDict('WorkerHealth', {
+    'on': bool,
+    'running': bool,
+    'updated_at': float
+})
+
+# Details of the worker, as reported by Celery's inspect commands
+WorkerStatus = TypedDict('WorkerStatus', {
+    'availability': Any,
+    'stats': Any,
+    'registered_tasks': Any,
+    'active_tasks': Any,
+    'updated_at': Optional[float]   # None while the status is unknown
+})
+
+UNKNOWN_WORKER_STATUS: WorkerStatus = {
+    'availability': None,
+    'stats': None,
+    'registered_tasks': None,
+    'active_tasks': None,
+    'updated_at': None
+}
+
+WorkerTaskState = TypedDict('WorkerTaskState', {
+    'status': str,
+    'info': Any
+})
+
+# State of the worker for a group of tasks, queried at once
+WorkerSnapshot = TypedDict('WorkerSnapshot', {
+    'paused': bool,
+    'states': dict[int, WorkerTaskState]     # By ID of the task in DB
+})
+
+
+def get_task_channel(task_id: str) -> bytes:
+    """Returns the channel where Celery's Redis result backend
+    publishes every state update of the task.
+    """
+    return app.backend.get_key_for_task(task_id)
+
+
+def get_backend_client():
+    """Returns the Redis client of the Celery result backend, if it uses Redis.
+    """
+    return getattr(app.backend, 'client', None)
+
+
+def get_id_key(prefix: str, item_id: int) -> str:
+    """Returns the key where the storage of the core (see core.utils.storage)
+    keeps a value with an ID, like the worker task of a DB task.
+    """
+    return f'{prefix}_{item_id}'
+
+
+def decode_value(value) -> Optional[str]:
+    if isinstance(value, bytes):
+        return value.decode()
+    return value
 
 
 class CncWorkerMonitor(QObject):
     """Utility class to monitor the status of the active task in worker
     and know if it is finished.
+
+    By default, it subscribes to the Redis channel where the result backend
+    publishes the task's state updates, and listens to it from a background
+    thread. When the subscription is not possible, it falls back to polling
+    the result backend every STATUS_POLL miliseconds.
+    In both cases, signals are only emitted when the task's state changes.
     """
     # CLASS ATTRIBUTES
     device_enabled = True
+    # Last known state of the worker, updated by WorkerHealthProbe
+    worker_health: Optional[WorkerHealth] = None
+    worker_status: Optional[WorkerStatus] = None
+    worker_status_requested = False
 
     # SIGNALS
 
     task_new_status = pyqtSignal(int, int, int, object, object)
     task_finished = pyqtSignal()
     task_failed = pyqtSignal(str)
+    subscription_lost = pyqtSignal()
 
     # CONSTRUCTOR
 
-    def __init__(self):
+    def __init__(self, redis_client=None, subscribe: bool = True):
         super().__init__()
 
         # Attributes definition
         self.active_task = ''
+        self.redis_client = redis_client
+        self.subscribe = subscribe
+        self._last_state: Optional[tuple[str, Any]] = None
 
         # Create and configure timer
         self.monitor = QTimer(self)
         self.monitor.setInterval(STATUS_POLL)
         self.monitor.timeout.connect(self.check_task_status)
 
+        # Thread configuration
+        self.listener: Optional[threading.Thread] = None
+        self._stop_listening = threading.Event()
+        self._pubsub = None
+        self.subscription_lost.connect(self.monitor.start)
+
     # FLOW CONTROL
 
     def start_task_monitor(
         self,
         task_id: str
     ):
+        self.stop_subscription()
         self.active_task = task_id
+        self._last_state = None
+        self.update_worker_health(running=True)
+
+        if self.subscribe and self.start_subscription():
+            return
+
         self.monitor.start()
 
     def stop_task_monitor(self):
         self.monitor.stop()
+        self.stop_subscription()
+
+    def start_subscription(self) -> bool:
+        """Subscribes to the task's state updates in the result backend.
+        Returns False when it is not possible.
+        """
+        client = self.redis_client or get_backend_client()
+        if not client:
+            return False
+
+        try:
+            pubsub = client.pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(get_task_channel(self.active_task))
+        except Exception:
+            return False
+
+        # Each listener has its own flag, since a stopped one may still be finishing
+        self._stop_listening = threading.Event()
+        self._pubsub = pubsub
+        self.listener = threading.Thread(
+            target=self.listen,
+            args=(pubsub, self._stop_listening),
+            daemon=True
+        )
+        self.listener.start()
+        return True
+
+    def stop_subscription(self):
+        """Stops listening without waiting for the listener thread, so the GUI
+        never blocks. Closing the connection wakes the thread up, and it ends
+        by itself without notifying anything else.
+        """
+        self._stop_listening.set()
+        if self._pubsub:
+            try:
+                self._pubsub.close()
+            except Exception:
+                pass
+        self._pubsub = None
+        self.listener = None
+
+    def listen(self, pubsub, stop_listening: threading.Event):
+        """Main loop of the listener thread.
+        """
+        # Catch up with the updates published before subscribing
+        try:
+            finished = self.check_task_state()
+        except Exception:
+            finished = False
+
+        while not finished and not stop_listening.is_set():
+            try:
+                message = pubsub.get_message(timeout=SUBSCRIPTION_TIMEOUT)
+            except Exception:
+                # The connection is also closed when the subscription is stopped
+                if not stop_listening.is_set():
+                    self.subscription_lost.emit()
+                break
+
+            if not message or stop_listening.is_set():
+                continue
+
+            task_meta = app.backend.decode_result(message['data'])
+            finished = self.process_task_state(task_meta['status'], task_meta['result'])
+
+        pubsub.close()
 
     # SLOTS
 
     def check_task_status(self):
-        task_state = AsyncResult(self.active_task)
+        if self.check_task_state():
+            self.stop_task_monitor()
+
+    # UTILITIES
+
+    def check_task_state(self) -> bool:
+        """Queries the task's state in the result backend.
+        Returns whether the task is finished.
+        """
+        task_state: AsyncResult = AsyncResult(self.active_task)
         task_info = task_state.info
         task_status = task_state.status
+        return self.process_task_state(task_status, task_info)
+
+    def process_task_state(self, task_status: str, task_info) -> bool:
+        """Emits the signal corresponding to the task's state, if it changed.
+        Returns whether the task is finished.
+        """
+        if self._last_state == (task_status, task_info):
+            return False
+        self._last_state = (task_status, task_info)
 
         if task_status == 'PROGRESS':
             sent_lines = task_info.get('sent_lines')
@@ -69,19 +248,42 @@ class CncWorkerMonitor(QObject):
 
         if task_status == 'SUCCESS':
             self.set_device_enabled(False)
-            self.stop_task_monitor()
+            self.update_worker_health(running=False)
             self.task_finished.emit()
+            return True
 
         if task_status == 'FAILURE':
             self.set_device_enabled(False)
-            self.stop_task_monitor()
+            self.update_worker_health(running=False)
             self.task_failed.emit(str(task_info))
+            return True
+
+        return False
 
     # STATIC METHODS
 
     @classmethod
-    def is_worker_on(cls):
-        """Returns whether the worker process is running.
+    def is_worker_on(cls) -> bool:
+        """Returns whether the worker process is running, as last checked by
+        WorkerHealthProbe. It's False while the state is unknown.
+        """
+        if cls.worker_health:
+            return cls.worker_health['on']
+        return False
+
+    @classmethod
+    def is_worker_running(cls) -> bool:
+        """Returns whether the worker process is working on a task, as last
+        checked by WorkerHealthProbe. It's False while the state is unknown.
+        """
+        if cls.worker_health:
+            return cls.worker_health['running']
+        return False
+
+    @classmethod
+    def probe_worker_on(cls) -> bool:
+        """Queries the worker to know whether it is running.
+        This is a broadcast call, which blocks until the worker answers or it times out.
         """
         try:
             return not not app.control.ping()
@@ -89,8 +291,9 @@ class CncWorkerMonitor(QObject):
             return False
 
     @classmethod
-    def is_worker_running(cls):
-        """Returns whether the worker process is working on a task.
+    def probe_worker_running(cls) -> bool:
+        """Queries the worker to know whether it is working on a task.
+        This is a broadcast call, which blocks until the worker answers or it times out.
         """
         inspector = app.control.inspect()
         try:
@@ -107,20 +310,93 @@ class CncWorkerMonitor(QObject):
             return False
 
     @classmethod
-    def get_worker_status(cls):
+    def get_worker_status(cls) -> WorkerStatus:
+        """Returns the details of the worker, as last checked by WorkerHealthProbe,
+        and requests the probe to check them again in its next check.
+        Its `updated_at` is None while they are unknown.
+        """
+        cls.worker_status_requested = True
+        return cls.worker_status or UNKNOWN_WORKER_STATUS
+
+    @classmethod
+    def probe_worker_status(cls) -> WorkerStatus:
+        """Queries the details of the worker.
+        These are broadcast calls, which block until the worker answers or they time out.
+        """
         inspector = app.control.inspect()
 
         availability = inspector.ping()
         stats = inspector.stats()
         registered_tasks = inspector.registered()
         active_tasks = inspector.active()
-        result = {
+        return {
             'availability': availability,
             'stats': stats,
             'registered_tasks': registered_tasks,
-            'active_tasks': active_tasks
+            'active_tasks': active_tasks,
+            'updated_at': time.time()
+        }
+
+    @classmethod
+    def get_tasks_states(cls, task_ids: list[str]) -> dict[str, WorkerTaskState]:
+        """Returns the states of the given worker tasks in the result backend.
+
+        Key-value backends, like the Redis one, are queried with a single
+        MGET instead of one query per task.
+        """
+        backend = app.backend
+        if not hasattr(backend, 'mget'):
+            states: dict[str, WorkerTaskState] = {}
+            for task_id in task_ids:
+                task_state: AsyncResult = AsyncResult(task_id)
+                states[task_id] = {'status': task_state.status, 'info': task_state.info}
+            return states
+
+        if not task_ids:
+            return {}
+        values = backend.mget([backend.get_key_for_task(task_id) for task_id in task_ids])
+
+        states = {}
+        for task_id, value in zip(task_ids, values):
+            # Unknown tasks are pending, like in AsyncResult
+            if not value:
+                states[task_id] = {'status': 'PENDING', 'info': None}
+                continue
+            task_meta = backend.decode_result(value)
+            states[task_id] = {'status': task_meta['status'], 'info': task_meta['result']}
+        return states
+
+    @classmethod
+    def get_worker_snapshot(cls, db_task_ids: list[int]) -> WorkerSnapshot:
+        """Returns the state in the worker of the given DB tasks, along with
+        whether the worker is paused.
+
+        The IDs of the worker tasks and the pause flag are read from Redis with
+        a single MGET, and then the states of all the tasks at once (see
+        get_tasks_states). Without a Redis client, they're read one by one.
+        """
+        client = get_backend_client()
+        if client:
+            keys = [get_id_key('task', db_task_id) for db_task_id in db_task_ids]
+            values = [decode_value(value) for value in client.mget(keys + [WORKER_IS_PAUSED_KEY])]
+            paused = values.pop()
+        else:
+            values = [get_value_from_id('task', db_task_id) for db_task_id in db_task_ids]
+            paused = get_value(WORKER_IS_PAUSED_KEY)
+
+        worker_task_ids: dict[int, str] = {
+            db_task_id: worker_task_id
+            for db_task_id, worker_task_id in zip(db_task_ids, values)
+            if worker_task_id
+        }
+        states = cls.get_tasks_states(list(worker_task_ids.values()))
+        return {
+            'paused': not not paused,
+            'states': {
+                db_task_id: states[worker_task_id]
+                for db_task_id, worker_task_id in worker_task_ids.items()
+            }
         }
-        return result
 
     @classmethod
     def is_device_enabled(cls):
@@ -135,3 +411,28 @@ class CncWorkerMonitor(QObject):
     @classmethod
     def set_device_enabled(cls, enabled: bool):
         cls.device_enabled = enabled
+
+    @classmethod
+    def get_worker_health(cls) -> Optional[WorkerHealth]:
+        return cls.worker_health
+
+    @classmethod
+    def set_worker_health(cls, health: Optional[WorkerHealth]):
+        cls.worker_health = health
+
+    @classmethod
+    def set_worker_status(cls, status: Optional[WorkerStatus]):
+        cls.worker_status = status
+        cls.worker_status_requested = False
+
+    @classmethod
+    def update_worker_health(cls, running: bool):
+        """Updates the cached activity of the worker, if there is a cached state.
+        """
+        if not cls.worker_health:
+            return
+        cls.worker_health = {
+            'on': cls.worker_health['on'] or running,
+            'running': running,
+            'updated_at': time.time()
+        }
@@ -0,0 +1,156 @@
+from core.database.base import Session as SessionLocal
+import json
+from PyQt5.QtCore import pyqtSignal, QObject
+import select
+from sqlalchemy.engine import Engine
+import threading
+from typing import Optional
+from typing_extensions import TypedDict
+
+# Constants
+# Channel of the triggers defined in rpi/db_schema.sql
+CHANGES_CHANNEL = 'cnc_admin_changes'
+LISTEN_TIMEOUT = 1.0    # seconds
+RECONNECT_DELAY = 5.0   # seconds
+
+INSERT_OPERATION = 'INSERT'
+UPDATE_OPERATION = 'UPDATE'
+DELETE_OPERATION = 'DELETE'
+
+# Row-level change, as notified by the triggers
+DbChange = TypedDict('DbChange', {
+    'table': str,
+    'operation': str,   # INSERT, UPDATE or DELETE
+    'id': int
+})
+
+
+def get_engine() -> Engine:
+    return SessionLocal.kw['bind']
+
+
+def supports_notifications(engine: Engine) -> bool:
+    return engine.dialect.name == 'postgresql'
+
+
+def parse_change(payload: str) -> Optional[DbChange]:
+    """Returns the change notified by a trigger, or None if the payload is invalid.
+    """
+    try:
+        data = json.loads(payload)
+        return {
+            'table': str(data['table']),
+            'operation': str(data['operation']),
+            'id': int(data['id'])
+        }
+    except (ValueError, TypeError, KeyError):
+        return None
+
+
+class DbChangesListener(QObject):
+    """Utility class to listen to the changes in the rows of the tables of
+    tasks, files, tools, materials and users, made by any client of the
+    database (for example, other panels), which are notified by the triggers
+    defined in the schema.
+
+    It keeps a dedicated connection, which listens to CHANGES_CHANNEL from a
+    background thread, so the changes arrive as soon as they are committed
+    without polling the database.
+
+    When the connection is lost, it's opened again every RECONNECT_DELAY
+    seconds. Changes made in the meantime are not notified, so `reconnected`
+    is emitted to update everything at once.
+    """
+    # SIGNALS
+    changed = pyqtSignal(str, str, int)     # table, operation, ID of the row
+    reconnected = pyqtSignal()
+
+    # CONSTRUCTOR
+
+    def __init__(self, engine: Optional[Engine] = None):
+        super().__init__()
+
+        # Attributes definition
+        self.engine = engine
+
+        # Thread configuration
+        self.listener_thread: Optional[threading.Thread] = None
+        self._stop_listening = threading.Event()
+
+    # FLOW CONTROL
+
+    def start(self) -> bool:
+        """Starts listening in background. Returns False when the database
+        doesn't support notifications.
+        """
+        if self.listener_thread:
+            return True
+        if not supports_notifications(self.engine or get_engine()):
+            return False
+
+        self._stop_listening.clear()
+        self.listener_thread = threading.Thread(target=self.run, daemon=True)
+        self.listener_thread.start()
+        return True
+
+    def stop(self):
+        if not self.listener_thread:
+            return
+        self._stop_listening.set()
+        self.listener_thread.join()
+        self.listener_thread = None
+
+    def run(self):
+        """Main loop of the listener thread.
+        """
+        connected_before = False
+        while not self._stop_listening.is_set():
+            try:
+                connection = self.connect()
+            except Exception:
+                self._stop_listening.wait(RECONNECT_DELAY)
+                continue
+
+            if connected_before:
+                self.reconnected.emit()
+            connected_before = True
+
+            try:
+                self.listen(connection)
+            except Exception:
+                self._stop_listening.wait(RECONNECT_DELAY)
+            finally:
+                connection.close()
+
+    # UTILITIES
+
+    def connect(self):
+        """Opens a connection out of the pool, in autocommit mode so
+        notifications are delivered, and listens to CHANGES_CHANNEL in it.
+        """
+        engine = self.engine or get_engine()
+        connection = engine.raw_connection()
+        connection.detach()
+        connection.driver_connection.autocommit = True
+        cursor = connection.cursor()
+        cursor.execute(f'LISTEN {CHANGES_CHANNEL}')
+        cursor.close()
+        return connection
+
+    def listen(self, connection):
+        driver_connection = connection.driver_connection
+        while not self._stop_listening.is_set():
+            ready, _, _ = select.select([driver_connection], [], [], LISTEN_TIMEOUT)
+            if not ready:
+                continue
+
+            driver_connection.poll()
+            while driver_connection.notifies:
+                notification = driver_connection.notifies.pop(0)
+                self.notify(notification.payload)
+
+    def notify(self, payload: str):
+        change = parse_change(payload)
+        if not change:
+            return
+        self.changed.emit(change['table'], change['operation'], change['id'])
@@ -0,0 +1,64 @@
+from contextlib import contextmanager
+from core.database.base import Session as SessionLocal
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from typing import Iterator
+
+# Constants
+DEFAULT_POOL_SIZE = 5
+DEFAULT_MAX_OVERFLOW = 5
+DEFAULT_POOL_TIMEOUT = 10   # seconds
+DEFAULT_POOL_RECYCLE = 1800     # seconds
+
+
+def configure_engine(
+    pool_size: int = DEFAULT_POOL_SIZE,
+    max_overflow: int = DEFAULT_MAX_OVERFLOW,
+    pool_timeout: int = DEFAULT_POOL_TIMEOUT,
+    pool_recycle: int = DEFAULT_POOL_RECYCLE
+) -> Engine:
+    """Binds the sessions to an engine for the same database, whose pool keeps
+    a bounded amount of connections, recycles the old ones and checks them
+    before their use, so a long running app survives database restarts.
+
+    SQLite engines, which don't use a queue of connections, are kept as they are.
+    """
+    engine: Engine = SessionLocal.kw['bind']
+    if engine.dialect.name == 'sqlite':
+        return engine
+
+    tuned_engine = create_engine(
+        engine.url,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=pool_timeout,
+        pool_recycle=pool_recycle,
+        pool_pre_ping=True
+    )
+    SessionLocal.configure(bind=tuned_engine)
+    engine.dispose()
+    return tuned_engine
+
+
+@contextmanager
+def session_scope(read_only: bool = False) -> Iterator[Session]:
+    """Provides a session for a unit of work: its changes are committed when
+    the block ends, or rolled back if it raises an exception. The session is
+    always closed, returning its connection to the pool.
+
+    Loaded objects aren't expired by the commit, so they can still be read
+    after the block, without querying the database again.
+
+    Read-only sessions, used for loads, are never committed.
+    """
+    db_session = SessionLocal(expire_on_commit=False)
+    try:
+        yield db_session
+        if not read_only:
+            db_session.commit()
+    except Exception:
+        db_session.rollback()
+        raise
+    finally:
+        db_session.close()
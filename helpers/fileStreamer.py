@@ -1,13 +1,283 @@
+from collections import deque
 from core.gcode.gcodeFileSender import GcodeFileSender, FinishedFile
 from core.grbl.grblController import GrblController
-from PyQt5.QtCore import pyqtSignal, QObject, QTimer
+from PyQt5.QtCore import pyqtSignal, QObject, QThread
+import re
+import threading
+import time
+from typing import Optional, TextIO
 
 # Constants
 SEND_INTERVAL = 100     # miliseconds
+PROGRESS_INTERVAL = 50  # miliseconds
+GRBL_RX_BUFFER_SIZE = 128   # bytes
+
+# Streaming modes
+MODE_TIMED = 'timed'
+MODE_CHARACTER_COUNTING = 'character-counting'
+
+# GRBL responses which free space in its RX buffer
+ACKNOWLEDGEMENT_PATTERN = re.compile(r'(^|\s)(ok|error:\d+)\s*$')
+# Comments and whitespaces, which GRBL ignores
+COMMENT_PATTERN = re.compile(r'\(.*?\)|;.*$')
+
+
+def is_acknowledgement(message: str) -> bool:
+    """Returns whether the message is a GRBL response to a sent line ('ok' or 'error:X').
+    """
+    return ACKNOWLEDGEMENT_PATTERN.search(message.strip()) is not None
+
+
+class RxBufferCounter:
+    """Keeps track of the characters sent to GRBL which are still in its RX buffer.
+
+    It's thread-safe: lines are pushed by the streaming thread, and released by
+    the thread which reads the GRBL responses.
+    """
+    def __init__(self, size: int = GRBL_RX_BUFFER_SIZE):
+        self.size = size
+        self._in_flight: deque[int] = deque()
+        self._used = 0
+        self._lock = threading.Lock()
+
+    def fits(self, length: int) -> bool:
+        """Returns whether a line of the given length fits in the buffer.
+        An empty buffer always accepts a line, even if it is bigger than the buffer.
+        """
+        with self._lock:
+            return not self._in_flight or self._used + length <= self.size
+
+    def push(self, length: int):
+        with self._lock:
+            self._in_flight.append(length)
+            self._used += length
+
+    def release(self) -> bool:
+        """Frees the space of the oldest line in the buffer.
+        Returns False when there were no lines waiting for a response.
+        """
+        with self._lock:
+            if not self._in_flight:
+                return False
+            self._used -= self._in_flight.popleft()
+            return True
+
+    def reset(self):
+        with self._lock:
+            self._in_flight.clear()
+            self._used = 0
+
+    def used(self) -> int:
+        with self._lock:
+            return self._used
+
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._in_flight)
+
+
+class FileStreamerWorker(QObject):
+    """Sends a file to the GRBL device from its own thread, so the streaming
+    never depends on the responsiveness of the GUI.
+
+    The state shared with the GUI thread (pause status, RX buffer) is
+    protected by `condition`, which also wakes the worker up when it changes.
+    """
+    # SIGNALS
+    finished = pyqtSignal()
+    sent_line = pyqtSignal(int)
+
+    # CONSTRUCTOR
+
+    def __init__(
+        self,
+        file_sender: GcodeFileSender,
+        grbl_controller: GrblController,
+        mode: str,
+        condition: threading.Condition
+    ):
+        super().__init__()
+
+        # Attributes definition
+        self.file_sender = file_sender
+        self.grbl_controller = grbl_controller
+        self.mode = mode
+        self.rx_buffer = RxBufferCounter()
+        self._condition = condition
+        self._file: Optional[TextIO] = None
+        self._next_line: Optional[str] = None
+        self._running = True
+        self.current_line = 0
+
+        # Progress throttling
+        self._last_report = 0.0
+        self._unreported_line: Optional[int] = None
+
+    # FLOW CONTROL
+
+    def run(self):
+        with self._condition:
+            if self.mode == MODE_CHARACTER_COUNTING:
+                self._open_file()
+                self._stream_by_character_counting()
+            else:
+                self._stream_by_interval()
+
+            self._close_file()
+            self.report_progress(force=True)
+
+    def stop(self):
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
+
+    def is_running(self) -> bool:
+        return self._running
+
+    def _stream_by_interval(self):
+        while self._running:
+            if self.file_sender.is_paused():
+                self.report_progress(force=True)
+                self._condition.wait_for(
+                    lambda: not self._running or not self.file_sender.is_paused()
+                )
+                continue
+
+            self.send_line()
+            self._condition.wait_for(lambda: not self._running, SEND_INTERVAL / 1000)
+
+    def _stream_by_character_counting(self):
+        while self._running:
+            self.fill_buffer()
+            if not self._running:
+                return
+
+            self.report_progress()
+            # Wait for a response, or for the pending progress to be due
+            timeout = PROGRESS_INTERVAL / 1000 if self._unreported_line else None
+            self._condition.wait(timeout)
+
+    def _finish(self):
+        self._running = False
+        self.file_sender.stop()
+        self._close_file()
+        self.report_progress(force=True)
+        self.finished.emit()
+
+    # UTILITIES
+
+    def _open_file(self):
+        self._file = open(self.file_sender.file_path, 'r')
+        self._next_line = None
+        self.current_line = 0
+        self.rx_buffer.reset()
+
+    def _close_file(self):
+        if self._file:
+            self._file.close()
+            self._file = None
+
+    def _peek_line(self) -> Optional[str]:
+        """Returns the next line to send, without comments nor whitespaces,
+        or None when the end of the file was reached.
+        Lines with nothing to send are skipped, but still counted.
+        """
+        if self._next_line is not None:
+            return self._next_line
+
+        while self._file:
+            raw_line = self._file.readline()
+            if not raw_line:
+                return None
+            self.current_line += 1
+            line = COMMENT_PATTERN.sub('', raw_line).strip()
+            if line:
+                self._next_line = line
+                return line
+        return None
+
+    def report_progress(self, line: Optional[int] = None, force: bool = False):
+        """Emits the last sent line, at most once every PROGRESS_INTERVAL miliseconds.
+        """
+        if line is not None:
+            self._unreported_line = line
+
+        if self._unreported_line is None:
+            return
+
+        now = time.monotonic()
+        if not force and (now - self._last_report) * 1000 < PROGRESS_INTERVAL:
+            return
+
+        self.sent_line.emit(self._unreported_line)
+        self._unreported_line = None
+        self._last_report = now
+
+    # SLOTS
+
+    def send_line(self):
+        """Sends the next line of the file (timed mode).
+        """
+        with self._condition:
+            try:
+                self.current_line = self.file_sender.send_line()
+            except FinishedFile:
+                self._finish()
+                return
+
+            self.report_progress(self.current_line)
+
+    def fill_buffer(self):
+        """Sends as many lines as fit in GRBL's RX buffer (character-counting mode).
+        """
+        with self._condition:
+            while self._running and not self.file_sender.is_paused():
+                line = self._peek_line()
+                if line is None:
+                    self._finish()
+                    return
+
+                # GRBL also stores the line break in its buffer
+                length = len(line) + 1
+                if not self.rx_buffer.fits(length):
+                    return
+
+                self.grbl_controller.sendCommand(line)
+                self.rx_buffer.push(length)
+                self._next_line = None
+                self.report_progress(self.current_line)
+
+    def handle_responses(self, messages: list[str]):
+        """Frees space in the RX buffer when GRBL responds to lines (character-counting mode).
+        """
+        acknowledged = sum(1 for message in messages if is_acknowledgement(message))
+        if not acknowledged:
+            return
+
+        with self._condition:
+            if not self._running:
+                return
+            released = False
+            for _ in range(acknowledged):
+                released = self.rx_buffer.release() or released
+            if released:
+                self._condition.notify_all()
 
 
 class FileStreamer(QObject):
     """Utility class to open a file and send it to the GRBL device, line by line.
+
+    The file is streamed from a dedicated thread (see FileStreamerWorker),
+    and the progress is reported back through throttled queued signals.
+
+    It supports two streaming modes:
+    - MODE_TIMED: Sends one line every SEND_INTERVAL miliseconds.
+    - MODE_CHARACTER_COUNTING: Keeps GRBL's RX buffer as full as possible,
+    sending new lines whenever a response ('ok' or 'error') frees space in it.
+    Responses must be notified via the `handle_responses` slot, which is
+    thread-safe and can be called from the thread reading the GRBL logs.
+    Every response is taken as the one of the oldest line of the file, so no
+    other command can be sent while it streams (see `is_exclusive`).
     """
     # SIGNALS
     finished = pyqtSignal()
@@ -15,52 +285,109 @@ class FileStreamer(QObject):
 
     # CONSTRUCTOR
 
-    def __init__(self, grbl_controller: GrblController):
+    def __init__(self, grbl_controller: GrblController, mode: str = MODE_TIMED):
         super().__init__()
 
         # Attributes definition
+        self.grbl_controller = grbl_controller
         self.file_sender = GcodeFileSender(grbl_controller, '')
+        self.mode = mode
 
-        # Create and configure timers
-        self.file_manager = QTimer(self)
-        self.file_manager.setInterval(SEND_INTERVAL)
-        self.file_manager.timeout.connect(self.send_line)
+        # Thread configuration
+        self._condition = threading.Condition()
+        self.streaming_thread: Optional[QThread] = None
+        self.streaming_worker: Optional[FileStreamerWorker] = None
 
     # FLOW CONTROL
 
     def start(self):
-        self.file_sender.start()
-        self.file_manager.start()
+        self.stop()
+
+        with self._condition:
+            self.file_sender.start()
+
+        self.streaming_worker = FileStreamerWorker(
+            self.file_sender,
+            self.grbl_controller,
+            self.mode,
+            self._condition
+        )
+        # Create a QThread object
+        self.streaming_thread = QThread(self)
+        # Move worker to the thread
+        self.streaming_worker.moveToThread(self.streaming_thread)
+        # Connect signals and slots
+        self.streaming_thread.started.connect(self.streaming_worker.run)
+        self.streaming_worker.sent_line.connect(self.sent_line)
+        self.streaming_worker.finished.connect(self.on_worker_finished)
+        # Release both objects once the thread ends
+        self.streaming_thread.finished.connect(self.streaming_worker.deleteLater)
+        self.streaming_thread.finished.connect(self.streaming_thread.deleteLater)
+        # Start the thread
+        self.streaming_thread.start()
+
+    def is_running(self) -> bool:
+        return self.streaming_thread is not None
+
+    def is_exclusive(self) -> bool:
+        """Returns whether other commands must not be sent to GRBL while the
+        file streams, because their responses would free space in the RX buffer
+        which the lines of the file still use (character-counting mode).
+        """
+        return self.mode == MODE_CHARACTER_COUNTING and self.is_running()
 
     def is_paused(self) -> bool:
-        return self.file_sender.is_paused()
+        with self._condition:
+            return self.file_sender.is_paused()
 
     def pause(self):
-        self.file_sender.pause()
+        with self._condition:
+            self.file_sender.pause()
+            self._condition.notify_all()
 
     def resume(self):
-        self.file_sender.resume()
+        with self._condition:
+            self.file_sender.resume()
+            self._condition.notify_all()
 
     def toggle_paused(self):
-        self.file_sender.toggle_paused()
+        with self._condition:
+            self.file_sender.toggle_paused()
+            self._condition.notify_all()
 
     def stop(self):
-        self.file_manager.stop()
-        self.file_sender.stop()
+        if self.streaming_worker:
+            self.streaming_worker.stop()
+        self._release_thread()
+
+        with self._condition:
+            self.file_sender.stop()
+
+    def _release_thread(self):
+        if not self.streaming_thread:
+            return
+        self.streaming_thread.quit()
+        self.streaming_thread.wait()
+        self.streaming_thread = None
+        with self._condition:
+            self.streaming_worker = None
 
     # UTILITIES
 
     def set_file(self, file_path: str):
         self.file_sender.set_file(file_path)
 
+    def set_mode(self, mode: str):
+        self.mode = mode
+
     # SLOTS
 
-    def send_line(self):
-        try:
-            self.current_line = self.file_sender.send_line()
-        except FinishedFile:
-            self.stop()
-            self.finished.emit()
-            return
+    def handle_responses(self, messages: list[str]):
+        with self._condition:
+            worker = self.streaming_worker
+        if worker:
+            worker.handle_responses(messages)
 
-        self.sent_line.emit(self.current_line)
+    def on_worker_finished(self):
+        self._release_thread()
+        self.finished.emit()
@@ -1,17 +1,39 @@
 from core.grbl.grblController import GrblController
 from PyQt5.QtCore import pyqtSignal, QObject, QTimer
+from queue import Empty
+import threading
+from typing import Optional
 
 # Constants
 STATUS_POLL = 50       # miliseconds
-COMMANDS_POLL = 100    # miliseconds
+LOGS_READ_TIMEOUT = 0.1    # seconds, to check whether the reader must stop
+MAX_MESSAGES_BATCH = 500
+
+
+def get_changes(current: dict, previous: dict) -> dict:
+    """Returns the fields of `current` whose value differs from the one in `previous`.
+    """
+    return {
+        key: value for key, value in current.items()
+        if key not in previous or previous[key] != value
+    }
 
 
 class GrblSync(QObject):
     """Utility class to sync a GRBL device with some widget via signals.
+
+    The `new_status` signal only includes the fields of the status report
+    and parser state which changed since the last emission, and it is only
+    emitted by the status poll, when something changed.
+
+    The GRBL logs are read in bulk from a background thread, which blocks
+    until the GRBL monitor receives a message from the serial port and then
+    emits `new_messages` with the whole batch of new messages.
+    Slots connected with Qt.DirectConnection run in that thread.
     """
     # SIGNALS
 
-    new_message = pyqtSignal(str)
+    new_messages = pyqtSignal(list)
     new_status = pyqtSignal(object, object)
     failed = pyqtSignal(str)
     finished = pyqtSignal()
@@ -26,15 +48,17 @@ class GrblSync(QObject):
         self.grbl_monitor = grbl_controller.grbl_monitor
         self._has_error = False
         self._has_finished = False
+        self._last_status: dict = {}
+        self._last_parserstate: dict = {}
 
         # Create and configure timers
         self.monitor_status = QTimer(self)
         self.monitor_status.setInterval(STATUS_POLL)
         self.monitor_status.timeout.connect(self.get_status)
 
-        self.monitor_commands = QTimer(self)
-        self.monitor_commands.setInterval(COMMANDS_POLL)
-        self.monitor_commands.timeout.connect(self.get_command)
+        # Thread configuration
+        self.logs_reader: Optional[threading.Thread] = None
+        self._stop_reading = threading.Event()
 
     # FLOW CONTROL
 
@@ -42,26 +66,62 @@ class GrblSync(QObject):
         # Reset state
         self._has_error = False
         self._has_finished = False
-        # Start timers
+        self._last_status = {}
+        self._last_parserstate = {}
+        # Start timers and threads
         self.monitor_status.start()
-        self.monitor_commands.start()
+        self.start_logs_reader()
 
     def stop_monitor(self):
-        # Stop timers
+        # Stop timers and threads
+        self.monitor_status.stop()
+        self.stop_logs_reader()
+
+    def pause_status(self):
+        """Stops querying the status of the device until `resume_status`.
+        The logs reader goes on, since the file streamer depends on it.
+        """
         self.monitor_status.stop()
-        self.monitor_commands.stop()
+
+    def resume_status(self):
+        # Only while monitoring (see start_monitor)
+        if self.logs_reader:
+            self.monitor_status.start()
+
+    def start_logs_reader(self):
+        if self.logs_reader:
+            return
+        self._stop_reading.clear()
+        self.logs_reader = threading.Thread(target=self.read_logs, daemon=True)
+        self.logs_reader.start()
+
+    def stop_logs_reader(self):
+        if not self.logs_reader:
+            return
+        self._stop_reading.set()
+        self.logs_reader.join()
+        self.logs_reader = None
+
+    def read_logs(self):
+        """Main loop of the logs reader thread.
+        """
+        while not self._stop_reading.is_set():
+            message = self.wait_for_message(LOGS_READ_TIMEOUT)
+            if message:
+                self.get_messages([message])
+
+    def wait_for_message(self, timeout: float) -> Optional[str]:
+        """Blocks until the GRBL monitor receives a message, or the timeout elapses.
+        """
+        try:
+            return self.grbl_monitor.logs_queue.get(timeout=timeout)
+        except Empty:
+            return None
 
     # SLOTS
 
     def get_status(self):
-        status = self.grbl_status.get_status_report()
-        parserstate = self.grbl_status.get_parser_state()
-
-        # Emit new status signal
-        self.new_status.emit(
-            status,
-            parserstate
-        )
+        self.emit_status_changes()
 
         # Check error status
         if self.grbl_status.failed() and not self._has_error:
@@ -77,8 +137,40 @@ class GrblSync(QObject):
             self.finished.emit()
             self._has_finished = True
 
-    def get_command(self):
-        message = self.grbl_monitor.getLog()
-        if message:
-            # Emit new message signal
-            self.new_message.emit(message)
+    def emit_status_changes(self):
+        """Emits the fields of the status which changed since the last emission.
+        """
+        status = self.grbl_status.get_status_report()
+        parserstate = self.grbl_status.get_parser_state()
+        status_changes = get_changes(status, self._last_status)
+        parserstate_changes = get_changes(parserstate, self._last_parserstate)
+
+        if not status_changes and not parserstate_changes:
+            return
+
+        self._last_status.update(status_changes)
+        self._last_parserstate.update(parserstate_changes)
+
+        # Emit new status signal
+        self.new_status.emit(
+            status_changes,
+            parserstate_changes
+        )
+
+    def get_messages(self, received: Optional[list[str]] = None) -> bool:
+        """Drains the GRBL monitor queue and emits all its messages at once,
+        after the already `received` ones. Returns whether there were new messages.
+        """
+        messages: list[str] = list(received or [])
+        while len(messages) < MAX_MESSAGES_BATCH:
+            message = self.grbl_monitor.getLog()
+            if not message:
+                break
+            messages.append(message)
+
+        if not messages:
+            return False
+
+        # Emit new messages signal
+        self.new_messages.emit(messages)
+        return True
@@ -0,0 +1,94 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from helpers.dbSession import session_scope
+from PyQt5.QtCore import pyqtSignal, QObject
+from sqlalchemy.orm import Session
+from typing import Any, Callable, Optional
+
+# Constants
+LOADER_THREADS = 2
+
+# Threads shared by all the loaders
+executor = ThreadPoolExecutor(max_workers=LOADER_THREADS, thread_name_prefix='items-loader')
+
+
+class ItemsLoader(QObject):
+    """Utility class to query the database from a background thread, so a slow
+    database never blocks the GUI.
+
+    Each load runs with its own read-only session, which is closed as soon as
+    it ends, without committing.
+    The loaded rows are detached from it before being returned, so they keep
+    the values of their loaded attributes (including the eagerly loaded
+    relationships) but never query the database again.
+
+    Only the result of the last load is notified: starting a new load or
+    cancelling the current one discards the result of the previous one.
+    """
+    # SIGNALS
+    loaded = pyqtSignal(object)
+    failed = pyqtSignal(str)
+    _load_finished = pyqtSignal(int, bool, object)  # load ID, success, result or error
+
+    # CONSTRUCTOR
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        # Attributes definition
+        self._load_id = 0
+        self._future: Optional[Future] = None
+
+        # Results are always handled in the thread of the loader
+        self._load_finished.connect(self.on_load_finished)
+
+    # FLOW CONTROL
+
+    def start(self, load: Callable[[Session], Any]):
+        """Runs `load` in background, with a new database session.
+        """
+        self.cancel()
+        self._future = executor.submit(self.run, self._load_id, load)
+
+    def cancel(self):
+        """Discards the current load, if any. Loads which didn't start yet
+        never run.
+        """
+        if self._future:
+            self._future.cancel()
+        self._future = None
+        self._load_id += 1
+
+    def is_running(self) -> bool:
+        return self._future is not None
+
+    def run(self, load_id: int, load: Callable[[Session], Any]):
+        """Body of the background load.
+        """
+        try:
+            with session_scope(read_only=True) as db_session:
+                result = load(db_session)
+                db_session.expunge_all()
+        except Exception as error:
+            self._notify(load_id, False, str(error))
+            return
+        self._notify(load_id, True, result)
+
+    def _notify(self, load_id: int, success: bool, result: Any):
+        if load_id != self._load_id:
+            return
+        try:
+            self._load_finished.emit(load_id, success, result)
+        except RuntimeError:
+            # The loader was deleted during the load
+            pass
+
+    # SLOTS
+
+    def on_load_finished(self, load_id: int, success: bool, result: Any):
+        if load_id != self._load_id:
+            return
+        self._future = None
+        if success:
+            self.loaded.emit(result)
+        else:
+            self.failed.emit(result)
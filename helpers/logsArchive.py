@@ -0,0 +1,384 @@
+from bisect import bisect_right
+from datetime import date, datetime
+import gzip
+from helpers.logsIndex import parse_datetime
+from helpers.logsReader import CHUNK_SIZE, LogEntry, LogsReader
+import io
+import json
+import os
+from pathlib import Path
+import threading
+from typing import BinaryIO, Optional, Union
+from typing_extensions import TypedDict
+
+# Constants
+MANIFEST_SUFFIX = '.manifest.json'
+ARCHIVE_SUFFIX = '.log.gz'
+ARCHIVE_DATETIME_FORMAT = '%Y%m%d-%H%M%S'
+DEFAULT_MAX_SIZE = 10 * 1024 * 1024  # bytes
+
+# Readers in this process never see a rotation half done
+rotation_lock = threading.RLock()
+
+# Types definition
+LogSegment = TypedDict('LogSegment', {
+    'file': str,        # Name of the compressed file, in the folder of the logs file
+    'start': int,       # Offset of its first log, as if no rotation happened
+    'size': int,        # Uncompressed size, in bytes
+    'lines': int,
+    'first': str,       # Datetime of its first and last logs
+    'last': str
+})
+
+
+class LogsArchive:
+    """Rotates the logs file when it reaches `max_size` bytes or, if `daily`,
+    when its first log is from a previous day.
+
+    Rotated logs are compressed into archives next to the logs file, and listed
+    in a manifest along with their time ranges. Offsets of the logs never change
+    with the rotation: the logs file starts where the last archive ends.
+
+    The logs file is written by other processes, so it's rotated by copying and
+    truncating it, like logrotate's 'copytruncate' mode: its complete lines are
+    copied and then the file is truncated, which needs the writers to open it in
+    append mode. The bytes written after the copied lines, like a log still being
+    written, are read again right before truncating the file and appended back.
+    Only a log written in the instant between that read and the truncation
+    could still be lost, or be followed by the older ones appended back.
+    """
+    def __init__(
+        self,
+        file_path: Union[str, Path],
+        max_size: int = DEFAULT_MAX_SIZE,
+        daily: bool = True
+    ):
+        self.file_path = Path(file_path)
+        self.manifest_path = self.file_path.with_name(self.file_path.name + MANIFEST_SUFFIX)
+        self.max_size = max_size
+        self.daily = daily
+        self.segments: list[LogSegment] = []
+        self._manifest_version: Optional[int] = None
+        self.reload()
+
+    # Manifest
+
+    def reload(self):
+        """Loads the manifest again, only if it changed.
+        """
+        try:
+            version = os.stat(self.manifest_path).st_mtime_ns
+        except OSError:
+            self.segments = []
+            self._manifest_version = None
+            return
+
+        if version == self._manifest_version:
+            return
+
+        try:
+            with open(self.manifest_path, 'r') as manifest:
+                self.segments = json.load(manifest)['segments']
+        except (OSError, ValueError, KeyError):
+            self.segments = []
+        self._manifest_version = version
+
+    def save(self):
+        # Replace the manifest at once, so it's never read half written
+        temporary_path = self.manifest_path.with_name(self.manifest_path.name + '.tmp')
+        with open(temporary_path, 'w') as manifest:
+            json.dump({'segments': self.segments}, manifest, indent=2)
+        os.replace(temporary_path, self.manifest_path)
+        self._manifest_version = os.stat(self.manifest_path).st_mtime_ns
+
+    # Getters
+
+    def active_start(self) -> int:
+        """Returns the offset of the first log in the logs file.
+        """
+        if not self.segments:
+            return 0
+        last = self.segments[-1]
+        return last['start'] + last['size']
+
+    def get_segment_path(self, segment: LogSegment) -> Path:
+        return self.file_path.with_name(segment['file'])
+
+    def get_segments(
+        self,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None
+    ) -> list[LogSegment]:
+        """Returns the archived segments with logs in the given time range.
+        """
+        segments: list[LogSegment] = []
+        for segment in self.segments:
+            first = parse_datetime(segment['first'])
+            last = parse_datetime(segment['last'])
+            if since and last and last < since:
+                continue
+            if until and first and first > until:
+                continue
+            segments.append(segment)
+        return segments
+
+    # Rotation
+
+    def should_rotate(self, today: Optional[date] = None) -> bool:
+        reader = LogsReader(self.file_path)
+        size = reader.size()
+        if not size:
+            return False
+        if size >= self.max_size:
+            return True
+        if not self.daily:
+            return False
+
+        first_log, _ = reader.read_after(0, 1)
+        if not first_log:
+            return False
+        first = parse_datetime(first_log[0][1][0])
+        if not first:
+            return False
+        return first.date() < (today or date.today())
+
+    def rotate_if_needed(self) -> Optional[LogSegment]:
+        with rotation_lock:
+            self.reload()
+            if not self.should_rotate():
+                return None
+            return self.rotate()
+
+    def rotate(self) -> Optional[LogSegment]:
+        """Moves the complete logs of the logs file to a new archive.
+        Returns the new segment, or None if there was nothing to archive.
+        """
+        with rotation_lock:
+            self.reload()
+            reader = LogsReader(self.file_path)
+            end = reader.complete_size()
+            if not end:
+                return None
+
+            first_log, _ = reader.read_after(0, 1)
+            last_log = reader.read_before(end, 1)
+            first = first_log[0][1][0]
+            last = last_log[0][1][0]
+
+            archive_path = self._get_archive_path(parse_datetime(first))
+            copy_path = self._copy_truncate(end)
+            lines = self._compress(copy_path, archive_path)
+            os.remove(copy_path)
+
+            segment: LogSegment = {
+                'file': archive_path.name,
+                'start': self.active_start(),
+                'size': end,
+                'lines': lines,
+                'first': first,
+                'last': last,
+            }
+            self.segments.append(segment)
+            self.save()
+            return segment
+
+    def _get_archive_path(self, moment: Optional[datetime]) -> Path:
+        name = (moment or datetime.now()).strftime(ARCHIVE_DATETIME_FORMAT)
+        archive_path = self.file_path.with_name(f'{self.file_path.stem}-{name}{ARCHIVE_SUFFIX}')
+        suffix = 1
+        while archive_path.exists():
+            archive_path = self.file_path.with_name(
+                f'{self.file_path.stem}-{name}.{suffix}{ARCHIVE_SUFFIX}'
+            )
+            suffix += 1
+        return archive_path
+
+    def _copy_truncate(self, end: int) -> Path:
+        """Copies the first `end` bytes of the logs file and removes them from it,
+        keeping the ones after them. Returns the path to the copy.
+        """
+        copy_path = self.file_path.with_name(self.file_path.name + '.rotating')
+        with open(self.file_path, 'rb') as source, open(copy_path, 'wb') as copy:
+            remaining = end
+            while remaining:
+                chunk = source.read(min(remaining, CHUNK_SIZE))
+                if not chunk:
+                    break
+                copy.write(chunk)
+                remaining -= len(chunk)
+            tail = self._read_tail(source, end)
+            os.truncate(self.file_path, 0)
+
+        # Writers append to the file, so the tail goes after anything they wrote
+        if tail:
+            with open(self.file_path, 'ab') as logs:
+                logs.write(tail)
+        return copy_path
+
+    @staticmethod
+    def _read_tail(source: BinaryIO, end: int) -> bytes:
+        """Reads the bytes of the file after `end`, until no more are written
+        while reading them.
+        """
+        while True:
+            source.seek(end)
+            tail = source.read()
+            if os.fstat(source.fileno()).st_size == end + len(tail):
+                return tail
+
+    def _compress(self, source_path: Path, archive_path: Path) -> int:
+        """Compresses a copy of the logs file into an archive.
+        Returns the amount of lines in it.
+        """
+        lines = 0
+        temporary_path = archive_path.with_name(archive_path.name + '.tmp')
+        with open(source_path, 'rb') as source, gzip.open(temporary_path, 'wb') as archive:
+            while True:
+                chunk = source.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+                archive.write(chunk)
+                lines += chunk.count(b'\n')
+        os.replace(temporary_path, archive_path)
+        return lines
+
+
+class ArchivedLogsReader(LogsReader):
+    """Reads the logs of an archive, which is decompressed in memory once.
+    """
+    def __init__(self, file_path: Union[str, Path], size: int):
+        super().__init__(file_path)
+        self._size = size
+        self._data: Optional[bytes] = None
+
+    def size(self) -> int:
+        return self._size
+
+    def _open(self) -> BinaryIO:
+        if self._data is None:
+            with gzip.open(self.file_path, 'rb') as archive:
+                self._data = archive.read()
+        return io.BytesIO(self._data)
+
+
+class RotatedLogsReader:
+    """Same interface as LogsReader, but reads transparently across the archives
+    of the logs file and the logs file itself, using the offsets of the logs
+    as if no rotation happened.
+    """
+    # Decompressed archives kept in memory
+    CACHED_ARCHIVES = 2
+
+    def __init__(self, file_path: Union[str, Path], archive: Optional[LogsArchive] = None):
+        self.file_path = file_path
+        self.archive = archive or LogsArchive(file_path)
+        self.active = LogsReader(file_path)
+        self._archive_readers: dict[str, ArchivedLogsReader] = {}
+
+    # Segments
+
+    def _get_parts(self) -> list[tuple[int, LogsReader]]:
+        """Returns the readers of each segment of the logs, with their start offsets.
+        """
+        self.archive.reload()
+        parts: list[tuple[int, LogsReader]] = []
+        for segment in self.archive.segments:
+            parts.append((segment['start'], self._get_archive_reader(segment)))
+        parts.append((self.archive.active_start(), self.active))
+        return parts
+
+    def _get_archive_reader(self, segment: LogSegment) -> LogsReader:
+        name = segment['file']
+        reader = self._archive_readers.pop(name, None)
+        if not reader:
+            reader = ArchivedLogsReader(self.archive.get_segment_path(segment), segment['size'])
+        # Keep the most recently used archives last
+        self._archive_readers[name] = reader
+        while len(self._archive_readers) > self.CACHED_ARCHIVES:
+            del self._archive_readers[next(iter(self._archive_readers))]
+        return reader
+
+    @staticmethod
+    def _shift(entries: list[LogEntry], start: int) -> list[LogEntry]:
+        return [(start + offset, log) for offset, log in entries]
+
+    # Reading methods
+
+    def active_start(self) -> int:
+        with rotation_lock:
+            self.archive.reload()
+            return self.archive.active_start()
+
+    def size(self) -> int:
+        with rotation_lock:
+            return self.active_start() + self.active.size()
+
+    def complete_size(self) -> int:
+        with rotation_lock:
+            return self.active_start() + self.active.complete_size()
+
+    def read_last(self, count: int) -> tuple[list[LogEntry], int]:
+        with rotation_lock:
+            end = self.complete_size()
+            return self.read_before(end, count), end
+
+    def read_before(self, offset: int, count: int) -> list[LogEntry]:
+        with rotation_lock:
+            entries: list[LogEntry] = []
+            for start, reader in reversed(self._get_parts()):
+                if len(entries) >= count or offset <= 0:
+                    break
+                if start >= offset:
+                    continue
+                previous = reader.read_before(offset - start, count - len(entries))
+                entries = self._shift(previous, start) + entries
+                offset = start
+            return entries
+
+    def read_after(self, offset: int, count: int) -> tuple[list[LogEntry], int]:
+        with rotation_lock:
+            entries: list[LogEntry] = []
+            position = offset
+            parts = self._get_parts()
+            for index, (start, reader) in enumerate(parts):
+                end = start + reader.size()
+                is_active = index == len(parts) - 1
+                if position >= end and not is_active:
+                    continue
+
+                following, local_end = reader.read_after(
+                    max(position - start, 0),
+                    count - len(entries)
+                )
+                entries.extend(self._shift(following, start))
+                position = start + local_end
+                if len(entries) >= count or position < end:
+                    break
+            return entries, position
+
+    def read_at(self, offsets: list[int]) -> list[LogEntry]:
+        with rotation_lock:
+            parts = self._get_parts()
+            starts = [start for start, _ in parts]
+            entries: list[LogEntry] = []
+            for offset in offsets:
+                start, reader = parts[max(bisect_right(starts, offset) - 1, 0)]
+                entries.extend(self._shift(reader.read_at([offset - start]), start))
+            return entries
+
+    def get_files(
+        self,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None
+    ) -> list[tuple[Path, int, bool]]:
+        """Returns the files with logs in the given time range, in order,
+        along with their uncompressed sizes and whether they are compressed.
+        """
+        with rotation_lock:
+            self.archive.reload()
+            files = [
+                (self.archive.get_segment_path(segment), segment['size'], True)
+                for segment in self.archive.get_segments(since, until)
+            ]
+            files.append((Path(self.file_path), self.active.size(), False))
+            return files
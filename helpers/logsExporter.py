@@ -0,0 +1,236 @@
+import csv
+import gzip
+from helpers.logsArchive import RotatedLogsReader
+from helpers.logsIndex import LogsFilter
+from helpers.logsReader import parse_log
+import os
+from pathlib import Path
+from PyQt5.QtCore import pyqtSignal, QObject, QThread
+from typing import BinaryIO, Optional, TextIO, Union
+
+# Constants
+CSV_HEADERS = ['DATETIME', 'LEVEL', 'TYPE', 'Message']
+CSV_DELIMITER = ';'
+GZIP_EXTENSION = '.gz'
+
+
+def is_csv_file(output_path: str) -> bool:
+    """Returns whether the logs should be exported as CSV, which depends on the
+    extension of the output file, ignoring the compression one.
+    """
+    if output_path.endswith(GZIP_EXTENSION):
+        output_path = output_path[:-len(GZIP_EXTENSION)]
+    return output_path.endswith('.csv')
+
+
+class LogsExporterWorker(QObject):
+    """Copies the logs which match a filter to another file, from its own thread.
+
+    The archives of the logs file and the file itself are read line by line,
+    so the memory usage doesn't depend on their size, and the progress is
+    reported as the percentage of the logs read. Archives out of the time
+    range of the filter are skipped.
+    When the export is stopped or fails, the incomplete output file is removed.
+    """
+    # SIGNALS
+    progress = pyqtSignal(int)
+    finished = pyqtSignal(bool, str)
+
+    # CONSTRUCTOR
+
+    def __init__(
+        self,
+        logs_file: Union[str, Path],
+        output_path: str,
+        logs_filter: Optional[LogsFilter] = None,
+        compress: bool = False
+    ):
+        super().__init__()
+
+        # Attributes definition
+        self.logs_file = logs_file
+        self.output_path = output_path
+        self.logs_filter = logs_filter if logs_filter and not logs_filter.is_empty() else None
+        self.compress = compress
+        self.exported = 0
+        self._running = True
+        self._percentage = -1
+
+    # FLOW CONTROL
+
+    def run(self):
+        try:
+            completed = self.export()
+        except (OSError, UnicodeError) as error:
+            self._remove_output()
+            self.finished.emit(False, str(error))
+            return
+
+        if not completed:
+            self._remove_output()
+        self.finished.emit(completed, self.output_path)
+
+    def stop(self):
+        self._running = False
+
+    def is_running(self) -> bool:
+        return self._running
+
+    # EXPORT
+
+    def export(self) -> bool:
+        """Writes the matching logs to the output file.
+        Returns False if the export was stopped before the end.
+        """
+        self.exported = 0
+        if not os.path.exists(self.logs_file):
+            raise FileNotFoundError(f'No se encontró el archivo {self.logs_file}')
+
+        logs_filter = self.logs_filter
+        files = RotatedLogsReader(self.logs_file).get_files(
+            logs_filter.since if logs_filter else None,
+            logs_filter.until if logs_filter else None
+        )
+        size = sum(file_size for _, file_size, _ in files)
+        as_csv = is_csv_file(self.output_path)
+
+        with self._open_output() as output:
+            csv_writer = csv.writer(output, delimiter=CSV_DELIMITER) if as_csv else None
+            if csv_writer:
+                csv_writer.writerow(CSV_HEADERS)
+
+            position = 0
+            for file_path, _, compressed in files:
+                with self._open_source(file_path, compressed) as source:
+                    for raw_line in source:
+                        if not self._running:
+                            return False
+                        # Skip the last line if it's still being written
+                        if not raw_line.endswith(b'\n'):
+                            break
+                        position += len(raw_line)
+
+                        line = raw_line.decode('utf-8', errors='replace').rstrip('\r\n')
+                        log = parse_log(line)
+                        if logs_filter and not logs_filter.matches(log):
+                            continue
+
+                        if csv_writer:
+                            csv_writer.writerow(log)
+                        else:
+                            output.write(line + '\n')
+                        self.exported += 1
+                        self.report_progress(position, size)
+
+        self.report_progress(size, size)
+        return True
+
+    def report_progress(self, position: int, size: int):
+        """Emits the percentage of the logs file which was read, only when it changes.
+        """
+        # The file may grow during the export
+        percentage = min(position * 100 // size, 100) if size else 100
+        if percentage == self._percentage:
+            return
+        self._percentage = percentage
+        self.progress.emit(percentage)
+
+    # UTILITIES
+
+    def _open_source(self, file_path: Path, compressed: bool) -> BinaryIO:
+        if compressed:
+            return gzip.open(file_path, 'rb')  # type: ignore
+        return open(file_path, 'rb')
+
+    def _open_output(self) -> TextIO:
+        if self.compress:
+            return gzip.open(self.output_path, 'wt', encoding='utf-8', newline='')
+        return open(self.output_path, 'w', encoding='utf-8', newline='')
+
+    def _remove_output(self):
+        try:
+            os.remove(self.output_path)
+        except OSError:
+            pass
+
+
+class LogsExporter(QObject):
+    """Utility class to export the logs in background, optionally
+    filtered by date, level, type or text, as plain text or CSV.
+
+    The export runs in a dedicated thread (see LogsExporterWorker), so exporting
+    a big logs file never blocks the GUI, and can be cancelled with `stop`.
+    Output files ending in '.gz' are always compressed.
+    """
+    # SIGNALS
+    progress = pyqtSignal(int)
+    finished = pyqtSignal(bool, str)
+
+    # CONSTRUCTOR
+
+    def __init__(self, logs_file: Union[str, Path], parent=None):
+        super().__init__(parent)
+
+        # Attributes definition
+        self.logs_file = logs_file
+
+        # Thread configuration
+        self.export_thread: Optional[QThread] = None
+        self.export_worker: Optional[LogsExporterWorker] = None
+
+    # FLOW CONTROL
+
+    def start(
+        self,
+        output_path: str,
+        logs_filter: Optional[LogsFilter] = None,
+        compress: bool = False
+    ):
+        self.stop()
+
+        compress = compress or output_path.endswith(GZIP_EXTENSION)
+        if compress and not output_path.endswith(GZIP_EXTENSION):
+            output_path += GZIP_EXTENSION
+
+        self.export_worker = LogsExporterWorker(
+            self.logs_file,
+            output_path,
+            logs_filter,
+            compress
+        )
+        # Create a QThread object
+        self.export_thread = QThread(self)
+        # Move worker to the thread
+        self.export_worker.moveToThread(self.export_thread)
+        # Connect signals and slots
+        self.export_thread.started.connect(self.export_worker.run)
+        self.export_worker.progress.connect(self.progress)
+        self.export_worker.finished.connect(self.on_worker_finished)
+        # Start the thread
+        self.export_thread.start()
+
+    def stop(self):
+        """Cancels the current export, if any, without notifying its end.
+        """
+        if self.export_worker:
+            self.export_worker.finished.disconnect(self.on_worker_finished)
+            self.export_worker.stop()
+        self._release_thread()
+        self.export_worker = None
+
+    def is_running(self) -> bool:
+        return self.export_thread is not None
+
+    def _release_thread(self):
+        if not self.export_thread:
+            return
+        self.export_thread.quit()
+        self.export_thread.wait()
+        self.export_thread = None
+
+    # SLOTS
+
+    def on_worker_finished(self, completed: bool, result: str):
+        self._release_thread()
+        self.export_worker = None
+        self.finished.emit(completed, result)
@@ -0,0 +1,266 @@
+from array import array
+from bisect import bisect_left
+from collections import defaultdict
+from core.utils.logs import Log
+from datetime import datetime
+from helpers.logsReader import LogEntry
+import re
+import threading
+from typing import Optional, Sequence
+from typing_extensions import TypedDict
+
+# Constants
+LOG_LEVELS = ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']
+DATETIME_FORMAT = '%d/%m/%Y %H:%M:%S'
+TIME_BUCKET = 3600  # seconds
+
+# Words of the messages, like 'ALARM:2', 'error:20' or '$H'
+TOKEN_PATTERN = re.compile(r'[^\s\[\]<>|,()]+')
+# Words which are indexed: alarms, errors, GRBL commands and G/M words
+INDEXED_TOKEN_PATTERN = re.compile(r'alarm:\d+|error:\d+|\$\S*|[gm]\d+(?:\.\d+)?')
+
+
+def get_tokens(text: str) -> set[str]:
+    return {token.lower() for token in TOKEN_PATTERN.findall(text)}
+
+
+def is_indexed_token(token: str) -> bool:
+    return INDEXED_TOKEN_PATTERN.fullmatch(token) is not None
+
+
+def parse_datetime(value: str) -> Optional[datetime]:
+    try:
+        return datetime.strptime(value, DATETIME_FORMAT)
+    except ValueError:
+        return None
+
+
+def get_time_bucket(moment: datetime) -> int:
+    return int(moment.timestamp()) // TIME_BUCKET
+
+
+# Types definition
+IndexSummary = TypedDict('IndexSummary', {
+    'start': int,           # Offsets of the first log and after the last one
+    'end': int,
+    'levels': set[str],
+    'types': set[str],
+    'buckets': set[int],
+    'tokens': set[str]
+})
+
+
+class LogsFilter:
+    """Criteria to look for logs. Empty criteria match every log.
+    The text matches logs whose messages contain all of its words.
+    """
+    def __init__(
+        self,
+        level: Optional[str] = None,
+        log_type: Optional[str] = None,
+        text: str = '',
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None
+    ):
+        self.level = level
+        self.log_type = log_type
+        self.tokens = get_tokens(text)
+        self.since = since
+        self.until = until
+
+    def is_empty(self) -> bool:
+        return not (
+            self.level or self.log_type or self.tokens or self.since or self.until
+        )
+
+    def matches(self, log: Log) -> bool:
+        time, level, log_type, message = log
+        if self.level and level != self.level:
+            return False
+        if self.log_type and log_type != self.log_type:
+            return False
+        if self.tokens and not self.tokens.issubset(get_tokens(message)):
+            return False
+        if self.since or self.until:
+            moment = parse_datetime(time)
+            if not moment:
+                return False
+            if self.since and moment < self.since:
+                return False
+            if self.until and moment > self.until:
+                return False
+        return True
+
+
+class LogsIndex:
+    """Index of the logs file, which maps levels, types, time buckets and the
+    words of the messages to the offsets of the logs in the file.
+
+    Only the words of a fixed vocabulary (see INDEXED_TOKEN_PATTERN) are
+    indexed, so its size doesn't grow with the free text of the messages.
+    Other words are checked by scanning the candidate logs.
+
+    It is built incrementally, as batches of logs are added in order, and it
+    is safe to query it from another thread while it's being built.
+
+    To bound its size, the offsets of the oldest logs can be replaced by a
+    summary of their keys (see `summarize`): the logs of a summary are only
+    scanned when it may have matches (see `search_summaries`).
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.clear()
+
+    def clear(self):
+        with self._lock:
+            self.start = 0
+            self.end = 0
+            self.count = 0
+            self.summaries: list[IndexSummary] = []
+            self._levels: dict[str, array] = defaultdict(lambda: array('Q'))
+            self._types: dict[str, array] = defaultdict(lambda: array('Q'))
+            self._buckets: dict[int, array] = defaultdict(lambda: array('Q'))
+            self._tokens: dict[str, array] = defaultdict(lambda: array('Q'))
+
+    def add(self, entries: list[LogEntry], end: int):
+        """Indexes a batch of logs, where `end` is the offset after the last one.
+        Logs which were already indexed are ignored.
+        """
+        with self._lock:
+            for offset, (time, level, log_type, message) in entries:
+                if offset < self.end:
+                    continue
+
+                self._levels[level].append(offset)
+                if log_type:
+                    self._types[log_type].append(offset)
+                moment = parse_datetime(time)
+                if moment:
+                    self._buckets[get_time_bucket(moment)].append(offset)
+                for token in get_tokens(message):
+                    if is_indexed_token(token):
+                        self._tokens[token].append(offset)
+                self.count += 1
+
+            self.end = max(self.end, end)
+
+    def summarize(self, end: int):
+        """Replaces the offsets of the logs before `end` by a summary.
+        """
+        with self._lock:
+            if end <= self.start or end > self.end:
+                return
+            self.summaries.append({
+                'start': self.start,
+                'end': end,
+                'levels': self._remove_before(self._levels, end),
+                'types': self._remove_before(self._types, end),
+                'buckets': self._remove_before(self._buckets, end),
+                'tokens': self._remove_before(self._tokens, end)
+            })
+            self.start = end
+
+    @staticmethod
+    def _remove_before(index: dict, end: int) -> set:
+        """Removes the offsets before `end` from the index.
+        Returns the keys which had any.
+        """
+        keys = set()
+        for key, offsets in list(index.items()):
+            position = bisect_left(offsets, end)
+            if not position:
+                continue
+            keys.add(key)
+            del offsets[:position]
+            if not offsets:
+                del index[key]
+        return keys
+
+    # Queries
+
+    def get_levels(self) -> list[str]:
+        with self._lock:
+            levels = set(self._levels).union(
+                *(summary['levels'] for summary in self.summaries)
+            )
+            return sorted(level for level in levels if level)
+
+    def get_types(self) -> list[str]:
+        with self._lock:
+            return sorted(set(self._types).union(
+                *(summary['types'] for summary in self.summaries)
+            ))
+
+    def search(self, logs_filter: LogsFilter) -> list[int]:
+        """Returns the sorted offsets of the logs which may match the filter.
+        Time ranges are matched by bucket and words out of the vocabulary are
+        not indexed, so the candidates must be checked with `LogsFilter.matches`.
+        When only those words are given, every log is a candidate.
+        """
+        with self._lock:
+            candidates: list[Sequence[int]] = []
+            if logs_filter.level:
+                candidates.append(self._levels.get(logs_filter.level, ()))
+            if logs_filter.log_type:
+                candidates.append(self._types.get(logs_filter.log_type, ()))
+            for token in logs_filter.tokens:
+                if is_indexed_token(token):
+                    candidates.append(self._tokens.get(token, ()))
+            if logs_filter.since or logs_filter.until:
+                candidates.append(self._get_time_range(logs_filter.since, logs_filter.until))
+
+            if not candidates:
+                if not logs_filter.tokens:
+                    return []
+                # Scan every log
+                candidates.append([
+                    offset for offsets in self._levels.values() for offset in offsets
+                ])
+
+            # Intersect starting from the smallest set
+            candidates.sort(key=len)
+            result = set(candidates[0])
+            for offsets in candidates[1:]:
+                if not result:
+                    break
+                result.intersection_update(offsets)
+
+        return sorted(result)
+
+    def search_summaries(self, logs_filter: LogsFilter) -> list[IndexSummary]:
+        """Returns the summaries whose logs may match the filter, in order.
+        """
+        if logs_filter.is_empty():
+            return []
+
+        first = get_time_bucket(logs_filter.since) if logs_filter.since else None
+        last = get_time_bucket(logs_filter.until) if logs_filter.until else None
+        tokens = {token for token in logs_filter.tokens if is_indexed_token(token)}
+        with self._lock:
+            summaries: list[IndexSummary] = []
+            for summary in self.summaries:
+                if logs_filter.level and logs_filter.level not in summary['levels']:
+                    continue
+                if logs_filter.log_type and logs_filter.log_type not in summary['types']:
+                    continue
+                if not tokens.issubset(summary['tokens']):
+                    continue
+                if (first is not None or last is not None) and not any(
+                    (first is None or bucket >= first) and (last is None or bucket <= last)
+                    for bucket in summary['buckets']
+                ):
+                    continue
+                summaries.append(summary)
+            return summaries
+
+    def _get_time_range(self, since: Optional[datetime], until: Optional[datetime]) -> list[int]:
+        first = get_time_bucket(since) if since else None
+        last = get_time_bucket(until) if until else None
+        offsets: list[int] = []
+        for bucket, bucket_offsets in self._buckets.items():
+            if first is not None and bucket < first:
+                continue
+            if last is not None and bucket > last:
+                continue
+            offsets.extend(bucket_offsets)
+        return offsets
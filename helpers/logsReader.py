@@ -0,0 +1,153 @@
+from core.utils.logs import Log
+import os
+from pathlib import Path
+import re
+from typing import BinaryIO, Union
+
+# Constants
+CHUNK_SIZE = 64 * 1024  # bytes
+
+# Format of the GRBL logs, as written by the logger of the core:
+# [datetime] LEVEL: [type] message
+LOG_PATTERN = re.compile(
+    r'^\[(?P<datetime>[^\]]+)\]\s+(?P<level>[A-Z]+):\s?'
+    r'(?:\[(?P<type>[^\]]+)\]\s)?(?P<message>.*)$'
+)
+
+# Types definition
+LogEntry = tuple[int, Log]  # Offset in the file and log
+
+
+def parse_log(line: str) -> Log:
+    """Returns the fields of a line of the logs file, in the format
+    of the logs interpreter of the core.
+    Lines in an unknown format are kept as a message without metadata.
+    """
+    match = LOG_PATTERN.match(line)
+    if not match:
+        return ('', '', None, line)
+    return (match['datetime'], match['level'], match['type'], match['message'])
+
+
+class LogsReader:
+    """Reads pages of logs from any position of the logs file, including
+    backwards from its end, without loading the whole file in memory.
+
+    Every log comes with the offset of its line in the file, which can
+    be used to request the previous or next page.
+    """
+    def __init__(self, file_path: Union[str, Path], encoding: str = 'utf-8'):
+        self.file_path = file_path
+        self.encoding = encoding
+
+    def size(self) -> int:
+        """Returns the size of the file, or 0 if it doesn't exist.
+        """
+        try:
+            return os.path.getsize(self.file_path)
+        except OSError:
+            return 0
+
+    def _open(self) -> BinaryIO:
+        return open(self.file_path, 'rb')
+
+    def _decode(self, raw_line: bytes) -> str:
+        return raw_line.decode(self.encoding, errors='replace').rstrip('\r\n')
+
+    def complete_size(self) -> int:
+        """Returns the offset after the last complete line of the file,
+        ignoring a last line which is still being written.
+        """
+        size = self.size()
+        try:
+            with self._open() as file:
+                end = size
+                while end > 0:
+                    start = max(end - CHUNK_SIZE, 0)
+                    file.seek(start)
+                    position = file.read(end - start).rfind(b'\n')
+                    if position >= 0:
+                        return start + position + 1
+                    end = start
+        except OSError:
+            pass
+        return 0
+
+    def read_last(self, count: int) -> tuple[list[LogEntry], int]:
+        """Returns the last `count` complete logs of the file,
+        and the offset after the last of them.
+        """
+        end = self.complete_size()
+        return self.read_before(end, count), end
+
+    def read_before(self, offset: int, count: int) -> list[LogEntry]:
+        """Returns up to `count` logs, from the ones which end before `offset`.
+        `offset` must be the start of a line, or the end of the file.
+        """
+        if offset <= 0 or count <= 0:
+            return []
+
+        start = offset
+        data = b''
+        try:
+            with self._open() as file:
+                # Read chunks backwards until there are enough complete lines
+                while start > 0 and data.count(b'\n') <= count:
+                    size = min(CHUNK_SIZE, start)
+                    start -= size
+                    file.seek(start)
+                    data = file.read(size) + data
+        except OSError:
+            return []
+
+        lines = data.split(b'\n')
+        # Remove the empty string after the last line break
+        if not lines[-1]:
+            lines.pop()
+
+        entries: list[LogEntry] = []
+        position = start
+        for index, raw_line in enumerate(lines):
+            # The first line may be incomplete, unless the file starts there
+            if index or not start:
+                entries.append((position, parse_log(self._decode(raw_line))))
+            position += len(raw_line) + 1
+
+        return entries[-count:]
+
+    def read_after(self, offset: int, count: int) -> tuple[list[LogEntry], int]:
+        """Returns up to `count` complete logs starting at `offset`,
+        and the offset after the last of them.
+        """
+        entries: list[LogEntry] = []
+        position = offset
+        try:
+            with self._open() as file:
+                file.seek(offset)
+                while len(entries) < count:
+                    raw_line = file.readline()
+                    # Skip lines which are still being written
+                    if not raw_line.endswith(b'\n'):
+                        break
+                    entries.append((position, parse_log(self._decode(raw_line))))
+                    position += len(raw_line)
+        except OSError:
+            pass
+
+        return entries, position
+
+    def read_at(self, offsets: list[int]) -> list[LogEntry]:
+        """Returns the logs which start at each of the given offsets.
+        """
+        entries: list[LogEntry] = []
+        try:
+            with self._open() as file:
+                for offset in offsets:
+                    file.seek(offset)
+                    raw_line = file.readline()
+                    if raw_line:
+                        entries.append((offset, parse_log(self._decode(raw_line))))
+        except OSError:
+            pass
+
+        return entries
@@ -0,0 +1,55 @@
+from config import GRBL_LOGS_FILE, LOGS_DAILY_ROTATION, LOGS_MAX_SIZE
+from helpers.logsArchive import LogsArchive
+import threading
+from typing import Optional
+
+# Constants
+ROTATION_INTERVAL = 60.0    # seconds
+
+
+class LogsRotator:
+    """Utility class to rotate the logs file when needed (see LogsArchive),
+    from a background thread which runs while the app is open.
+    """
+    # CONSTRUCTOR
+
+    def __init__(self, interval: float = ROTATION_INTERVAL):
+        # Attributes definition
+        self.interval = interval
+        self.archive = LogsArchive(GRBL_LOGS_FILE, LOGS_MAX_SIZE, LOGS_DAILY_ROTATION)
+
+        # Thread configuration
+        self.rotator_thread: Optional[threading.Thread] = None
+        self._stop_rotating = threading.Event()
+
+    # FLOW CONTROL
+
+    def start(self):
+        if self.rotator_thread:
+            return
+        self._stop_rotating.clear()
+        self.rotator_thread = threading.Thread(target=self.run, daemon=True)
+        self.rotator_thread.start()
+
+    def stop(self):
+        if not self.rotator_thread:
+            return
+        self._stop_rotating.set()
+        self.rotator_thread.join()
+        self.rotator_thread = None
+
+    def run(self):
+        """Main loop of the rotator thread.
+        """
+        while not self._stop_rotating.is_set():
+            self.rotate_logs()
+            self._stop_rotating.wait(self.interval)
+
+    # UTILITIES
+
+    def rotate_logs(self):
+        try:
+            self.archive.rotate_if_needed()
+        except OSError:
+            # Try again later
+            pass
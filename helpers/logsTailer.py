@@ -0,0 +1,134 @@
+import ctypes
+import ctypes.util
+from helpers.logsArchive import RotatedLogsReader
+from helpers.logsReader import LogEntry
+import os
+from pathlib import Path
+import select
+import threading
+from typing import Optional, Union
+
+# Constants
+LOGS_POLL = 0.10    # seconds, only without inotify
+BATCH_SIZE = 500    # logs
+
+# inotify events which may mean that the logs file changed
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+INOTIFY_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_DELETE
+
+
+class InotifyNotifier:
+    """Blocks until the content of a folder changes, using Linux's inotify.
+    The folder is watched instead of the file, to detect when the file
+    is created or replaced.
+    """
+    def __init__(self, folder: Union[str, Path]):
+        libc_name = ctypes.util.find_library('c')
+        if not libc_name:
+            raise OSError('C library not found')
+        libc = ctypes.CDLL(libc_name, use_errno=True)
+        if not hasattr(libc, 'inotify_init1'):
+            raise OSError('inotify is not available')
+
+        self._fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), 'Could not initialize inotify')
+
+        watch = libc.inotify_add_watch(self._fd, os.fsencode(folder), INOTIFY_MASK)
+        if watch < 0:
+            error = ctypes.get_errno()
+            os.close(self._fd)
+            raise OSError(error, f'Could not watch {folder}')
+
+        # Pipe to interrupt the wait from other threads
+        self._wake_read, self._wake_write = os.pipe()
+        os.set_blocking(self._wake_read, False)
+
+    def wait(self, timeout: Optional[float] = None):
+        """Blocks until there is a change, `wake` is called or the timeout expires.
+        """
+        ready, _, _ = select.select([self._fd, self._wake_read], [], [], timeout)
+        for fd in ready:
+            self._drain(fd)
+
+    def wake(self):
+        os.write(self._wake_write, b'\0')
+
+    def close(self):
+        for fd in (self._fd, self._wake_read, self._wake_write):
+            os.close(fd)
+
+    @staticmethod
+    def _drain(fd: int):
+        try:
+            while os.read(fd, 4096):
+                pass
+        except BlockingIOError:
+            pass
+
+
+class PollingNotifier:
+    """Fallback for systems without inotify, which just waits LOGS_POLL seconds.
+    """
+    def __init__(self):
+        self._event = threading.Event()
+
+    def wait(self, timeout: Optional[float] = None):
+        if timeout is None or timeout > LOGS_POLL:
+            timeout = LOGS_POLL
+        self._event.wait(timeout)
+        self._event.clear()
+
+    def wake(self):
+        self._event.set()
+
+    def close(self):
+        pass
+
+
+def create_notifier(file_path: Union[str, Path]):
+    """Returns the most efficient notifier available for changes in the given file.
+    """
+    try:
+        return InotifyNotifier(os.path.dirname(os.path.abspath(file_path)))
+    except (OSError, AttributeError):
+        return PollingNotifier()
+
+
+class LogsTailer:
+    """Follows the logs appended to the logs file, starting from `offset`.
+    Instead of polling the file, it blocks until the file changes.
+
+    Rotations of the file are transparent, but if the file is truncated or
+    replaced otherwise, it starts again from its beginning.
+    """
+    def __init__(self, file_path: Union[str, Path], offset: int = 0):
+        self.reader = RotatedLogsReader(file_path)
+        self.offset = offset
+        self.notifier = create_notifier(file_path)
+
+    def read_new(self, count: int = BATCH_SIZE) -> tuple[list[LogEntry], int]:
+        """Returns up to `count` new complete logs, and the offset after them.
+        """
+        if self.reader.size() < self.offset:
+            self.offset = self.reader.active_start()
+
+        entries, self.offset = self.reader.read_after(self.offset, count)
+        return entries, self.offset
+
+    def wait(self, timeout: Optional[float] = None):
+        """Blocks until the logs file might have changed.
+        """
+        self.notifier.wait(timeout)
+
+    def wake(self):
+        """Interrupts the current wait, from another thread.
+        """
+        self.notifier.wake()
+
+    def close(self):
+        self.notifier.close()
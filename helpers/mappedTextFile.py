@@ -0,0 +1,119 @@
+from array import array
+import mmap
+import re
+import threading
+from typing import Optional
+
+NEW_LINE_PATTERN = re.compile(rb'\n')
+INDEX_CHUNK_SIZE = 1024 * 1024  # bytes
+
+
+class MappedTextFile:
+    """Read-only view of a text file, which is memory-mapped instead of
+    loaded in memory. An index with the offset of each line allows
+    to read any range of lines without scanning the file again.
+
+    The index is built lazily, a chunk at a time: reading a range of lines
+    only scans the file up to the end of that range, and `build_index` can
+    complete the index from another thread while lines are being read.
+    """
+    def __init__(self, file_path: str, encoding: str = 'utf-8'):
+        self.file_path = file_path
+        self.encoding = encoding
+        self._file = open(file_path, 'rb')
+        self._map: Optional[mmap.mmap] = None
+        # Offset of the start of each line, plus the end of the file
+        self._offsets = array('Q', [0])
+        # Position up to which the file was scanned
+        self._scanned = 0
+        self._indexed = True
+        self._lock = threading.Lock()
+
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files can't be mapped
+            return
+
+        self._indexed = False
+
+    def _index_chunk(self):
+        """Scans the next chunk of the file, adding its lines to the index.
+        It must be called with the lock held.
+        """
+        if self._indexed or not self._map:
+            return
+
+        size = self._map.size()
+        end = min(self._scanned + INDEX_CHUNK_SIZE, size)
+        self._offsets.extend(
+            match.end() for match in NEW_LINE_PATTERN.finditer(self._map, self._scanned, end)
+        )
+        self._scanned = end
+
+        if end == size:
+            # The last line has no line break at the end
+            if self._offsets[-1] != size:
+                self._offsets.append(size)
+            self._indexed = True
+
+    def index_lines(self, count: int):
+        """Scans the file until the index has at least the given amount of lines.
+        """
+        with self._lock:
+            while not self._indexed and len(self._offsets) <= count:
+                self._index_chunk()
+
+    def build_index(self):
+        """Completes the index, releasing the lock after each chunk so lines
+        can be read meanwhile. It stops when the file is closed.
+        """
+        while True:
+            with self._lock:
+                if self._indexed or not self._map:
+                    return
+                self._index_chunk()
+
+    def is_indexed(self) -> bool:
+        return self._indexed
+
+    def close(self):
+        with self._lock:
+            if self._map:
+                self._map.close()
+                self._map = None
+            self._file.close()
+
+    def size(self) -> int:
+        """Returns the size of the file, in bytes.
+        """
+        return self._map.size() if self._map else 0
+
+    def line_count(self) -> int:
+        """Returns the amount of lines in the file, or the ones
+        indexed so far when the index is not complete.
+        """
+        return max(1, len(self._offsets) - 1)
+
+    def line_offset(self, line: int) -> int:
+        """Returns the position in the file where the given line (0-indexed) starts.
+        """
+        self.index_lines(line)
+        return self._line_offset(line)
+
+    def _line_offset(self, line: int) -> int:
+        line = min(max(line, 0), len(self._offsets) - 1)
+        return self._offsets[line]
+
+    def read_lines(self, start: int, end: int) -> str:
+        """Returns the text of the lines in range [start, end), without the last line break.
+        """
+        if not self._map:
+            return ''
+
+        self.index_lines(end)
+        with self._lock:
+            if not self._map:
+                return ''
+            text = self._map[self._line_offset(start):self._line_offset(end)]
+        return text.decode(self.encoding, errors='replace').removesuffix('\n').replace('\r', '')
@@ -0,0 +1,98 @@
+from core.database.models import File, Material, Task, Tool, User
+from sqlalchemy import select, Select
+from sqlalchemy.orm import InstrumentedAttribute, joinedload, raiseload, Session
+from typing import Any, Optional
+
+# Constants
+PAGE_SIZE = 50
+
+
+def get_page(
+    session: Session,
+    statement: Select,
+    key_column: InstrumentedAttribute,
+    after: Optional[Any] = None,
+    limit: int = PAGE_SIZE,
+    before: Optional[Any] = None
+) -> list:
+    """Returns up to `limit` rows of the query, sorted by `key_column`,
+    starting after the row whose key is `after` or, if `before` is given,
+    ending before the row whose key is `before`.
+
+    Pages are found by key (keyset pagination) instead of by offset,
+    so getting the last pages is as fast as getting the first one.
+    """
+    if before is not None:
+        statement = statement.where(key_column < before)
+        statement = statement.order_by(key_column.desc()).limit(limit)
+        return list(reversed(session.scalars(statement).all()))
+
+    if after is not None:
+        statement = statement.where(key_column > after)
+    statement = statement.order_by(key_column).limit(limit)
+    return list(session.scalars(statement))
+
+
+# Pages of each entity, sorted by ID
+# Rows are used after their session is closed, so each page loads the
+# relationships its cards show and forbids lazy loading the rest
+
+def get_tasks_page(
+    session: Session,
+    user_id: int,
+    after: Optional[int] = None,
+    limit: int = PAGE_SIZE,
+    before: Optional[int] = None
+) -> list[Task]:
+    # Cards of tasks open a dialog with their files, tools and materials
+    statement = select(Task).where(Task.user_id == user_id).options(
+        joinedload(Task.file),
+        joinedload(Task.tool),
+        joinedload(Task.material),
+        raiseload('*')
+    )
+    return get_page(session, statement, Task.id, after, limit, before)
+
+
+def get_files_page(
+    session: Session,
+    after: Optional[int] = None,
+    limit: int = PAGE_SIZE,
+    before: Optional[int] = None
+) -> list[File]:
+    # Cards of files show the name of their owners
+    statement = select(File).options(joinedload(File.user), raiseload('*'))
+    return get_page(session, statement, File.id, after, limit, before)
+
+
+def get_tools_page(
+    session: Session,
+    after: Optional[int] = None,
+    limit: int = PAGE_SIZE,
+    before: Optional[int] = None
+) -> list[Tool]:
+    # Cards of tools only show their own columns
+    statement = select(Tool).options(raiseload('*'))
+    return get_page(session, statement, Tool.id, after, limit, before)
+
+
+def get_materials_page(
+    session: Session,
+    after: Optional[int] = None,
+    limit: int = PAGE_SIZE,
+    before: Optional[int] = None
+) -> list[Material]:
+    # Cards of materials only show their own columns
+    statement = select(Material).options(raiseload('*'))
+    return get_page(session, statement, Material.id, after, limit, before)
+
+
+def get_users_page(
+    session: Session,
+    after: Optional[int] = None,
+    limit: int = PAGE_SIZE,
+    before: Optional[int] = None
+) -> list[User]:
+    # Cards of users only show their own columns
+    statement = select(User).options(raiseload('*'))
+    return get_page(session, statement, User.id, after, limit, before)
@@ -0,0 +1,105 @@
+from helpers.cncWorkerMonitor import CncWorkerMonitor, UNKNOWN_WORKER_STATUS, WorkerHealth, \
+    WorkerStatus
+from PyQt5.QtCore import pyqtSignal, QObject
+import threading
+import time
+from typing import Optional
+
+# Constants
+HEALTH_POLL = 5.0   # seconds
+
+
+class WorkerHealthProbe(QObject):
+    """Utility class to check the availability and activity of the CNC worker
+    from a background thread, so the broadcast calls never block the GUI.
+
+    The results are cached in CncWorkerMonitor, whose `is_worker_on` and
+    `is_worker_running` methods return them instantly while the probe is active.
+    The details of the worker are only checked when `get_worker_status` requests them.
+    """
+    # SIGNALS
+    health_changed = pyqtSignal(bool, bool)     # worker on, worker running
+
+    # CONSTRUCTOR
+
+    def __init__(self, interval: float = HEALTH_POLL):
+        super().__init__()
+
+        # Attributes definition
+        self.interval = interval
+
+        # Thread configuration
+        self.probe_thread: Optional[threading.Thread] = None
+        self._stop_probing = threading.Event()
+        self._refresh_requested = threading.Event()
+
+    # FLOW CONTROL
+
+    def start(self):
+        if self.probe_thread:
+            return
+        self._stop_probing.clear()
+        self.probe_thread = threading.Thread(target=self.run, daemon=True)
+        self.probe_thread.start()
+
+    def stop(self):
+        if not self.probe_thread:
+            return
+        self._stop_probing.set()
+        self._refresh_requested.set()
+        self.probe_thread.join()
+        self.probe_thread = None
+        CncWorkerMonitor.set_worker_health(None)
+        CncWorkerMonitor.set_worker_status(None)
+
+    def refresh(self):
+        """Requests a new check without waiting for the next scheduled one.
+        """
+        self._refresh_requested.set()
+
+    def run(self):
+        """Main loop of the probe thread.
+        """
+        while not self._stop_probing.is_set():
+            self.check_health()
+            self._refresh_requested.wait(self.interval)
+            self._refresh_requested.clear()
+
+    # UTILITIES
+
+    def check_health(self):
+        worker_on = CncWorkerMonitor.probe_worker_on()
+        worker_running = worker_on and CncWorkerMonitor.probe_worker_running()
+        if CncWorkerMonitor.worker_status_requested:
+            self.check_status(worker_on)
+
+        previous = CncWorkerMonitor.get_worker_health()
+        CncWorkerMonitor.set_worker_health({
+            'on': worker_on,
+            'running': worker_running,
+            'updated_at': time.time()
+        })
+
+        if previous and (previous['on'], previous['running']) == (worker_on, worker_running):
+            return
+
+        self.health_changed.emit(worker_on, worker_running)
+
+    def check_status(self, worker_on: bool):
+        # A worker which is off has no details, there's no need to wait for them
+        status: WorkerStatus = (
+            CncWorkerMonitor.probe_worker_status() if worker_on
+            else {**UNKNOWN_WORKER_STATUS, 'updated_at': time.time()}
+        )
+        CncWorkerMonitor.set_worker_status(status)
+
+    def get_health(self) -> Optional[WorkerHealth]:
+        return CncWorkerMonitor.get_worker_health()
+
+    def get_age(self) -> Optional[float]:
+        """Returns how many seconds ago the cached state was updated.
+        """
+        health = self.get_health()
+        if not health:
+            return None
+        return time.time() - health['updated_at']
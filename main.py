@@ -5,9 +5,17 @@ from MainWindow import MainWindow
 from config import suppressQtWarnings
 import sys
 
-if __name__ == '__main__':
+
+def create_app(argv: list[str]) -> tuple[QApplication, MainWindow]:
+    """Creates the application and shows its main window.
+    """
     suppressQtWarnings()
-    app = QApplication(sys.argv)
+    app = QApplication(argv)
     mainWindow = MainWindow()
     mainWindow.show()
+    return app, mainWindow
+
+
+if __name__ == '__main__':
+    app, mainWindow = create_app(sys.argv)
     sys.exit(app.exec())
@@ -182,5 +182,50 @@ DROP TYPE temp_task_status;
 
 UPDATE alembic_version SET version_num='5269cf543947' WHERE alembic_version.version_num = '3235826a58f1';
 
+-- Indexes of the tasks queue (see benchmarks/task_queries.py)
+
+CREATE INDEX ix_tasks_status_priority_created_at ON tasks (status, priority, created_at);
+
+CREATE INDEX ix_tasks_user_id_id ON tasks (user_id, id);
+
+-- Notify the changes in the rows to other panels (see helpers/dbNotifications.py)
+
+CREATE OR REPLACE FUNCTION notify_table_change() RETURNS trigger AS $$
+DECLARE
+    row_id integer;
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        row_id := OLD.id;
+    ELSE
+        row_id := NEW.id;
+    END IF;
+    PERFORM pg_notify(
+        TG_ARGV[0],
+        json_build_object('table', TG_TABLE_NAME, 'operation', TG_OP, 'id', row_id)::text
+    );
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE TRIGGER tasks_notify_change
+AFTER INSERT OR UPDATE OR DELETE ON tasks
+FOR EACH ROW EXECUTE FUNCTION notify_table_change('cnc_admin_changes');
+
+CREATE OR REPLACE TRIGGER files_notify_change
+AFTER INSERT OR UPDATE OR DELETE ON files
+FOR EACH ROW EXECUTE FUNCTION notify_table_change('cnc_admin_changes');
+
+CREATE OR REPLACE TRIGGER tools_notify_change
+AFTER INSERT OR UPDATE OR DELETE ON tools
+FOR EACH ROW EXECUTE FUNCTION notify_table_change('cnc_admin_changes');
+
+CREATE OR REPLACE TRIGGER materials_notify_change
+AFTER INSERT OR UPDATE OR DELETE ON materials
+FOR EACH ROW EXECUTE FUNCTION notify_table_change('cnc_admin_changes');
+
+CREATE OR REPLACE TRIGGER users_notify_change
+AFTER INSERT OR UPDATE OR DELETE ON users
+FOR EACH ROW EXECUTE FUNCTION notify_table_change('cnc_admin_changes');
+
 COMMIT;
 
@@ -0,0 +1,64 @@
+from benchmarks.cold_start import check, DEFAULT_FRAME_BUDGET, DEFAULT_IMPORT_BUDGET, \
+    parse_import_times, start_app, StartupResult
+import pytest
+
+IMPORTTIME_OUTPUT = """import time: self [us] | cumulative | imported package
+import time:       120 |        120 |     PyQt5.sip
+import time:      2500 |       2620 |   PyQt5.QtCore
+import time:      1000 |       3620 | MainWindow
+import time:       300 |        300 | json
+"""
+
+
+def test_parse_import_times():
+    imports = parse_import_times(IMPORTTIME_OUTPUT)
+
+    assert imports == [
+        {'module': 'PyQt5.sip', 'level': 2, 'self': 0.12, 'cumulative': 0.12},
+        {'module': 'PyQt5.QtCore', 'level': 1, 'self': 2.5, 'cumulative': 2.62},
+        {'module': 'MainWindow', 'level': 0, 'self': 1.0, 'cumulative': 3.62},
+        {'module': 'json', 'level': 0, 'self': 0.3, 'cumulative': 0.3},
+    ]
+
+
+def test_check():
+    result: StartupResult = {
+        'import_time': 1200.0,
+        'first_frame': 1500.0,
+        'imports': [],
+        'imported_views': ['views.TasksView'],
+        'imported_services': ['celery'],
+        'services_started': True
+    }
+
+    assert check(result, 2000.0, 2000.0) == [
+        'Views imported before the first frame: views.TasksView',
+        'Services imported before the first frame: celery',
+        'Background services started before the first frame'
+    ]
+    assert check(result, 1000.0, 1000.0)[:2] == [
+        'Imports took 1200 ms, over the budget of 1000 ms',
+        'The first frame took 1500 ms, over the budget of 1000 ms'
+    ]
+
+
+# Budgets of the unit tests, loose enough for slow machines
+LOOSE_BUDGET_FACTOR = 3
+
+
+def test_cold_start_loose_budget():
+    result = start_app()
+
+    assert check(
+        result,
+        DEFAULT_IMPORT_BUDGET * LOOSE_BUDGET_FACTOR,
+        DEFAULT_FRAME_BUDGET * LOOSE_BUDGET_FACTOR
+    ) == []
+
+
+# Depends on the machine, so it's left out of the unit tests (see setup.cfg)
+@pytest.mark.benchmark
+def test_cold_start_budget():
+    result = start_app()
+
+    assert check(result, DEFAULT_IMPORT_BUDGET, DEFAULT_FRAME_BUDGET) == []
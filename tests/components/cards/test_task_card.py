@@ -4,16 +4,22 @@ from celery.result import AsyncResult
 from components.cards.TaskCard import TaskCard
 from components.dialogs.TaskCancelDialog import TaskCancelDialog
 from components.dialogs.TaskDataDialog import TaskDataDialog
-from core.database.models import Task, TASK_CANCELLED_STATUS, TASK_ON_HOLD_STATUS, \
-    TASK_INITIAL_STATUS, TASK_APPROVED_STATUS
+from core.database.models import Base, File, Material, Task, Tool, User, \
+    TASK_CANCELLED_STATUS, TASK_ON_HOLD_STATUS, TASK_INITIAL_STATUS, TASK_APPROVED_STATUS
 from core.database.repositories.fileRepository import FileRepository
 from core.database.repositories.materialRepository import MaterialRepository
 from core.database.repositories.taskRepository import TaskRepository
 from core.database.repositories.toolRepository import ToolRepository
 from core.worker import WORKER_REQUEST_KEY, WORKER_PAUSE_REQUEST, WORKER_RESUME_REQUEST
-from helpers.cncWorkerMonitor import CncWorkerMonitor
+from helpers.cncWorkerMonitor import CncWorkerMonitor, WorkerSnapshot
+from helpers.dbSession import session_scope
+from helpers.itemsLoader import ItemsLoader
+from helpers.pagination import get_tasks_page
 from pytest_mock.plugin import MockerFixture
 from pytestqt.qtbot import QtBot
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 from typing import Union
 from views.TasksView import TasksView
 
@@ -105,6 +111,54 @@ class TestTaskCard:
             if isinstance(child.widget(), QPushButton):
                 assert child.widget().isEnabled() is False
 
+    def test_task_card_dialogs_of_loaded_task(
+        self,
+        setup_method,
+        qtbot: QtBot,
+        mocker: MockerFixture
+    ):
+        # Store a task in a database
+        # The same in-memory database for every thread
+        engine = create_engine(
+            'sqlite://',
+            connect_args={'check_same_thread': False},
+            poolclass=StaticPool
+        )
+        Base.metadata.create_all(engine)
+        mocker.patch('helpers.dbSession.SessionLocal', sessionmaker(bind=engine))
+        with session_scope() as db_session:
+            db_session.add(
+                User(name='John Doe', email='test@testing.com', password='1234', role='user')
+            )
+            db_session.add(File(user_id=1, file_name='example.gcode', file_hash='hashed-file'))
+            db_session.add(Tool(name='Example tool', description='Just a tool'))
+            db_session.add(Material(name='Example material', description='Just a material'))
+            db_session.add(Task(1, 1, 1, 1, 'Example task', 'Just a task'))
+
+        # Load it in background, like the view does
+        loader = ItemsLoader()
+        with qtbot.waitSignal(loader.loaded) as blocker:
+            loader.start(lambda db_session: get_tasks_page(db_session, 1))
+        task = blocker.args[0][0]
+
+        # Mock TaskDataDialog methods
+        mock_exec = mocker.patch.object(TaskDataDialog, 'exec', return_value=QDialog.Rejected)
+
+        # Call the methods under test
+        card = TaskCard(
+            task,
+            False,
+            files=[{'id': 1, 'name': 'example.gcode'}],
+            tools=[{'id': 1, 'name': 'Example tool'}],
+            materials=[{'id': 1, 'name': 'Example material'}],
+            parent=self.parent
+        )
+        card.updateTask()
+        card.repeatTask()
+
+        # Assertions
+        assert mock_exec.call_count == 2
+
     @pytest.mark.parametrize("dialogResponse", [QDialog.Accepted, QDialog.Rejected])
     def test_task_card_update_task(
         self,
@@ -344,6 +398,57 @@ class TestTaskCard:
         assert mock_query_task.call_count == (1 if worker_task_id else 0)
         assert mock_query_task_info.call_count == (2 if worker_task_id else 0)
 
+    @pytest.mark.parametrize(
+            "status_db,worker_state",
+            [
+                ('in_progress', {'status': 'PROGRESS', 'info': {
+                    'sent_lines': 15,
+                    'processed_lines': 10,
+                    'total_lines': 20
+                }}),
+                ('failed', {'status': 'FAILURE', 'info': 'Mocked error message'}),
+                ('cancelled', None)
+            ]
+        )
+    def test_task_card_from_worker_snapshot(
+        self,
+        qtbot: QtBot,
+        mocker: MockerFixture,
+        status_db,
+        worker_state
+    ):
+        # Mock task status
+        self.task.status = status_db
+        self.task.id = 1
+
+        # Mock Redis methods
+        mock_get_worker_id = mocker.patch('components.cards.TaskCard.get_value_from_id')
+        mock_get_value = mocker.patch('components.cards.TaskCard.get_value')
+
+        # Mock Celery methods
+        mock_query_task = mocker.patch.object(AsyncResult, '__init__', return_value=None)
+
+        # Instantiate card
+        worker_snapshot: WorkerSnapshot = {
+            'paused': True,
+            'states': {1: worker_state} if worker_state else {}
+        }
+        card = TaskCard(self.task, False, worker_snapshot=worker_snapshot)
+        qtbot.addWidget(card)
+
+        # Assertions
+        expected_text = f'Tarea 1: Example task\nEstado: {status_db}'
+        if status_db == 'failed':
+            expected_text += '\nError: Mocked error message'
+        expected_sent = 15 if status_db == 'in_progress' else 0
+
+        assert card.label_description.text() == expected_text
+        assert card.task_progress.sent_progress.value() == expected_sent
+        assert card.paused is (status_db == 'in_progress')
+        assert mock_get_worker_id.call_count == 0
+        assert mock_get_value.call_count == 0
+        assert mock_query_task.call_count == 0
+
     @pytest.mark.parametrize("dialogResponse",  [QDialog.Accepted, QDialog.Rejected])
     def test_task_card_cancel_task(
         self,
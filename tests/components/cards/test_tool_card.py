@@ -4,6 +4,7 @@ from components.cards.ToolCard import ToolCard
 from components.dialogs.ToolDataDialog import ToolDataDialog
 from core.database.models import Tool
 from core.database.repositories.toolRepository import ToolRepository
+from helpers.catalogCache import CatalogCache
 from pytest_mock.plugin import MockerFixture
 from pytestqt.qtbot import QtBot
 
@@ -46,11 +47,15 @@ class TestToolCard:
         # Mock DB method
         mock_update_tool = mocker.patch.object(ToolRepository, 'update_tool')
 
+        # Mock cache methods
+        mock_invalidate = mocker.patch.object(CatalogCache, 'invalidate')
+
         # Call the updateTool method
         self.card.updateTool()
 
         # Validate DB calls
         assert mock_update_tool.call_count == (1 if expected_updated else 0)
+        assert mock_invalidate.call_count == (1 if expected_updated else 0)
 
         if expected_updated:
             update_tool_params = {
@@ -102,11 +107,15 @@ class TestToolCard:
         # Mock DB method
         mock_remove_tool = mocker.patch.object(ToolRepository, 'remove_tool')
 
+        # Mock cache methods
+        mock_invalidate = mocker.patch.object(CatalogCache, 'invalidate')
+
         # Call the removeTool method
         self.card.removeTool()
 
         # Validate DB calls
         assert mock_remove_tool.call_count == expectedMethodCalls
+        assert mock_invalidate.call_count == expectedMethodCalls
 
     def test_tool_card_remove_tool_db_error(self, mocker: MockerFixture):
         # Mock confirmation dialog methods
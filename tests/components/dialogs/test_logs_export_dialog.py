@@ -0,0 +1,42 @@
+from components.dialogs.LogsExportDialog import LogsExportDialog
+from datetime import datetime
+from PyQt5.QtCore import QDateTime
+
+
+class TestLogsExportDialog:
+    def test_logs_export_dialog_init(self, qtbot):
+        dialog = LogsExportDialog()
+        qtbot.addWidget(dialog)
+
+        assert dialog.layout() is not None
+        assert not dialog.since.isEnabled()
+        assert not dialog.until.isEnabled()
+
+    def test_logs_export_dialog_get_inputs_default(self, qtbot):
+        dialog = LogsExportDialog()
+        qtbot.addWidget(dialog)
+
+        logs_filter, compress = dialog.getInputs()
+
+        assert logs_filter.is_empty()
+        assert compress is False
+
+    def test_logs_export_dialog_get_inputs(self, qtbot):
+        dialog = LogsExportDialog()
+        qtbot.addWidget(dialog)
+
+        # Interaction with widget
+        dialog.level.setCurrentIndex(4)
+        dialog.check_since.setChecked(True)
+        dialog.since.setDateTime(QDateTime(2023, 12, 12, 10, 15, 30))
+        dialog.check_until.setChecked(True)
+        dialog.until.setDateTime(QDateTime(2023, 12, 12, 11, 0))
+        dialog.compress.setChecked(True)
+
+        logs_filter, compress = dialog.getInputs()
+
+        assert dialog.since.isEnabled()
+        assert logs_filter.level == 'ERROR'
+        assert logs_filter.since == datetime(2023, 12, 12, 10, 15)
+        assert logs_filter.until == datetime(2023, 12, 12, 11, 0, 59)
+        assert compress is True
@@ -0,0 +1,104 @@
+from components.models.LogsTableModel import LogsTableModel, COLUMN_DATETIME, \
+    COLUMN_LEVEL, COLUMN_MESSAGE, COLUMN_TYPE, LEVEL_COLORS
+from PyQt5.QtCore import Qt
+import pytest
+from pytestqt.modeltest import ModelTester
+from pytestqt.qtbot import QtBot
+
+
+def make_entries(first: int, count: int, level: str = 'INFO'):
+    return [
+        (index * 10, (f'12/12/2023 00:00:{index:02d}', level, None, f'Log {index}'))
+        for index in range(first, first + count)
+    ]
+
+
+class TestLogsTableModel:
+    @pytest.fixture(autouse=True)
+    def setup_method(self, qtbot: QtBot):
+        self.model = LogsTableModel()
+
+    def test_logs_table_model_append(self, qtbot: QtBot):
+        # Call method under test
+        with qtbot.waitSignal(self.model.rowsInserted, raising=True) as blocker:
+            self.model.append(make_entries(0, 3))
+
+        # Assertions
+        assert blocker.args[1:] == [0, 2]
+        assert self.model.rowCount() == 3
+        assert self.model.messages == ['Log 0', 'Log 1', 'Log 2']
+        assert list(self.model.offsets) == [0, 10, 20]
+
+    def test_logs_table_model_prepend(self, qtbot: QtBot):
+        # Mock model state
+        self.model.append(make_entries(5, 2))
+
+        # Call method under test
+        with qtbot.waitSignal(self.model.rowsInserted, raising=True) as blocker:
+            self.model.prepend(make_entries(2, 3))
+
+        # Assertions
+        assert blocker.args[1:] == [0, 2]
+        assert self.model.messages == [f'Log {i}' for i in range(2, 7)]
+        assert list(self.model.offsets) == [20, 30, 40, 50, 60]
+
+    @pytest.mark.parametrize(
+            "first,count,expected",
+            [
+                (0, 2, [2, 3, 4]),
+                (3, 5, [0, 1, 2]),
+                (1, 1, [0, 2, 3, 4]),
+                (5, 1, [0, 1, 2, 3, 4]),
+            ]
+        )
+    def test_logs_table_model_remove(self, first, count, expected):
+        # Mock model state
+        self.model.append(make_entries(0, 5))
+
+        # Call method under test
+        self.model.remove(first, count)
+
+        # Assertions
+        assert self.model.messages == [f'Log {i}' for i in expected]
+        assert list(self.model.offsets) == [i * 10 for i in expected]
+
+    def test_logs_table_model_clear(self):
+        # Mock model state
+        self.model.append(make_entries(0, 5))
+
+        # Call method under test
+        self.model.clear()
+
+        # Assertions
+        assert self.model.rowCount() == 0
+
+    def test_logs_table_model_data(self):
+        # Mock model state
+        self.model.append(make_entries(0, 1))
+        self.model.append([(10, ('12/12/2023 00:00:01', 'ERROR', 'Sent', 'Log 1'))])
+
+        # Assertions
+        assert self.model.data(self.model.index(1, COLUMN_DATETIME)) == '12/12/2023 00:00:01'
+        assert self.model.data(self.model.index(1, COLUMN_LEVEL)) == 'ERROR'
+        assert self.model.data(self.model.index(1, COLUMN_TYPE)) == 'Sent'
+        assert self.model.data(self.model.index(1, COLUMN_MESSAGE)) == 'Log 1'
+        assert self.model.data(self.model.index(0, COLUMN_TYPE)) is None
+        assert self.model.data(self.model.index(0, 0), Qt.ForegroundRole) is None
+        assert self.model.data(self.model.index(1, 0), Qt.ForegroundRole) == LEVEL_COLORS['ERROR']
+        assert self.model.get_log(1) == ('12/12/2023 00:00:01', 'ERROR', 'Sent', 'Log 1')
+        assert self.model.headerData(COLUMN_MESSAGE, Qt.Horizontal) == 'Mensaje'
+
+    def test_logs_table_model_interns_values(self):
+        # Call method under test
+        self.model.append(make_entries(0, 100, 'WARNING'))
+
+        # Assertions
+        assert self.model.levels.itemsize == 1
+        assert set(self.model.levels) == {1}
+
+    def test_logs_table_model_is_valid(self, qtmodeltester: ModelTester):
+        # Mock model state
+        self.model.append(make_entries(0, 5))
+
+        # Assertions
+        qtmodeltester.check(self.model)
@@ -1,5 +1,6 @@
 from components.CodeEditor import CodeEditor
 from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QColor
 from PyQt5.QtWidgets import QFileDialog, QMessageBox
 import pytest
 from pytest_mock.plugin import MockerFixture
@@ -94,6 +95,7 @@ class TestCodeEditor:
         # Mock FS methods
         mocked_file_data = mocker.mock_open(read_data='G1 X10 Y20\nG1 X30 Y40\nG1 X50 Y60')
         mocked_open = mocker.patch('builtins.open', mocked_file_data)
+        mocker.patch('os.path.getsize', return_value=30)
 
         # Mock other methods
         mock_ask_to_save_changes = mocker.patch.object(
@@ -242,3 +244,171 @@ class TestCodeEditor:
         line_number = self.code_editor.extraSelections().pop().cursor.blockNumber() + 1
         assert highlighted_lines == 1
         assert line_number == 3
+
+    @pytest.mark.parametrize(
+            "line,expected",
+            [
+                ('G1 X10 Y-2.5', [(0, 2, 'gword'), (3, 3, 'xyz'), (7, 5, 'xyz')]),
+                ('N10 M3 S1000', [(0, 3, 'line_number'), (4, 2, 'mword'), (7, 5, 'speed')]),
+                (
+                    'G2 I1.5 J-1 F.5',
+                    [(0, 2, 'gword'), (3, 4, 'ijk'), (8, 3, 'ijk'), (12, 3, 'feed')]
+                ),
+                (
+                    'G4 P0.5 (M3 X10)',
+                    [
+                        (0, 2, 'gword'),
+                        (3, 4, 'dwell_time'),
+                        (8, 4, 'comment'),
+                        (12, 3, 'xyz'),
+                        (15, 1, 'comment')
+                    ]
+                ),
+                ('T2 M6 ; G1 tool', [(0, 2, 'tool'), (3, 2, 'mword'), (6, 9, 'comment')]),
+                ('$H', [(0, 2, 'grbl')]),
+                ('$J=G91 X5', [(0, 2, 'grbl'), (3, 3, 'gword'), (7, 2, 'xyz')]),
+            ]
+        )
+    def test_gcode_highlighter(self, qtbot: QtBot, line, expected):
+        # Wait for the highlighter to process the text
+        with qtbot.waitSignal(self.code_editor.textChanged, raising=True):
+            self.code_editor.setPlainText(line)
+        self.code_editor.highlighter.rehighlight()
+
+        # Assertions
+        formats = self.code_editor.highlighter._formats
+        block = self.code_editor.document().firstBlock()
+        applied = [
+            (format_range.start, format_range.length, format_range.format)
+            for format_range in block.layout().formats()
+        ]
+        assert applied == [
+            (start, length, formats[group]) for start, length, group in expected
+        ]
+
+
+class TestCodeEditorLargeFile:
+    @pytest.fixture(autouse=True)
+    def setup_method(self, qtbot: QtBot, tmp_path, mocker: MockerFixture):
+        # Create a file bigger than the large-file threshold
+        self.file_path = tmp_path / 'large.gcode'
+        lines = [f'G1 X{i} Y{i}' for i in range(5000)]
+        self.file_path.write_text('\n'.join(lines))
+        mocker.patch('components.CodeEditor.LARGE_FILE_SIZE', 1024)
+        mocker.patch('components.CodeEditor.WINDOW_LINES', 1000)
+
+        # Create an instance of CodeEditor
+        self.code_editor = CodeEditor()
+        qtbot.addWidget(self.code_editor)
+
+        # Mock dialog methods
+        mocker.patch.object(
+            QFileDialog,
+            'getOpenFileName',
+            return_value=(str(self.file_path), 'G code files (*.txt *.gcode *.nc)')
+        )
+
+    def test_code_editor_import_large_file(self):
+        # Call method under test
+        self.code_editor.import_file()
+
+        # Assertions
+        assert self.code_editor.is_large_file()
+        assert self.code_editor.isReadOnly()
+        assert self.code_editor.get_modified() is False
+        assert self.code_editor.get_file_path() == str(self.file_path)
+        assert self.code_editor.blockCount() == 1000
+        assert self.code_editor.line_count() == 5000
+        assert self.code_editor.document().firstBlock().text() == 'G1 X0 Y0'
+
+    def test_code_editor_large_file_indexed_in_background(
+            self,
+            qtbot: QtBot,
+            mocker: MockerFixture
+    ):
+        mocker.patch('helpers.mappedTextFile.INDEX_CHUNK_SIZE', 1024)
+
+        # Call method under test
+        with qtbot.waitSignal(self.code_editor.large_file_indexed):
+            self.code_editor.import_file()
+
+            # The first window is shown before the index is complete
+            assert self.code_editor.blockCount() == 1000
+            assert self.code_editor.document().firstBlock().text() == 'G1 X0 Y0'
+
+        # Assertions
+        assert self.code_editor.large_file is not None
+        assert self.code_editor.large_file.is_indexed()
+        assert self.code_editor.line_count() == 5000
+
+    def test_code_editor_large_file_stays_read_only(self):
+        self.code_editor.import_file()
+
+        # Call method under test
+        self.code_editor.setReadOnly(False)
+
+        # Assertions
+        assert self.code_editor.isReadOnly()
+
+    def test_code_editor_large_file_scroll_window(self):
+        self.code_editor.import_file()
+
+        # Call method under test
+        scrollbar = self.code_editor.verticalScrollBar()
+        scrollbar.setValue(scrollbar.maximum())
+
+        # Assertions
+        window_start = self.code_editor.window_start
+        first_block = self.code_editor.document().firstBlock()
+        first_visible = self.code_editor.firstVisibleBlock()
+        assert window_start > 0
+        assert first_block.text() == f'G1 X{window_start} Y{window_start}'
+        assert self.code_editor.setIndex(first_visible) == str(
+            self.code_editor.window_start + first_visible.blockNumber() + 1
+        )
+
+        # Go back to the beginning of the file
+        scrollbar.setValue(scrollbar.minimum())
+        scrollbar.setValue(scrollbar.minimum())
+        assert self.code_editor.window_start == 0
+
+    def test_code_editor_large_file_processed_lines(self):
+        self.code_editor.import_file()
+        self.code_editor.load_window(3000)
+
+        # Call method under test
+        self.code_editor.markProcessedLines(3500)
+
+        # Assertions
+        block = self.code_editor.document().firstBlock()
+        assert self.code_editor.setIndexPenColor(block) == QColor(Qt.darkYellow)
+        block = self.code_editor.document().findBlockByNumber(600)
+        assert self.code_editor.setIndexPenColor(block) == QColor(Qt.black)
+
+    def test_code_editor_large_file_export(self, tmp_path, mocker: MockerFixture):
+        self.code_editor.import_file()
+        new_path = tmp_path / 'copy.gcode'
+        mocker.patch.object(
+            QFileDialog,
+            'getSaveFileName',
+            return_value=(str(new_path), 'G code files (*.txt *.gcode *.nc)')
+        )
+
+        # Call methods under test
+        assert self.code_editor.export_file() is True
+        assert self.code_editor.export_file_as() is True
+
+        # Assertions
+        assert new_path.read_text() == self.file_path.read_text()
+        assert self.code_editor.get_file_path() == str(new_path)
+
+    def test_code_editor_large_file_new_file(self):
+        self.code_editor.import_file()
+
+        # Call method under test
+        self.code_editor.new_file()
+
+        # Assertions
+        assert not self.code_editor.is_large_file()
+        assert not self.code_editor.isReadOnly()
+        assert self.code_editor.toPlainText() == ''
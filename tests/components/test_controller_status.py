@@ -38,36 +38,88 @@ class TestControllerStatus:
         assert self.controller_status.y_pos.text() == 'Y: 2.55 (7.55)'
         assert self.controller_status.z_pos.text() == 'Z: 3.3 (8.3)'
 
+    def test_controller_status_set_partial_status(self):
+        # Set widget initial status
+        self.controller_status.set_status({
+            'activeState': 'Idle',
+            'mpos': {'x': 1.0, 'y': 2.55, 'z': 3.30},
+            'wpos': {'x': 6.0, 'y': 7.55, 'z': 8.30},
+            'ov': []
+        })
+
+        # Call method under test
+        self.controller_status.set_status({'wpos': {'x': 0.0, 'y': 0.0, 'z': 0.0}})
+
+        # Assertions
+        assert self.controller_status.status.text() == 'IDLE'
+        assert self.controller_status.x_pos.text() == 'X: 1.0 (0.0)'
+        assert self.controller_status.y_pos.text() == 'Y: 2.55 (0.0)'
+        assert self.controller_status.z_pos.text() == 'Z: 3.3 (0.0)'
+
     def test_controller_status_set_tool(self, mocker):
         # Mock DB methods
         test_tool = Tool('Test tool', 'It is a really useful tool')
-        mock_db_get_tool_by_id = mocker.patch.object(
+        test_tool.id = 2
+        other_tool = Tool('Other tool', 'It is another useful tool')
+        other_tool.id = 3
+        mock_db_get_all_tools = mocker.patch.object(
             ToolRepository,
-            'get_tool_by_id',
-            return_value=test_tool
+            'get_all_tools',
+            return_value=[test_tool, other_tool]
         )
 
+        mock_submit = mocker.patch('helpers.catalogCache.executor.submit')
+
         # Call method under test
         self.controller_status.set_tool(2)
 
         # Assertions
-        assert mock_db_get_tool_by_id.call_count == 1
+        # The tools are loaded in background, not in the GUI thread
+        assert mock_db_get_all_tools.call_count == 0
+        assert self.controller_status.tool.text() == 'Tool: xxx'
+        assert self.controller_status.tool_index == 0
+
+        load, *args = mock_submit.call_args[0]
+        load(*args)
+        self.controller_status.set_tool(2)
+        assert mock_db_get_all_tools.call_count == 1
         assert self.controller_status.tool.text() == 'Tool: 2 (Test tool)'
         assert self.controller_status.tool_index == 2
 
+        # Tools are cached
+        self.controller_status.set_tool(3)
+        assert mock_db_get_all_tools.call_count == 1
+        assert self.controller_status.tool.text() == 'Tool: 3 (Other tool)'
+        assert self.controller_status.tool_index == 3
+
+    def test_controller_status_set_unknown_tool(self, mocker):
+        # Set widget initial status
+        self.controller_status.tool.setText('Tool: 1 (Initial tool)')
+        self.controller_status.tool_index = 1
+
+        # Mock DB methods
+        mocker.patch.object(ToolRepository, 'get_all_tools', return_value=[])
+
+        # Call method under test
+        self.controller_status.set_tool(2)
+
+        # Assertions
+        assert self.controller_status.tool.text() == 'Tool: 1 (Initial tool)'
+        assert self.controller_status.tool_index == 1
+
     def test_controller_status_set_tool_no_change(self, mocker):
         # Set widget initial status
         self.controller_status.tool.setText('Tool: 1 (Initial tool)')
         self.controller_status.tool_index = 1
 
         # Mock DB methods
-        mock_db_get_tool_by_id = mocker.patch.object(ToolRepository, 'get_tool_by_id')
+        mock_db_get_all_tools = mocker.patch.object(ToolRepository, 'get_all_tools')
 
         # Call method under test
         self.controller_status.set_tool(1)
 
         # Assertions
-        assert mock_db_get_tool_by_id.call_count == 0
+        assert mock_db_get_all_tools.call_count == 0
         assert self.controller_status.tool.text() == 'Tool: 1 (Initial tool)'
         assert self.controller_status.tool_index == 1
 
@@ -77,17 +129,22 @@ class TestControllerStatus:
         self.controller_status.tool_index = 1
 
         # Mock DB methods
-        mock_db_get_tool_by_id = mocker.patch.object(
+        mock_db_get_all_tools = mocker.patch.object(
             ToolRepository,
-            'get_tool_by_id',
+            'get_all_tools',
             side_effect=Exception('mocked-error')
         )
+        mock_submit = mocker.patch('helpers.catalogCache.executor.submit')
 
         # Call method under test
         self.controller_status.set_tool(2)
+        load, *args = mock_submit.call_args[0]
+        with pytest.raises(Exception):
+            load(*args)
+        self.controller_status.set_tool(2)
 
         # Assertions
-        assert mock_db_get_tool_by_id.call_count == 1
+        assert mock_db_get_all_tools.call_count == 1
         assert self.controller_status.tool.text() == 'Tool: 1 (Initial tool)'
         assert self.controller_status.tool_index == 1
 
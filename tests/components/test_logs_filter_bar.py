@@ -0,0 +1,52 @@
+from components.LogsFilterBar import LogsFilterBar
+import pytest
+from pytestqt.qtbot import QtBot
+
+
+class TestLogsFilterBar:
+    @pytest.fixture(autouse=True)
+    def setup_method(self, qtbot: QtBot):
+        self.filter_bar = LogsFilterBar()
+        qtbot.addWidget(self.filter_bar)
+
+    def test_logs_filter_bar_set_types(self):
+        # Select a type
+        self.filter_bar.set_types(['received', 'sent'])
+        self.filter_bar.log_type.setCurrentIndex(2)
+
+        # Call method under test
+        self.filter_bar.set_types(['alarm', 'received', 'sent'])
+
+        # Assertions
+        assert self.filter_bar.log_type.count() == 4
+        assert self.filter_bar.log_type.currentData() == 'sent'
+
+    def test_logs_filter_bar_apply(self, qtbot: QtBot):
+        # Fill the inputs
+        self.filter_bar.set_types(['received', 'sent'])
+        self.filter_bar.log_type.setCurrentIndex(1)
+        self.filter_bar.search.setText('ALARM:2')
+
+        # Call method under test
+        with qtbot.waitSignal(self.filter_bar.filter_changed) as blocker:
+            self.filter_bar.level.setCurrentIndex(5)
+
+        # Assertions
+        logs_filter = blocker.args[0]
+        assert logs_filter.level == 'CRITICAL'
+        assert logs_filter.log_type == 'received'
+        assert logs_filter.tokens == {'alarm:2'}
+
+    def test_logs_filter_bar_clear(self, qtbot: QtBot):
+        # Fill the inputs
+        self.filter_bar.level.setCurrentIndex(1)
+        self.filter_bar.search.setText('ALARM:2')
+
+        # Call method under test
+        with qtbot.waitSignal(self.filter_bar.filter_changed) as blocker:
+            self.filter_bar.clear()
+
+        # Assertions
+        assert blocker.args[0].is_empty()
+        assert self.filter_bar.search.text() == ''
+        assert self.filter_bar.level.currentIndex() == 0
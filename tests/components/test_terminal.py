@@ -19,12 +19,92 @@ class TestTerminal:
         assert helpers.count_widgets(self.terminal.layout(), QLineEdit) == 1
         assert self.terminal.display_screen.toPlainText() == ''
 
-    def test_terminal_display_text(self):
+    def test_terminal_display_text(self, qtbot):
         # Call method under test
         self.terminal.display_text('some text')
 
         # Assertions
-        assert self.terminal.display_screen.toPlainText() == 'some text\n'
+        qtbot.waitUntil(lambda: self.terminal.display_screen.toPlainText() == 'some text\n')
+
+    def test_terminal_display_lines(self, qtbot):
+        # Spy on document changes
+        changes = []
+        document = self.terminal.display_screen.document()
+        document.contentsChange.connect(lambda *args: changes.append(args))
+
+        # Call method under test
+        self.terminal.display_lines(['ok', 'ok'])
+        self.terminal.display_lines(['[MSG:Reset to continue]'])
+        self.terminal.display_lines([])
+
+        # Assertions
+        assert self.terminal.display_screen.toPlainText() == ''
+        expected = 'ok\nok\n[MSG:Reset to continue]\n'
+        qtbot.waitUntil(lambda: self.terminal.display_screen.toPlainText() == expected)
+        assert len(changes) == 1
+
+    def test_terminal_max_lines(self):
+        # Mock state of widget
+        self.terminal.display_screen.setMaximumBlockCount(3 + 1)
+
+        # Call method under test
+        self.terminal.display_lines([f'line {i}' for i in range(10)])
+        self.terminal.flush()
+
+        # Assertions
+        assert self.terminal.display_screen.toPlainText() == 'line 7\nline 8\nline 9\n'
+
+    @pytest.mark.parametrize(
+            "batches,expected",
+            [
+                ([['ok', 'ok', 'ok']], 'ok (x3)\n'),
+                ([['ok'], ['ok'], ['ok']], 'ok (x3)\n'),
+                ([['ok', 'error:9', 'ok', 'ok']], 'ok\nerror:9\nok (x2)\n'),
+                ([['ok', 'ok'], ['<Idle>', 'ok']], 'ok (x2)\n<Idle>\nok\n'),
+            ]
+        )
+    def test_terminal_collapse_ok(self, batches, expected):
+        # Mock state of widget
+        self.terminal.set_collapse_ok(True)
+
+        # Call method under test
+        for batch in batches:
+            self.terminal.display_lines(batch)
+            self.terminal.flush()
+
+        # Assertions
+        assert self.terminal.display_screen.toPlainText() == expected
+
+    @pytest.mark.parametrize("pinned", [False, True])
+    def test_terminal_auto_scroll(self, pinned):
+        # Mock state of widget
+        self.terminal.display_lines([f'line {i}' for i in range(200)])
+        self.terminal.flush()
+        scrollbar = self.terminal.display_screen.verticalScrollBar()
+        scrollbar.setValue(scrollbar.maximum() if pinned else 0)
+
+        # Call method under test
+        self.terminal.display_lines([f'new line {i}' for i in range(50)])
+        self.terminal.flush()
+
+        # Assertions
+        if pinned:
+            assert scrollbar.value() == scrollbar.maximum()
+        else:
+            assert scrollbar.value() == 0
+
+    def test_terminal_clear(self):
+        # Mock state of widget
+        self.terminal.display_lines(['ok'])
+        self.terminal.flush()
+        self.terminal.display_lines(['pending'])
+
+        # Call method under test
+        self.terminal.clear()
+        self.terminal.flush()
+
+        # Assertions
+        assert self.terminal.display_screen.toPlainText() == ''
 
     def test_terminal_send_line(self):
         # Mock state of widget
@@ -1,5 +1,6 @@
 from components.text.LogsViewer import LogsViewer, Worker
-from core.utils.logs import LogsInterpreter, LogFileWatcher
+from helpers.logsArchive import LogsArchive
+from helpers.logsIndex import LogsFilter
 from operator import xor
 from PyQt5.QtCore import QThread
 import pytest
@@ -7,36 +8,83 @@ from pytest_mock.plugin import MockerFixture
 from pytestqt.qtbot import QtBot
 
 
+def write_logs(file_path, messages: list[str]):
+    with open(file_path, 'a') as file:
+        for message in messages:
+            file.write(f'[12/12/2023 00:00:00] INFO: {message}\n')
+
+
 class TestLogsViewer:
     @pytest.fixture(autouse=True)
-    def setup_method(self, mocker: MockerFixture):
-        # Mock the logs interpreter
-        mocker.patch.object(
-            LogsInterpreter,
-            'interpret_file',
-            return_value=[]
-        )
+    def setup_method(self, qtbot: QtBot, tmp_path, mocker: MockerFixture):
+        # Mock the logs file
+        self.logs_file = tmp_path / 'grbl.log'
+        mocker.patch('components.text.LogsViewer.GRBL_LOGS_FILE', self.logs_file)
 
         # Create an instance of Terminal
         self.logs_viewer = LogsViewer()
+        qtbot.addWidget(self.logs_viewer)
 
     def test_setup_ui(self, mocker: MockerFixture):
-        # Mock the logs interpreter
-        mocker.patch.object(
-            LogsInterpreter,
-            'interpret_file',
-            return_value=[
-                ('2023/12/12 00:00:00', 'INFO', None, 'Log 1'),
-                ('2023/12/12 00:00:10', 'WARNING', None, 'Log 2'),
-                ('2023/12/12 00:00:20', 'CRITICAL', None, 'Log 3'),
-            ]
-        )
+        # Mock the logs file
+        write_logs(self.logs_file, ['Log 1', 'Log 2', 'Log 3'])
+
+        # Create an instance of Terminal
+        logs_viewer = LogsViewer()
+
+        # Assertions
+        assert logs_viewer.logs.messages == ['Log 1', 'Log 2', 'Log 3']
+        assert logs_viewer.logs.get_log(0) == ('12/12/2023 00:00:00', 'INFO', None, 'Log 1')
+
+    def test_setup_ui_loads_last_logs(self, mocker: MockerFixture):
+        # Mock the logs file
+        write_logs(self.logs_file, [f'Log {i}' for i in range(100)])
+        mocker.patch('components.text.LogsViewer.INITIAL_LOGS', 10)
 
         # Create an instance of Terminal
         logs_viewer = LogsViewer()
 
         # Assertions
-        assert logs_viewer.toPlainText() == 'Log 1\nLog 2\nLog 3'
+        assert logs_viewer.logs.messages == [f'Log {i}' for i in range(90, 100)]
+        assert logs_viewer.logs.rowCount() == 10
+
+    def test_logs_viewer_load_pages(self, qtbot: QtBot, mocker: MockerFixture):
+        # Mock the logs file
+        write_logs(self.logs_file, [f'Log {i}' for i in range(100)])
+        mocker.patch('components.text.LogsViewer.INITIAL_LOGS', 10)
+        mocker.patch('components.text.LogsViewer.PAGE_SIZE', 10)
+        mocker.patch('components.text.LogsViewer.MAX_LOGS', 25)
+        logs_viewer = LogsViewer()
+        qtbot.addWidget(logs_viewer)
+        logs_viewer.show()
+        scrollbar = logs_viewer.verticalScrollBar()
+
+        def messages():
+            return logs_viewer.logs.messages
+
+        def loaded_from_offsets():
+            model = logs_viewer.logs
+            entries, _ = logs_viewer.reader.read_after(model.get_offset(0), model.rowCount())
+            return [log[-1] for _, log in entries]
+
+        # Scroll to the top
+        scrollbar.setValue(scrollbar.minimum())
+
+        # Assertions
+        assert messages() == [f'Log {i}' for i in range(80, 100)]
+        assert logs_viewer.at_end
+
+        # Exceed the maximum amount of logs
+        logs_viewer.load_older()
+        assert messages() == [f'Log {i}' for i in range(70, 95)]
+        assert loaded_from_offsets() == messages()
+        assert not logs_viewer.at_end
+
+        # Go back to the newest logs
+        logs_viewer.load_newer()
+        assert messages() == [f'Log {i}' for i in range(75, 100)]
+        assert loaded_from_offsets() == messages()
+        assert logs_viewer.at_end
 
     def test_logs_viewer_start_watching(self, mocker: MockerFixture):
         # Mock thread
@@ -123,21 +171,64 @@ class TestLogsViewer:
         # Assertions
         assert mock_worker_stop.call_count == (1 if running else 0)
 
-    def test_logs_viewer_add_log(self, mocker: MockerFixture):
+    def test_logs_viewer_add_logs(self, mocker: MockerFixture):
         # Mock ui methods
         mock_append_log_msg = mocker.patch.object(
-            self.logs_viewer,
-            'appendPlainText'
+            self.logs_viewer.logs,
+            'append'
         )
 
         # Call method under test
-        self.logs_viewer.add_log(
-            ('2023/12/12 00:00:00', 'INFO', None, 'Testing')
+        self.logs_viewer.add_logs(
+            [(0, ('12/12/2023 00:00:00', 'INFO', None, 'Testing'))],
+            48
         )
 
         # Assertions
         assert mock_append_log_msg.call_count == 1
-        mock_append_log_msg.assert_called_with('Testing')
+        mock_append_log_msg.assert_called_with(
+            [(0, ('12/12/2023 00:00:00', 'INFO', None, 'Testing'))]
+        )
+        assert self.logs_viewer.window_end == 48
+
+    def test_logs_viewer_add_logs_when_not_at_end(self):
+        # Mock viewer state
+        self.logs_viewer.at_end = False
+
+        # Call method under test
+        self.logs_viewer.add_logs(
+            [(0, ('12/12/2023 00:00:00', 'INFO', None, 'Testing'))],
+            48
+        )
+
+        # Assertions
+        assert self.logs_viewer.logs.messages == []
+
+    def test_logs_viewer_add_logs_not_contiguous(self):
+        # Mock the logs file
+        write_logs(self.logs_file, ['Log 1', 'Log 2', 'Log 3'])
+
+        # Call method under test
+        self.logs_viewer.add_logs(
+            [(100, ('12/12/2023 00:00:00', 'INFO', None, 'Log 3'))],
+            150
+        )
+
+        # Assertions
+        assert self.logs_viewer.logs.messages == ['Log 1', 'Log 2', 'Log 3']
+
+    def test_logs_viewer_load_latest_truncated_file(self):
+        # Mock the logs file
+        write_logs(self.logs_file, ['Log 1', 'Log 2'])
+        self.logs_viewer.load_latest()
+        self.logs_file.write_text('')
+        write_logs(self.logs_file, ['New log'])
+
+        # Call method under test
+        self.logs_viewer.load_latest()
+
+        # Assertions
+        assert self.logs_viewer.logs.messages == ['New log']
 
     def test_logs_viewer_worker_stop(self):
         # Mock worker state
@@ -149,33 +240,180 @@ class TestLogsViewer:
         # Assertions
         assert self.logs_viewer.logs_worker._running is False
 
-    def test_logs_viewer_watch_logs(self, qtbot: QtBot, mocker: MockerFixture):
-        def manage_thread(_):
-            self.logs_viewer.stop()
-
-        # Mock file watcher
-        mock_watcher = mocker.patch.object(
-            LogFileWatcher,
-            'watch',
-            return_value=iter([
-                ('2023/12/12 00:00:00', 'INFO', None, 'Log 1'),
-                ('2023/12/12 00:00:10', 'WARNING', None, 'Log 2'),
-                ('2023/12/12 00:00:20', 'CRITICAL', None, 'Log 3'),
-            ])
+    def test_logs_viewer_watch_logs(self, qtbot: QtBot):
+        # Mock the logs file
+        write_logs(self.logs_file, ['Log 1'])
+        self.logs_viewer.load_latest()
+
+        # Start watching the file
+        self.logs_viewer.start()
+
+        # Call method under test
+        with qtbot.waitSignal(self.logs_viewer.logs_worker.new_logs, raising=True):
+            write_logs(self.logs_file, ['Log 2', 'Log 3'])
+
+        # Assertions
+        qtbot.waitUntil(lambda: self.logs_viewer.logs.messages == ['Log 1', 'Log 2', 'Log 3'])
+
+        self.logs_viewer.stop()
+        assert self.logs_viewer.logs_worker.tailer is None
+
+    def test_logs_viewer_watch_logs_paused(self, qtbot: QtBot):
+        # Start watching the file
+        self.logs_viewer.start()
+        self.logs_viewer.pause()
+
+        # Call method under test
+        with qtbot.assertNotEmitted(self.logs_viewer.logs_worker.new_logs, wait=300):
+            write_logs(self.logs_file, ['Log 1'])
+
+        with qtbot.waitSignal(self.logs_viewer.logs_worker.new_logs, raising=True):
+            self.logs_viewer.resume()
+
+        # Assertions
+        qtbot.waitUntil(lambda: self.logs_viewer.logs.messages == ['Log 1'])
+
+        self.logs_viewer.stop()
+
+    def test_logs_viewer_index_history(self):
+        # Mock the logs file
+        write_logs(self.logs_file, ['Log 1', 'Log 2 ALARM:2', 'Log 3'])
+        self.logs_viewer.logs_worker._running = True
+
+        # Call method under test
+        end = self.logs_viewer.reader.complete_size()
+        self.logs_viewer.logs_worker.index_history(end)
+
+        # Assertions
+        assert self.logs_viewer.index.count == 3
+        assert self.logs_viewer.index.end == end
+
+    def test_logs_viewer_set_filter(self, qtbot: QtBot):
+        # Mock the logs file
+        write_logs(self.logs_file, ['Log 1', 'Log 2 ALARM:2', 'Log 3', 'Log 4 ALARM:2'])
+        self.logs_viewer.load_latest()
+        self.logs_viewer.logs_worker._running = True
+        self.logs_viewer.logs_worker.index_history(self.logs_viewer.window_end)
+
+        # Call method under test
+        with qtbot.waitSignal(self.logs_viewer.logs_search.found, raising=True):
+            self.logs_viewer.set_filter(LogsFilter(text='alarm:2'))
+
+        # Assertions
+        assert self.logs_viewer.logs.messages == ['Log 2 ALARM:2', 'Log 4 ALARM:2']
+
+        # New logs are filtered too
+        offset = self.logs_viewer.window_end
+        self.logs_viewer.add_logs(
+            [
+                (offset, ('12/12/2023 00:00:00', 'INFO', None, 'Log 5')),
+                (offset + 40, ('12/12/2023 00:00:00', 'INFO', None, 'Log 6 ALARM:2')),
+            ],
+            offset + 80
         )
-        mocker.patch('time.sleep', side_effect=manage_thread)
+        assert self.logs_viewer.logs.messages[-1] == 'Log 6 ALARM:2'
+        assert self.logs_viewer.logs.rowCount() == 3
+
+        # An empty filter shows every log again
+        self.logs_viewer.set_filter(LogsFilter())
+        assert self.logs_viewer.logs.messages == [
+            'Log 1', 'Log 2 ALARM:2', 'Log 3', 'Log 4 ALARM:2'
+        ]
+
+    def test_logs_viewer_set_filter_not_indexed(self, qtbot: QtBot, mocker: MockerFixture):
+        # Mock the logs file
+        write_logs(self.logs_file, [f'Log {i}' for i in range(10)] + ['Log Homing'])
+        self.logs_viewer.load_latest()
+        self.logs_viewer.logs_worker._running = True
+        self.logs_viewer.logs_worker.index_history(self.logs_viewer.window_end)
+        mocker.patch('components.text.LogsViewer.BATCH_SIZE', 3)
 
-        # Mock thread methods
-        mocker.patch.object(QThread, 'wait')
+        # Call method under test
+        with qtbot.waitSignal(self.logs_viewer.logs_search.found, raising=True):
+            self.logs_viewer.set_filter(LogsFilter(text='homing'))
+
+        # Assertions
+        assert self.logs_viewer.logs.messages == ['Log Homing']
+
+    def test_logs_viewer_set_filter_archived_logs(self, qtbot: QtBot):
+        # Mock the logs file, with two archives
+        write_logs(self.logs_file, ['Log 1 ALARM:2', 'Log 2'])
+        LogsArchive(self.logs_file).rotate()
+        write_logs(self.logs_file, ['Log 3 ALARM:2', 'Log 4'])
+        LogsArchive(self.logs_file).rotate()
+        write_logs(self.logs_file, ['Log 5 ALARM:2', 'Log 6 homing'])
+        self.logs_viewer.load_latest()
+        self.logs_viewer.logs_worker._running = True
+        self.logs_viewer.logs_worker.index_history(self.logs_viewer.window_end)
+
+        # Only the oldest archive is summarized
+        index = self.logs_viewer.index
+        assert len(index.summaries) == 1
+        assert index.start == index.summaries[0]['end']
 
         # Call method under test
-        with qtbot.waitSignals(
-            [self.logs_viewer.logs_worker.new_log] * 3,
-            raising=True
+        with qtbot.waitSignal(self.logs_viewer.logs_search.found, raising=True):
+            self.logs_viewer.set_filter(LogsFilter(text='alarm:2'))
+
+        # Assertions
+        assert self.logs_viewer.logs.messages == [
+            'Log 1 ALARM:2', 'Log 3 ALARM:2', 'Log 5 ALARM:2'
+        ]
+
+        # Summaries without matches are not scanned
+        with qtbot.waitSignal(self.logs_viewer.logs_search.found, raising=True):
+            self.logs_viewer.set_filter(LogsFilter(text='error:9'))
+        assert self.logs_viewer.logs.messages == []
+
+    def test_logs_viewer_set_filter_cancelled(self, qtbot: QtBot):
+        # Mock the logs file
+        write_logs(self.logs_file, ['Log 1', 'Log 2 ALARM:2'])
+        self.logs_viewer.load_latest()
+        self.logs_viewer.logs_worker._running = True
+        self.logs_viewer.logs_worker.index_history(self.logs_viewer.window_end)
+
+        # Call method under test
+        self.logs_viewer.set_filter(LogsFilter(text='alarm:2'))
+        first_search_id = self.logs_viewer.logs_search.search_id
+        with qtbot.waitSignal(
+            self.logs_viewer.logs_search.found,
+            raising=True,
+            check_params_cb=lambda search_id, _: search_id != first_search_id
         ):
-            self.logs_viewer.start()
+            self.logs_viewer.set_filter(LogsFilter(text='alarm:3'))
 
         # Assertions
-        assert mock_watcher.call_count == 1
-        assert self.logs_viewer.logs_worker._running is False
-        assert self.logs_viewer.toPlainText() == 'Log 1\nLog 2\nLog 3'
+        # Matches of a previous search are discarded
+        self.logs_viewer.on_logs_found(first_search_id, [
+            (0, ('12/12/2023 00:00:00', 'INFO', None, 'Log 2 ALARM:2'))
+        ])
+        assert self.logs_viewer.logs.messages == []
+
+    def test_logs_viewer_show_in_context(self, qtbot: QtBot):
+        # Mock the logs file
+        write_logs(self.logs_file, [f'Log {i}' for i in range(10)] + ['Log ALARM:2'])
+        self.logs_viewer.load_latest()
+        self.logs_viewer.logs_worker._running = True
+        self.logs_viewer.logs_worker.index_history(self.logs_viewer.window_end)
+        with qtbot.waitSignal(self.logs_viewer.logs_search.found, raising=True):
+            self.logs_viewer.set_filter(LogsFilter(text='alarm:2'))
+
+        # Call method under test
+        self.logs_viewer.show_in_context(self.logs_viewer.logs.index(0, 0))
+
+        # Assertions
+        assert self.logs_viewer.logs_filter is None
+        assert self.logs_viewer.logs.messages[-2:] == ['Log 9', 'Log ALARM:2']
+        assert self.logs_viewer.currentIndex().row() == self.logs_viewer.logs.rowCount() - 1
+
+    def test_logs_viewer_reads_rotated_logs(self):
+        # Mock the logs file
+        write_logs(self.logs_file, ['Log 1', 'Log 2'])
+        LogsArchive(self.logs_file).rotate()
+        write_logs(self.logs_file, ['Log 3'])
+
+        # Call method under test
+        logs_viewer = LogsViewer()
+
+        # Assertions
+        assert logs_viewer.logs.messages == ['Log 1', 'Log 2', 'Log 3']
@@ -1,7 +1,9 @@
+from helpers.catalogCache import CatalogCache
 from MainWindow import MainWindow
 from PyQt5.QtWidgets import QLayout, QGridLayout, QWidget
 import pytest
 from pytest_mock.plugin import MockerFixture
+from pytestqt.qtbot import QtBot
 from typing import cast
 from views.BaseListView import BaseListView
 
@@ -17,6 +19,21 @@ class Helpers:
                 count = count + 1
         return count
 
+    @staticmethod
+    def count_list_widgets(view: BaseListView, widgetType) -> int:
+        return sum(
+            Helpers.count_widgets(list_widgets['container'].items_layout, widgetType)
+            for list_widgets in view.list_widgets
+        )
+
+    @staticmethod
+    def wait_loaded(qtbot: QtBot, view: BaseListView):
+        """Waits until the items of the view are loaded in background.
+        """
+        qtbot.waitUntil(
+            lambda: not view.items_loader.is_running() and not view.page_loader.is_running()
+        )
+
     @staticmethod
     def count_grid_widgets(layout: QGridLayout, widgetType) -> int:
         count = 0
@@ -34,6 +51,18 @@ class Helpers:
 def helpers():
     return Helpers
 
+
+@pytest.fixture(autouse=True)
+def clear_catalog_cache(mocker: MockerFixture):
+    """Prevents the cached catalogs from leaking between tests, and from
+    being loaded in background.
+    """
+    mocker.patch('helpers.catalogCache.executor')
+    CatalogCache.invalidate()
+    yield
+    CatalogCache.invalidate()
+    CatalogCache.warming.clear()
+
 # Mock for UI elements
 
 
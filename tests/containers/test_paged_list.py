@@ -0,0 +1,95 @@
+from containers.PagedList import PagedList
+from PyQt5.QtWidgets import QLabel
+
+
+class TestPagedList:
+    def test_paged_list_init(self, qtbot, helpers):
+        paged_list = PagedList()
+        qtbot.addWidget(paged_list)
+
+        for index in range(3):
+            paged_list.items_layout.addWidget(QLabel(f'label {index}'))
+
+        # Assertions
+        assert helpers.count_widgets(paged_list.items_layout, QLabel) == 3
+
+    def test_paged_list_fetch_more_on_scroll(self, qtbot):
+        paged_list = PagedList()
+        paged_list.resize(200, 200)
+        qtbot.addWidget(paged_list)
+
+        for index in range(100):
+            paged_list.items_layout.addWidget(QLabel(f'label {index}'))
+        paged_list.show()
+        qtbot.waitExposed(paged_list)
+
+        scroll_bar = paged_list.verticalScrollBar()
+        assert scroll_bar.maximum() > 0
+
+        # Scrolling far from the end
+        with qtbot.assertNotEmitted(paged_list.fetch_more):
+            scroll_bar.setValue(1)
+
+        # Scrolling near the end
+        with qtbot.waitSignal(paged_list.fetch_more):
+            scroll_bar.setValue(scroll_bar.maximum())
+
+    def test_paged_list_fetch_previous_on_scroll(self, qtbot):
+        paged_list = PagedList()
+        paged_list.resize(200, 200)
+        qtbot.addWidget(paged_list)
+
+        for index in range(100):
+            paged_list.items_layout.addWidget(QLabel(f'label {index}'))
+        paged_list.show()
+        qtbot.waitExposed(paged_list)
+
+        scroll_bar = paged_list.verticalScrollBar()
+        scroll_bar.setValue(scroll_bar.maximum())
+
+        # Scrolling near the start
+        with qtbot.waitSignal(paged_list.fetch_previous):
+            scroll_bar.setValue(0)
+
+    def test_paged_list_keep_position(self, qtbot):
+        paged_list = PagedList()
+        paged_list.resize(200, 200)
+        qtbot.addWidget(paged_list)
+
+        labels = [QLabel(f'label {index}') for index in range(100)]
+        for label in labels:
+            paged_list.items_layout.addWidget(label)
+        paged_list.show()
+        qtbot.waitExposed(paged_list)
+
+        scroll_bar = paged_list.verticalScrollBar()
+        scroll_bar.setValue(scroll_bar.maximum() // 2)
+        anchor = labels[50]
+        position = anchor.y() - scroll_bar.value()
+
+        # Call the method under test
+        paged_list.keep_position(anchor)
+        for label in labels[:20]:
+            paged_list.items_layout.removeWidget(label)
+            label.deleteLater()
+
+        # Assertions
+        qtbot.waitUntil(lambda: paged_list._anchor is None)
+        assert anchor.y() - scroll_bar.value() == position
+
+    def test_paged_list_fetch_more_when_not_full(self, qtbot):
+        paged_list = PagedList()
+        paged_list.resize(200, 200)
+        qtbot.addWidget(paged_list)
+
+        # The widgets never fill the list
+        with qtbot.waitSignal(paged_list.fetch_more):
+            paged_list.items_layout.addWidget(QLabel('label'))
+            paged_list.show()
+
+    def test_paged_list_check_fetch_more(self, qtbot):
+        paged_list = PagedList()
+        qtbot.addWidget(paged_list)
+
+        with qtbot.waitSignal(paged_list.fetch_more):
+            paged_list.check_fetch_more()
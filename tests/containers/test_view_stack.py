@@ -0,0 +1,118 @@
+from containers.ViewStack import ViewStack
+from MainWindow import MainWindow
+from PyQt5.QtGui import QCloseEvent
+from PyQt5.QtWidgets import QMainWindow, QWidget
+import pytest
+from pytest_mock.plugin import MockerFixture
+from pytestqt.qtbot import QtBot
+from typing import cast
+from views.BaseView import BaseView
+
+
+class FirstView(BaseView):
+    constructed = 0
+    reusable = True
+
+    def __init__(self, parent):
+        super().__init__(parent)
+        FirstView.constructed += 1
+
+    def canReuse(self):
+        return FirstView.reusable
+
+
+class SecondView(BaseView):
+    pass
+
+
+class TestViewStack:
+    @pytest.fixture(autouse=True)
+    def setup_method(self, qtbot: QtBot, mocker: MockerFixture):
+        FirstView.constructed = 0
+        FirstView.reusable = True
+
+        self.window = QMainWindow()
+        qtbot.addWidget(self.window)
+        self.view_stack = ViewStack(cast(MainWindow, self.window))
+        self.window.setCentralWidget(self.view_stack)
+
+        self.mock_activate = mocker.patch.object(BaseView, 'activate')
+        self.mock_deactivate = mocker.patch.object(BaseView, 'deactivate')
+
+    def test_view_stack_show_view(self):
+        # Call the method under test
+        first_view = self.view_stack.showView(FirstView)
+
+        # Assertions
+        assert type(first_view) is FirstView
+        assert first_view.getWindow() is self.window
+        assert self.view_stack.currentWidget() is first_view
+        assert self.mock_activate.call_count == 1
+        assert self.mock_deactivate.call_count == 0
+
+        # Showing the current view again does nothing
+        assert self.view_stack.showView(FirstView) is first_view
+        assert self.mock_activate.call_count == 1
+
+    def test_view_stack_keeps_views(self):
+        # Call the method under test
+        first_view = self.view_stack.showView(FirstView)
+        second_view = self.view_stack.showView(SecondView)
+        shown_again = self.view_stack.showView(FirstView)
+
+        # Assertions
+        assert shown_again is first_view
+        assert FirstView.constructed == 1
+        assert self.view_stack.currentWidget() is first_view
+        assert self.view_stack.getView(SecondView) is second_view
+        assert self.mock_activate.call_count == 3
+        assert self.mock_deactivate.call_count == 2
+
+    def test_view_stack_constructs_outdated_views(self, mocker: MockerFixture):
+        first_view = self.view_stack.showView(FirstView)
+        self.view_stack.showView(SecondView)
+        mock_close = mocker.patch.object(first_view, 'close')
+
+        # Call the method under test
+        FirstView.reusable = False
+        new_view = self.view_stack.showView(FirstView)
+
+        # Assertions
+        assert new_view is not first_view
+        assert FirstView.constructed == 2
+        assert mock_close.call_count == 1
+        assert self.view_stack.count() == 2
+
+    def test_view_stack_remove_view(self):
+        self.view_stack.showView(FirstView)
+
+        # Call the method under test
+        self.view_stack.removeView(FirstView)
+        self.view_stack.removeView(SecondView)
+
+        # Assertions
+        assert self.view_stack.getView(FirstView) is None
+        assert self.view_stack.count() == 0
+        assert self.mock_deactivate.call_count == 1
+
+    def test_view_stack_close_views(self, mocker: MockerFixture):
+        first_view = self.view_stack.showView(FirstView)
+        second_view = self.view_stack.showView(SecondView)
+        mock_first_close = mocker.patch.object(first_view, 'closeEvent')
+        mock_second_close = mocker.patch.object(second_view, 'closeEvent')
+
+        # Call the method under test
+        self.view_stack.closeViews(QCloseEvent())
+
+        # Assertions
+        assert mock_first_close.call_count == 1
+        assert mock_second_close.call_count == 1
+
+    def test_view_stack_other_widgets(self):
+        # Call the method under test
+        widget = self.view_stack.showView(QWidget)
+        self.view_stack.showView(FirstView)
+
+        # Assertions
+        assert self.view_stack.getView(QWidget) is widget
+        assert self.mock_deactivate.call_count == 0
@@ -0,0 +1,165 @@
+from core.database.models import Tool
+from core.database.repositories.toolRepository import ToolRepository
+from helpers.catalogCache import CatalogCache, FILES_CATALOG, MATERIALS_CATALOG, \
+    TOOLS_CATALOG
+import pytest
+
+
+class TestCatalogCache:
+    def mock_tools(self, mocker, side_effect=None):
+        tool_1 = Tool(name='Rectangular pocket', description='Example tool 1')
+        tool_1.id = 1
+        tool_2 = Tool(name='Spiral drill', description='Example tool 2')
+        tool_2.id = 2
+        return mocker.patch.object(
+            ToolRepository,
+            'get_all_tools',
+            return_value=[tool_1, tool_2],
+            side_effect=side_effect
+        )
+
+    def test_catalog_cache_get(self, mocker):
+        # Mock DB methods
+        mocker.patch('helpers.catalogCache.session_scope')
+        mock_get_all_tools = self.mock_tools(mocker)
+
+        # Call the method under test
+        first = CatalogCache.get_tools()
+        second = CatalogCache.get_tools()
+
+        # Assertions
+        assert mock_get_all_tools.call_count == 1
+        assert first == second == [
+            {'id': 1, 'name': 'Rectangular pocket', 'description': 'Example tool 1'},
+            {'id': 2, 'name': 'Spiral drill', 'description': 'Example tool 2'}
+        ]
+
+    def test_catalog_cache_get_with_session(self, mocker):
+        # Mock DB methods
+        mock_session_scope = mocker.patch('helpers.catalogCache.session_scope')
+        mock_get_all_tools = self.mock_tools(mocker)
+
+        # Call the method under test
+        CatalogCache.get_tools(mocker.MagicMock())
+
+        # Assertions
+        assert mock_get_all_tools.call_count == 1
+        assert mock_session_scope.call_count == 0
+
+    def test_catalog_cache_get_item(self, mocker):
+        # Mock DB methods
+        mocker.patch('helpers.catalogCache.session_scope')
+        mock_get_all_tools = self.mock_tools(mocker)
+
+        # Call the method under test
+        tool = CatalogCache.get_item(TOOLS_CATALOG, 2)
+        unknown = CatalogCache.get_item(TOOLS_CATALOG, 3)
+
+        # Assertions
+        assert mock_get_all_tools.call_count == 1
+        assert tool == {'id': 2, 'name': 'Spiral drill', 'description': 'Example tool 2'}
+        assert unknown is None
+
+    def test_catalog_cache_get_tool_warms_cache(self, mocker):
+        # Mock DB methods
+        mocker.patch('helpers.catalogCache.session_scope')
+        mock_get_all_tools = self.mock_tools(mocker)
+        mock_submit = mocker.patch('helpers.catalogCache.executor.submit')
+
+        # Call the method under test
+        first = CatalogCache.get_tool(2)
+        second = CatalogCache.get_tool(2)
+
+        # Assertions
+        assert first is second is None
+        assert mock_get_all_tools.call_count == 0
+        mock_submit.assert_called_once_with(CatalogCache._warm, TOOLS_CATALOG, mocker.ANY)
+
+        # Load the catalog in background
+        load, *args = mock_submit.call_args[0]
+        load(*args)
+
+        assert CatalogCache.get_tool(2) == {
+            'id': 2,
+            'name': 'Spiral drill',
+            'description': 'Example tool 2'
+        }
+        assert mock_get_all_tools.call_count == 1
+        assert mock_submit.call_count == 1
+        assert CatalogCache.warming == {}
+
+    def test_catalog_cache_warm_error(self, mocker):
+        # Mock DB methods
+        mocker.patch('helpers.catalogCache.session_scope')
+        self.mock_tools(mocker, side_effect=Exception('mocked-error'))
+        mock_submit = mocker.patch('helpers.catalogCache.executor.submit')
+
+        # Call the method under test
+        CatalogCache.warm(TOOLS_CATALOG)
+        load, *args = mock_submit.call_args[0]
+        with pytest.raises(Exception):
+            load(*args)
+
+        # Assertions
+        assert CatalogCache.warming == {}
+        # The load is retried the next time the catalog is needed
+        assert CatalogCache.get_tool(2) is None
+        assert mock_submit.call_count == 2
+
+    def test_catalog_cache_invalidate(self, mocker):
+        # Mock DB methods
+        mocker.patch('helpers.catalogCache.session_scope')
+        mock_get_all_tools = self.mock_tools(mocker)
+
+        # Call the method under test
+        CatalogCache.get_tools()
+        CatalogCache.invalidate(TOOLS_CATALOG)
+        CatalogCache.get_tools()
+        CatalogCache.invalidate()
+        CatalogCache.get_tools()
+
+        # Assertions
+        assert mock_get_all_tools.call_count == 3
+
+    def test_catalog_cache_discards_outdated_load(self, mocker):
+        # Mock DB methods
+        mocker.patch('helpers.catalogCache.session_scope')
+
+        def invalidate_during_load():
+            # The catalog changes while it's being loaded
+            CatalogCache.invalidate(TOOLS_CATALOG)
+            return []
+
+        mock_get_all_tools = self.mock_tools(mocker, side_effect=invalidate_during_load)
+
+        # Call the method under test
+        CatalogCache.get_tools()
+        CatalogCache.get_tools()
+
+        # Assertions
+        assert mock_get_all_tools.call_count == 2
+
+    def test_catalog_cache_db_changes(self, mocker):
+        # Mock DB methods
+        mocker.patch('helpers.catalogCache.session_scope')
+        mock_get_all_tools = self.mock_tools(mocker)
+        mock_submit = mocker.patch('helpers.catalogCache.executor.submit')
+
+        # Call the methods under test
+        CatalogCache.get_tools()
+        CatalogCache.on_db_changed('users', 'UPDATE', 1)
+        CatalogCache.get_tools()
+        CatalogCache.on_db_changed('tools', 'UPDATE', 1)
+        CatalogCache.get_tools()
+        CatalogCache.on_db_reconnected()
+        CatalogCache.get_tools()
+
+        # Assertions
+        assert mock_get_all_tools.call_count == 3
+        # Changed catalogs are loaded again in background
+        assert mock_submit.call_args_list == [
+            mocker.call(CatalogCache._warm, TOOLS_CATALOG, mocker.ANY),
+            mocker.call(CatalogCache._warm, FILES_CATALOG, mocker.ANY),
+            mocker.call(CatalogCache._warm, MATERIALS_CATALOG, mocker.ANY),
+            mocker.call(CatalogCache._warm, TOOLS_CATALOG, mocker.ANY)
+        ]
@@ -3,12 +3,17 @@ from celery.app.control import Inspect
 import core.mocks.celery_mocks as celery_mocks
 import core.mocks.grbl_mocks as grbl_mocks
 import core.mocks.worker_mocks as worker_mocks
+from core.cncworker.app import app
 from core.grbl.types import Status, ParserState
-from helpers.cncWorkerMonitor import CncWorkerMonitor
+from core.worker import WORKER_IS_PAUSED_KEY
+import fakeredis
+from helpers.cncWorkerMonitor import CncWorkerMonitor, get_task_channel, SUBSCRIPTION_TIMEOUT, \
+    UNKNOWN_WORKER_STATUS, WorkerStatus
 from PyQt5.QtCore import QTimer
 import pytest
 from pytest_mock.plugin import MockerFixture
 from pytestqt.qtbot import QtBot
+import time
 
 
 class TestCncWorkerMonitor:
@@ -21,6 +26,9 @@ class TestCncWorkerMonitor:
         # Mock timer method
         mock_timer_start = mocker.patch.object(QTimer, 'start')
 
+        # Mock subscription to the result backend
+        mocker.patch.object(CncWorkerMonitor, 'start_subscription', return_value=False)
+
         # Call method under test
         self.cnc_worker_monitor.start_task_monitor(task_id='abcd-1234')
 
@@ -28,6 +36,132 @@ class TestCncWorkerMonitor:
         assert self.cnc_worker_monitor.active_task == 'abcd-1234'
         assert mock_timer_start.call_count == 1
 
+    def test_cnc_worker_monitor_start_monitor_subscribed(self, mocker: MockerFixture):
+        # Mock timer method
+        mock_timer_start = mocker.patch.object(QTimer, 'start')
+
+        # Mock subscription to the result backend
+        mock_subscribe = mocker.patch.object(
+            CncWorkerMonitor,
+            'start_subscription',
+            return_value=True
+        )
+
+        # Call method under test
+        self.cnc_worker_monitor.start_task_monitor(task_id='abcd-1234')
+
+        # Assertions
+        assert mock_subscribe.call_count == 1
+        assert mock_timer_start.call_count == 0
+
+    def test_cnc_worker_monitor_start_subscription_fails(self, mocker: MockerFixture):
+        # Mock Redis client
+        redis_client = mocker.MagicMock()
+        redis_client.pubsub.side_effect = Exception('mocked-error')
+        cnc_worker_monitor = CncWorkerMonitor(redis_client)
+
+        # Mock timer method
+        mock_timer_start = mocker.patch.object(QTimer, 'start')
+
+        # Call method under test
+        cnc_worker_monitor.start_task_monitor(task_id='abcd-1234')
+
+        # Assertions
+        assert mock_timer_start.call_count == 1
+        assert cnc_worker_monitor.listener is None
+
+    def test_cnc_worker_monitor_listen_to_updates(self, qtbot: QtBot, mocker: MockerFixture):
+        # Mock Redis client
+        redis_client = fakeredis.FakeStrictRedis()
+        cnc_worker_monitor = CncWorkerMonitor(redis_client)
+
+        # Mock Celery methods
+        mocker.patch.object(AsyncResult, '__init__', return_value=None)
+        mocker.patch.object(
+            AsyncResult,
+            '_get_task_meta',
+            return_value={'status': 'PENDING', 'result': None}
+        )
+
+        # Mock other methods from the class
+        mocker.patch.object(CncWorkerMonitor, 'set_device_enabled')
+
+        def publish(task_metadata):
+            redis_client.publish(
+                get_task_channel('abcd-1234'),
+                app.backend.encode(task_metadata)
+            )
+
+        # Call method under test and wait for signals
+        cnc_worker_monitor.start_task_monitor(task_id='abcd-1234')
+        listener = cnc_worker_monitor.listener
+        assert listener is not None
+
+        with qtbot.waitSignal(cnc_worker_monitor.task_new_status, raising=True):
+            publish(worker_mocks.task_metadata_in_progress)
+
+        with qtbot.waitSignal(cnc_worker_monitor.task_finished, raising=True):
+            # Repeated updates are ignored
+            publish(worker_mocks.task_metadata_in_progress)
+            publish(worker_mocks.task_metadata_success)
+
+        # Assertions
+        qtbot.waitUntil(lambda: not listener.is_alive())
+        cnc_worker_monitor.stop_task_monitor()
+        assert cnc_worker_monitor.listener is None
+
+    def test_cnc_worker_monitor_stop_subscription_does_not_block(
+        self,
+        qtbot: QtBot,
+        mocker: MockerFixture
+    ):
+        # Mock Redis client
+        redis_client = fakeredis.FakeStrictRedis()
+        cnc_worker_monitor = CncWorkerMonitor(redis_client)
+
+        # Mock other methods from the class
+        mocker.patch.object(CncWorkerMonitor, 'check_task_state', return_value=False)
+
+        # Start listening
+        cnc_worker_monitor.start_task_monitor(task_id='abcd-1234')
+        listener = cnc_worker_monitor.listener
+        assert listener is not None
+
+        # Call method under test
+        with qtbot.assertNotEmitted(cnc_worker_monitor.subscription_lost, wait=100):
+            start = time.monotonic()
+            cnc_worker_monitor.stop_subscription()
+            elapsed = time.monotonic() - start
+
+            # The listener ends by itself
+            qtbot.waitUntil(lambda: not listener.is_alive())
+
+        # Assertions
+        assert elapsed < SUBSCRIPTION_TIMEOUT / 2
+        assert cnc_worker_monitor.listener is None
+
+    def test_cnc_worker_monitor_ignores_repeated_status(self, qtbot: QtBot):
+        # Mock monitor state
+        self.cnc_worker_monitor.process_task_state(
+            'PROGRESS',
+            worker_mocks.task_metadata_in_progress['result']
+        )
+
+        # Call method under test
+        with qtbot.waitSignal(
+            self.cnc_worker_monitor.task_new_status,
+            raising=False,
+            timeout=500
+        ) as blocker:
+            finished = self.cnc_worker_monitor.process_task_state(
+                'PROGRESS',
+                worker_mocks.task_metadata_in_progress['result']
+            )
+
+        # Assertions
+        assert finished is False
+        assert blocker.signal_triggered is False
+
     def test_cnc_worker_monitor_stop_monitor(self, mocker: MockerFixture):
         # Mock timer method
         mock_timer_stop = mocker.patch.object(QTimer, 'stop')
@@ -196,7 +330,7 @@ class TestCncWorkerMonitor:
         assert mock_disable_device.call_count == 1
 
     @pytest.mark.parametrize("worker_on", [False, True])
-    def test_cnc_worker_monitor_is_worker_on(self, mocker: MockerFixture, worker_on):
+    def test_cnc_worker_monitor_probe_worker_on(self, mocker: MockerFixture, worker_on):
         # Mock worker status
         pong = (celery_mocks.celery_pong if worker_on else None)
         mocker.patch(
@@ -205,9 +339,9 @@ class TestCncWorkerMonitor:
         )
 
         # Assertions
-        assert CncWorkerMonitor.is_worker_on() == worker_on
+        assert CncWorkerMonitor.probe_worker_on() == worker_on
 
-    def test_cnc_worker_monitor_is_worker_on_fails(self, mocker: MockerFixture):
+    def test_cnc_worker_monitor_probe_worker_on_fails(self, mocker: MockerFixture):
         # Mock worker status
         mocker.patch(
             'helpers.cncWorkerMonitor.app.control.ping',
@@ -215,10 +349,10 @@ class TestCncWorkerMonitor:
         )
 
         # Assertions
-        assert CncWorkerMonitor.is_worker_on() is False
+        assert CncWorkerMonitor.probe_worker_on() is False
 
     @pytest.mark.parametrize("worker_running", [False, True])
-    def test_cnc_worker_monitor_is_worker_running(
+    def test_cnc_worker_monitor_probe_worker_running(
         self,
         mocker: MockerFixture,
         worker_running
@@ -232,9 +366,9 @@ class TestCncWorkerMonitor:
         )
 
         # Assertions
-        assert CncWorkerMonitor.is_worker_running() == worker_running
+        assert CncWorkerMonitor.probe_worker_running() == worker_running
 
-    def test_cnc_worker_monitor_is_worker_running_fails(self, mocker: MockerFixture):
+    def test_cnc_worker_monitor_probe_worker_running_fails(self, mocker: MockerFixture):
         # Mock list of tasks from worker
         mocker.patch.object(
             Inspect,
@@ -243,9 +377,39 @@ class TestCncWorkerMonitor:
         )
 
         # Assertions
+        assert CncWorkerMonitor.probe_worker_running() is False
+
+    def test_cnc_worker_monitor_unknown_health(self, mocker: MockerFixture):
+        # Mock worker monitor methods
+        mock_probe_on = mocker.patch.object(CncWorkerMonitor, 'probe_worker_on')
+        mock_probe_running = mocker.patch.object(CncWorkerMonitor, 'probe_worker_running')
+
+        # Assertions
+        assert CncWorkerMonitor.get_worker_health() is None
+        assert CncWorkerMonitor.is_worker_on() is False
         assert CncWorkerMonitor.is_worker_running() is False
+        assert mock_probe_on.call_count == 0
+        assert mock_probe_running.call_count == 0
 
     def test_cnc_worker_monitor_get_worker_status(self, mocker: MockerFixture):
+        # Mock worker monitor methods
+        mock_probe_status = mocker.patch.object(CncWorkerMonitor, 'probe_worker_status')
+
+        # Unknown until the health probe checks it
+        assert CncWorkerMonitor.get_worker_status() == UNKNOWN_WORKER_STATUS
+        assert CncWorkerMonitor.worker_status_requested is True
+
+        # Cached status
+        status: WorkerStatus = {**UNKNOWN_WORKER_STATUS, 'updated_at': 1.0}
+        CncWorkerMonitor.set_worker_status(status)
+        assert CncWorkerMonitor.worker_status_requested is False
+        assert CncWorkerMonitor.get_worker_status() == status
+
+        # Assertions
+        CncWorkerMonitor.set_worker_status(None)
+        assert mock_probe_status.call_count == 0
+
+    def test_cnc_worker_monitor_probe_worker_status(self, mocker: MockerFixture):
         # Mock Celery methods
         mocker.patch.object(
             Inspect,
@@ -269,15 +433,47 @@ class TestCncWorkerMonitor:
         )
 
         # Call method under test
-        result = CncWorkerMonitor.get_worker_status()
+        result = CncWorkerMonitor.probe_worker_status()
 
         # Assertions
         assert result == {
             'availability': celery_mocks.celery_worker_pong,
             'stats': celery_mocks.celery_worker_stats,
             'registered_tasks': celery_mocks.celery_worker_registered_tasks,
-            'active_tasks': celery_mocks.celery_worker_active_tasks
+            'active_tasks': celery_mocks.celery_worker_active_tasks,
+            'updated_at': result['updated_at']
         }
+        assert result['updated_at'] is not None
+
+    @pytest.mark.parametrize("worker_on", [False, True])
+    @pytest.mark.parametrize("worker_running", [False, True])
+    def test_cnc_worker_monitor_cached_health(
+        self,
+        mocker: MockerFixture,
+        worker_on,
+        worker_running
+    ):
+        # Mock cached state
+        CncWorkerMonitor.set_worker_health({
+            'on': worker_on,
+            'running': worker_running,
+            'updated_at': 0.0
+        })
+
+        # Mock worker monitor methods
+        mock_probe_on = mocker.patch.object(CncWorkerMonitor, 'probe_worker_on')
+        mock_probe_running = mocker.patch.object(CncWorkerMonitor, 'probe_worker_running')
+
+        # Call methods under test
+        result_on = CncWorkerMonitor.is_worker_on()
+        result_running = CncWorkerMonitor.is_worker_running()
+        CncWorkerMonitor.set_worker_health(None)
+
+        # Assertions
+        assert result_on == worker_on
+        assert result_running == worker_running
+        assert mock_probe_on.call_count == 0
+        assert mock_probe_running.call_count == 0
 
     def test_cnc_worker_monitor_set_device_enabled(self):
         CncWorkerMonitor.set_device_enabled(True)
@@ -285,3 +481,99 @@ class TestCncWorkerMonitor:
 
         CncWorkerMonitor.set_device_enabled(False)
         assert CncWorkerMonitor.is_device_enabled() is False
+
+    def test_cnc_worker_monitor_get_tasks_states(self, mocker: MockerFixture):
+        # Mock Celery methods
+        mock_mget = mocker.patch.object(
+            app.backend,
+            'mget',
+            create=True,
+            return_value=[
+                app.backend.encode(worker_mocks.task_metadata_in_progress),
+                None
+            ]
+        )
+        mock_query_task = mocker.patch.object(AsyncResult, '__init__', return_value=None)
+
+        # Call method under test
+        states = CncWorkerMonitor.get_tasks_states(['abcd-1234', 'efgh-5678'])
+
+        # Assertions
+        assert states == {
+            'abcd-1234': {
+                'status': worker_mocks.task_metadata_in_progress['status'],
+                'info': worker_mocks.task_metadata_in_progress['result']
+            },
+            'efgh-5678': {'status': 'PENDING', 'info': None}
+        }
+        assert mock_mget.call_count == 1
+        assert mock_query_task.call_count == 0
+
+    def test_cnc_worker_monitor_get_worker_snapshot(self, mocker: MockerFixture):
+        # Mock Redis methods
+        mocker.patch('helpers.cncWorkerMonitor.get_backend_client', return_value=None)
+        mocker.patch(
+            'helpers.cncWorkerMonitor.get_value_from_id',
+            side_effect=lambda type, id: {1: 'abcd-1234', 3: 'ijkl-9012'}.get(id)
+        )
+        mocker.patch('helpers.cncWorkerMonitor.get_value', return_value='1')
+
+        # Mock other methods from the class
+        mock_get_tasks_states = mocker.patch.object(
+            CncWorkerMonitor,
+            'get_tasks_states',
+            return_value={
+                'abcd-1234': {'status': 'PROGRESS', 'info': {}},
+                'ijkl-9012': {'status': 'FAILURE', 'info': 'Mocked error'}
+            }
+        )
+
+        # Call method under test
+        snapshot = CncWorkerMonitor.get_worker_snapshot([1, 2, 3])
+
+        # Assertions
+        mock_get_tasks_states.assert_called_once_with(['abcd-1234', 'ijkl-9012'])
+        assert snapshot == {
+            'paused': True,
+            'states': {
+                1: {'status': 'PROGRESS', 'info': {}},
+                3: {'status': 'FAILURE', 'info': 'Mocked error'}
+            }
+        }
+
+    def test_cnc_worker_monitor_get_worker_snapshot_redis(self, mocker: MockerFixture):
+        # Mock Redis client
+        redis_client = fakeredis.FakeStrictRedis()
+        redis_client.set('task_1', 'abcd-1234')
+        redis_client.set('task_3', 'ijkl-9012')
+        redis_client.set(WORKER_IS_PAUSED_KEY, '1')
+        mock_mget = mocker.spy(redis_client, 'mget')
+        mocker.patch('helpers.cncWorkerMonitor.get_backend_client', return_value=redis_client)
+        mock_get_value_from_id = mocker.patch('helpers.cncWorkerMonitor.get_value_from_id')
+
+        # Mock other methods from the class
+        mock_get_tasks_states = mocker.patch.object(
+            CncWorkerMonitor,
+            'get_tasks_states',
+            return_value={
+                'abcd-1234': {'status': 'PROGRESS', 'info': {}},
+                'ijkl-9012': {'status': 'FAILURE', 'info': 'Mocked error'}
+            }
+        )
+
+        # Call method under test
+        snapshot = CncWorkerMonitor.get_worker_snapshot([1, 2, 3])
+
+        # Assertions
+        mock_mget.assert_called_once_with(
+            ['task_1', 'task_2', 'task_3', WORKER_IS_PAUSED_KEY]
+        )
+        assert mock_get_value_from_id.call_count == 0
+        mock_get_tasks_states.assert_called_once_with(['abcd-1234', 'ijkl-9012'])
+        assert snapshot == {
+            'paused': True,
+            'states': {
+                1: {'status': 'PROGRESS', 'info': {}},
+                3: {'status': 'FAILURE', 'info': 'Mocked error'}
+            }
+        }
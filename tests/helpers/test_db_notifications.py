@@ -0,0 +1,159 @@
+from helpers.dbNotifications import CHANGES_CHANNEL, DbChangesListener, parse_change
+from pathlib import Path
+import pytest
+from pytest_mock.plugin import MockerFixture
+from pytestqt.qtbot import QtBot
+import threading
+
+
+def create_mock_engine(mocker: MockerFixture, dialect: str = 'postgresql'):
+    engine = mocker.MagicMock()
+    engine.dialect.name = dialect
+    return engine
+
+
+@pytest.mark.parametrize("table", ['tasks', 'files', 'tools', 'materials', 'users'])
+def test_schema_defines_triggers(table):
+    schema = (Path(__file__).parents[2] / 'rpi' / 'db_schema.sql').read_text()
+
+    # Assertions
+    assert 'CREATE OR REPLACE FUNCTION notify_table_change()' in schema
+    assert (
+        f'CREATE OR REPLACE TRIGGER {table}_notify_change\n'
+        f'AFTER INSERT OR UPDATE OR DELETE ON {table}\n'
+        f"FOR EACH ROW EXECUTE FUNCTION notify_table_change('{CHANGES_CHANNEL}');"
+    ) in schema
+
+
+@pytest.mark.parametrize(
+        "payload,expected",
+        [
+            (
+                '{"table": "tasks", "operation": "UPDATE", "id": 3}',
+                {'table': 'tasks', 'operation': 'UPDATE', 'id': 3}
+            ),
+            ('{"table": "tasks", "operation": "UPDATE"}', None),
+            ('{"table": "tasks", "operation": "UPDATE", "id": null}', None),
+            ('not-json', None)
+        ]
+    )
+def test_parse_change(payload, expected):
+    assert parse_change(payload) == expected
+
+
+class TestDbChangesListener:
+    @pytest.fixture(autouse=True)
+    def setup_method(self, mocker: MockerFixture):
+        self.engine = create_mock_engine(mocker)
+        self.listener = DbChangesListener(self.engine)
+
+    def test_db_changes_listener_start(self, mocker: MockerFixture):
+        # Mock thread method
+        mock_thread_start = mocker.patch.object(threading.Thread, 'start')
+
+        # Call method under test
+        result = self.listener.start()
+
+        # Assertions
+        assert result is True
+        assert mock_thread_start.call_count == 1
+        assert self.listener.listener_thread is not None
+
+    def test_db_changes_listener_start_not_supported(self, mocker: MockerFixture):
+        # Mock thread method
+        mock_thread_start = mocker.patch.object(threading.Thread, 'start')
+
+        # Call method under test
+        listener = DbChangesListener(create_mock_engine(mocker, 'sqlite'))
+        result = listener.start()
+
+        # Assertions
+        assert result is False
+        assert mock_thread_start.call_count == 0
+        assert listener.listener_thread is None
+
+    @pytest.mark.parametrize("running", [False, True])
+    def test_db_changes_listener_stop(self, mocker: MockerFixture, running):
+        # Mock attributes
+        self.listener.listener_thread = (threading.Thread() if running else None)
+
+        # Mock thread method
+        mock_thread_join = mocker.patch.object(threading.Thread, 'join')
+
+        # Call method under test
+        self.listener.stop()
+
+        # Assertions
+        assert mock_thread_join.call_count == (1 if running else 0)
+        assert self.listener.listener_thread is None
+
+    def test_db_changes_listener_connect(self):
+        # Call method under test
+        connection = self.listener.connect()
+
+        # Assertions
+        assert connection is self.engine.raw_connection.return_value
+        connection.detach.assert_called_once()
+        assert connection.driver_connection.autocommit is True
+        connection.cursor.return_value.execute.assert_called_once_with(
+            f'LISTEN {CHANGES_CHANNEL}'
+        )
+
+    def test_db_changes_listener_listen(self, qtbot: QtBot, mocker: MockerFixture):
+        # Mock connection
+        connection = mocker.MagicMock()
+        notification = mocker.MagicMock()
+        notification.payload = '{"table": "files", "operation": "DELETE", "id": 5}'
+        connection.driver_connection.notifies = []
+
+        def poll():
+            connection.driver_connection.notifies.append(notification)
+            # Stop after this notification
+            self.listener._stop_listening.set()
+
+        connection.driver_connection.poll.side_effect = poll
+        mocker.patch(
+            'helpers.dbNotifications.select.select',
+            return_value=([connection.driver_connection], [], [])
+        )
+
+        # Call method under test
+        with qtbot.waitSignal(self.listener.changed, raising=True) as blocker:
+            self.listener.listen(connection)
+
+        # Assertions
+        assert blocker.args == ['files', 'DELETE', 5]
+
+    def test_db_changes_listener_notify_invalid(self, qtbot: QtBot):
+        # Call method under test
+        with qtbot.assertNotEmitted(self.listener.changed):
+            self.listener.notify('invalid-payload')
+
+    def test_db_changes_listener_run(self, qtbot: QtBot, mocker: MockerFixture):
+        # Mock methods
+        mocker.patch('helpers.dbNotifications.RECONNECT_DELAY', 0)
+        connection = mocker.MagicMock()
+        mock_connect = mocker.patch.object(
+            DbChangesListener,
+            'connect',
+            side_effect=[Exception('mocked-error'), connection, connection]
+        )
+        listens = 0
+
+        def listen(_):
+            nonlocal listens
+            listens += 1
+            if listens == 2:
+                self.listener._stop_listening.set()
+            # The connection is lost
+            raise Exception('mocked-error')
+
+        mocker.patch.object(DbChangesListener, 'listen', side_effect=listen)
+
+        # Call method under test
+        with qtbot.waitSignal(self.listener.reconnected, raising=True):
+            self.listener.run()
+
+        # Assertions
+        assert mock_connect.call_count == 3
+        assert connection.close.call_count == 2
@@ -0,0 +1,85 @@
+from helpers.dbSession import configure_engine, session_scope
+import pytest
+
+
+class TestSessionScope:
+    @pytest.fixture(autouse=True)
+    def setup_method(self, mocker):
+        self.mock_session = mocker.MagicMock()
+        self.mock_session_local = mocker.patch(
+            'helpers.dbSession.SessionLocal',
+            return_value=self.mock_session
+        )
+
+    def test_session_scope(self):
+        # Call the method under test
+        with session_scope() as db_session:
+            db_session.add('item')
+
+        # Assertions
+        self.mock_session_local.assert_called_once_with(expire_on_commit=False)
+        self.mock_session.add.assert_called_once_with('item')
+        self.mock_session.commit.assert_called_once()
+        self.mock_session.rollback.assert_not_called()
+        self.mock_session.close.assert_called_once()
+
+    def test_session_scope_read_only(self):
+        # Call the method under test
+        with session_scope(read_only=True) as db_session:
+            db_session.scalars('query')
+
+        # Assertions
+        self.mock_session.commit.assert_not_called()
+        self.mock_session.rollback.assert_not_called()
+        self.mock_session.close.assert_called_once()
+
+    def test_session_scope_error(self):
+        # Call the method under test
+        with pytest.raises(Exception, match='mocked-error'):
+            with session_scope():
+                raise Exception('mocked-error')
+
+        # Assertions
+        self.mock_session.commit.assert_not_called()
+        self.mock_session.rollback.assert_called_once()
+        self.mock_session.close.assert_called_once()
+
+
+class TestConfigureEngine:
+    def test_configure_engine(self, mocker):
+        mock_engine = mocker.MagicMock()
+        mock_engine.dialect.name = 'postgresql'
+        mock_session_local = mocker.patch('helpers.dbSession.SessionLocal')
+        mock_session_local.kw = {'bind': mock_engine}
+        mock_create_engine = mocker.patch('helpers.dbSession.create_engine')
+
+        # Call the method under test
+        engine = configure_engine(pool_size=3, max_overflow=2, pool_timeout=5, pool_recycle=60)
+
+        # Assertions
+        assert engine == mock_create_engine.return_value
+        mock_create_engine.assert_called_once_with(
+            mock_engine.url,
+            pool_size=3,
+            max_overflow=2,
+            pool_timeout=5,
+            pool_recycle=60,
+            pool_pre_ping=True
+        )
+        mock_session_local.configure.assert_called_once_with(bind=engine)
+        mock_engine.dispose.assert_called_once()
+
+    def test_configure_engine_sqlite(self, mocker):
+        mock_engine = mocker.MagicMock()
+        mock_engine.dialect.name = 'sqlite'
+        mock_session_local = mocker.patch('helpers.dbSession.SessionLocal')
+        mock_session_local.kw = {'bind': mock_engine}
+        mock_create_engine = mocker.patch('helpers.dbSession.create_engine')
+
+        # Call the method under test
+        engine = configure_engine()
+
+        # Assertions
+        assert engine == mock_engine
+        mock_create_engine.assert_not_called()
+        mock_session_local.configure.assert_not_called()
@@ -1,9 +1,12 @@
 from core.gcode.gcodeFileSender import GcodeFileSender, FinishedFile
 from core.grbl.grblController import GrblController
-from helpers.fileStreamer import FileStreamer
+from helpers.fileStreamer import FileStreamer, FileStreamerWorker, RxBufferCounter, \
+    is_acknowledgement, MODE_CHARACTER_COUNTING, MODE_TIMED
 from logging import Logger
-from PyQt5.QtCore import QTimer
+from pathlib import Path
+from PyQt5.QtCore import QCoreApplication, QEvent, QThread
 import pytest
+import threading
 from pytest_mock.plugin import MockerFixture
 from pytestqt.qtbot import QtBot
 
@@ -28,15 +31,33 @@ class TestFileStreamer:
         # Mock Gcode sender method
         mock_sender_start = mocker.patch.object(GcodeFileSender, 'start')
 
-        # Mock timer method
-        mock_timer_start = mocker.patch.object(QTimer, 'start')
+        # Mock thread
+        mock_worker_move_to_thread = mocker.patch.object(FileStreamerWorker, 'moveToThread')
+        mock_thread_start = mocker.patch.object(QThread, 'start')
 
         # Call method under test
         self.file_streamer.start()
 
         # Assertions
         assert mock_sender_start.call_count == 1
-        assert mock_timer_start.call_count == 1
+        assert mock_worker_move_to_thread.call_count == 1
+        assert mock_thread_start.call_count == 1
+        assert self.file_streamer.streaming_worker is not None
+
+    def test_file_streamer_releases_threads(self, qtbot: QtBot, mocker: MockerFixture):
+        # Mock worker method
+        mocker.patch.object(FileStreamerWorker, 'run')
+
+        # Call method under test
+        for _ in range(3):
+            self.file_streamer.start()
+            self.file_streamer.stop()
+
+        # Threads and workers are deleted once they end
+        QCoreApplication.processEvents()
+        QCoreApplication.sendPostedEvents(None, QEvent.DeferredDelete)
+        assert self.file_streamer.findChildren(QThread) == []
+        assert self.file_streamer.streaming_worker is None
 
     def test_file_streamer_pause(self, mocker: MockerFixture):
         # Mock Gcode sender method
@@ -68,42 +89,287 @@ class TestFileStreamer:
         # Assertions
         assert mock_sender_toggle_paused.call_count == 1
 
-    def test_file_streamer_stop(self, mocker: MockerFixture):
+    @pytest.mark.parametrize("running", [False, True])
+    def test_file_streamer_stop(self, mocker: MockerFixture, running):
+        # Mock attributes
+        self.file_streamer.streaming_thread = (QThread() if running else None)
+        self.file_streamer.streaming_worker = (
+            FileStreamerWorker(
+                self.file_streamer.file_sender,
+                self.grbl_controller,
+                MODE_TIMED,
+                threading.Condition()
+            ) if running else None
+        )
+
         # Mock Gcode sender method
         mock_sender_stop = mocker.patch.object(GcodeFileSender, 'stop')
 
-        # Mock timer method
-        mock_timer_stop = mocker.patch.object(QTimer, 'stop')
+        # Mock thread
+        mock_worker_stop = mocker.patch.object(FileStreamerWorker, 'stop')
+        mock_thread_quit = mocker.patch.object(QThread, 'quit')
+        mocker.patch.object(QThread, 'wait')
 
         # Call method under test
         self.file_streamer.stop()
 
         # Assertions
-        assert mock_timer_stop.call_count == 1
         assert mock_sender_stop.call_count == 1
+        assert mock_worker_stop.call_count == (1 if running else 0)
+        assert mock_thread_quit.call_count == (1 if running else 0)
+        assert self.file_streamer.streaming_thread is None
+
+    @pytest.mark.parametrize("mode", [MODE_TIMED, MODE_CHARACTER_COUNTING])
+    @pytest.mark.parametrize("running", [False, True])
+    def test_file_streamer_is_exclusive(self, mode, running):
+        # Mock attributes
+        self.file_streamer.set_mode(mode)
+        self.file_streamer.streaming_thread = (QThread() if running else None)
+
+        # Assertions
+        assert self.file_streamer.is_running() is running
+        assert self.file_streamer.is_exclusive() is (running and mode == MODE_CHARACTER_COUNTING)
+
+
+class TestFileStreamerWorker:
+    @pytest.fixture(autouse=True)
+    def setup_method(self):
+        # Mock GRBL controller object
+        self.grbl_controller = GrblController(Logger('test-logger'))
 
-    def test_file_streamer_send_line(self, qtbot: QtBot, mocker: MockerFixture):
+        # Create an instance of FileStreamerWorker
+        self.worker = FileStreamerWorker(
+            GcodeFileSender(self.grbl_controller, ''),
+            self.grbl_controller,
+            MODE_TIMED,
+            threading.Condition()
+        )
+
+    def test_file_streamer_worker_send_line(self, qtbot: QtBot, mocker: MockerFixture):
         # Mock Gcode sender method
-        mock_send_line = mocker.patch.object(GcodeFileSender, 'send_line')
+        mock_send_line = mocker.patch.object(GcodeFileSender, 'send_line', return_value=5)
 
         # Call method under test and wait for signal
-        with qtbot.waitSignal(self.file_streamer.sent_line, raising=True):
-            self.file_streamer.send_line()
+        with qtbot.waitSignal(self.worker.sent_line, raising=True) as blocker:
+            self.worker.send_line()
 
         # Assertions
         assert mock_send_line.call_count == 1
+        assert blocker.args == [5]
 
-    def test_file_streamer_send_whole_file(self, qtbot: QtBot, mocker: MockerFixture):
+    def test_file_streamer_worker_throttles_progress(self, qtbot: QtBot, mocker: MockerFixture):
+        # Mock Gcode sender method
+        mocker.patch.object(GcodeFileSender, 'send_line', side_effect=[1, 2, 3])
+
+        # Call method under test and wait for signal
+        with qtbot.waitSignal(self.worker.sent_line, raising=True) as blocker:
+            self.worker.send_line()
+            self.worker.send_line()
+            self.worker.send_line()
+
+        # Assertions
+        assert blocker.args == [1]
+        assert self.worker._unreported_line == 3
+
+    def test_file_streamer_worker_send_whole_file(self, qtbot: QtBot, mocker: MockerFixture):
         # Mock Gcode sender method
         mock_send_line = mocker.patch.object(
             GcodeFileSender,
             'send_line',
             side_effect=FinishedFile()
         )
+        mocker.patch.object(GcodeFileSender, 'stop')
 
         # Call method under test and wait for signal
-        with qtbot.waitSignal(self.file_streamer.finished, raising=True):
-            self.file_streamer.send_line()
+        with qtbot.waitSignal(self.worker.finished, raising=True):
+            self.worker.send_line()
 
         # Assertions
         assert mock_send_line.call_count == 1
+        assert self.worker.is_running() is False
+
+    def test_file_streamer_worker_stop(self):
+        # Call method under test
+        self.worker.stop()
+
+        # Assertions
+        assert self.worker.is_running() is False
+
+
+class TestRxBufferCounter:
+    def test_rx_buffer_counter_fits(self):
+        # Create an instance of RxBufferCounter
+        counter = RxBufferCounter(10)
+
+        # Call methods under test
+        counter.push(6)
+
+        # Assertions
+        assert counter.fits(4) is True
+        assert counter.fits(5) is False
+        assert counter.used() == 6
+
+    def test_rx_buffer_counter_accepts_long_line_when_empty(self):
+        # Create an instance of RxBufferCounter
+        counter = RxBufferCounter(10)
+
+        # Assertions
+        assert counter.fits(50) is True
+
+    def test_rx_buffer_counter_release(self):
+        # Create an instance of RxBufferCounter
+        counter = RxBufferCounter(10)
+        counter.push(3)
+        counter.push(5)
+
+        # Call method under test
+        result = counter.release()
+
+        # Assertions
+        assert result is True
+        assert counter.used() == 5
+        assert counter.pending() == 1
+
+    def test_rx_buffer_counter_release_empty(self):
+        # Create an instance of RxBufferCounter
+        counter = RxBufferCounter(10)
+
+        # Call method under test and assertions
+        assert counter.release() is False
+        assert counter.used() == 0
+
+
+@pytest.mark.parametrize(
+    'message,expected',
+    [
+        ('ok', True),
+        ('error:20', True),
+        ('[MSG] ok', True),
+        ('<Idle|MPos:0.000,0.000,0.000>', False),
+        ('ALARM:1', False),
+        ('book', False),
+    ]
+)
+def test_is_acknowledgement(message, expected):
+    assert is_acknowledgement(message) is expected
+
+
+class TestFileStreamerCharacterCounting:
+    @pytest.fixture(autouse=True)
+    def setup_method(self, tmp_path: Path, mocker: MockerFixture):
+        # Mock GRBL controller object
+        self.grbl_controller = GrblController(Logger('test-logger'))
+        self.mock_send_command = mocker.patch.object(self.grbl_controller, 'sendCommand')
+
+        # Create a G-code file whose lines are 50 bytes long
+        self.file_path = tmp_path / 'file.nc'
+        lines = [f'G01 X{index:02d} ' + 'Y' * 42 for index in range(5)]
+        lines.insert(1, '(comment only)')
+        self.file_path.write_text('\n'.join(lines) + '\n')
+
+        # Create an instance of FileStreamerWorker
+        self.file_sender = GcodeFileSender(self.grbl_controller, str(self.file_path))
+        self.worker = FileStreamerWorker(
+            self.file_sender,
+            self.grbl_controller,
+            MODE_CHARACTER_COUNTING,
+            threading.Condition()
+        )
+        self.worker._open_file()
+
+    def test_file_streamer_fills_buffer(self, qtbot: QtBot, mocker: MockerFixture):
+        # Mock Gcode sender method
+        mocker.patch.object(GcodeFileSender, 'is_paused', return_value=False)
+
+        # Call method under test and wait for signal
+        with qtbot.waitSignal(self.worker.sent_line, raising=True) as blocker:
+            self.worker.fill_buffer()
+
+        # Assertions
+        # Only two lines (51 bytes each) fit in the 128 bytes buffer
+        assert self.mock_send_command.call_count == 2
+        assert self.worker.rx_buffer.used() == 102
+        # Progress is throttled, only the first line is reported
+        assert blocker.args == [1]
+        # The comment in line 2 is skipped, but counted
+        self.worker.report_progress(force=True)
+        assert blocker.args == [1]
+        assert self.worker._unreported_line is None
+
+    def test_file_streamer_response_frees_buffer(self, mocker: MockerFixture):
+        # Mock Gcode sender method
+        mocker.patch.object(GcodeFileSender, 'is_paused', return_value=False)
+
+        # Call method under test
+        self.worker.fill_buffer()
+        self.worker.handle_responses(['<Idle|MPos:0.000,0.000,0.000>', 'ok'])
+        self.worker.fill_buffer()
+
+        # Assertions
+        assert self.mock_send_command.call_count == 3
+        assert self.worker.rx_buffer.pending() == 2
+
+    def test_file_streamer_response_batch(self, mocker: MockerFixture):
+        # Mock Gcode sender method
+        mocker.patch.object(GcodeFileSender, 'is_paused', return_value=False)
+
+        # Call method under test
+        self.worker.fill_buffer()
+        self.worker.handle_responses(['ok', 'ok', 'ok'])
+
+        # Assertions
+        assert self.worker.rx_buffer.pending() == 0
+
+    def test_file_streamer_paused_does_not_send(self, mocker: MockerFixture):
+        # Mock Gcode sender method
+        mock_is_paused = mocker.patch.object(GcodeFileSender, 'is_paused', return_value=False)
+
+        # Call method under test
+        self.worker.fill_buffer()
+        mock_is_paused.return_value = True
+        self.worker.handle_responses(['ok'])
+        self.worker.fill_buffer()
+
+        # Assertions
+        assert self.mock_send_command.call_count == 2
+        assert self.worker.rx_buffer.pending() == 1
+
+    def test_file_streamer_send_whole_file(self, qtbot: QtBot, mocker: MockerFixture):
+        # Mock Gcode sender method
+        mocker.patch.object(GcodeFileSender, 'stop')
+        mocker.patch.object(GcodeFileSender, 'is_paused', return_value=False)
+
+        # Call method under test and wait for signal
+        with qtbot.waitSignal(self.worker.finished, raising=True):
+            for _ in range(5):
+                self.worker.fill_buffer()
+                self.worker.handle_responses(['ok'])
+
+        # Assertions
+        assert self.mock_send_command.call_count == 5
+        self.mock_send_command.assert_called_with('G01 X04 ' + 'Y' * 42)
+        assert self.worker.is_running() is False
+
+    def test_file_streamer_streams_from_thread(self, qtbot: QtBot, mocker: MockerFixture):
+        # Mock Gcode sender method
+        mocker.patch.object(GcodeFileSender, 'start')
+        mocker.patch.object(GcodeFileSender, 'stop')
+        mocker.patch.object(GcodeFileSender, 'is_paused', return_value=False)
+
+        # Create an instance of FileStreamer
+        file_streamer = FileStreamer(self.grbl_controller, MODE_CHARACTER_COUNTING)
+        file_streamer.set_file(str(self.file_path))
+
+        # Call method under test and wait for signal
+        with qtbot.waitSignal(file_streamer.sent_line, raising=True):
+            file_streamer.start()
+        qtbot.waitUntil(lambda: self.mock_send_command.call_count == 2)
+
+        with qtbot.waitSignal(file_streamer.finished, raising=True):
+            for sent_lines in range(3, 6):
+                file_streamer.handle_responses(['ok'])
+                qtbot.waitUntil(lambda: self.mock_send_command.call_count == sent_lines)
+
+        # Assertions
+        assert self.mock_send_command.call_count == 5
+        assert file_streamer.streaming_thread is None
@@ -4,6 +4,7 @@ from helpers.grblSync import GrblSync
 from logging import Logger
 from PyQt5.QtCore import QTimer
 import pytest
+import threading
 from pytest_mock.plugin import MockerFixture
 from pytestqt.qtbot import QtBot
 
@@ -19,33 +20,120 @@ class TestGrblSync:
         # Mock timer method
         mock_timer_start = mocker.patch.object(QTimer, 'start')
 
+        # Mock thread method
+        mock_thread_start = mocker.patch.object(threading.Thread, 'start')
+
         # Call method under test
         self.grbl_sync.start_monitor()
 
         # Assertions
-        assert mock_timer_start.call_count == 2
+        assert mock_timer_start.call_count == 1
+        assert mock_thread_start.call_count == 1
+        assert self.grbl_sync.logs_reader is not None
+
+    @pytest.mark.parametrize("running", [False, True])
+    def test_grbl_sync_pause_and_resume_status(self, running):
+        # Mock attributes
+        self.grbl_sync.logs_reader = (threading.Thread() if running else None)
+
+        # Call methods under test
+        self.grbl_sync.monitor_status.start()
+        self.grbl_sync.pause_status()
+        assert not self.grbl_sync.monitor_status.isActive()
+        self.grbl_sync.resume_status()
+
+        # Assertions
+        assert self.grbl_sync.monitor_status.isActive() == running
+        self.grbl_sync.monitor_status.stop()
+        self.grbl_sync.logs_reader = None
+
+    @pytest.mark.parametrize("running", [False, True])
+    def test_grbl_sync_stop_monitor(self, mocker: MockerFixture, running):
+        # Mock attributes
+        self.grbl_sync.logs_reader = (threading.Thread() if running else None)
 
-    def test_grbl_sync_stop_monitor(self, mocker: MockerFixture):
         # Mock timer method
         mock_timer_stop = mocker.patch.object(QTimer, 'stop')
 
+        # Mock thread method
+        mock_thread_join = mocker.patch.object(threading.Thread, 'join')
+
         # Call method under test
         self.grbl_sync.stop_monitor()
 
         # Assertions
-        assert mock_timer_stop.call_count == 2
+        assert mock_timer_stop.call_count == 1
+        assert mock_thread_join.call_count == (1 if running else 0)
+        assert self.grbl_sync.logs_reader is None
 
     def test_grbl_sync_message_received(self, qtbot: QtBot, mocker: MockerFixture):
         # Mock GRBL monitor methods
         mocker.patch.object(
             self.grbl_controller.grbl_monitor,
             'getLog',
-            return_value='A message'
+            side_effect=['A message', 'Another message', None]
+        )
+
+        # Call method under test and wait for signal
+        with qtbot.waitSignal(self.grbl_sync.new_messages, raising=True) as blocker:
+            result = self.grbl_sync.get_messages()
+
+        # Assertions
+        assert result is True
+        assert blocker.args == [['A message', 'Another message']]
+
+    def test_grbl_sync_no_messages(self, qtbot: QtBot, mocker: MockerFixture):
+        # Mock GRBL monitor methods
+        mocker.patch.object(self.grbl_controller.grbl_monitor, 'getLog', return_value=None)
+
+        # Call method under test and wait for signal
+        with qtbot.waitSignal(
+            self.grbl_sync.new_messages,
+            timeout=500,
+            raising=False
+        ) as blocker:
+            result = self.grbl_sync.get_messages()
+
+        # Assertions
+        assert result is False
+        assert blocker.signal_triggered is False
+
+    def test_grbl_sync_read_logs_from_thread(self, qtbot: QtBot):
+        # Call method under test
+        self.grbl_sync.start_logs_reader()
+
+        # Messages are emitted as soon as they are received
+        with qtbot.waitSignal(self.grbl_sync.new_messages, raising=True) as blocker:
+            self.grbl_controller.grbl_monitor.logs_queue.put('A message')
+        assert blocker.args == [['A message']]
+
+        with qtbot.waitSignal(self.grbl_sync.new_messages, raising=True) as blocker:
+            self.grbl_controller.grbl_monitor.logs_queue.put('Another message')
+        assert blocker.args == [['Another message']]
+
+        self.grbl_sync.stop_logs_reader()
+
+        # Assertions
+        assert self.grbl_sync.logs_reader is None
+
+    def test_grbl_sync_message_received_after_waiting(self, qtbot: QtBot, mocker: MockerFixture):
+        # Mock GRBL monitor methods
+        mocker.patch.object(
+            self.grbl_controller.grbl_monitor,
+            'getLog',
+            side_effect=['Another message', None]
         )
 
         # Call method under test and wait for signal
-        with qtbot.waitSignal(self.grbl_sync.new_message, raising=True):
-            self.grbl_sync.get_command()
+        with qtbot.waitSignal(self.grbl_sync.new_messages, raising=True) as blocker:
+            result = self.grbl_sync.get_messages(['A message'])
+
+        # Assertions
+        assert result is True
+        assert blocker.args == [['A message', 'Another message']]
+
+    def test_grbl_sync_wait_for_message_timeout(self):
+        assert self.grbl_sync.wait_for_message(0.01) is None
 
     def test_grbl_sync_status_received(self, qtbot: QtBot, mocker: MockerFixture):
         # Mock GRBL controller methods
@@ -64,6 +152,81 @@ class TestGrblSync:
         with qtbot.waitSignal(self.grbl_sync.new_status, raising=True):
             self.grbl_sync.get_status()
 
+    def test_grbl_sync_status_not_changed(self, qtbot: QtBot, mocker: MockerFixture):
+        # Mock state
+        self.grbl_sync._last_status = dict(grbl_mocks.grbl_status)
+        self.grbl_sync._last_parserstate = dict(grbl_mocks.grbl_parserstate)
+
+        # Mock GRBL controller methods
+        mocker.patch.object(
+            self.grbl_controller.grbl_status,
+            'get_status_report',
+            return_value=grbl_mocks.grbl_status
+        )
+        mocker.patch.object(
+            self.grbl_controller.grbl_status,
+            'get_parser_state',
+            return_value=grbl_mocks.grbl_parserstate
+        )
+
+        # Call method under test and wait for signal
+        with qtbot.waitSignal(self.grbl_sync.new_status, timeout=500, raising=False) as blocker:
+            self.grbl_sync.get_status()
+
+        # Assertions
+        assert blocker.signal_triggered is False
+
+    def test_grbl_sync_status_emits_changes(self, qtbot: QtBot, mocker: MockerFixture):
+        # Mock state
+        self.grbl_sync._last_status = dict(grbl_mocks.grbl_status)
+        self.grbl_sync._last_parserstate = dict(grbl_mocks.grbl_parserstate)
+
+        # Mock GRBL controller methods
+        mocker.patch.object(
+            self.grbl_controller.grbl_status,
+            'get_status_report',
+            return_value={**grbl_mocks.grbl_status, 'activeState': 'Test'}
+        )
+        mocker.patch.object(
+            self.grbl_controller.grbl_status,
+            'get_parser_state',
+            return_value=grbl_mocks.grbl_parserstate
+        )
+
+        # Call method under test and wait for signal
+        with qtbot.waitSignal(self.grbl_sync.new_status, raising=True) as blocker:
+            self.grbl_sync.get_status()
+
+        # Assertions
+        assert blocker.args == [{'activeState': 'Test'}, {}]
+        assert self.grbl_sync._last_status['activeState'] == 'Test'
+
+    def test_grbl_sync_status_emits_each_poll(self, qtbot: QtBot, mocker: MockerFixture):
+        # Mock GRBL controller methods
+        mock_get_status_report = mocker.patch.object(
+            self.grbl_controller.grbl_status,
+            'get_status_report',
+            side_effect=[
+                grbl_mocks.grbl_status,
+                {**grbl_mocks.grbl_status, 'activeState': 'Test'}
+            ]
+        )
+        mocker.patch.object(
+            self.grbl_controller.grbl_status,
+            'get_parser_state',
+            return_value=grbl_mocks.grbl_parserstate
+        )
+
+        # Call method under test and wait for signals
+        with qtbot.waitSignal(self.grbl_sync.new_status, raising=True):
+            self.grbl_sync.get_status()
+        with qtbot.waitSignal(self.grbl_sync.new_status, raising=True) as blocker:
+            self.grbl_sync.get_status()
+
+        # Assertions
+        assert mock_get_status_report.call_count == 2
+        assert blocker.args == [{'activeState': 'Test'}, {}]
+
     def test_grbl_sync_grbl_failed(self, qtbot: QtBot, mocker: MockerFixture):
         # Mock GRBL controller methods
         mocker.patch.object(
@@ -0,0 +1,90 @@
+from helpers.itemsLoader import ItemsLoader
+import pytest
+from pytestqt.qtbot import QtBot
+import threading
+
+
+class TestItemsLoader:
+    @pytest.fixture(autouse=True)
+    def setup_method(self, mocker):
+        self.mock_session = mocker.MagicMock()
+        mocker.patch('helpers.dbSession.SessionLocal', return_value=self.mock_session)
+        self.loader = ItemsLoader()
+
+    def test_items_loader_load(self, qtbot: QtBot):
+        threads = []
+
+        def load(db_session):
+            threads.append(threading.current_thread())
+            assert db_session is self.mock_session
+            return ['item-1', 'item-2']
+
+        # Call the method under test
+        with qtbot.waitSignal(self.loader.loaded) as blocker:
+            self.loader.start(load)
+            assert self.loader.is_running()
+
+        # Assertions
+        assert blocker.args == [['item-1', 'item-2']]
+        assert threads[0] is not threading.main_thread()
+        assert not self.loader.is_running()
+        self.mock_session.expunge_all.assert_called_once()
+        self.mock_session.commit.assert_not_called()
+        self.mock_session.close.assert_called_once()
+
+    def test_items_loader_load_error(self, qtbot: QtBot):
+        def load(db_session):
+            raise Exception('mocked-error')
+
+        # Call the method under test
+        with qtbot.waitSignal(self.loader.failed) as blocker:
+            self.loader.start(load)
+
+        # Assertions
+        assert blocker.args == ['mocked-error']
+        assert not self.loader.is_running()
+        self.mock_session.expunge_all.assert_not_called()
+        self.mock_session.close.assert_called_once()
+
+    def test_items_loader_start_discards_previous_load(self, qtbot: QtBot):
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_load(db_session):
+            started.set()
+            release.wait(5)
+            return ['old-item']
+
+        self.loader.start(slow_load)
+        started.wait(5)
+
+        # Call the method under test
+        with qtbot.waitSignal(self.loader.loaded) as blocker:
+            self.loader.start(lambda db_session: ['new-item'])
+            release.set()
+
+        # Assertions
+        assert blocker.args == [['new-item']]
+
+    def test_items_loader_cancel(self, qtbot: QtBot):
+        started = threading.Event()
+        release = threading.Event()
+        finished = threading.Event()
+
+        def slow_load(db_session):
+            started.set()
+            release.wait(5)
+            finished.set()
+            return ['item']
+
+        self.loader.start(slow_load)
+        started.wait(5)
+
+        # Call the method under test
+        with qtbot.assertNotEmitted(self.loader.loaded, wait=100):
+            self.loader.cancel()
+            release.set()
+            finished.wait(5)
+
+        # Assertions
+        assert not self.loader.is_running()
@@ -0,0 +1,226 @@
+from datetime import date, datetime
+import gzip
+from helpers.logsArchive import LogsArchive, RotatedLogsReader
+import pytest
+from pytest_mock.plugin import MockerFixture
+
+
+def make_log_line(index: int, day: int = 12) -> str:
+    return f'[{day:02d}/12/2023 00:00:{index:02d}] INFO: Log {index}\n'
+
+
+class TestLogsArchive:
+    @pytest.fixture(autouse=True)
+    def setup_method(self, tmp_path):
+        self.file_path = tmp_path / 'grbl.log'
+        self.lines = [make_log_line(index) for index in range(10)]
+        self.file_path.write_text(''.join(self.lines))
+        self.archive = LogsArchive(self.file_path, max_size=1024)
+
+    @pytest.mark.parametrize(
+            "max_size,daily,today,expected",
+            [
+                (1024, False, date(2023, 12, 13), False),
+                (100, False, date(2023, 12, 12), True),
+                (1024, True, date(2023, 12, 12), False),
+                (1024, True, date(2023, 12, 13), True),
+            ]
+        )
+    def test_logs_archive_should_rotate(self, max_size, daily, today, expected):
+        archive = LogsArchive(self.file_path, max_size, daily)
+        assert archive.should_rotate(today) == expected
+
+    def test_logs_archive_should_rotate_empty_file(self):
+        self.file_path.write_text('')
+        assert self.archive.should_rotate(date(2024, 1, 1)) is False
+
+    def test_logs_archive_rotate(self):
+        # Mock a log which is still being written
+        with open(self.file_path, 'a') as file:
+            file.write('[12/12/2023 00:00:10] INFO: Lo')
+
+        # Call method under test
+        segment = self.archive.rotate()
+
+        # Assertions
+        assert segment == {
+            'file': 'grbl-20231212-000000.log.gz',
+            'start': 0,
+            'size': len(''.join(self.lines)),
+            'lines': 10,
+            'first': '12/12/2023 00:00:00',
+            'last': '12/12/2023 00:00:09',
+        }
+        with gzip.open(self.archive.get_segment_path(segment), 'rt') as archived:
+            assert archived.read() == ''.join(self.lines)
+        # Logs which were not complete when copied are kept
+        assert self.file_path.read_text() == '[12/12/2023 00:00:10] INFO: Lo'
+        assert not self.file_path.with_name('grbl.log.rotating').exists()
+
+        # The manifest is shared with other instances
+        other_archive = LogsArchive(self.file_path)
+        assert other_archive.segments == [segment]
+        assert other_archive.active_start() == segment['size']
+
+    def test_logs_archive_rotate_keeps_new_logs(self, mocker: MockerFixture):
+        read_tail = LogsArchive._read_tail
+
+        def write_and_read_tail(source, end):
+            # Mock a log written after the copy
+            with open(self.file_path, 'a') as file:
+                file.write(make_log_line(10))
+            return read_tail(source, end)
+
+        mocker.patch.object(LogsArchive, '_read_tail', side_effect=write_and_read_tail)
+
+        # Call method under test
+        segment = self.archive.rotate()
+
+        # Assertions
+        assert segment
+        assert segment['size'] == len(''.join(self.lines))
+        assert self.file_path.read_text() == make_log_line(10)
+        reader = RotatedLogsReader(self.file_path)
+        entries, _ = reader.read_after(segment['size'], 10)
+        assert [offset for offset, _ in entries] == [segment['size']]
+
+    def test_logs_archive_rotate_twice(self):
+        # Call method under test
+        first_segment = self.archive.rotate()
+        self.file_path.write_text(make_log_line(10))
+        second_segment = self.archive.rotate()
+
+        # Assertions
+        assert first_segment and second_segment
+        assert second_segment['start'] == first_segment['size']
+        assert second_segment['file'] == 'grbl-20231212-000010.log.gz'
+        assert self.archive.rotate() is None
+
+    def test_logs_archive_rotate_if_needed(self, mocker: MockerFixture):
+        mock_should_rotate = mocker.patch.object(LogsArchive, 'should_rotate', return_value=False)
+        mock_rotate = mocker.patch.object(LogsArchive, 'rotate')
+
+        # Call method under test
+        self.archive.rotate_if_needed()
+
+        # Assertions
+        assert mock_should_rotate.call_count == 1
+        assert mock_rotate.call_count == 0
+
+    def test_logs_archive_get_segments(self):
+        self.archive.rotate()
+        self.file_path.write_text(make_log_line(0, day=13))
+        self.archive.rotate()
+
+        # Call method under test
+        segments = self.archive.get_segments(since=datetime(2023, 12, 13))
+
+        # Assertions
+        assert [segment['first'] for segment in segments] == ['13/12/2023 00:00:00']
+        assert len(self.archive.get_segments()) == 2
+        assert self.archive.get_segments(until=datetime(2023, 12, 11)) == []
+
+    def test_logs_archive_corrupted_manifest(self):
+        self.archive.manifest_path.write_text('not a manifest')
+
+        # Call method under test
+        self.archive.reload()
+
+        # Assertions
+        assert self.archive.segments == []
+        assert self.archive.active_start() == 0
+
+
+class TestRotatedLogsReader:
+    @pytest.fixture(autouse=True)
+    def setup_method(self, tmp_path, mocker: MockerFixture):
+        # Use small chunks, to read the files in several steps
+        mocker.patch('helpers.logsReader.CHUNK_SIZE', 16)
+
+        # Split 30 logs into two archives and the logs file
+        self.file_path = tmp_path / 'grbl.log'
+        self.lines = [make_log_line(index) for index in range(30)]
+        archive = LogsArchive(self.file_path)
+        for first in (0, 10, 20):
+            self.file_path.write_text(''.join(self.lines[first:first + 10]))
+            if first < 20:
+                archive.rotate()
+        self.reader = RotatedLogsReader(self.file_path)
+
+    def offset_of(self, index: int) -> int:
+        return sum(len(line) for line in self.lines[:index])
+
+    def messages(self, entries) -> list[str]:
+        return [log[-1] for _, log in entries]
+
+    def test_rotated_logs_reader_size(self):
+        assert self.reader.active_start() == self.offset_of(20)
+        assert self.reader.size() == self.offset_of(30)
+        assert self.reader.complete_size() == self.offset_of(30)
+
+    def test_rotated_logs_reader_read_last(self):
+        # Call method under test
+        entries, end = self.reader.read_last(15)
+
+        # Assertions
+        assert self.messages(entries) == [f'Log {index}' for index in range(15, 30)]
+        assert [offset for offset, _ in entries] == [self.offset_of(i) for i in range(15, 30)]
+        assert end == self.offset_of(30)
+
+    def test_rotated_logs_reader_read_before(self):
+        # Call method under test
+        entries = self.reader.read_before(self.offset_of(22), 25)
+
+        # Assertions
+        assert self.messages(entries) == [f'Log {index}' for index in range(22)]
+        assert self.reader.read_before(0, 5) == []
+
+    def test_rotated_logs_reader_read_after(self):
+        # Call method under test
+        entries, end = self.reader.read_after(self.offset_of(5), 20)
+
+        # Assertions
+        assert self.messages(entries) == [f'Log {index}' for index in range(5, 25)]
+        assert end == self.offset_of(25)
+
+        # Up to the end of the logs file
+        entries, end = self.reader.read_after(end, 20)
+        assert self.messages(entries) == [f'Log {index}' for index in range(25, 30)]
+        assert end == self.offset_of(30)
+        assert self.reader.read_after(end, 20) == ([], end)
+
+    def test_rotated_logs_reader_read_at(self):
+        offsets = [self.offset_of(index) for index in (3, 15, 27)]
+
+        # Call method under test
+        entries = self.reader.read_at(offsets)
+
+        # Assertions
+        assert self.messages(entries) == ['Log 3', 'Log 15', 'Log 27']
+        assert [offset for offset, _ in entries] == offsets
+
+    def test_rotated_logs_reader_follows_rotation(self):
+        entries, end = self.reader.read_last(1)
+
+        # Rotate the logs file and add new logs
+        with open(self.file_path, 'a') as file:
+            file.write(make_log_line(30))
+        LogsArchive(self.file_path).rotate()
+        with open(self.file_path, 'a') as file:
+            file.write(make_log_line(31))
+
+        # Call method under test
+        entries, _ = self.reader.read_after(end, 10)
+
+        # Assertions
+        assert self.messages(entries) == ['Log 30', 'Log 31']
+
+    def test_rotated_logs_reader_get_files(self):
+        # Call method under test
+        files = self.reader.get_files(since=datetime(2023, 12, 12, 0, 0, 15))
+
+        # Assertions
+        assert [(path.name, compressed) for path, _, compressed in files] == [
+            ('grbl-20231212-000010.log.gz', True),
+            ('grbl.log', False),
+        ]
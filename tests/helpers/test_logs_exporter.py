@@ -0,0 +1,173 @@
+from datetime import datetime
+import gzip
+from helpers.logsArchive import LogsArchive
+from helpers.logsExporter import is_csv_file, LogsExporter, LogsExporterWorker
+from helpers.logsIndex import LogsFilter
+import pytest
+from pytestqt.qtbot import QtBot
+
+LOGS = [
+    '[12/12/2023 10:00:00] INFO: [sent] $H',
+    '[12/12/2023 10:30:00] ERROR: [received] error:20',
+    '[12/12/2023 12:00:00] INFO: [received] ok',
+]
+
+
+@pytest.fixture
+def logs_file(tmp_path):
+    file_path = tmp_path / 'grbl.log'
+    file_path.write_text('\n'.join(LOGS) + '\n')
+    return file_path
+
+
+@pytest.mark.parametrize(
+    "output_path,expected",
+    [
+        ('logs.csv', True),
+        ('logs.csv.gz', True),
+        ('logs.txt', False),
+        ('logs.log.gz', False),
+    ]
+)
+def test_is_csv_file(output_path, expected):
+    assert is_csv_file(output_path) == expected
+
+
+class TestLogsExporterWorker:
+    def test_logs_exporter_worker_export_text(self, logs_file, tmp_path):
+        output_path = str(tmp_path / 'output.log')
+        worker = LogsExporterWorker(logs_file, output_path)
+
+        # Call method under test
+        assert worker.export() is True
+
+        # Assertions
+        with open(output_path) as output:
+            assert output.read().splitlines() == LOGS
+        assert worker.exported == 3
+
+    def test_logs_exporter_worker_export_csv(self, logs_file, tmp_path):
+        output_path = str(tmp_path / 'output.csv')
+        worker = LogsExporterWorker(logs_file, output_path, LogsFilter(level='INFO'))
+
+        # Call method under test
+        assert worker.export() is True
+
+        # Assertions
+        with open(output_path) as output:
+            assert output.read().splitlines() == [
+                'DATETIME;LEVEL;TYPE;Message',
+                '12/12/2023 10:00:00;INFO;sent;$H',
+                '12/12/2023 12:00:00;INFO;received;ok',
+            ]
+
+    def test_logs_exporter_worker_export_compressed(self, logs_file, tmp_path):
+        output_path = str(tmp_path / 'output.log.gz')
+        logs_filter = LogsFilter(
+            since=datetime(2023, 12, 12, 10, 15),
+            until=datetime(2023, 12, 12, 11)
+        )
+        worker = LogsExporterWorker(logs_file, output_path, logs_filter, compress=True)
+
+        # Call method under test
+        assert worker.export() is True
+
+        # Assertions
+        with gzip.open(output_path, 'rt') as output:
+            assert output.read().splitlines() == [LOGS[1]]
+
+    def test_logs_exporter_worker_ignores_incomplete_line(self, logs_file, tmp_path):
+        with open(logs_file, 'a') as file:
+            file.write('[12/12/2023 12:30:00] INFO: [rec')
+        output_path = str(tmp_path / 'output.log')
+        worker = LogsExporterWorker(logs_file, output_path)
+
+        # Call method under test
+        worker.export()
+
+        # Assertions
+        assert worker.exported == 3
+
+    def test_logs_exporter_worker_progress(self, qtbot: QtBot, logs_file, tmp_path):
+        worker = LogsExporterWorker(logs_file, str(tmp_path / 'output.log'))
+        progress: list[int] = []
+        worker.progress.connect(progress.append)
+
+        # Call method under test
+        worker.export()
+
+        # Assertions
+        assert progress == sorted(set(progress))
+        assert progress[-1] == 100
+
+    def test_logs_exporter_worker_stop(self, qtbot: QtBot, logs_file, tmp_path):
+        output_path = tmp_path / 'output.log'
+        worker = LogsExporterWorker(logs_file, str(output_path))
+        worker.stop()
+
+        # Call method under test
+        with qtbot.waitSignal(worker.finished) as blocker:
+            worker.run()
+
+        # Assertions
+        assert blocker.args == [False, str(output_path)]
+        assert not output_path.exists()
+
+    def test_logs_exporter_worker_error(self, qtbot: QtBot, tmp_path):
+        output_path = tmp_path / 'output.log'
+        worker = LogsExporterWorker(tmp_path / 'missing.log', str(output_path))
+
+        # Call method under test
+        with qtbot.waitSignal(worker.finished) as blocker:
+            worker.run()
+
+        # Assertions
+        assert blocker.args[0] is False
+        assert not output_path.exists()
+
+
+class TestLogsExporter:
+    def test_logs_exporter_start(self, qtbot: QtBot, logs_file, tmp_path):
+        exporter = LogsExporter(logs_file)
+        output_path = tmp_path / 'output.csv'
+
+        # Call method under test
+        with qtbot.waitSignal(exporter.finished) as blocker:
+            exporter.start(str(output_path), compress=True)
+
+        # Assertions
+        assert blocker.args == [True, str(output_path) + '.gz']
+        assert not exporter.is_running()
+        with gzip.open(blocker.args[1], 'rt') as output:
+            assert len(output.read().splitlines()) == 4
+
+    def test_logs_exporter_stop(self, qtbot: QtBot, logs_file, tmp_path):
+        exporter = LogsExporter(logs_file)
+        exporter.start(str(tmp_path / 'output.log'))
+
+        # Call method under test
+        with qtbot.assertNotEmitted(exporter.finished, wait=100):
+            exporter.stop()
+
+        # Assertions
+        assert not exporter.is_running()
+        assert exporter.export_worker is None
+
+
+def test_logs_exporter_worker_export_archives(logs_file, tmp_path):
+    LogsArchive(logs_file).rotate()
+    with open(logs_file, 'a') as file:
+        file.write('[13/12/2023 09:00:00] INFO: [sent] $X\n')
+    output_path = str(tmp_path / 'output.log')
+    worker = LogsExporterWorker(logs_file, output_path, LogsFilter(level='INFO'))
+
+    # Call method under test
+    worker.export()
+
+    # Assertions
+    with open(output_path) as output:
+        assert output.read().splitlines() == [
+            LOGS[0],
+            LOGS[2],
+            '[13/12/2023 09:00:00] INFO: [sent] $X',
+        ]
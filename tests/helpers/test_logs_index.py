@@ -0,0 +1,168 @@
+from datetime import datetime
+from helpers.logsIndex import get_time_bucket, get_tokens, is_indexed_token, LogsFilter, \
+    LogsIndex
+import pytest
+
+ENTRIES = [
+    (0, ('12/12/2023 10:00:00', 'INFO', 'sent', '$H')),
+    (40, ('12/12/2023 10:30:00', 'ERROR', 'received', 'error:20')),
+    (80, ('12/12/2023 12:00:00', 'INFO', 'received', 'ok')),
+    (120, ('12/12/2023 12:30:00', 'CRITICAL', 'received', 'ALARM:2')),
+    (160, ('', '', None, 'Line in unknown format')),
+]
+
+
+def test_get_tokens():
+    assert get_tokens('<Idle|MPos:0.000,0.000> ALARM:2 Homing') == {
+        'idle', 'mpos:0.000', '0.000', 'alarm:2', 'homing'
+    }
+
+
+@pytest.mark.parametrize(
+    "token,expected",
+    [
+        ('alarm:2', True),
+        ('error:20', True),
+        ('$h', True),
+        ('$$', True),
+        ('g1', True),
+        ('m3', True),
+        ('g38.2', True),
+        ('homing', False),
+        ('mpos:0.000', False),
+        ('0.000', False),
+        ('alarm', False),
+    ]
+)
+def test_is_indexed_token(token, expected):
+    assert is_indexed_token(token) == expected
+
+
+@pytest.mark.parametrize(
+    "logs_filter,expected",
+    [
+        (LogsFilter(), True),
+        (LogsFilter(level='ERROR'), True),
+        (LogsFilter(level='INFO'), False),
+        (LogsFilter(log_type='received'), True),
+        (LogsFilter(log_type='sent'), False),
+        (LogsFilter(text='ERROR:20'), True),
+        (LogsFilter(text='error:22'), False),
+        (LogsFilter(since=datetime(2023, 12, 12, 10, 30)), True),
+        (LogsFilter(until=datetime(2023, 12, 12, 10, 29)), False),
+    ]
+)
+def test_logs_filter_matches(logs_filter, expected):
+    log = ('12/12/2023 10:30:00', 'ERROR', 'received', 'error:20')
+    assert logs_filter.matches(log) == expected
+
+
+def test_logs_filter_is_empty():
+    assert LogsFilter().is_empty()
+    assert LogsFilter(text='  ').is_empty()
+    assert not LogsFilter(level='INFO').is_empty()
+
+
+class TestLogsIndex:
+    @pytest.fixture(autouse=True)
+    def setup_method(self):
+        self.index = LogsIndex()
+        self.index.add(ENTRIES[:3], 120)
+        self.index.add(ENTRIES[2:], 200)
+
+    def test_logs_index_add(self):
+        # Assertions
+        assert self.index.count == 5
+        assert self.index.end == 200
+        assert self.index.get_levels() == ['CRITICAL', 'ERROR', 'INFO']
+        assert self.index.get_types() == ['received', 'sent']
+
+    @pytest.mark.parametrize(
+        "logs_filter,expected",
+        [
+            (LogsFilter(), []),
+            (LogsFilter(level='INFO'), [0, 80]),
+            (LogsFilter(level='INFO', log_type='received'), [80]),
+            (LogsFilter(level='WARNING'), []),
+            (LogsFilter(text='alarm:2'), [120]),
+            (LogsFilter(text='$h alarm:2'), []),
+            (LogsFilter(text='unknown format'), [0, 40, 80, 120, 160]),
+            (LogsFilter(text='unknown', level='ERROR'), [40]),
+            (LogsFilter(since=datetime(2023, 12, 12, 12, 15)), [80, 120]),
+            (LogsFilter(level='INFO', until=datetime(2023, 12, 12, 11)), [0]),
+        ]
+    )
+    def test_logs_index_search(self, logs_filter, expected):
+        assert self.index.search(logs_filter) == expected
+
+    def test_logs_index_vocabulary(self):
+        # Assertions
+        assert sorted(self.index._tokens) == ['$h', 'alarm:2', 'error:20']
+
+    def test_logs_index_clear(self):
+        # Call method under test
+        self.index.clear()
+
+        # Assertions
+        assert self.index.count == 0
+        assert self.index.end == 0
+        assert self.index.search(LogsFilter(level='INFO')) == []
+
+    def test_logs_index_summarize(self):
+        # Call method under test
+        self.index.summarize(80)
+
+        # Assertions
+        assert self.index.start == 80
+        assert self.index.summaries == [{
+            'start': 0,
+            'end': 80,
+            'levels': {'INFO', 'ERROR'},
+            'types': {'sent', 'received'},
+            'buckets': {
+                get_time_bucket(datetime(2023, 12, 12, 10)),
+                get_time_bucket(datetime(2023, 12, 12, 10, 30))
+            },
+            'tokens': {'$h', 'error:20'}
+        }]
+        assert self.index.search(LogsFilter(level='INFO')) == [80]
+        assert self.index.search(LogsFilter(text='unknown format')) == [80, 120, 160]
+        assert sorted(self.index._tokens) == ['alarm:2']
+        # Keys of the summarized logs are still known
+        assert self.index.get_levels() == ['CRITICAL', 'ERROR', 'INFO']
+        assert self.index.get_types() == ['received', 'sent']
+
+    def test_logs_index_summarize_out_of_range(self):
+        # Call method under test
+        self.index.summarize(80)
+        self.index.summarize(40)
+        self.index.summarize(240)
+
+        # Assertions
+        assert self.index.start == 80
+        assert len(self.index.summaries) == 1
+
+    @pytest.mark.parametrize(
+        "logs_filter,expected",
+        [
+            (LogsFilter(), []),
+            (LogsFilter(level='INFO'), [0]),
+            (LogsFilter(level='CRITICAL'), []),
+            (LogsFilter(log_type='sent'), [0]),
+            (LogsFilter(text='error:20'), [0]),
+            (LogsFilter(text='alarm:2'), []),
+            (LogsFilter(text='homing'), [0]),
+            (LogsFilter(since=datetime(2023, 12, 12, 10, 15)), [0]),
+            (LogsFilter(since=datetime(2023, 12, 12, 11, 15)), []),
+            (LogsFilter(until=datetime(2023, 12, 12, 9)), []),
+        ]
+    )
+    def test_logs_index_search_summaries(self, logs_filter, expected):
+        # Mock index state
+        self.index.summarize(80)
+
+        # Call method under test
+        summaries = self.index.search_summaries(logs_filter)
+
+        # Assertions
+        assert [summary['start'] for summary in summaries] == expected
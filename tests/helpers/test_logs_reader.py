@@ -0,0 +1,109 @@
+from helpers.logsReader import LogsReader, parse_log
+import pytest
+from pytest_mock.plugin import MockerFixture
+
+
+def make_log_line(index: int) -> str:
+    return f'[12/12/2023 00:00:{index:02d}] INFO: Log {index}\n'
+
+
+class TestLogsReader:
+    @pytest.fixture(autouse=True)
+    def setup_method(self, tmp_path, mocker: MockerFixture):
+        # Use small chunks, to read the file in several steps
+        mocker.patch('helpers.logsReader.CHUNK_SIZE', 16)
+
+        self.file_path = tmp_path / 'grbl.log'
+        self.lines = [make_log_line(index) for index in range(20)]
+        self.file_path.write_text(''.join(self.lines))
+        self.reader = LogsReader(self.file_path)
+
+    def offset_of(self, index: int) -> int:
+        return sum(len(line) for line in self.lines[:index])
+
+    @pytest.mark.parametrize(
+            "line,expected",
+            [
+                (
+                    '[12/12/2023 00:00:00] INFO: Log 1',
+                    ('12/12/2023 00:00:00', 'INFO', None, 'Log 1')
+                ),
+                (
+                    '[12/12/2023 00:00:00] WARNING: [Sent] G1 X10',
+                    ('12/12/2023 00:00:00', 'WARNING', 'Sent', 'G1 X10')
+                ),
+                (
+                    'Unknown format',
+                    ('', '', None, 'Unknown format')
+                ),
+            ]
+        )
+    def test_parse_log(self, line, expected):
+        assert parse_log(line) == expected
+
+    def test_logs_reader_read_last(self):
+        # Call method under test
+        entries, end = self.reader.read_last(5)
+
+        # Assertions
+        assert [log[-1] for _, log in entries] == [f'Log {index}' for index in range(15, 20)]
+        assert [offset for offset, _ in entries] == [self.offset_of(i) for i in range(15, 20)]
+        assert end == self.offset_of(20)
+
+    def test_logs_reader_read_last_ignores_incomplete_line(self):
+        # Mock file state
+        with open(self.file_path, 'a') as file:
+            file.write('[12/12/2023 00:00:20] INFO: Lo')
+
+        # Call method under test
+        entries, end = self.reader.read_last(2)
+
+        # Assertions
+        assert [log[-1] for _, log in entries] == ['Log 18', 'Log 19']
+        assert end == self.offset_of(20)
+
+    @pytest.mark.parametrize(
+            "index,count,expected",
+            [
+                (10, 3, [7, 8, 9]),
+                (2, 5, [0, 1]),
+                (0, 5, []),
+                (20, 30, list(range(20))),
+            ]
+        )
+    def test_logs_reader_read_before(self, index, count, expected):
+        # Call method under test
+        entries = self.reader.read_before(self.offset_of(index), count)
+
+        # Assertions
+        assert [log[-1] for _, log in entries] == [f'Log {i}' for i in expected]
+        assert [offset for offset, _ in entries] == [self.offset_of(i) for i in expected]
+
+    @pytest.mark.parametrize(
+            "index,count,expected",
+            [
+                (10, 3, [10, 11, 12]),
+                (18, 5, [18, 19]),
+                (20, 5, []),
+            ]
+        )
+    def test_logs_reader_read_after(self, index, count, expected):
+        # Mock file state
+        with open(self.file_path, 'a') as file:
+            file.write('[12/12/2023 00:00:20] INFO: Lo')
+
+        # Call method under test
+        entries, end = self.reader.read_after(self.offset_of(index), count)
+
+        # Assertions
+        assert [log[-1] for _, log in entries] == [f'Log {i}' for i in expected]
+        assert end == self.offset_of(index + len(expected))
+
+    def test_logs_reader_missing_file(self, tmp_path):
+        reader = LogsReader(tmp_path / 'missing.log')
+
+        # Assertions
+        assert reader.size() == 0
+        assert reader.read_last(10) == ([], 0)
+        assert reader.read_before(100, 10) == []
+        assert reader.read_after(0, 10) == ([], 0)
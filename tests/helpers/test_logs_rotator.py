@@ -0,0 +1,71 @@
+from helpers.logsArchive import LogsArchive
+from helpers.logsRotator import LogsRotator
+import pytest
+from pytest_mock.plugin import MockerFixture
+import threading
+
+
+class TestLogsRotator:
+    @pytest.fixture(autouse=True)
+    def setup_method(self):
+        # Create an instance of the logs rotator
+        self.logs_rotator = LogsRotator(interval=0.01)
+
+    def test_logs_rotator_start(self, mocker: MockerFixture):
+        # Mock thread method
+        mock_thread_start = mocker.patch.object(threading.Thread, 'start')
+
+        # Call method under test
+        self.logs_rotator.start()
+        self.logs_rotator.start()
+
+        # Assertions
+        assert mock_thread_start.call_count == 1
+        assert self.logs_rotator.rotator_thread is not None
+
+    @pytest.mark.parametrize("running", [False, True])
+    def test_logs_rotator_stop(self, mocker: MockerFixture, running):
+        # Mock attributes
+        self.logs_rotator.rotator_thread = (threading.Thread() if running else None)
+
+        # Mock thread method
+        mock_thread_join = mocker.patch.object(threading.Thread, 'join')
+
+        # Call method under test
+        self.logs_rotator.stop()
+
+        # Assertions
+        assert mock_thread_join.call_count == (1 if running else 0)
+        assert self.logs_rotator.rotator_thread is None
+
+    def test_logs_rotator_run(self, mocker: MockerFixture):
+        # Mock methods
+        rotated = threading.Event()
+        mock_rotate = mocker.patch.object(
+            LogsArchive,
+            'rotate_if_needed',
+            side_effect=lambda: rotated.set()
+        )
+
+        # Call method under test
+        self.logs_rotator.start()
+        assert rotated.wait(1)
+        self.logs_rotator.stop()
+
+        # Assertions
+        assert mock_rotate.call_count >= 1
+        assert self.logs_rotator.rotator_thread is None
+
+    def test_logs_rotator_rotate_logs_error(self, mocker: MockerFixture):
+        # Mock methods
+        mock_rotate = mocker.patch.object(
+            LogsArchive,
+            'rotate_if_needed',
+            side_effect=OSError('mocked-error')
+        )
+
+        # Call method under test
+        self.logs_rotator.rotate_logs()
+
+        # Assertions
+        assert mock_rotate.call_count == 1
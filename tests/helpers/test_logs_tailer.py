@@ -0,0 +1,118 @@
+from helpers.logsTailer import create_notifier, InotifyNotifier, LogsTailer, PollingNotifier
+import pytest
+from pytest_mock.plugin import MockerFixture
+import threading
+import time
+
+
+def write_logs(file_path, messages: list[str]):
+    with open(file_path, 'a') as file:
+        for message in messages:
+            file.write(f'[12/12/2023 00:00:00] INFO: {message}\n')
+
+
+class TestLogsTailer:
+    @pytest.fixture(autouse=True)
+    def setup_method(self, tmp_path):
+        self.file_path = tmp_path / 'grbl.log'
+        write_logs(self.file_path, ['Log 1', 'Log 2'])
+        self.tailer = LogsTailer(self.file_path)
+        yield
+        self.tailer.close()
+
+    def test_logs_tailer_read_new(self):
+        # Call method under test
+        entries, offset = self.tailer.read_new()
+
+        # Assertions
+        assert [log[-1] for _, log in entries] == ['Log 1', 'Log 2']
+        assert offset == self.file_path.stat().st_size
+
+        # Read again, after new logs are added
+        write_logs(self.file_path, ['Log 3'])
+        entries, offset = self.tailer.read_new()
+        assert [log[-1] for _, log in entries] == ['Log 3']
+        assert offset == self.file_path.stat().st_size
+
+    def test_logs_tailer_read_new_in_batches(self):
+        # Call method under test
+        entries, _ = self.tailer.read_new(1)
+
+        # Assertions
+        assert [log[-1] for _, log in entries] == ['Log 1']
+        entries, _ = self.tailer.read_new(1)
+        assert [log[-1] for _, log in entries] == ['Log 2']
+
+    def test_logs_tailer_truncated_file(self):
+        # Mock file state
+        self.tailer.read_new()
+        self.file_path.write_text('')
+        write_logs(self.file_path, ['New log'])
+
+        # Call method under test
+        entries, _ = self.tailer.read_new()
+
+        # Assertions
+        assert [log[-1] for _, log in entries] == ['New log']
+
+    def test_logs_tailer_wait_for_changes(self):
+        # Mock file state
+        self.tailer.read_new()
+        timer = threading.Timer(0.1, write_logs, [self.file_path, ['Log 3']])
+        timer.start()
+
+        # Call method under test
+        self.tailer.wait(5)
+        timer.join()
+
+        # Assertions
+        entries, _ = self.tailer.read_new()
+        assert [log[-1] for _, log in entries] == ['Log 3']
+
+    def test_logs_tailer_wake(self):
+        # Call method under test
+        start = time.monotonic()
+        timer = threading.Timer(0.1, self.tailer.wake)
+        timer.start()
+        self.tailer.wait(5)
+        timer.join()
+
+        # Assertions
+        assert time.monotonic() - start < 5
+
+
+class TestNotifiers:
+    def test_create_notifier(self, tmp_path):
+        notifier = create_notifier(tmp_path / 'grbl.log')
+
+        # Assertions
+        assert isinstance(notifier, InotifyNotifier)
+        notifier.close()
+
+    def test_create_notifier_missing_folder(self, tmp_path):
+        notifier = create_notifier(tmp_path / 'missing' / 'grbl.log')
+
+        # Assertions
+        assert isinstance(notifier, PollingNotifier)
+
+    def test_create_notifier_without_inotify(self, tmp_path, mocker: MockerFixture):
+        # Mock system libraries
+        mocker.patch('ctypes.util.find_library', return_value=None)
+
+        notifier = create_notifier(tmp_path / 'grbl.log')
+
+        # Assertions
+        assert isinstance(notifier, PollingNotifier)
+
+    def test_polling_notifier(self, mocker: MockerFixture):
+        notifier = PollingNotifier()
+        spy_wait = mocker.spy(notifier._event, 'wait')
+
+        # Call method under test
+        notifier.wait(5)
+        notifier.wake()
+        notifier.wait()
+
+        # Assertions
+        assert spy_wait.call_count == 2
+        spy_wait.assert_any_call(0.1)
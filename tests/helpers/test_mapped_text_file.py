@@ -0,0 +1,94 @@
+from helpers.mappedTextFile import MappedTextFile
+import pytest
+
+
+class TestMappedTextFile:
+    @pytest.fixture(autouse=True)
+    def setup_method(self, tmp_path):
+        self.file_path = tmp_path / 'file.gcode'
+
+    def create_file(self, content: str) -> MappedTextFile:
+        self.file_path.write_bytes(content.encode())
+        return MappedTextFile(str(self.file_path))
+
+    @pytest.mark.parametrize(
+            "content,expected",
+            [
+                ('', 1),
+                ('G1 X10', 1),
+                ('G1 X10\n', 1),
+                ('G1 X10\nG1 Y10', 2),
+                ('G1 X10\nG1 Y10\n', 2),
+                ('G1 X10\n\nG1 Y10\n', 3),
+            ]
+        )
+    def test_mapped_text_file_line_count(self, content, expected):
+        mapped_file = self.create_file(content)
+        mapped_file.build_index()
+
+        # Assertions
+        assert mapped_file.line_count() == expected
+        assert mapped_file.size() == len(content)
+
+        mapped_file.close()
+
+    @pytest.mark.parametrize(
+            "start,end,expected",
+            [
+                (0, 1, 'G1 X10'),
+                (1, 3, 'G1 X20\nG1 X30'),
+                (2, 10, 'G1 X30\nG1 X40'),
+                (-5, 1, 'G1 X10'),
+                (10, 20, ''),
+            ]
+        )
+    def test_mapped_text_file_read_lines(self, start, end, expected):
+        mapped_file = self.create_file('G1 X10\r\nG1 X20\nG1 X30\nG1 X40')
+
+        # Call method under test
+        text = mapped_file.read_lines(start, end)
+
+        # Assertions
+        assert text == expected
+
+        mapped_file.close()
+
+    def test_mapped_text_file_empty(self):
+        mapped_file = self.create_file('')
+
+        # Assertions
+        assert mapped_file.read_lines(0, 10) == ''
+
+        mapped_file.close()
+
+    def test_mapped_text_file_indexes_lazily(self, mocker):
+        mocker.patch('helpers.mappedTextFile.INDEX_CHUNK_SIZE', 10)
+        lines = [f'G1 X{i}' for i in range(100)]
+        mapped_file = self.create_file('\n'.join(lines))
+
+        # Call method under test
+        text = mapped_file.read_lines(0, 2)
+
+        # Assertions
+        assert text == 'G1 X0\nG1 X1'
+        assert not mapped_file.is_indexed()
+        assert mapped_file.line_count() < 100
+
+        # Complete the index
+        mapped_file.build_index()
+        assert mapped_file.is_indexed()
+        assert mapped_file.line_count() == 100
+        assert mapped_file.read_lines(98, 100) == 'G1 X98\nG1 X99'
+
+        mapped_file.close()
+
+    def test_mapped_text_file_build_index_after_close(self):
+        mapped_file = self.create_file('G1 X10\nG1 X20')
+        mapped_file.close()
+
+        # Call method under test
+        mapped_file.build_index()
+
+        # Assertions
+        assert not mapped_file.is_indexed()
+        assert mapped_file.read_lines(0, 1) == ''
@@ -0,0 +1,152 @@
+from core.database.models import Base, File, Material, Task, Tool, User
+from helpers.pagination import get_files_page, get_materials_page, get_page, get_tasks_page, \
+    get_tools_page, get_users_page, PAGE_SIZE
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import Session
+
+
+@pytest.fixture
+def db_session():
+    engine = create_engine('sqlite://')
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(
+            User(name='John Doe', email='test@testing.com', password='1234', role='user')
+        )
+        session.add(File(user_id=1, file_name='example.gcode'))
+        session.add(Tool(name='Example tool', description='It is a tool'))
+        session.add(Material(name='Example material', description='It is a material'))
+        session.add(Task(user_id=1, file_id=1, tool_id=1, material_id=1, name='Example task'))
+        session.commit()
+        yield session
+
+
+class TestPagination:
+    def test_get_page(self, mocker):
+        session = mocker.MagicMock()
+        session.scalars.return_value = iter(['file-1', 'file-2'])
+
+        # Call the method under test
+        result = get_page(session, select(File), File.id)
+
+        # Assertions
+        statement = session.scalars.call_args[0][0]
+        compiled = statement.compile()
+        assert result == ['file-1', 'file-2']
+        assert 'WHERE' not in str(compiled)
+        assert 'ORDER BY files.id' in str(compiled)
+        assert compiled.params == {'param_1': PAGE_SIZE}
+
+    def test_get_page_after_key(self, mocker):
+        session = mocker.MagicMock()
+        session.scalars.return_value = iter([])
+
+        # Call the method under test
+        get_page(session, select(File), File.id, after=10, limit=5)
+
+        # Assertions
+        statement = session.scalars.call_args[0][0]
+        compiled = statement.compile()
+        assert 'WHERE files.id > :id_1' in str(compiled)
+        assert compiled.params == {'id_1': 10, 'param_1': 5}
+
+    def test_get_page_before_key(self, mocker):
+        session = mocker.MagicMock()
+        session.scalars.return_value.all.return_value = ['file-3', 'file-2']
+
+        # Call the method under test
+        result = get_page(session, select(File), File.id, limit=5, before=4)
+
+        # Assertions
+        statement = session.scalars.call_args[0][0]
+        compiled = statement.compile()
+        assert result == ['file-2', 'file-3']
+        assert 'WHERE files.id < :id_1' in str(compiled)
+        assert 'ORDER BY files.id DESC' in str(compiled)
+        assert compiled.params == {'id_1': 4, 'param_1': 5}
+
+    def test_get_files_page(self, mocker):
+        mock_get_page = mocker.patch('helpers.pagination.get_page', return_value=[])
+
+        # Call the method under test
+        get_files_page(mocker.Mock(), 10, 5)
+
+        # Assertions
+        mock_get_page.assert_called_once_with(mocker.ANY, mocker.ANY, File.id, 10, 5, None)
+
+    def test_get_tasks_page(self, mocker):
+        session = mocker.MagicMock()
+        session.scalars.return_value = iter([])
+
+        # Call the method under test
+        get_tasks_page(session, 1, after=10)
+
+        # Assertions
+        statement = session.scalars.call_args[0][0]
+        compiled = statement.compile()
+        # Labels of the parameters are numbered after the ones of the joined columns
+        assert 'WHERE tasks.user_id = :user_id_2 AND tasks.id > :id_4' in str(compiled)
+        assert compiled.params == {'user_id_2': 1, 'id_4': 10, 'param_1': PAGE_SIZE}
+        assert Task.__tablename__ == 'tasks'
+
+    def test_get_files_page_loads_users(self, mocker):
+        session = mocker.MagicMock()
+        session.scalars.return_value = iter([])
+
+        # Call the method under test
+        get_files_page(session)
+
+        # Assertions
+        statement = session.scalars.call_args[0][0]
+        assert 'LEFT OUTER JOIN users' in str(statement.compile())
+
+    def test_get_tasks_page_loads_relationships(self, mocker):
+        session = mocker.MagicMock()
+        session.scalars.return_value = iter([])
+
+        # Call the method under test
+        get_tasks_page(session, 1)
+
+        # Assertions
+        compiled = str(session.scalars.call_args[0][0].compile())
+        assert 'LEFT OUTER JOIN files' in compiled
+        assert 'LEFT OUTER JOIN tools' in compiled
+        assert 'LEFT OUTER JOIN materials' in compiled
+
+    def test_get_tasks_page_detached(self, db_session):
+        # Call the method under test
+        tasks = get_tasks_page(db_session, 1)
+        db_session.close()
+
+        # Assertions
+        assert tasks[0].file.file_name == 'example.gcode'
+        assert tasks[0].tool.name == 'Example tool'
+        assert tasks[0].material.name == 'Example material'
+        with pytest.raises(InvalidRequestError):
+            tasks[0].user
+
+    def test_get_files_page_detached(self, db_session):
+        # Call the method under test
+        files = get_files_page(db_session)
+        db_session.close()
+
+        # Assertions
+        assert files[0].user.name == 'John Doe'
+
+    @pytest.mark.parametrize(
+        'get_items_page,expected_name',
+        [
+            (get_tools_page, 'Example tool'),
+            (get_materials_page, 'Example material'),
+            (get_users_page, 'John Doe')
+        ]
+    )
+    def test_get_catalog_page_detached(self, db_session, get_items_page, expected_name):
+        # Call the method under test
+        items = get_items_page(db_session)
+        db_session.close()
+
+        # Assertions
+        assert [item.name for item in items] == [expected_name]
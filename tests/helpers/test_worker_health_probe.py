@@ -0,0 +1,143 @@
+from helpers.cncWorkerMonitor import CncWorkerMonitor, UNKNOWN_WORKER_STATUS
+from helpers.workerHealthProbe import WorkerHealthProbe
+import pytest
+from pytest_mock.plugin import MockerFixture
+from pytestqt.qtbot import QtBot
+import threading
+
+
+class TestWorkerHealthProbe:
+    @pytest.fixture(autouse=True)
+    def setup_method(self):
+        # Create an instance of the health probe
+        self.health_probe = WorkerHealthProbe(interval=0.01)
+
+        yield
+
+        # Clear the cached state
+        CncWorkerMonitor.set_worker_health(None)
+        CncWorkerMonitor.set_worker_status(None)
+
+    def test_worker_health_probe_start(self, mocker: MockerFixture):
+        # Mock thread method
+        mock_thread_start = mocker.patch.object(threading.Thread, 'start')
+
+        # Call method under test
+        self.health_probe.start()
+
+        # Assertions
+        assert mock_thread_start.call_count == 1
+        assert self.health_probe.probe_thread is not None
+
+    @pytest.mark.parametrize("running", [False, True])
+    def test_worker_health_probe_stop(self, mocker: MockerFixture, running):
+        # Mock attributes
+        self.health_probe.probe_thread = (threading.Thread() if running else None)
+        CncWorkerMonitor.set_worker_health({'on': True, 'running': False, 'updated_at': 0.0})
+
+        # Mock thread method
+        mock_thread_join = mocker.patch.object(threading.Thread, 'join')
+
+        # Call method under test
+        self.health_probe.stop()
+
+        # Assertions
+        assert mock_thread_join.call_count == (1 if running else 0)
+        assert self.health_probe.probe_thread is None
+        assert (CncWorkerMonitor.get_worker_health() is None) == running
+
+    @pytest.mark.parametrize("worker_on", [False, True])
+    @pytest.mark.parametrize("worker_running", [False, True])
+    def test_worker_health_probe_check_health(
+        self,
+        qtbot: QtBot,
+        mocker: MockerFixture,
+        worker_on,
+        worker_running
+    ):
+        # Mock worker monitor methods
+        mocker.patch.object(CncWorkerMonitor, 'probe_worker_on', return_value=worker_on)
+        mock_probe_running = mocker.patch.object(
+            CncWorkerMonitor,
+            'probe_worker_running',
+            return_value=worker_running
+        )
+
+        # Call method under test and wait for signal
+        with qtbot.waitSignal(self.health_probe.health_changed, raising=True) as blocker:
+            self.health_probe.check_health()
+
+        # Assertions
+        expected_running = worker_on and worker_running
+        assert blocker.args == [worker_on, expected_running]
+        assert mock_probe_running.call_count == (1 if worker_on else 0)
+        assert CncWorkerMonitor.is_worker_on() == worker_on
+        assert CncWorkerMonitor.is_worker_running() == expected_running
+        assert self.health_probe.get_age() is not None
+
+    @pytest.mark.parametrize("worker_on", [False, True])
+    def test_worker_health_probe_check_requested_status(
+        self,
+        mocker: MockerFixture,
+        worker_on
+    ):
+        # Mock worker monitor methods
+        mocker.patch.object(CncWorkerMonitor, 'probe_worker_on', return_value=worker_on)
+        mocker.patch.object(CncWorkerMonitor, 'probe_worker_running', return_value=False)
+        mock_probe_status = mocker.patch.object(
+            CncWorkerMonitor,
+            'probe_worker_status',
+            return_value={**UNKNOWN_WORKER_STATUS, 'availability': [], 'updated_at': 1.0}
+        )
+
+        # Details are only checked when requested
+        self.health_probe.check_health()
+        assert mock_probe_status.call_count == 0
+
+        # Call method under test
+        CncWorkerMonitor.get_worker_status()
+        self.health_probe.check_health()
+
+        # Assertions
+        status = CncWorkerMonitor.get_worker_status()
+        assert mock_probe_status.call_count == (1 if worker_on else 0)
+        assert status['availability'] == ([] if worker_on else None)
+        assert status['updated_at'] is not None
+
+    def test_worker_health_probe_no_changes(self, qtbot: QtBot, mocker: MockerFixture):
+        # Mock worker monitor methods
+        mocker.patch.object(CncWorkerMonitor, 'probe_worker_on', return_value=True)
+        mocker.patch.object(CncWorkerMonitor, 'probe_worker_running', return_value=False)
+        CncWorkerMonitor.set_worker_health({'on': True, 'running': False, 'updated_at': 0.0})
+
+        # Call method under test and wait for signal
+        with qtbot.waitSignal(
+            self.health_probe.health_changed,
+            timeout=500,
+            raising=False
+        ) as blocker:
+            self.health_probe.check_health()
+
+        # Assertions
+        health = CncWorkerMonitor.get_worker_health()
+        assert blocker.signal_triggered is False
+        assert health is not None
+        assert health['updated_at'] > 0.0
+
+    def test_worker_health_probe_runs_in_background(self, qtbot: QtBot, mocker: MockerFixture):
+        # Mock worker monitor methods
+        mock_probe_on = mocker.patch.object(
+            CncWorkerMonitor,
+            'probe_worker_on',
+            return_value=True
+        )
+        mocker.patch.object(CncWorkerMonitor, 'probe_worker_running', return_value=False)
+
+        # Call method under test and wait for signal
+        with qtbot.waitSignal(self.health_probe.health_changed, raising=True):
+            self.health_probe.start()
+        qtbot.waitUntil(lambda: mock_probe_on.call_count > 1)
+        self.health_probe.stop()
+
+        # Assertions
+        assert self.health_probe.probe_thread is None
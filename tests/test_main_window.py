@@ -1,4 +1,9 @@
+from config import DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_POOL_TIMEOUT, DB_POOL_RECYCLE
+from helpers.catalogCache import CatalogCache, TOOLS_CATALOG
 from helpers.cncWorkerMonitor import CncWorkerMonitor
+from helpers.dbNotifications import DbChangesListener
+from helpers.logsRotator import LogsRotator
+from helpers.workerHealthProbe import WorkerHealthProbe
 from MainWindow import MainWindow
 from views.MainMenu import MainMenu
 from views.UsersView import UsersView
@@ -10,6 +15,15 @@ from pytestqt.qtbot import QtBot
 
 
 class TestMainWindow:
+    def start_services(self, window: MainWindow, mocker: MockerFixture):
+        """Starts the services of the window, without their background threads.
+        """
+        mocker.patch.object(WorkerHealthProbe, 'start')
+        mocker.patch.object(LogsRotator, 'start')
+        mocker.patch.object(DbChangesListener, 'start')
+        mocker.patch('MainWindow.DB_NOTIFICATIONS', True)
+        window.startServices()
+
     @pytest.mark.parametrize("worker_on", [False, True])
     @pytest.mark.parametrize("worker_running", [False, True])
     def test_main_window_init(
@@ -20,8 +34,9 @@ class TestMainWindow:
         worker_running
     ):
         # Mock worker monitor methods
-        mocker.patch.object(CncWorkerMonitor, 'is_worker_on', return_value=worker_on)
-        mocker.patch.object(CncWorkerMonitor, 'is_worker_running', return_value=worker_running)
+        mocker.patch.object(CncWorkerMonitor, 'probe_worker_on', return_value=worker_on)
+        mocker.patch.object(CncWorkerMonitor, 'probe_worker_running', return_value=worker_running)
+        CncWorkerMonitor.set_device_enabled(True)
 
         # Mock QMessageBox method
         mocker.patch.object(
@@ -35,8 +50,18 @@ class TestMainWindow:
         qtbot.addWidget(window)
 
         # Assertions
-        assert type(window.centralWidget()) is MainMenu
+        assert type(window.views.currentWidget()) is MainMenu
         assert window.windowTitle() == "CNC admin"
+        assert window.status_bar.label_worker.text() == 'Worker : DESCONECTADO'
+        assert window.status_bar.label_device.text() == 'Dispositivo : ---'
+
+        # Worker status is updated when checked in background
+        self.start_services(window, mocker)
+        assert window.worker_health is not None
+        with qtbot.waitSignal(window.worker_health.health_changed, raising=True):
+            window.worker_health.check_health()
+        CncWorkerMonitor.set_worker_health(None)
+
         expected_worker_status = (
             'Worker : CONECTADO' if worker_on else 'Worker : DESCONECTADO'
         )
@@ -49,10 +74,33 @@ class TestMainWindow:
             )
         assert window.status_bar.label_device.text() == expected_device_status
 
+    def test_main_window_worker_finished_with_device_disabled(
+        self,
+        qtbot: QtBot,
+        mocker: MockerFixture
+    ):
+        # Mock worker monitor methods
+        CncWorkerMonitor.set_device_enabled(False)
+
+        # Instantiate window
+        window = MainWindow()
+        qtbot.addWidget(window)
+        self.start_services(window, mocker)
+
+        # Call method under test
+        window.on_worker_health_changed(True, True)
+        window.on_worker_health_changed(True, False)
+        CncWorkerMonitor.set_device_enabled(True)
+
+        # Assertions
+        assert window.status_bar.label_worker.text() == 'Worker : CONECTADO'
+        assert window.status_bar.label_device.text() == 'Dispositivo : DESHABILITADO'
+
     def test_main_window_changes_view(self, qtbot: QtBot, mocker: MockerFixture):
         # Mock worker monitor methods
         mocker.patch.object(CncWorkerMonitor, 'is_worker_on', return_value=False)
         mocker.patch.object(CncWorkerMonitor, 'is_worker_running', return_value=False)
+        mocker.patch.object(WorkerHealthProbe, 'start')
 
         # Instantiate window
         window = MainWindow()
@@ -68,11 +116,96 @@ class TestMainWindow:
         # Test changing view to 'users'
         mocker.patch.object(UsersView, 'refreshLayout')
         window.changeView(UsersView)
-        assert type(window.centralWidget()) is UsersView
+        users_view = window.views.currentWidget()
+        assert type(users_view) is UsersView
 
         # Test going back to the main menu
         window.backToMenu()
-        assert type(window.centralWidget()) is MainMenu
+        assert type(window.views.currentWidget()) is MainMenu
+
+        # Views are kept
+        window.changeView(UsersView)
+        assert window.views.currentWidget() is users_view
+
+    def test_main_window_applies_db_changes(self, qtbot: QtBot, mocker: MockerFixture):
+        # Mock worker monitor methods
+        mocker.patch.object(CncWorkerMonitor, 'is_worker_on', return_value=False)
+        mocker.patch.object(CncWorkerMonitor, 'is_worker_running', return_value=False)
+
+        # Instantiate window
+        window = MainWindow()
+        qtbot.addWidget(window)
+        self.start_services(window, mocker)
+        assert window.db_changes is not None
+
+        # Mock view and cache methods
+        mock_refresh_layout = mocker.patch.object(UsersView, 'refreshLayout')
+        mock_apply_change = mocker.patch.object(UsersView, 'applyChange')
+        mock_invalidate = mocker.patch.object(CatalogCache, 'invalidate')
+
+        # Changes are ignored by views without lists
+        window.db_changes.changed.emit('tools', 'UPDATE', 1)
+        assert mock_invalidate.call_args_list == [mocker.call(TOOLS_CATALOG)]
+
+        # Call the methods under test
+        window.changeView(UsersView)
+        window.db_changes.changed.emit('users', 'INSERT', 2)
+        window.db_changes.reconnected.emit()
+
+        # Hidden views are notified too
+        window.backToMenu()
+        window.db_changes.changed.emit('users', 'DELETE', 3)
+
+        # Assertions
+        assert mock_apply_change.call_args_list == [
+            mocker.call('users', 'INSERT', 2),
+            mocker.call('users', 'DELETE', 3)
+        ]
+        assert mock_invalidate.call_args_list[1:] == [mocker.call()]
+        assert mock_refresh_layout.call_count == 2
+
+    @pytest.mark.parametrize("db_notifications", [False, True])
+    def test_main_window_starts_services_after_first_paint(
+        self,
+        qtbot: QtBot,
+        mocker: MockerFixture,
+        db_notifications
+    ):
+        # Mock services methods
+        mock_probe_start = mocker.patch.object(WorkerHealthProbe, 'start')
+        mock_rotator_start = mocker.patch.object(LogsRotator, 'start')
+        mock_listener_start = mocker.patch.object(DbChangesListener, 'start')
+        mock_configure_engine = mocker.patch('helpers.dbSession.configure_engine')
+        mocker.patch('MainWindow.DB_NOTIFICATIONS', db_notifications)
+
+        # Instantiate window
+        window = MainWindow()
+        qtbot.addWidget(window)
+
+        # Services don't start before the window is painted
+        assert mock_probe_start.call_count == 0
+        assert mock_configure_engine.call_count == 0
+        assert window.worker_health is None
+
+        # Show the window
+        window.show()
+        qtbot.waitUntil(lambda: mock_probe_start.call_count == 1)
+
+        # Assertions
+        mock_configure_engine.assert_called_once_with(
+            DB_POOL_SIZE,
+            DB_MAX_OVERFLOW,
+            DB_POOL_TIMEOUT,
+            DB_POOL_RECYCLE
+        )
+        assert mock_rotator_start.call_count == 1
+        assert mock_listener_start.call_count == (1 if db_notifications else 0)
+        assert (window.db_changes is not None) == db_notifications
+
+        # Services are started only once
+        window.repaint()
+        qtbot.wait(10)
+        assert mock_probe_start.call_count == 1
 
     @pytest.mark.parametrize(
             "msgBoxResponse,expectedMethodCalls",
@@ -91,10 +224,14 @@ class TestMainWindow:
         # Mock worker monitor methods
         mocker.patch.object(CncWorkerMonitor, 'is_worker_on', return_value=False)
         mocker.patch.object(CncWorkerMonitor, 'is_worker_running', return_value=False)
+        mock_probe_stop = mocker.patch.object(WorkerHealthProbe, 'stop')
+        mock_listener_stop = mocker.patch.object(DbChangesListener, 'stop')
+        mock_rotator_stop = mocker.patch.object(LogsRotator, 'stop')
 
         # Instantiate window
         window = MainWindow()
         qtbot.addWidget(window)
+        self.start_services(window, mocker)
 
         # Mock QMessageBox method
         mock_popup = mocker.patch.object(
@@ -105,7 +242,7 @@ class TestMainWindow:
 
         # Mock child widget method
         mock_child_close_event = mocker.patch.object(
-            window.centralWidget(),
+            window.views.currentWidget(),
             'closeEvent'
         )
 
@@ -115,3 +252,21 @@ class TestMainWindow:
         # Assertions
         assert mock_popup.call_count == 1
         assert mock_child_close_event.call_count == expectedMethodCalls
+        assert mock_probe_stop.call_count == expectedMethodCalls
+        assert mock_listener_stop.call_count == expectedMethodCalls
+        assert mock_rotator_stop.call_count == expectedMethodCalls
+
+    def test_main_window_close_event_before_services(self, qtbot: QtBot, mocker: MockerFixture):
+        # Mock services and QMessageBox methods
+        mock_rotator_stop = mocker.patch.object(LogsRotator, 'stop')
+        mocker.patch.object(QMessageBox, 'question', return_value=QMessageBox.Yes)
+
+        # Instantiate window
+        window = MainWindow()
+        qtbot.addWidget(window)
+
+        # Call method under test
+        window.closeEvent(QCloseEvent())
+
+        # Assertions
+        assert mock_rotator_stop.call_count == 1
@@ -15,6 +15,8 @@ from PyQt5.QtWidgets import QDialog, QMessageBox
 import pytest
 from pytest_mock.plugin import MockerFixture
 from pytestqt.qtbot import QtBot
+from typing import cast
+from unittest.mock import Mock
 from views.ControlView import ControlView
 
 
@@ -38,7 +40,7 @@ class TestControlView:
         device_busy
     ):
         # Reset parent mocks call count
-        self.parent.addToolBar.reset_mock()
+        cast(Mock, self.parent.addToolBar).reset_mock()
 
         # Mock worker monitor methods
         mock_check_tasks_in_progress = mocker.patch.object(
@@ -60,7 +62,7 @@ class TestControlView:
         assert helpers.count_grid_widgets(layout, Terminal) == 1
 
         # More assertions
-        assert self.parent.addToolBar.call_count == (1 if device_busy else 2)
+        assert cast(Mock, self.parent.addToolBar).call_count == (1 if device_busy else 2)
         assert mock_check_tasks_in_progress.call_count == 1
         assert control_view.checkmode is False
 
@@ -73,8 +75,27 @@ class TestControlView:
         self.control_view.backToMenu()
 
         # Assertions
-        self.parent.removeToolBar.call_count == (1 if device_busy else 2)
-        self.parent.backToMenu.assert_called_once()
+        cast(Mock, self.parent.backToMenu).assert_called_once()
+
+    @pytest.mark.parametrize("device_busy", [False, True])
+    def test_control_view_deactivate_and_activate(self, mocker: MockerFixture, device_busy):
+        # Mock attributes and methods
+        self.control_view.device_busy = device_busy
+        mock_disconnect = mocker.patch.object(ControlView, 'disconnect_device')
+        mock_pause_status = mocker.patch.object(GrblSync, 'pause_status')
+        mock_resume_status = mocker.patch.object(GrblSync, 'resume_status')
+        cast(Mock, self.parent.addToolBar).reset_mock()
+
+        # Call methods under test
+        self.control_view.deactivate()
+        self.control_view.activate()
+
+        # Assertions
+        assert mock_disconnect.call_count == 0
+        assert mock_pause_status.call_count == 1
+        assert mock_resume_status.call_count == 1
+        assert cast(Mock, self.parent.removeToolBar).call_count == (1 if device_busy else 2)
+        assert cast(Mock, self.parent.addToolBar).call_count == (1 if device_busy else 2)
 
     def test_control_view_close_event(self, mocker: MockerFixture):
         # Mock methods
@@ -309,6 +330,7 @@ class TestControlView:
         # Mock file sender methods
         mock_set_file_to_stream = mocker.patch.object(FileStreamer, 'set_file')
         mock_start_file_stream = mocker.patch.object(FileStreamer, 'start')
+        mocker.patch.object(FileStreamer, 'is_exclusive', return_value=False)
 
         # Mock QMessageBox methods
         mock_popup = mocker.patch.object(QMessageBox, 'warning', return_value=QMessageBox.Ok)
@@ -325,6 +347,34 @@ class TestControlView:
         assert mock_start_file_stream.call_count == (1 if should_stream else 0)
         assert self.control_view.code_editor.isReadOnly() is (True if should_stream else False)
 
+    @pytest.mark.parametrize("exclusive", [False, True])
+    def test_start_file_stream_blocks_manual_commands(self, mocker: MockerFixture, exclusive):
+        # Mock code editor methods
+        mocker.patch.object(CodeEditor, 'get_file_path', return_value='/path/to/file.gcode')
+        mocker.patch.object(CodeEditor, 'get_modified', return_value=False)
+
+        # Mock file sender methods
+        mocker.patch.object(FileStreamer, 'set_file')
+        mocker.patch.object(FileStreamer, 'start')
+        mocker.patch.object(FileStreamer, 'stop')
+        mocker.patch.object(FileStreamer, 'is_exclusive', return_value=exclusive)
+
+        # Mock connected device
+        self.control_view.connected = True
+        self.control_view.enable_serial_widgets(True)
+
+        # Call method under test
+        self.control_view.start_file_stream()
+
+        # Assertions
+        assert self.control_view.control_panel.isEnabled() is not exclusive
+        assert self.control_view.terminal.input.isEnabled() is not exclusive
+
+        # Commands are allowed again when the stream ends
+        self.control_view.stop_file_stream()
+        assert self.control_view.control_panel.isEnabled()
+        assert self.control_view.terminal.input.isEnabled()
+
     def test_pause_file_stream(self, mocker: MockerFixture):
         # Mock file sender methods
         mock_toggle_paused = mocker.patch.object(FileStreamer, 'toggle_paused')
@@ -440,6 +490,17 @@ class TestControlView:
         assert mock_display_text.call_count == 1
         mock_display_text.assert_called_with('some text')
 
+    def test_control_view_write_messages_to_terminal(self, mocker: MockerFixture):
+        # Mock methods
+        mock_display_lines = mocker.patch.object(Terminal, 'display_lines')
+
+        # Call method under test
+        self.control_view.write_messages_to_terminal(['ok', 'ok'])
+
+        # Assertions
+        assert mock_display_lines.call_count == 1
+        mock_display_lines.assert_called_with(['ok', 'ok'])
+
     def test_control_view_update_device_status(self, mocker: MockerFixture):
         # Mock methods
         mock_set_status = mocker.patch.object(ControllerStatus, 'set_status')
@@ -458,3 +519,19 @@ class TestControlView:
         assert mock_set_feedrate.call_count == 1
         assert mock_set_spindle.call_count == 1
         assert mock_set_tool.call_count == 1
+
+    def test_control_view_update_device_status_partial(self, mocker: MockerFixture):
+        # Mock methods
+        mock_set_status = mocker.patch.object(ControllerStatus, 'set_status')
+        mock_set_feedrate = mocker.patch.object(ControllerStatus, 'set_feedrate')
+        mock_set_spindle = mocker.patch.object(ControllerStatus, 'set_spindle')
+        mock_set_tool = mocker.patch.object(ControllerStatus, 'set_tool')
+
+        # Call method under test
+        self.control_view.update_device_status({}, {'feedrate': 500.0})
+
+        # Assertions
+        assert mock_set_status.call_count == 0
+        assert mock_set_feedrate.call_count == 1
+        assert mock_set_spindle.call_count == 0
+        assert mock_set_tool.call_count == 0
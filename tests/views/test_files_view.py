@@ -6,9 +6,12 @@ from core.database.repositories.fileRepository import DatabaseError, DuplicatedF
     DuplicatedFileNameError, FileRepository
 from core.utils.fileManager import FileManager
 from core.utils.files import FileSystemError
+from helpers.pagination import PAGE_SIZE
 from MainWindow import MainWindow
 from PyQt5.QtWidgets import QDialogButtonBox, QMessageBox
 import pytest
+from sqlalchemy import inspect
+from sqlalchemy.orm import make_transient_to_detached
 from pytest_mock.plugin import MockerFixture
 from pytestqt.qtbot import QtBot
 from views.FilesView import FilesView
@@ -17,7 +20,13 @@ from core.database.models import File, User
 
 class TestFilesView:
     @pytest.fixture(autouse=True)
-    def setup_method(self, qtbot: QtBot, mocker: MockerFixture, mock_window: MainWindow):
+    def setup_method(
+        self,
+        qtbot: QtBot,
+        mocker: MockerFixture,
+        mock_window: MainWindow,
+        helpers
+    ):
         file_1 = File(user_id=1, file_name='example-file-1', file_hash='hashed-file-1')
         file_2 = File(user_id=1, file_name='example-file-2', file_hash='hashed-file-2')
         file_3 = File(user_id=1, file_name='example-file-3', file_hash='hashed-file-3')
@@ -34,44 +43,50 @@ class TestFilesView:
             file.user = self.user_test
 
         # Patch the getAllFilesFromUser method with the mock function
-        self.mock_get_all_files = mocker.patch.object(
-            FileRepository,
-            'get_all_files',
+        self.mock_get_files_page = mocker.patch(
+            'views.FilesView.get_files_page',
             return_value=self.files_list
         )
 
         # Create an instance of FilesView
         self.parent = mock_window
         self.files_view = FilesView(self.parent)
+        helpers.wait_loaded(qtbot, self.files_view)
         qtbot.addWidget(self.files_view)
+        self.views = [self.files_view]
+
+        yield
+
+        # Pages requested after the test are not loaded, since the DB is not mocked anymore
+        for view in self.views:
+            view.deactivate()
 
     def test_files_view_init(self, helpers):
         # Validate DB calls
-        self.mock_get_all_files.assert_called_once()
+        self.mock_get_files_page.assert_called_once()
 
         # Validate amount of each type of widget
         assert helpers.count_widgets(self.files_view.layout(), MenuButton) == 2
-        assert helpers.count_widgets(self.files_view.layout(), FileCard) == 3
+        assert helpers.count_list_widgets(self.files_view, FileCard) == 3
 
-    def test_files_view_init_with_no_files(self, mocker: MockerFixture, helpers):
-        mock_get_all_files = mocker.patch.object(
-            FileRepository,
-            'get_all_files',
+    def test_files_view_init_with_no_files(self, qtbot: QtBot, mocker: MockerFixture, helpers):
+        mock_get_files_page = mocker.patch(
+            'views.FilesView.get_files_page',
             return_value=[]
         )
         files_view = FilesView(self.parent)
+        helpers.wait_loaded(qtbot, files_view)
         # Validate DB calls
-        mock_get_all_files.assert_called_once()
+        mock_get_files_page.assert_called_once()
 
         # Validate amount of each type of widget
         assert helpers.count_widgets(files_view.layout(), MenuButton) == 2
-        assert helpers.count_widgets(files_view.layout(), FileCard) == 0
-        assert helpers.count_widgets(files_view.layout(), MsgCard) == 1
+        assert helpers.count_list_widgets(files_view, FileCard) == 0
+        assert helpers.count_list_widgets(files_view, MsgCard) == 1
 
-    def test_files_view_init_db_error(self, mocker: MockerFixture, helpers):
-        mock_get_all_files = mocker.patch.object(
-            FileRepository,
-            'get_all_files',
+    def test_files_view_init_db_error(self, qtbot: QtBot, mocker: MockerFixture, helpers):
+        mock_get_files_page = mocker.patch(
+            'views.FilesView.get_files_page',
             side_effect=Exception('mocked-error')
         )
 
@@ -80,35 +95,36 @@ class TestFilesView:
 
         # Create test view
         files_view = FilesView(self.parent)
+        helpers.wait_loaded(qtbot, files_view)
 
         # Assertions
-        mock_get_all_files.assert_called_once()
+        mock_get_files_page.assert_called_once()
         mock_popup.assert_called_once()
         assert helpers.count_widgets(files_view.layout(), MenuButton) == 0
-        assert helpers.count_widgets(files_view.layout(), FileCard) == 0
-        assert helpers.count_widgets(files_view.layout(), MsgCard) == 0
+        assert helpers.count_list_widgets(files_view, FileCard) == 0
+        assert helpers.count_list_widgets(files_view, MsgCard) == 0
 
-    def test_files_view_refresh_layout(self, helpers):
+    def test_files_view_refresh_layout(self, qtbot: QtBot, helpers):
         # We remove a file
         self.files_list.pop()
 
         # Call the refreshLayout method
         self.files_view.refreshLayout()
+        helpers.wait_loaded(qtbot, self.files_view)
 
         # Validate DB calls
-        assert self.mock_get_all_files.call_count == 2
+        assert self.mock_get_files_page.call_count == 2
 
         # Validate amount of each type of widget
         assert helpers.count_widgets(self.files_view.layout(), MenuButton) == 2
-        assert helpers.count_widgets(self.files_view.layout(), FileCard) == 2
+        assert helpers.count_list_widgets(self.files_view, FileCard) == 2
 
-    def test_files_view_refresh_layout_db_error(self, mocker: MockerFixture, helpers):
+    def test_files_view_refresh_layout_db_error(self, qtbot: QtBot, mocker: MockerFixture, helpers):
         # Mock DB methods to simulate error(s)
         # 1st execution: Widget creation (needs to success)
         # 2nd execution: Test case
-        mock_get_all_files = mocker.patch.object(
-            FileRepository,
-            'get_all_files',
+        mock_get_files_page = mocker.patch(
+            'views.FilesView.get_files_page',
             side_effect=[
                 self.files_list,
                 Exception('mocked-error')
@@ -120,15 +136,326 @@ class TestFilesView:
 
         # Call the method under test
         files_view = FilesView(self.parent)
+        helpers.wait_loaded(qtbot, files_view)
         files_view.refreshLayout()
+        helpers.wait_loaded(qtbot, files_view)
 
         # Assertions
-        assert mock_get_all_files.call_count == 2
+        assert mock_get_files_page.call_count == 2
         assert mock_popup.call_count == 1
         assert helpers.count_widgets(files_view.layout(), MenuButton) == 0
-        assert helpers.count_widgets(files_view.layout(), FileCard) == 0
+        assert helpers.count_list_widgets(files_view, FileCard) == 0
+
+    def test_files_view_cards_find_view(self):
+        # Call the methods under test
+        card = self.files_view.list_widgets[0]['cards'][0]
+
+        # Assertions
+        assert card.getView() is self.files_view
+        assert card.getWindow() is self.parent
+
+    def test_files_view_fetch_more(self, qtbot: QtBot, mocker: MockerFixture, helpers):
+        # Mock DB methods
+        next_page = [
+            File(id=index, user_id=1, file_name=f'example-file-{index}', file_hash='hashed')
+            for index in range(4, 4 + PAGE_SIZE)
+        ]
+        for file in next_page:
+            file.user = self.user_test
+        self.mock_get_files_page.side_effect = [next_page, []]
+        self.files_view.list_widgets[0]['has_more'] = True
+
+        # Call the method under test
+        self.files_view.fetchMore(0)
+
+        # The new cards don't fill the list, so it also fetches the next page
+        qtbot.waitUntil(lambda: self.mock_get_files_page.call_count == 3)
+        helpers.wait_loaded(qtbot, self.files_view)
+
+        # Assertions
+        assert self.mock_get_files_page.call_args_list[1] == mocker.call(
+            mocker.ANY, None, PAGE_SIZE, None
+        )
+        assert self.mock_get_files_page.call_args_list[2] == mocker.call(
+            mocker.ANY, 3 + PAGE_SIZE, PAGE_SIZE, None
+        )
+        assert self.files_view.lists[0]['items'] == self.files_list + next_page
+        assert self.files_view.list_widgets[0]['has_more'] is False
+        assert helpers.count_list_widgets(self.files_view, FileCard) == 3 + PAGE_SIZE
+
+    def test_files_view_fetch_more_no_more_items(self, qtbot: QtBot, helpers):
+        # Call the method under test
+        self.files_view.fetchMore(0)
+        helpers.wait_loaded(qtbot, self.files_view)
+
+        # Assertions
+        assert self.mock_get_files_page.call_count == 1
+
+    def test_files_view_fetch_more_db_error(self, qtbot: QtBot, mocker: MockerFixture, helpers):
+        # Mock DB methods to simulate error
+        self.mock_get_files_page.side_effect = Exception('mocked-error')
+        self.files_view.list_widgets[0]['has_more'] = True
+
+        # Mock QMessageBox methods
+        mock_popup = mocker.patch.object(QMessageBox, 'critical', return_value=QMessageBox.Ok)
+
+        # Call the method under test
+        self.files_view.fetchMore(0)
+        helpers.wait_loaded(qtbot, self.files_view)
+
+        # Assertions
+        assert mock_popup.call_count == 1
+        assert self.files_view.list_widgets[0]['has_more'] is False
+        assert helpers.count_list_widgets(self.files_view, FileCard) == 3
+
+    def create_stored_files_view(self, qtbot: QtBot, helpers) -> FilesView:
+        # Files which were stored, so they are identified by their IDs
+        for index, file in enumerate(self.files_list, start=1):
+            file.id = index
+            for column in inspect(file).mapper.column_attrs:
+                setattr(file, column.key, getattr(file, column.key))
+            make_transient_to_detached(file)
+
+        files_view = FilesView(self.parent)
+        helpers.wait_loaded(qtbot, files_view)
+        qtbot.addWidget(files_view)
+        return files_view
+
+    def test_files_view_apply_change_delete(self, qtbot: QtBot, helpers):
+        files_view = self.create_stored_files_view(qtbot, helpers)
+
+        # Call the method under test
+        files_view.applyChange('files', 'DELETE', 2)
+
+        # Assertions
+        assert self.mock_get_files_page.call_count == 2
+        assert not files_view.changes_timer.isActive()
+        assert [file.id for file in files_view.lists[0]['items']] == [1, 3]
+        assert helpers.count_list_widgets(files_view, FileCard) == 2
+
+    @pytest.mark.parametrize("operation", ['INSERT', 'UPDATE'])
+    def test_files_view_apply_change(self, qtbot: QtBot, helpers, operation):
+        files_view = self.create_stored_files_view(qtbot, helpers)
+
+        # Call the method under test
+        files_view.applyChange('files', operation, 3)
+        files_view.applyChange('files', operation, 4)
+
+        # Changes are loaded together
+        qtbot.waitUntil(lambda: self.mock_get_files_page.call_count == 3)
+        helpers.wait_loaded(qtbot, files_view)
+        assert not files_view.changes_timer.isActive()
+
+    def test_files_view_apply_change_not_shown(self, qtbot: QtBot, helpers):
+        files_view = self.create_stored_files_view(qtbot, helpers)
+        files_view.list_widgets[0]['has_more'] = True
+
+        # Call the method under test
+        files_view.applyChange('files', 'INSERT', 4)
+        files_view.applyChange('tools', 'UPDATE', 1)
+
+        # Assertions
+        assert not files_view.changes_timer.isActive()
+        assert self.mock_get_files_page.call_count == 2
+
+    def create_paged_files_view(
+        self,
+        qtbot: QtBot,
+        mocker: MockerFixture,
+        helpers
+    ) -> FilesView:
+        # Four pages of stored files, and up to two pages in the list
+        files = []
+        for index in range(1, 4 * PAGE_SIZE + 1):
+            file = File(id=index, user_id=1, file_name=f'file-{index}', file_hash='hashed')
+            for column in inspect(file).mapper.column_attrs:
+                setattr(file, column.key, getattr(file, column.key))
+            make_transient_to_detached(file)
+            file.user = self.user_test
+            files.append(file)
+        mocker.patch('views.BaseListView.MAX_PAGES', 2)
+
+        def get_files_page(session, after, limit, before):
+            if before is not None:
+                return [file for file in files if file.id < before][-limit:]
+            return [file for file in files if file.id > (after or 0)][:limit]
+
+        self.mock_get_files_page.side_effect = get_files_page
+
+        # The cards don't fill the list, so it fetches every page
+        files_view = FilesView(self.parent)
+        qtbot.addWidget(files_view)
+        self.views.append(files_view)
+        qtbot.waitUntil(
+            lambda: files_view.lists[0]['items'][-1:] == files[-1:]
+            and not files_view.list_widgets[0]['has_more']
+        )
+        helpers.wait_loaded(qtbot, files_view)
+        return files_view
 
-    def test_files_view_create_file(self, mocker: MockerFixture, helpers):
+    def test_files_view_drops_pages(self, qtbot: QtBot, mocker: MockerFixture, helpers):
+        # Call the method under test
+        files_view = self.create_paged_files_view(qtbot, mocker, helpers)
+
+        # Assertions
+        items = files_view.lists[0]['items']
+        previous = files_view.list_widgets[0]['previous']
+        assert [file.id for file in items] == list(range(2 * PAGE_SIZE + 1, 4 * PAGE_SIZE + 1))
+        assert previous is not None and previous.id == 2 * PAGE_SIZE
+        assert helpers.count_list_widgets(files_view, FileCard) == 2 * PAGE_SIZE
+
+    def test_files_view_fetch_previous(self, qtbot: QtBot, mocker: MockerFixture, helpers):
+        files_view = self.create_paged_files_view(qtbot, mocker, helpers)
+        mocker.patch.object(files_view, 'checkFetchMore')
+
+        # Call the method under test
+        files_view.fetchPrevious(0)
+        helpers.wait_loaded(qtbot, files_view)
+
+        # Assertions
+        items = files_view.lists[0]['items']
+        previous = files_view.list_widgets[0]['previous']
+        assert self.mock_get_files_page.call_args == mocker.call(
+            mocker.ANY, None, PAGE_SIZE + 1, 2 * PAGE_SIZE + 1
+        )
+        assert [file.id for file in items] == list(range(PAGE_SIZE + 1, 3 * PAGE_SIZE + 1))
+        assert previous is not None and previous.id == PAGE_SIZE
+        assert files_view.list_widgets[0]['has_more'] is True
+        assert helpers.count_list_widgets(files_view, FileCard) == 2 * PAGE_SIZE
+
+        # Back to the first page
+        files_view.fetchPrevious(0)
+        helpers.wait_loaded(qtbot, files_view)
+        assert files_view.lists[0]['items'][0].id == 1
+        assert files_view.list_widgets[0]['previous'] is None
+
+        # Nothing before the first page
+        files_view.fetchPrevious(0)
+        assert not files_view.page_loader.is_running()
+
+    def test_files_view_fetch_while_hidden(self, qtbot: QtBot, mocker: MockerFixture, helpers):
+        files_view = self.create_paged_files_view(qtbot, mocker, helpers)
+        files_view.list_widgets[0]['has_more'] = True
+        mock_check_fetch_more = mocker.patch.object(files_view, 'checkFetchMore')
+
+        # Call the methods under test
+        files_view.deactivate()
+        files_view.fetchMore(0)
+        files_view.fetchPrevious(0)
+
+        # Assertions
+        assert not files_view.page_loader.is_running()
+
+        # Pages are fetched when it's shown again
+        files_view.activate()
+        assert mock_check_fetch_more.call_count == 1
+
+    def test_files_view_refresh_dropped_pages(
+        self,
+        qtbot: QtBot,
+        mocker: MockerFixture,
+        helpers
+    ):
+        files_view = self.create_paged_files_view(qtbot, mocker, helpers)
+
+        # Changes in the dropped pages are not loaded
+        files_view.applyChange('files', 'UPDATE', 2 * PAGE_SIZE)
+        assert not files_view.changes_timer.isActive()
+
+        # Call the method under test
+        calls = self.mock_get_files_page.call_count
+        files_view.refreshLayout()
+        helpers.wait_loaded(qtbot, files_view)
+
+        # Assertions
+        assert self.mock_get_files_page.call_args_list[calls] == mocker.call(
+            mocker.ANY, 2 * PAGE_SIZE, 2 * PAGE_SIZE, None
+        )
+        assert files_view.lists[0]['items'][0].id == 2 * PAGE_SIZE + 1
+
+    def test_files_view_deactivate_and_activate(self, qtbot: QtBot, helpers):
+        # Call the method under test
+        self.files_view.refreshLayout()
+        self.files_view.deactivate()
+
+        # Assertions
+        assert not self.files_view.items_loader.is_running()
+        assert self.files_view.needs_refresh is True
+
+        # The interrupted load is done again when it's shown
+        self.files_view.activate()
+        assert self.files_view.items_loader.is_running()
+        helpers.wait_loaded(qtbot, self.files_view)
+        assert helpers.count_list_widgets(self.files_view, FileCard) == 3
+
+        # Views without changes while hidden are not loaded again
+        self.files_view.deactivate()
+        assert self.files_view.needs_refresh is False
+        self.files_view.activate()
+        assert not self.files_view.items_loader.is_running()
+
+    @pytest.mark.parametrize(
+        "table,expected_refresh",
+        [
+            ('files', True),
+            ('tools', False)
+        ]
+    )
+    def test_files_view_changes_while_hidden(self, qtbot: QtBot, helpers, table, expected_refresh):
+        helpers.wait_loaded(qtbot, self.files_view)
+        self.files_view.deactivate()
+
+        # Call the method under test
+        self.files_view.applyChange(table, 'UPDATE', 1)
+
+        # Assertions
+        assert not self.files_view.changes_timer.isActive()
+        assert self.files_view.needs_refresh is expected_refresh
+        self.files_view.activate()
+        assert self.files_view.items_loader.is_running() is expected_refresh
+        helpers.wait_loaded(qtbot, self.files_view)
+
+    def test_files_view_card_action_while_hidden(self, qtbot: QtBot, helpers):
+        helpers.wait_loaded(qtbot, self.files_view)
+        self.files_view.deactivate()
+
+        # Call the method under test
+        self.files_view.refreshLayout()
+
+        # Assertions
+        assert not self.files_view.items_loader.is_running()
+        assert self.files_view.needs_refresh is True
+        self.files_view.activate()
+        assert self.files_view.items_loader.is_running()
+        helpers.wait_loaded(qtbot, self.files_view)
+
+    def test_files_view_loading_placeholder(self, qtbot: QtBot, helpers):
+        # Call the method under test
+        files_view = FilesView(self.parent)
+        qtbot.addWidget(files_view)
+
+        # Assertions
+        assert helpers.count_list_widgets(files_view, MsgCard) == 1
+        assert helpers.count_list_widgets(files_view, FileCard) == 0
+
+        helpers.wait_loaded(qtbot, files_view)
+        assert helpers.count_list_widgets(files_view, MsgCard) == 0
+        assert helpers.count_list_widgets(files_view, FileCard) == 3
+
+    def test_files_view_back_to_menu_cancels_loading(self, qtbot: QtBot, helpers):
+        # Call the method under test
+        files_view = FilesView(self.parent)
+        qtbot.addWidget(files_view)
+        files_view.backToMenu()
+
+        # Assertions
+        assert not files_view.items_loader.is_running()
+        self.parent.backToMenu.assert_called_once()
+        with qtbot.assertNotEmitted(files_view.items_loader.loaded, wait=100):
+            pass
+        assert helpers.count_list_widgets(files_view, FileCard) == 0
+
+    def test_files_view_create_file(self, qtbot: QtBot, mocker: MockerFixture, helpers):
         # Mock FileDataDialog methods
         mock_input = 'example-file-4', 'path/to/file.gcode'
         mocker.patch.object(FileDataDialog, 'exec', return_value=QDialogButtonBox.Save)
@@ -153,16 +480,22 @@ class TestFilesView:
 
         # Call the createFile method
         self.files_view.createFile()
+        helpers.wait_loaded(qtbot, self.files_view)
 
         # Validate DB calls
         assert mock_create_file.call_count == 1
-        assert self.mock_get_all_files.call_count == 2
+        assert self.mock_get_files_page.call_count == 2
 
         # Validate amount of each type of widget
         assert helpers.count_widgets(self.files_view.layout(), MenuButton) == 2
-        assert helpers.count_widgets(self.files_view.layout(), FileCard) == 4
-
-    def test_files_view_create_file_repeated_name(self, mocker: MockerFixture, helpers):
+        assert helpers.count_list_widgets(self.files_view, FileCard) == 4
+
+    def test_files_view_create_file_repeated_name(
+        self,
+        qtbot: QtBot,
+        mocker: MockerFixture,
+        helpers
+    ):
         # Mock FileDataDialog methods
         mock_input = 'example-file-3', 'path/to/file.gcode'
         mocker.patch.object(FileDataDialog, 'exec', return_value=QDialogButtonBox.Save)
@@ -180,15 +513,16 @@ class TestFilesView:
 
         # Call the method under test
         self.files_view.createFile()
+        helpers.wait_loaded(qtbot, self.files_view)
 
         # Assertions
         assert mock_create_file.call_count == 1
         assert mock_popup.call_count == 1
-        assert self.mock_get_all_files.call_count == 1
+        assert self.mock_get_files_page.call_count == 1
         assert helpers.count_widgets(self.files_view.layout(), MenuButton) == 2
-        assert helpers.count_widgets(self.files_view.layout(), FileCard) == 3
+        assert helpers.count_list_widgets(self.files_view, FileCard) == 3
 
-    def test_files_view_create_file_duplicated(self, mocker: MockerFixture, helpers):
+    def test_files_view_create_file_duplicated(self, qtbot: QtBot, mocker: MockerFixture, helpers):
         # Mock FileDataDialog methods
         mock_input = 'example-file-4', 'path/to/file.gcode'
         mocker.patch.object(FileDataDialog, 'exec', return_value=QDialogButtonBox.Save)
@@ -206,15 +540,16 @@ class TestFilesView:
 
         # Call the method under test
         self.files_view.createFile()
+        helpers.wait_loaded(qtbot, self.files_view)
 
         # Assertions
         assert mock_create_file.call_count == 1
         assert mock_popup.call_count == 1
-        assert self.mock_get_all_files.call_count == 1
+        assert self.mock_get_files_page.call_count == 1
         assert helpers.count_widgets(self.files_view.layout(), MenuButton) == 2
-        assert helpers.count_widgets(self.files_view.layout(), FileCard) == 3
+        assert helpers.count_list_widgets(self.files_view, FileCard) == 3
 
-    def test_files_view_create_file_fs_error(self, mocker: MockerFixture, helpers):
+    def test_files_view_create_file_fs_error(self, qtbot: QtBot, mocker: MockerFixture, helpers):
         # Mock FileDataDialog methods
         mock_input = 'example-file-4', 'path/to/file.gcode'
         mocker.patch.object(FileDataDialog, 'exec', return_value=QDialogButtonBox.Save)
@@ -233,15 +568,16 @@ class TestFilesView:
 
         # Call the method under test
         self.files_view.createFile()
+        helpers.wait_loaded(qtbot, self.files_view)
 
         # Assertions
         assert mock_create_file.call_count == 0
         assert mock_popup.call_count == 1
-        assert self.mock_get_all_files.call_count == 1
+        assert self.mock_get_files_page.call_count == 1
         assert helpers.count_widgets(self.files_view.layout(), MenuButton) == 2
-        assert helpers.count_widgets(self.files_view.layout(), FileCard) == 3
+        assert helpers.count_list_widgets(self.files_view, FileCard) == 3
 
-    def test_files_view_create_file_db_error(self, mocker: MockerFixture, helpers):
+    def test_files_view_create_file_db_error(self, qtbot: QtBot, mocker: MockerFixture, helpers):
         # Mock FileDataDialog methods
         mock_input = 'example-file-4', 'path/to/file.gcode'
         mocker.patch.object(FileDataDialog, 'exec', return_value=QDialogButtonBox.Save)
@@ -260,10 +596,11 @@ class TestFilesView:
 
         # Call the method under test
         self.files_view.createFile()
+        helpers.wait_loaded(qtbot, self.files_view)
 
         # Assertions
         assert mock_create_file.call_count == 1
         assert mock_popup.call_count == 1
-        assert self.mock_get_all_files.call_count == 1
+        assert self.mock_get_files_page.call_count == 1
         assert helpers.count_widgets(self.files_view.layout(), MenuButton) == 2
-        assert helpers.count_widgets(self.files_view.layout(), FileCard) == 3
+        assert helpers.count_list_widgets(self.files_view, FileCard) == 3
@@ -17,16 +17,21 @@ from views.InventoryView import InventoryView
 
 class TestInventoryView:
     @pytest.fixture(autouse=True)
-    def setup_method(self, qtbot: QtBot, mocker: MockerFixture, mock_window: MainWindow):
+    def setup_method(
+        self,
+        qtbot: QtBot,
+        mocker: MockerFixture,
+        mock_window: MainWindow,
+        helpers
+    ):
         tool_1 = Tool(name='Example tool 1', description='It is the first tool')
         tool_2 = Tool(name='Example tool 2', description='It is the second tool')
         tool_3 = Tool(name='Example tool 3', description='It is the third tool')
         self.tools_list = [tool_1, tool_2, tool_3]
 
         # Patch the getAllTools method with the mock function
-        self.mock_get_all_tools = mocker.patch.object(
-            ToolRepository,
-            'get_all_tools',
+        self.mock_get_tools_page = mocker.patch(
+            'views.InventoryView.get_tools_page',
             return_value=self.tools_list
         )
 
@@ -36,49 +41,48 @@ class TestInventoryView:
         self.materials_list = [material_1, material_2, material_3]
 
         # Patch the getAllMaterials method with the mock function
-        self.mock_get_all_materials = mocker.patch.object(
-            MaterialRepository,
-            'get_all_materials',
+        self.mock_get_materials_page = mocker.patch(
+            'views.InventoryView.get_materials_page',
             return_value=self.materials_list
         )
 
         # Create an instance of InventoryView
         self.parent = mock_window
         self.inventory_view = InventoryView(self.parent)
+        helpers.wait_loaded(qtbot, self.inventory_view)
         qtbot.addWidget(self.inventory_view)
 
     def test_inventory_view_init(self, helpers):
         # Validate DB calls
-        self.mock_get_all_tools.assert_called_once()
-        self.mock_get_all_materials.assert_called_once()
+        self.mock_get_tools_page.assert_called_once()
+        self.mock_get_materials_page.assert_called_once()
 
         # Validate amount of each type of widget
         assert helpers.count_widgets(self.inventory_view.layout(), MenuButton) == 3
-        assert helpers.count_widgets(self.inventory_view.layout(), ToolCard) == 3
-        assert helpers.count_widgets(self.inventory_view.layout(), MaterialCard) == 3
+        assert helpers.count_list_widgets(self.inventory_view, ToolCard) == 3
+        assert helpers.count_list_widgets(self.inventory_view, MaterialCard) == 3
 
-    def test_inventory_view_init_with_no_inventory(self, mocker, helpers):
-        mock_get_all_tools = mocker.patch.object(
-            ToolRepository,
-            'get_all_tools',
+    def test_inventory_view_init_with_no_inventory(self, qtbot: QtBot, mocker, helpers):
+        mock_get_tools_page = mocker.patch(
+            'views.InventoryView.get_tools_page',
             return_value=[]
         )
-        mock_get_all_materials = mocker.patch.object(
-            MaterialRepository,
-            'get_all_materials',
+        mock_get_materials_page = mocker.patch(
+            'views.InventoryView.get_materials_page',
             return_value=[]
         )
         inventory_view = InventoryView(self.parent)
+        helpers.wait_loaded(qtbot, inventory_view)
 
         # Validate DB calls
-        mock_get_all_tools.assert_called_once()
-        mock_get_all_materials.assert_called_once()
+        mock_get_tools_page.assert_called_once()
+        mock_get_materials_page.assert_called_once()
 
         # Validate amount of each type of widget
         assert helpers.count_widgets(inventory_view.layout(), MenuButton) == 3
-        assert helpers.count_widgets(inventory_view.layout(), ToolCard) == 0
-        assert helpers.count_widgets(inventory_view.layout(), MaterialCard) == 0
-        assert helpers.count_widgets(inventory_view.layout(), MsgCard) == 2
+        assert helpers.count_list_widgets(inventory_view, ToolCard) == 0
+        assert helpers.count_list_widgets(inventory_view, MaterialCard) == 0
+        assert helpers.count_list_widgets(inventory_view, MsgCard) == 2
 
     @pytest.mark.parametrize(
             'tools_error,materials_error',
@@ -87,29 +91,32 @@ class TestInventoryView:
                 (True, False)
             ]
     )
-    def test_inventory_view_init_db_error(self, mocker, helpers, tools_error, materials_error):
+    def test_inventory_view_init_db_error(
+        self,
+        qtbot: QtBot,
+        mocker,
+        helpers,
+        tools_error,
+        materials_error
+    ):
         # Mock DB methods to simulate error(s)
-        mock_get_all_tools = mocker.patch.object(
-            ToolRepository,
-            'get_all_tools',
+        mock_get_tools_page = mocker.patch(
+            'views.InventoryView.get_tools_page',
             return_value=self.tools_list
         )
         if tools_error:
-            mock_get_all_tools = mocker.patch.object(
-                ToolRepository,
-                'get_all_tools',
+            mock_get_tools_page = mocker.patch(
+                'views.InventoryView.get_tools_page',
                 side_effect=Exception('mocked-error')
             )
 
-        mock_get_all_materials = mocker.patch.object(
-            MaterialRepository,
-            'get_all_materials',
+        mock_get_materials_page = mocker.patch(
+            'views.InventoryView.get_materials_page',
             return_value=self.materials_list
         )
         if materials_error:
-            mock_get_all_materials = mocker.patch.object(
-                MaterialRepository,
-                'get_all_materials',
+            mock_get_materials_page = mocker.patch(
+                'views.InventoryView.get_materials_page',
                 side_effect=Exception('mocked-error')
             )
 
@@ -118,17 +125,18 @@ class TestInventoryView:
 
         # Create test view
         inventory_view = InventoryView(self.parent)
+        helpers.wait_loaded(qtbot, inventory_view)
 
         # Assertions
-        assert mock_get_all_tools.call_count == 1
-        assert mock_get_all_materials.call_count == (0 if tools_error else 1)
+        assert mock_get_tools_page.call_count == 1
+        assert mock_get_materials_page.call_count == (0 if tools_error else 1)
         assert mock_popup.call_count == 1
         assert helpers.count_widgets(inventory_view.layout(), MenuButton) == 0
-        assert helpers.count_widgets(inventory_view.layout(), ToolCard) == 0
-        assert helpers.count_widgets(inventory_view.layout(), MaterialCard) == 0
-        assert helpers.count_widgets(inventory_view.layout(), MsgCard) == 0
+        assert helpers.count_list_widgets(inventory_view, ToolCard) == 0
+        assert helpers.count_list_widgets(inventory_view, MaterialCard) == 0
+        assert helpers.count_list_widgets(inventory_view, MsgCard) == 0
 
-    def test_inventory_view_refresh_layout(self, helpers):
+    def test_inventory_view_refresh_layout(self, qtbot: QtBot, helpers):
         # We remove a tool
         self.tools_list.pop()
         # We remove a material
@@ -136,14 +144,15 @@ class TestInventoryView:
 
         # Call the refreshLayout method
         self.inventory_view.refreshLayout()
+        helpers.wait_loaded(qtbot, self.inventory_view)
 
         # Validate DB calls
-        assert self.mock_get_all_tools.call_count == 2
+        assert self.mock_get_tools_page.call_count == 2
 
         # Validate amount of each type of widget
         assert helpers.count_widgets(self.inventory_view.layout(), MenuButton) == 3
-        assert helpers.count_widgets(self.inventory_view.layout(), ToolCard) == 2
-        assert helpers.count_widgets(self.inventory_view.layout(), MaterialCard) == 2
+        assert helpers.count_list_widgets(self.inventory_view, ToolCard) == 2
+        assert helpers.count_list_widgets(self.inventory_view, MaterialCard) == 2
 
     @pytest.mark.parametrize(
             'tools_error,materials_error',
@@ -154,6 +163,7 @@ class TestInventoryView:
     )
     def test_inventory_view_refresh_layout_db_error(
         self,
+        qtbot: QtBot,
         mocker,
         helpers,
         tools_error,
@@ -162,30 +172,26 @@ class TestInventoryView:
         # Mock DB methods to simulate error(s)
         # 1st execution: Widget creation (needs to success)
         # 2nd execution: Test case
-        mock_get_all_tools = mocker.patch.object(
-            ToolRepository,
-            'get_all_tools',
+        mock_get_tools_page = mocker.patch(
+            'views.InventoryView.get_tools_page',
             return_value=self.tools_list
         )
         if tools_error:
-            mock_get_all_tools = mocker.patch.object(
-                ToolRepository,
-                'get_all_tools',
+            mock_get_tools_page = mocker.patch(
+                'views.InventoryView.get_tools_page',
                 side_effect=[
                     self.tools_list,
                     Exception('mocked-error')
                 ]
             )
 
-        mock_get_all_materials = mocker.patch.object(
-            MaterialRepository,
-            'get_all_materials',
+        mock_get_materials_page = mocker.patch(
+            'views.InventoryView.get_materials_page',
             return_value=self.materials_list
         )
         if materials_error:
-            mock_get_all_materials = mocker.patch.object(
-                MaterialRepository,
-                'get_all_materials',
+            mock_get_materials_page = mocker.patch(
+                'views.InventoryView.get_materials_page',
                 side_effect=[
                     self.materials_list,
                     Exception('mocked-error')
@@ -197,17 +203,19 @@ class TestInventoryView:
 
         # Call the method under test
         inventory_view = InventoryView(self.parent)
+        helpers.wait_loaded(qtbot, inventory_view)
         inventory_view.refreshLayout()
+        helpers.wait_loaded(qtbot, inventory_view)
 
         # Assertions
-        assert mock_get_all_tools.call_count == 2
-        assert mock_get_all_materials.call_count == (1 if tools_error else 2)
+        assert mock_get_tools_page.call_count == 2
+        assert mock_get_materials_page.call_count == (1 if tools_error else 2)
         assert mock_popup.call_count == 1
         assert helpers.count_widgets(inventory_view.layout(), MenuButton) == 0
-        assert helpers.count_widgets(inventory_view.layout(), ToolCard) == 0
-        assert helpers.count_widgets(inventory_view.layout(), MaterialCard) == 0
+        assert helpers.count_list_widgets(inventory_view, ToolCard) == 0
+        assert helpers.count_list_widgets(inventory_view, MaterialCard) == 0
 
-    def test_inventory_view_create_tool(self, mocker, helpers):
+    def test_inventory_view_create_tool(self, qtbot: QtBot, mocker, helpers):
         # Mock ToolDataDialog methods
         mock_inputs = 'Example tool 4', 'It is the fourth tool'
         mocker.patch.object(ToolDataDialog, 'exec', return_value=QDialogButtonBox.Save)
@@ -227,17 +235,18 @@ class TestInventoryView:
 
         # Call the createTool method
         self.inventory_view.createTool()
+        helpers.wait_loaded(qtbot, self.inventory_view)
 
         # Validate DB calls
         assert mock_create_tool.call_count == 1
-        assert self.mock_get_all_tools.call_count == 2
+        assert self.mock_get_tools_page.call_count == 2
 
         # Validate amount of each type of widget
         assert helpers.count_widgets(self.inventory_view.layout(), MenuButton) == 3
-        assert helpers.count_widgets(self.inventory_view.layout(), ToolCard) == 4
-        assert helpers.count_widgets(self.inventory_view.layout(), MaterialCard) == 3
+        assert helpers.count_list_widgets(self.inventory_view, ToolCard) == 4
+        assert helpers.count_list_widgets(self.inventory_view, MaterialCard) == 3
 
-    def test_inventory_view_create_tool_db_error(self, mocker, helpers):
+    def test_inventory_view_create_tool_db_error(self, qtbot: QtBot, mocker, helpers):
         # Mock ToolDataDialog methods
         mock_inputs = 'Example tool 4', 'It is the fourth tool'
         mocker.patch.object(ToolDataDialog, 'exec', return_value=QDialogButtonBox.Save)
@@ -255,18 +264,19 @@ class TestInventoryView:
 
         # Call the createTool method
         self.inventory_view.createTool()
+        helpers.wait_loaded(qtbot, self.inventory_view)
 
         # Validate DB calls
         assert mock_create_tool.call_count == 1
         assert mock_popup.call_count == 1
-        assert self.mock_get_all_tools.call_count == 1
+        assert self.mock_get_tools_page.call_count == 1
 
         # Validate amount of each type of widget
         assert helpers.count_widgets(self.inventory_view.layout(), MenuButton) == 3
-        assert helpers.count_widgets(self.inventory_view.layout(), ToolCard) == 3
-        assert helpers.count_widgets(self.inventory_view.layout(), MaterialCard) == 3
+        assert helpers.count_list_widgets(self.inventory_view, ToolCard) == 3
+        assert helpers.count_list_widgets(self.inventory_view, MaterialCard) == 3
 
-    def test_inventory_view_create_material(self, mocker, helpers):
+    def test_inventory_view_create_material(self, qtbot: QtBot, mocker, helpers):
         # Mock MaterialDataDialog methods
         mock_inputs = 'Example material 4', 'It is the fourth material'
         mocker.patch.object(MaterialDataDialog, 'exec', return_value=QDialogButtonBox.Save)
@@ -289,17 +299,18 @@ class TestInventoryView:
 
         # Call the createMaterial method
         self.inventory_view.createMaterial()
+        helpers.wait_loaded(qtbot, self.inventory_view)
 
         # Validate DB calls
         assert mock_create_material.call_count == 1
-        assert self.mock_get_all_materials.call_count == 2
+        assert self.mock_get_materials_page.call_count == 2
 
         # Validate amount of each type of widget
         assert helpers.count_widgets(self.inventory_view.layout(), MenuButton) == 3
-        assert helpers.count_widgets(self.inventory_view.layout(), ToolCard) == 3
-        assert helpers.count_widgets(self.inventory_view.layout(), MaterialCard) == 4
+        assert helpers.count_list_widgets(self.inventory_view, ToolCard) == 3
+        assert helpers.count_list_widgets(self.inventory_view, MaterialCard) == 4
 
-    def test_inventory_view_create_material_db_error(self, mocker, helpers):
+    def test_inventory_view_create_material_db_error(self, qtbot: QtBot, mocker, helpers):
         # Mock MaterialDataDialog methods
         mock_inputs = 'Example material 4', 'It is the fourth material'
         mocker.patch.object(MaterialDataDialog, 'exec', return_value=QDialogButtonBox.Save)
@@ -317,13 +328,14 @@ class TestInventoryView:
 
         # Call the createMaterial method
         self.inventory_view.createMaterial()
+        helpers.wait_loaded(qtbot, self.inventory_view)
 
         # Validate DB calls
         assert mock_create_material.call_count == 1
         assert mock_popup.call_count == 1
-        assert self.mock_get_all_materials.call_count == 1
+        assert self.mock_get_materials_page.call_count == 1
 
         # Validate amount of each type of widget
         assert helpers.count_widgets(self.inventory_view.layout(), MenuButton) == 3
-        assert helpers.count_widgets(self.inventory_view.layout(), ToolCard) == 3
-        assert helpers.count_widgets(self.inventory_view.layout(), MaterialCard) == 3
+        assert helpers.count_list_widgets(self.inventory_view, ToolCard) == 3
+        assert helpers.count_list_widgets(self.inventory_view, MaterialCard) == 3
@@ -3,7 +3,8 @@ from MainWindow import MainWindow
 import pytest
 from pytest_mock.plugin import MockerFixture
 from pytestqt.qtbot import QtBot
-from views.MainMenu import MainMenu
+from views.MainMenu import load_view, MainMenu
+from views.UsersView import UsersView
 
 
 class TestMainMenu:
@@ -20,7 +21,10 @@ class TestMainMenu:
 
     def test_main_menu_redirects_to_view(self):
         # Call redirectToView method
-        self.main_menu.redirectToView("Another view")
+        self.main_menu.redirectToView('UsersView')
 
-        # Validate amount of each type of widget
-        assert self.parent.changeView.call_count == 1
+        # The view is imported and opened
+        self.parent.changeView.assert_called_once_with(UsersView)
+
+    def test_main_menu_load_view(self):
+        assert load_view('UsersView') is UsersView
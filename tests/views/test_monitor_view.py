@@ -1,12 +1,19 @@
 from components.buttons.MenuButton import MenuButton
 from components.ControllerStatus import ControllerStatus
+from components.dialogs.LogsExportDialog import LogsExportDialog
+from components.LogsFilterBar import LogsFilterBar
 from components.text.LogsViewer import LogsViewer
+from helpers.logsExporter import LogsExporter
+from helpers.logsIndex import LogsFilter, LogsIndex
 from helpers.cncWorkerMonitor import CncWorkerMonitor
 from MainWindow import MainWindow
 from PyQt5.QtGui import QCloseEvent
+from PyQt5.QtWidgets import QFileDialog
 import pytest
 from pytest_mock.plugin import MockerFixture
 from pytestqt.qtbot import QtBot
+from typing import cast
+from unittest.mock import Mock
 from views.MonitorView import MonitorView
 
 
@@ -36,7 +43,7 @@ class TestMonitorView:
         device_busy
     ):
         # Reset parent mocks call count
-        self.parent.addToolBar.reset_mock()
+        cast(Mock, self.parent.addToolBar).reset_mock()
 
         # Mock worker monitor methods
         mock_check_tasks_in_progress = mocker.patch.object(
@@ -54,10 +61,11 @@ class TestMonitorView:
         assert helpers.count_grid_widgets(layout, MenuButton) == 1
         assert helpers.count_grid_widgets(layout, LogsViewer) == 1
         assert helpers.count_grid_widgets(layout, ControllerStatus) == 1
+        assert helpers.count_grid_widgets(layout, LogsFilterBar) == 1
 
         # More assertions
         assert monitor_view.status_monitor.isEnabled() == device_busy
-        assert self.parent.addToolBar.call_count == 1
+        assert cast(Mock, self.parent.addToolBar).call_count == 1
         assert mock_check_tasks_in_progress.call_count == 1
 
     def test_monitor_view_goes_back_to_menu(self):
@@ -65,8 +73,33 @@ class TestMonitorView:
         self.monitor_view.backToMenu()
 
         # Assertions
-        self.parent.removeToolBar.call_count == 1
-        self.parent.backToMenu.assert_called_once()
+        cast(Mock, self.parent.backToMenu).assert_called_once()
+
+    @pytest.mark.parametrize("paused", [False, True])
+    def test_monitor_view_deactivate_and_activate(self, mocker: MockerFixture, paused):
+        # Mock methods
+        mock_pause_logs = mocker.patch.object(LogsViewer, 'pause')
+        mock_resume_logs = mocker.patch.object(LogsViewer, 'resume')
+        self.monitor_view.pause_button.setChecked(paused)
+        cast(Mock, self.parent.addToolBar).reset_mock()
+
+        # Call methods under test
+        self.monitor_view.deactivate()
+        self.monitor_view.activate()
+
+        # Assertions
+        cast(Mock, self.parent.removeToolBar).assert_called_once_with(self.monitor_view.tool_bar)
+        assert cast(Mock, self.parent.addToolBar).call_count == 1
+        assert mock_pause_logs.call_count == 1
+        assert mock_resume_logs.call_count == (0 if paused else 1)
+
+    @pytest.mark.parametrize("worker_running", [False, True])
+    def test_monitor_view_can_reuse(self, mocker: MockerFixture, worker_running):
+        # Mock worker monitor methods
+        mocker.patch.object(CncWorkerMonitor, 'is_worker_running', return_value=worker_running)
+
+        # Call method under test and assertions
+        assert self.monitor_view.canReuse() == (not worker_running)
 
     def test_monitor_view_close_event(self, mocker: MockerFixture):
         # Mock methods
@@ -103,3 +136,81 @@ class TestMonitorView:
 
         # Assertions
         assert mock_pause_logs_monitor.call_count == 1
+
+    def test_monitor_view_toggle_logs_filter(self, qtbot: QtBot, mocker: MockerFixture):
+        # Mock methods
+        mocker.patch.object(LogsIndex, 'get_types', return_value=['received', 'sent'])
+
+        # Call method under test
+        self.monitor_view.logs_button.setChecked(True)
+        self.monitor_view.toggle_logs_filter()
+
+        # Assertions
+        assert self.monitor_view.logs_filter_bar.isVisibleTo(self.monitor_view)
+        assert self.monitor_view.logs_filter_bar.log_type.count() == 3
+
+        # Hide the filter
+        self.monitor_view.logs_button.setChecked(False)
+        with qtbot.waitSignal(self.monitor_view.logs_filter_bar.filter_changed) as blocker:
+            self.monitor_view.toggle_logs_filter()
+
+        # Assertions
+        assert not self.monitor_view.logs_filter_bar.isVisibleTo(self.monitor_view)
+        assert blocker.args[0].is_empty()
+
+    @pytest.mark.parametrize("accepted,file_path", [(False, ''), (True, ''), (True, 'logs.csv')])
+    def test_monitor_view_export_logs(self, mocker: MockerFixture, accepted, file_path):
+        # Mock dialogs
+        logs_filter = LogsFilter(level='ERROR')
+        mocker.patch.object(LogsExportDialog, 'exec', return_value=accepted)
+        mocker.patch.object(LogsExportDialog, 'getInputs', return_value=(logs_filter, True))
+        mocker.patch.object(QFileDialog, 'getSaveFileName', return_value=(file_path, ''))
+        mock_start_export = mocker.patch.object(LogsExporter, 'start')
+
+        # Call method under test
+        self.monitor_view.export_logs()
+
+        # Assertions
+        if not file_path:
+            assert mock_start_export.call_count == 0
+            return
+        mock_start_export.assert_called_once_with('logs.csv', logs_filter, True)
+        assert self.monitor_view.export_progress is not None
+
+    def test_monitor_view_cancel_export(self, mocker: MockerFixture):
+        # Mock dialogs
+        mocker.patch.object(LogsExportDialog, 'exec', return_value=True)
+        mocker.patch.object(LogsExportDialog, 'getInputs', return_value=(LogsFilter(), False))
+        mocker.patch.object(QFileDialog, 'getSaveFileName', return_value=('logs.csv', ''))
+        mocker.patch.object(LogsExporter, 'start')
+        mock_stop_export = mocker.patch.object(LogsExporter, 'stop')
+        self.monitor_view.export_logs()
+        export_progress = self.monitor_view.export_progress
+        logs_exporter = self.monitor_view.logs_exporter
+        assert export_progress is not None
+
+        # Call method under test
+        export_progress.canceled.emit()
+
+        # Assertions
+        assert mock_stop_export.call_count == 1
+        assert self.monitor_view.export_progress is None
+        assert logs_exporter.receivers(logs_exporter.progress) == 0
+
+        # Another export shows a new dialog
+        self.monitor_view.export_logs()
+        assert self.monitor_view.export_progress is not export_progress
+        assert logs_exporter.receivers(logs_exporter.progress) == 1
+
+    @pytest.mark.parametrize("completed", [False, True])
+    def test_monitor_view_on_logs_exported(self, mocker: MockerFixture, completed):
+        # Mock methods
+        mock_show_info = mocker.patch.object(MonitorView, 'showInfo')
+        mock_show_error = mocker.patch.object(MonitorView, 'showError')
+
+        # Call method under test
+        self.monitor_view.on_logs_exported(completed, 'logs.csv')
+
+        # Assertions
+        assert mock_show_info.call_count == (1 if completed else 0)
+        assert mock_show_error.call_count == (0 if completed else 1)
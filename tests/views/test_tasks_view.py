@@ -7,6 +7,8 @@ from core.database.repositories.fileRepository import FileRepository
 from core.database.repositories.materialRepository import MaterialRepository
 from core.database.repositories.taskRepository import TaskRepository
 from core.database.repositories.toolRepository import ToolRepository
+from helpers.catalogCache import CatalogCache
+from helpers.cncWorkerMonitor import CncWorkerMonitor
 from MainWindow import MainWindow
 from PyQt5.QtWidgets import QDialogButtonBox, QMessageBox
 import pytest
@@ -17,7 +19,13 @@ from views.TasksView import TasksView
 
 class TestTasksView:
     @pytest.fixture(autouse=True)
-    def setup_method(self, qtbot: QtBot, mocker: MockerFixture, mock_window: MainWindow):
+    def setup_method(
+        self,
+        qtbot: QtBot,
+        mocker: MockerFixture,
+        mock_window: MainWindow,
+        helpers
+    ):
         task_1 = Task(
             user_id=1,
             file_id=1,
@@ -46,43 +54,46 @@ class TestTasksView:
         mocker.patch.object(ToolRepository, 'get_all_tools', return_value=[])
         mocker.patch.object(MaterialRepository, 'get_all_materials', return_value=[])
 
+        # Patch the Redis client, to read the worker state with the storage helpers
+        mocker.patch('helpers.cncWorkerMonitor.get_backend_client', return_value=None)
+
         # Patch the getAllTasksFromUser method with the mock function
-        self.mock_get_all_tasks = mocker.patch.object(
-            TaskRepository,
-            'get_all_tasks_from_user',
+        self.mock_get_tasks_page = mocker.patch(
+            'views.TasksView.get_tasks_page',
             return_value=self.tasks_list
         )
 
         # Patch the constructor of UI components
-        mocker.patch.object(TaskCard, 'setup_ui')
+        self.mock_setup_card = mocker.patch.object(TaskCard, 'setup_ui')
 
         # Create an instance of TasksView
         self.parent = mock_window
         self.tasks_view = TasksView(self.parent)
+        helpers.wait_loaded(qtbot, self.tasks_view)
         qtbot.addWidget(self.tasks_view)
 
     def test_tasks_view_init(self, helpers):
         # Validate DB calls
-        self.mock_get_all_tasks.assert_called_once()
+        self.mock_get_tasks_page.assert_called_once()
 
         # Validate amount of each type of widget
         assert helpers.count_widgets(self.tasks_view.layout(), MenuButton) == 2
-        assert helpers.count_widgets(self.tasks_view.layout(), TaskCard) == 3
+        assert helpers.count_list_widgets(self.tasks_view, TaskCard) == 3
 
-    def test_tasks_view_init_with_no_tasks(self, mocker: MockerFixture, helpers):
-        mock_get_all_tasks = mocker.patch.object(
-            TaskRepository,
-            'get_all_tasks_from_user',
+    def test_tasks_view_init_with_no_tasks(self, qtbot: QtBot, mocker: MockerFixture, helpers):
+        mock_get_tasks_page = mocker.patch(
+            'views.TasksView.get_tasks_page',
             return_value=[]
         )
         tasks_view = TasksView(self.parent)
+        helpers.wait_loaded(qtbot, tasks_view)
         # Validate DB calls
-        mock_get_all_tasks.assert_called_once()
+        mock_get_tasks_page.assert_called_once()
 
         # Validate amount of each type of widget
         assert helpers.count_widgets(tasks_view.layout(), MenuButton) == 2
-        assert helpers.count_widgets(tasks_view.layout(), TaskCard) == 0
-        assert helpers.count_widgets(tasks_view.layout(), MsgCard) == 1
+        assert helpers.count_list_widgets(tasks_view, TaskCard) == 0
+        assert helpers.count_list_widgets(tasks_view, MsgCard) == 1
 
     @pytest.mark.parametrize(
             'files_error,materials_error,tools_error,tasks_error',
@@ -95,6 +106,7 @@ class TestTasksView:
     )
     def test_tasks_view_init_db_error(
         self,
+        qtbot: QtBot,
         mocker,
         helpers,
         files_error,
@@ -135,23 +147,25 @@ class TestTasksView:
                 'get_all_tools',
                 side_effect=Exception('mocked-error')
             )
-        mock_get_all_tasks = mocker.patch.object(
-            TaskRepository,
-            'get_all_tasks_from_user',
+        mock_get_tasks_page = mocker.patch(
+            'views.TasksView.get_tasks_page',
             return_value=[]
         )
         if tasks_error:
-            mock_get_all_tasks = mocker.patch.object(
-                TaskRepository,
-                'get_all_tasks_from_user',
+            mock_get_tasks_page = mocker.patch(
+                'views.TasksView.get_tasks_page',
                 side_effect=Exception('mocked-error')
             )
 
         # Mock QMessageBox methods
         mock_popup = mocker.patch.object(QMessageBox, 'critical', return_value=QMessageBox.Ok)
 
+        # Discard the catalogs cached by the setup
+        CatalogCache.invalidate()
+
         # Create test view
         tasks_view = TasksView(self.parent)
+        helpers.wait_loaded(qtbot, tasks_view)
 
         # Helper flags
         should_query_materials = not files_error
@@ -162,30 +176,135 @@ class TestTasksView:
         assert mock_get_all_files.call_count == 1
         assert mock_get_all_materials.call_count == (1 if should_query_materials else 0)
         assert mock_get_all_tools.call_count == (1 if should_query_tools else 0)
-        assert mock_get_all_tasks.call_count == (1 if should_query_tasks else 0)
+        assert mock_get_tasks_page.call_count == (1 if should_query_tasks else 0)
         assert mock_popup.call_count == 1
         assert helpers.count_widgets(tasks_view.layout(), MenuButton) == 0
-        assert helpers.count_widgets(tasks_view.layout(), TaskCard) == 0
-        assert helpers.count_widgets(tasks_view.layout(), MsgCard) == 0
+        assert helpers.count_list_widgets(tasks_view, TaskCard) == 0
+        assert helpers.count_list_widgets(tasks_view, MsgCard) == 0
 
-    def test_tasks_view_refresh_layout(self, helpers):
+    def test_tasks_view_refresh_layout(self, qtbot: QtBot, helpers):
         # We remove a task
         self.tasks_list.pop()
 
         # Call the refreshLayout method
         self.tasks_view.refreshLayout()
+        helpers.wait_loaded(qtbot, self.tasks_view)
 
         # Validate DB calls
-        assert self.mock_get_all_tasks.call_count == 2
+        assert self.mock_get_tasks_page.call_count == 2
 
         # Validate amount of each type of widget
         assert helpers.count_widgets(self.tasks_view.layout(), MenuButton) == 2
-        assert helpers.count_widgets(self.tasks_view.layout(), TaskCard) == 2
+        assert helpers.count_list_widgets(self.tasks_view, TaskCard) == 2
 
-    def test_tasks_view_refresh_layout_db_error(self, mocker: MockerFixture, helpers):
-        mock_get_all_tasks = mocker.patch.object(
-            TaskRepository,
-            'get_all_tasks_from_user',
+    @pytest.mark.parametrize("table", ['files', 'tools', 'materials'])
+    def test_tasks_view_apply_change_of_assets(self, qtbot: QtBot, helpers, table):
+        # Call the method under test
+        self.tasks_view.applyChange(table, 'UPDATE', 1)
+
+        # Tasks are loaded again with the new assets
+        qtbot.waitUntil(lambda: self.mock_get_tasks_page.call_count == 2)
+        helpers.wait_loaded(qtbot, self.tasks_view)
+
+    def test_tasks_view_queries_worker_snapshot(
+        self,
+        qtbot: QtBot,
+        mocker: MockerFixture,
+        helpers
+    ):
+        for index, task in enumerate(self.tasks_list):
+            task.id = index + 1
+        worker_snapshot = {'paused': False, 'states': {}}
+        mock_get_worker_snapshot = mocker.patch.object(
+            CncWorkerMonitor,
+            'get_worker_snapshot',
+            return_value=worker_snapshot
+        )
+        spy_create_card = mocker.spy(TaskCard, '__init__')
+
+        # Call the method under test
+        tasks_view = TasksView(self.parent)
+        helpers.wait_loaded(qtbot, tasks_view)
+
+        # Assertions
+        mock_get_worker_snapshot.assert_called_once_with([1, 2, 3])
+        assert spy_create_card.call_count == 3
+        for call in spy_create_card.call_args_list:
+            assert call.kwargs['worker_snapshot'] is worker_snapshot
+
+    def test_tasks_view_refresh_layout_keeps_unchanged_cards(self, qtbot: QtBot, helpers):
+        def get_cards():
+            layout = self.tasks_view.list_widgets[0]['container'].items_layout
+            return [
+                layout.itemAt(index).widget() for index in range(layout.count())
+                if isinstance(layout.itemAt(index).widget(), TaskCard)
+            ]
+
+        self.mock_setup_card.reset_mock()
+        first_card, second_card, third_card = get_cards()
+
+        # Update a task, remove another one and add a new one at the start
+        self.tasks_list[0].name = 'Updated task'
+        self.tasks_list.pop(1)
+        self.tasks_list.insert(0, Task(
+            user_id=1,
+            file_id=1,
+            tool_id=1,
+            material_id=1,
+            name='Example task 4'
+        ))
+
+        # Call the refreshLayout method
+        self.tasks_view.refreshLayout()
+        helpers.wait_loaded(qtbot, self.tasks_view)
+
+        # Assertions
+        new_cards = get_cards()
+        assert self.mock_setup_card.call_count == 2
+        assert len(new_cards) == 3
+        assert new_cards[0].task is self.tasks_list[0]
+        assert new_cards[1] is not first_card
+        assert new_cards[1].task.name == 'Updated task'
+        assert new_cards[2] is third_card
+        assert second_card not in new_cards
+
+    def test_tasks_view_refresh_layout_device_status(
+        self,
+        qtbot: QtBot,
+        mocker: MockerFixture,
+        helpers
+    ):
+        self.mock_setup_card.reset_mock()
+        mocker.patch.object(
+            CncWorkerMonitor,
+            'is_device_available',
+            return_value=not self.tasks_view.device_available
+        )
+
+        # Call the refreshLayout method
+        self.tasks_view.refreshLayout()
+        helpers.wait_loaded(qtbot, self.tasks_view)
+
+        # Assertions
+        assert self.mock_setup_card.call_count == 3
+        assert helpers.count_list_widgets(self.tasks_view, TaskCard) == 3
+
+    def test_tasks_view_refresh_layout_empty_list(self, qtbot: QtBot, helpers):
+        # Remove all tasks
+        self.tasks_list.clear()
+
+        # Call the refreshLayout method
+        self.tasks_view.refreshLayout()
+        helpers.wait_loaded(qtbot, self.tasks_view)
+
+        # Assertions
+        assert helpers.count_list_widgets(self.tasks_view, TaskCard) == 0
+        assert helpers.count_list_widgets(self.tasks_view, MsgCard) == 1
+        assert helpers.count_widgets(self.tasks_view.layout(), MenuButton) == 2
+
+    def test_tasks_view_refresh_layout_db_error(self, qtbot: QtBot, mocker: MockerFixture, helpers):
+        mock_get_tasks_page = mocker.patch(
+            'views.TasksView.get_tasks_page',
             side_effect=[
                 self.tasks_list,
                 Exception('mocked-error')
@@ -197,15 +316,17 @@ class TestTasksView:
 
         # Call the method under test
         tasks_view = TasksView(self.parent)
+        helpers.wait_loaded(qtbot, tasks_view)
         tasks_view.refreshLayout()
+        helpers.wait_loaded(qtbot, tasks_view)
 
         # Assertions
-        assert mock_get_all_tasks.call_count == 2
+        assert mock_get_tasks_page.call_count == 2
         assert mock_popup.call_count == 1
         assert helpers.count_widgets(tasks_view.layout(), MenuButton) == 0
-        assert helpers.count_widgets(tasks_view.layout(), TaskCard) == 0
+        assert helpers.count_list_widgets(tasks_view, TaskCard) == 0
 
-    def test_tasks_view_create_task(self, mocker: MockerFixture, helpers):
+    def test_tasks_view_create_task(self, qtbot: QtBot, mocker: MockerFixture, helpers):
         # Mock TaskDataDialog methods
         mock_inputs = 2, 3, 4, 'Example task 4', 'Just a simple description'
         mocker.patch.object(TaskDataDialog, 'exec', return_value=QDialogButtonBox.Save)
@@ -233,6 +354,7 @@ class TestTasksView:
 
         # Call the createTask method
         self.tasks_view.createTask()
+        helpers.wait_loaded(qtbot, self.tasks_view)
 
         # Validate DB calls
         assert mock_create_task.call_count == 1
@@ -245,13 +367,13 @@ class TestTasksView:
             'note': 'Just a simple description'
         }
         mock_create_task.assert_called_with(*create_task_params.values())
-        assert self.mock_get_all_tasks.call_count == 2
+        assert self.mock_get_tasks_page.call_count == 2
 
         # Validate amount of each type of widget
         assert helpers.count_widgets(self.tasks_view.layout(), MenuButton) == 2
-        assert helpers.count_widgets(self.tasks_view.layout(), TaskCard) == 4
+        assert helpers.count_list_widgets(self.tasks_view, TaskCard) == 4
 
-    def test_tasks_view_create_task_db_error(self, mocker: MockerFixture, helpers):
+    def test_tasks_view_create_task_db_error(self, qtbot: QtBot, mocker: MockerFixture, helpers):
         # Mock TaskDataDialog methods
         mock_inputs = 2, 3, 4, 'Example task 4', 'Just a simple description'
         mocker.patch.object(TaskDataDialog, 'exec', return_value=QDialogButtonBox.Save)
@@ -269,12 +391,13 @@ class TestTasksView:
 
         # Call the createTask method
         self.tasks_view.createTask()
+        helpers.wait_loaded(qtbot, self.tasks_view)
 
         # Validate DB calls
         assert mock_create_task.call_count == 1
-        assert self.mock_get_all_tasks.call_count == 1
+        assert self.mock_get_tasks_page.call_count == 1
         assert mock_popup.call_count == 1
 
         # Validate amount of each type of widget
         assert helpers.count_widgets(self.tasks_view.layout(), MenuButton) == 2
-        assert helpers.count_widgets(self.tasks_view.layout(), TaskCard) == 3
+        assert helpers.count_list_widgets(self.tasks_view, TaskCard) == 3
@@ -13,36 +13,41 @@ from views.UsersView import UsersView
 
 class TestUsersView:
     @pytest.fixture(autouse=True)
-    def setup_method(self, qtbot: QtBot, mocker: MockerFixture, mock_window: MainWindow):
+    def setup_method(
+        self,
+        qtbot: QtBot,
+        mocker: MockerFixture,
+        mock_window: MainWindow,
+        helpers
+    ):
         user_1 = User(name='John 1', email='test1@testing.com', password='1234', role='user')
         user_2 = User(name='John 2', email='test2@testing.com', password='1234', role='user')
         user_3 = User(name='John 3', email='test3@testing.com', password='1234', role='user')
         self.users_list = [user_1, user_2, user_3]
 
         # Patch the getAllUsers method with the mock function
-        self.mock_get_all_users = mocker.patch.object(
-            UserRepository,
-            'get_all_users',
+        self.mock_get_users_page = mocker.patch(
+            'views.UsersView.get_users_page',
             return_value=self.users_list
         )
 
         # Create an instance of UsersView
         self.parent = mock_window
         self.users_view = UsersView(self.parent)
+        helpers.wait_loaded(qtbot, self.users_view)
         qtbot.addWidget(self.users_view)
 
     def test_users_view_init(self, helpers):
         # Validate DB calls
-        self.mock_get_all_users.assert_called_once()
+        self.mock_get_users_page.assert_called_once()
 
         # Validate amount of each type of widget
         assert helpers.count_widgets(self.users_view.layout(), MenuButton) == 2
-        assert helpers.count_widgets(self.users_view.layout(), UserCard) == 3
+        assert helpers.count_list_widgets(self.users_view, UserCard) == 3
 
-    def test_users_view_init_db_error(self, mocker: MockerFixture, helpers):
-        mock_get_all_users = mocker.patch.object(
-            UserRepository,
-            'get_all_users',
+    def test_users_view_init_db_error(self, qtbot: QtBot, mocker: MockerFixture, helpers):
+        mock_get_users_page = mocker.patch(
+            'views.UsersView.get_users_page',
             side_effect=Exception('mocked-error')
         )
 
@@ -51,34 +56,35 @@ class TestUsersView:
 
         # Create test view
         users_view = UsersView(self.parent)
+        helpers.wait_loaded(qtbot, users_view)
 
         # Assertions
-        mock_get_all_users.assert_called_once()
+        mock_get_users_page.assert_called_once()
         mock_popup.assert_called_once()
         assert helpers.count_widgets(users_view.layout(), MenuButton) == 0
-        assert helpers.count_widgets(users_view.layout(), UserCard) == 0
+        assert helpers.count_list_widgets(users_view, UserCard) == 0
 
-    def test_users_view_refresh_layout(self, helpers):
+    def test_users_view_refresh_layout(self, qtbot: QtBot, helpers):
         # We remove a user
         self.users_list.pop()
 
         # Call the refreshLayout method
         self.users_view.refreshLayout()
+        helpers.wait_loaded(qtbot, self.users_view)
 
         # Validate DB calls
-        assert self.mock_get_all_users.call_count == 2
+        assert self.mock_get_users_page.call_count == 2
 
         # Validate amount of each type of widget
         assert helpers.count_widgets(self.users_view.layout(), MenuButton) == 2
-        assert helpers.count_widgets(self.users_view.layout(), UserCard) == 2
+        assert helpers.count_list_widgets(self.users_view, UserCard) == 2
 
-    def test_users_view_refresh_layout_db_error(self, mocker: MockerFixture, helpers):
+    def test_users_view_refresh_layout_db_error(self, qtbot: QtBot, mocker: MockerFixture, helpers):
         # Mock DB methods to simulate error(s)
         # 1st execution: Widget creation (needs to success)
         # 2nd execution: Test case
-        mock_get_all_users = mocker.patch.object(
-            UserRepository,
-            'get_all_users',
+        mock_get_users_page = mocker.patch(
+            'views.UsersView.get_users_page',
             side_effect=[
                 self.users_list,
                 Exception('mocked-error')
@@ -90,15 +96,17 @@ class TestUsersView:
 
         # Call the method under test
         users_view = UsersView(self.parent)
+        helpers.wait_loaded(qtbot, users_view)
         users_view.refreshLayout()
+        helpers.wait_loaded(qtbot, users_view)
 
         # Assertions
-        assert mock_get_all_users.call_count == 2
+        assert mock_get_users_page.call_count == 2
         assert mock_popup.call_count == 1
         assert helpers.count_widgets(users_view.layout(), MenuButton) == 0
-        assert helpers.count_widgets(users_view.layout(), UserCard) == 0
+        assert helpers.count_list_widgets(users_view, UserCard) == 0
 
-    def test_users_view_create_user(self, mocker: MockerFixture, helpers):
+    def test_users_view_create_user(self, qtbot: QtBot, mocker: MockerFixture, helpers):
         # Mock UserDataDialog methods
         mock_inputs = 'John 4', 'test4@testing.com', '1234', 'user'
         mocker.patch.object(UserDataDialog, 'exec', return_value=QDialogButtonBox.Save)
@@ -123,16 +131,17 @@ class TestUsersView:
 
         # Call the createUser method
         self.users_view.createUser()
+        helpers.wait_loaded(qtbot, self.users_view)
 
         # Validate DB calls
         assert mock_create_user.call_count == 1
-        assert self.mock_get_all_users.call_count == 2
+        assert self.mock_get_users_page.call_count == 2
 
         # Validate amount of each type of widget
         assert helpers.count_widgets(self.users_view.layout(), MenuButton) == 2
-        assert helpers.count_widgets(self.users_view.layout(), UserCard) == 4
+        assert helpers.count_list_widgets(self.users_view, UserCard) == 4
 
-    def test_users_view_create_user_db_error(self, mocker: MockerFixture, helpers):
+    def test_users_view_create_user_db_error(self, qtbot: QtBot, mocker: MockerFixture, helpers):
         # Mock UserDataDialog methods
         mock_inputs = 'John 4', 'test4@testing.com', '1234', 'user'
         mocker.patch.object(UserDataDialog, 'exec', return_value=QDialogButtonBox.Save)
@@ -150,10 +159,11 @@ class TestUsersView:
 
         # Call the createUser method
         self.users_view.createUser()
+        helpers.wait_loaded(qtbot, self.users_view)
 
         # Assertions
         assert mock_create_user.call_count == 1
-        assert self.mock_get_all_users.call_count == 1
+        assert self.mock_get_users_page.call_count == 1
         assert mock_popup.call_count == 1
         assert helpers.count_widgets(self.users_view.layout(), MenuButton) == 2
-        assert helpers.count_widgets(self.users_view.layout(), UserCard) == 3
+        assert helpers.count_list_widgets(self.users_view, UserCard) == 3
@@ -1,10 +1,17 @@
 from abc import abstractmethod
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtGui import QCloseEvent
 from PyQt5.QtWidgets import QLabel, QVBoxLayout, QWidget
 from components.cards.MsgCard import MsgCard
 from components.buttons.MenuButton import MenuButton
+from containers.PagedList import PagedList
 from core.database.models import Base
-from typing import List, Callable, TYPE_CHECKING
+from helpers.dbNotifications import DELETE_OPERATION
+from helpers.itemsLoader import ItemsLoader
+from helpers.pagination import PAGE_SIZE
+from sqlalchemy import inspect
+from sqlalchemy.orm import Session
+from typing import Any, Callable, Hashable, List, Optional, TYPE_CHECKING
 from typing_extensions import TypedDict
 from views.BaseView import BaseView
 
@@ -12,15 +19,34 @@ if TYPE_CHECKING:
     from MainWindow import MainWindow   # pragma: no cover
 
 
+# Constants
+LOADING_MSG = 'Cargando...'
+CHANGES_DELAY = 200     # miliseconds
+MAX_PAGES = 4           # Pages of items kept in each list (see dropPages)
+
 ViewList = TypedDict('ViewList', {
     'title': str,
     'empty_msg': str,
     'create_btn_text': str,
     'items': List[Base],
+    'table': str,   # Table of the items, to apply its changes (see applyChange)
     'create_btn_action': Callable[[], None],
     'get_item_widget': Callable[[Base], QWidget]
 })
 
+# Widgets of a list in the layout, to update them incrementally
+ListWidgets = TypedDict('ListWidgets', {
+    'header': List[QWidget],
+    'container': PagedList,
+    'cards': List[QWidget],
+    'versions': List[Any],
+    'keys': List[Hashable],
+    'empty': Optional[QWidget],
+    'placeholder': Optional[QWidget],
+    'has_more': bool,
+    'previous': Optional[Base]  # Item before the first one, when the first pages were dropped
+})
+
 
 class BaseListView(BaseView):
     def __init__(self, parent: 'MainWindow'):
@@ -32,52 +58,449 @@ class BaseListView(BaseView):
 
         # Default attributes
         self.lists: list[ViewList] = []
-        self.current_index = 0
+        self.list_widgets: list[ListWidgets] = []
+
+        # Items are loaded in background
+        self.items_loader = ItemsLoader(self)
+        self.items_loader.loaded.connect(self.on_items_loaded)
+        self.items_loader.failed.connect(self.on_items_failed)
+        self.page_loader = ItemsLoader(self)
+        self.page_loader.loaded.connect(self.on_page_loaded)
+        self.page_loader.failed.connect(self.on_page_failed)
+        self.page_index = 0
+        self.page_backwards = False
+        # Hidden views don't load items, they are loaded again when shown
+        # if something changed in the meantime (see activate)
+        self.hidden = False
+        self.needs_refresh = False
+
+        # Changes in the database are applied in groups
+        self.changes_timer = QTimer(self)
+        self.changes_timer.setSingleShot(True)
+        self.changes_timer.setInterval(CHANGES_DELAY)
+        self.changes_timer.timeout.connect(self.refreshLayout)
 
     def refreshLayout(self):
         """Re-draw the view, updating the inside widgets.
+
+        Items are loaded in background (see loadItems) and, until they arrive,
+        empty lists show a placeholder.
+
+        Then, they are compared with the current ones by primary key and version
+        (see getItemVersion): only the cards of new or changed items are
+        created, the ones of removed items are deleted and the rest are kept,
+        moving them if the order changed.
+
+        Lists are loaded by pages (see fetchMore), so only the pages already
+        shown are loaded again.
+
+        Hidden views, which may be refreshed after an action of one of their
+        cards, are refreshed when they are shown again instead.
         """
-        while self.layout().count():
-            child = self.layout().takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
+        if self.hidden:
+            self.needs_refresh = True
+            return
 
-        self.current_index = 0
-        for list_definition in self.lists:
-            try:
-                list_definition['items'] = self.getItems()
-                self.current_index += 1
-            except Exception as error:
-                self.showError(
-                    'Error de base de datos',
-                    str(error)
-                )
+        if not self.list_widgets:
+            self.createLayout()
+
+        limits = [
+            max(len(list_definition['items']), PAGE_SIZE) for list_definition in self.lists
+        ]
+        starts = [list_widgets['previous'] for list_widgets in self.list_widgets]
+        for list_widgets in self.list_widgets:
+            if not list_widgets['cards']:
+                self.showPlaceholder(list_widgets)
+
+        # The current pages are loaded again
+        self.changes_timer.stop()
+        self.page_loader.cancel()
+        self.items_loader.start(lambda db_session: self.loadItems(db_session, limits, starts))
+
+    def loadItems(
+        self,
+        db_session: Session,
+        limits: list[int],
+        starts: list[Optional[Base]]
+    ) -> Any:
+        """Returns the items of each list, after the given starts and up to the given limits.
+        Runs in a background thread, so it must not update any widget.
+        """
+        return [
+            self.getItems(db_session, index, after=start, limit=limit)
+            for index, (start, limit) in enumerate(zip(starts, limits))
+        ]
+
+    def loadPage(
+        self,
+        db_session: Session,
+        index: int,
+        after: Optional[Base],
+        before: Optional[Base] = None
+    ) -> Any:
+        """Returns the next page of items of the list at `index` or, if `before`
+        is given, the previous one along with the item before it, if any.
+        Runs in a background thread, like loadItems.
+        """
+        if before is not None:
+            return self.getItems(db_session, index, limit=PAGE_SIZE + 1, before=before)
+        return self.getItems(db_session, index, after=after, limit=PAGE_SIZE)
+
+    def fetchMore(self, index: int):
+        """Loads the next page of items of a list in background, adding their
+        cards at the end of it when they arrive.
+        """
+        if self.hidden or index >= len(self.list_widgets):
+            return
+        if not self.list_widgets[index]['has_more']:
+            return
+        if self.items_loader.is_running() or self.page_loader.is_running():
+            return
+
+        items = self.lists[index]['items']
+        after = items[-1] if items else self.list_widgets[index]['previous']
+        self.page_index = index
+        self.page_backwards = False
+        self.page_loader.start(lambda db_session: self.loadPage(db_session, index, after))
+
+    def fetchPrevious(self, index: int):
+        """Loads again the page before the first one of a list, after it was
+        dropped (see dropPages), adding its cards at the start of it when they arrive.
+        """
+        if self.hidden or index >= len(self.list_widgets):
+            return
+        if self.list_widgets[index]['previous'] is None:
+            return
+        if self.items_loader.is_running() or self.page_loader.is_running():
+            return
+
+        items = self.lists[index]['items']
+        if not items:
+            # Every item of the list was removed, start it again
+            self.list_widgets[index]['previous'] = None
+            self.refreshLayout()
+            return
+
+        before = items[0]
+        self.page_index = index
+        self.page_backwards = True
+        self.page_loader.start(
+            lambda db_session: self.loadPage(db_session, index, None, before)
+        )
+
+    def cancelLoading(self):
+        self.changes_timer.stop()
+        self.items_loader.cancel()
+        self.page_loader.cancel()
+
+    def applyChange(self, table: str, operation: str, row_id: int):
+        """Applies a change made in a row of the database by any client
+        (see DbChangesListener) to the lists of items of its table.
+
+        Removed items are removed from the lists at once. New and updated items
+        are loaded along with the rest of the shown pages, after CHANGES_DELAY
+        miliseconds to group the changes made together, unless they belong to
+        pages not shown yet.
+
+        Hidden views are refreshed when they are shown again instead.
+        """
+        if self.hidden:
+            tables = [list_definition['table'] for list_definition in self.lists]
+            self.needs_refresh = self.needs_refresh or table in tables
+            return
+
+        should_refresh = False
+        for list_definition, list_widgets in zip(self.lists, self.list_widgets):
+            if list_definition['table'] != table:
+                continue
+
+            if operation == DELETE_OPERATION:
+                items = [
+                    item for item in list_definition['items']
+                    if self.getItemKey(item) != (row_id,)
+                ]
+                if len(items) != len(list_definition['items']):
+                    list_definition['items'] = items
+                    self.updateCards(list_definition, list_widgets)
+                # A load in progress may have read the row before its removal
+                should_refresh = should_refresh or self.items_loader.is_running()
+                continue
+
+            should_refresh = should_refresh or self.isShown(list_definition, list_widgets, row_id)
+
+        if should_refresh:
+            self.changes_timer.start()
+
+    def isShown(self, list_definition: ViewList, list_widgets: ListWidgets, row_id: int) -> bool:
+        """Returns True if the row belongs to the pages of the list already
+        shown, which are sorted by ID.
+        """
+        previous = list_widgets['previous']
+        if previous is not None:
+            previous_key = self.getItemKey(previous)
+            if isinstance(previous_key, tuple) and row_id <= previous_key[0]:
+                return False
+
+        items = list_definition['items']
+        if not list_widgets['has_more'] or not items:
+            return True
+        last_key = self.getItemKey(items[-1])
+        return isinstance(last_key, tuple) and row_id <= last_key[0]
+
+    # Slots
+
+    def on_items_loaded(self, items_lists: list[list[Base]]):
+        for list_definition, list_widgets, items in zip(
+            self.lists,
+            self.list_widgets,
+            items_lists
+        ):
+            limit = max(len(list_definition['items']), PAGE_SIZE)
+            list_definition['items'] = items
+            list_widgets['has_more'] = len(items) >= limit
+            self.hidePlaceholder(list_widgets)
+            self.updateCards(list_definition, list_widgets)
+
+        self.update()
+        self.checkFetchMore()
+
+    def on_items_failed(self, error: str):
+        self.clearLayout()
+        self.showError(
+            'Error de base de datos',
+            error
+        )
+
+    def on_page_loaded(self, page: list[Base]):
+        list_definition = self.lists[self.page_index]
+        list_widgets = self.list_widgets[self.page_index]
+        if self.page_backwards:
+            # The extra item is the one before the page, if there are more
+            list_widgets['previous'] = page[0] if len(page) > PAGE_SIZE else None
+            list_definition['items'] = page[-PAGE_SIZE:] + list_definition['items']
+        else:
+            list_definition['items'] = list_definition['items'] + page
+            list_widgets['has_more'] = len(page) >= PAGE_SIZE
+        self.dropPages(list_definition, list_widgets, from_start=not self.page_backwards)
+        self.keepCardsInPlace(list_definition, list_widgets)
+        self.updateCards(list_definition, list_widgets)
+
+        # The new cards may still not fill the list, and other
+        # lists may have asked for more items in the meantime
+        self.checkFetchMore()
+
+    def on_page_failed(self, error: str):
+        self.list_widgets[self.page_index]['has_more'] = False
+        self.showError(
+            'Error de base de datos',
+            error
+        )
+
+    def dropPages(self, list_definition: ViewList, list_widgets: ListWidgets, from_start: bool):
+        """Keeps up to MAX_PAGES pages of items in a list, so the amount of cards
+        is bounded, dropping the ones at its start or its end. Dropped pages are
+        loaded again when scrolling back to them (see fetchMore and fetchPrevious).
+        """
+        items = list_definition['items']
+        excess = len(items) - MAX_PAGES * PAGE_SIZE
+        if excess <= 0:
+            return
+
+        if from_start:
+            list_widgets['previous'] = items[excess - 1]
+            list_definition['items'] = items[excess:]
+        else:
+            list_definition['items'] = items[:-excess]
+            list_widgets['has_more'] = True
+
+    def keepCardsInPlace(self, list_definition: ViewList, list_widgets: ListWidgets):
+        """Keeps the first card which stays in the list at the same position on
+        screen, while cards before it are added or removed.
+        """
+        keys = {self.getItemKey(item) for item in list_definition['items']}
+        for key, card in zip(list_widgets['keys'], list_widgets['cards']):
+            if key in keys:
+                list_widgets['container'].keep_position(card)
                 return
 
+    def checkFetchMore(self):
+        for list_widgets in self.list_widgets:
+            if list_widgets['has_more']:
+                list_widgets['container'].check_fetch_more()
+
+    # Navigation
+
+    def activate(self):
+        self.hidden = False
+        if self.needs_refresh:
+            self.needs_refresh = False
+            self.refreshLayout()
+            return
+        # Pages are not fetched while hidden
+        self.checkFetchMore()
+
+    def deactivate(self):
+        # Items being loaded would be left half-updated
+        if self.items_loader.is_running() or self.changes_timer.isActive():
+            self.needs_refresh = True
+        self.cancelLoading()
+        self.hidden = True
+
+    def backToMenu(self):
+        self.cancelLoading()
+        self.getWindow().backToMenu()
+
+    def closeEvent(self, event: QCloseEvent):
+        self.cancelLoading()
+        return super().closeEvent(event)
+
+    def createLayout(self):
+        """Adds the widgets which don't depend on the items.
+        """
         for list_definition in self.lists:
+            header: list[QWidget] = []
             if list_definition['title']:
-                self.layout().addWidget(QLabel(list_definition['title']))
+                header.append(QLabel(list_definition['title']))
 
             if list_definition['create_btn_text']:
-                self.layout().addWidget(
+                header.append(
                     MenuButton(
                         list_definition['create_btn_text'],
                         list_definition['create_btn_action']
                     )
                 )
 
-            for item in list_definition['items']:
-                self.layout().addWidget(list_definition['get_item_widget'](item))
+            container = PagedList(self)
+            # Queued, to not update the list while it's being laid out
+            container.fetch_more.connect(
+                lambda index=len(self.list_widgets): self.fetchMore(index),
+                Qt.QueuedConnection
+            )
+            container.fetch_previous.connect(
+                lambda index=len(self.list_widgets): self.fetchPrevious(index),
+                Qt.QueuedConnection
+            )
 
-            if not list_definition['items'] and list_definition['empty_msg']:
-                self.layout().addWidget(
-                    MsgCard(list_definition['empty_msg'], self)
-                )
+            for widget in header:
+                self.layout().addWidget(widget)
+            self.layout().addWidget(container)
+            self.list_widgets.append({
+                'header': header,
+                'container': container,
+                'cards': [],
+                'versions': [],
+                'keys': [],
+                'empty': None,
+                'placeholder': None,
+                'has_more': False,
+                'previous': None
+            })
 
         self.layout().addWidget(
-            MenuButton('Volver al menú', onClick=self.getWindow().backToMenu)
+            MenuButton('Volver al menú', onClick=self.backToMenu)
+        )
+
+    def clearLayout(self):
+        while self.layout().count():
+            child = self.layout().takeAt(0)
+            if child.widget():
+                child.widget().deleteLater()
+        self.list_widgets = []
+
+    def updateCards(self, list_definition: ViewList, list_widgets: ListWidgets):
+        """Updates the cards of a list in its container.
+        """
+        current = {
+            key: (version, card)
+            for key, version, card in zip(
+                list_widgets['keys'],
+                list_widgets['versions'],
+                list_widgets['cards']
+            )
+        }
+
+        keys: list[Hashable] = []
+        versions: list[Any] = []
+        cards: list[QWidget] = []
+        for item in list_definition['items']:
+            key = self.getItemKey(item)
+            version = self.getItemVersion(item)
+            card: Optional[QWidget] = None
+            if key in current:
+                current_version, current_card = current.pop(key)
+                if current_version == version:
+                    card = current_card
+                else:
+                    self.removeCard(current_card, list_widgets)
+            keys.append(key)
+            versions.append(version)
+            cards.append(card or list_definition['get_item_widget'](item))
+
+        # Remove the cards of items which don't exist anymore
+        for _, card in current.values():
+            self.removeCard(card, list_widgets)
+
+        # Place the cards in order, only moving the ones out of place
+        layout = list_widgets['container'].items_layout
+        for index, card in enumerate(cards):
+            item = layout.itemAt(index)
+            if item and item.widget() is card:
+                continue
+            layout.removeWidget(card)
+            layout.insertWidget(index, card)
+
+        list_widgets['keys'] = keys
+        list_widgets['versions'] = versions
+        list_widgets['cards'] = cards
+
+        # Message for empty lists
+        empty_msg = list_definition['empty_msg']
+        if not cards and empty_msg and not list_widgets['empty']:
+            empty_card = MsgCard(empty_msg, self)
+            layout.insertWidget(0, empty_card)
+            list_widgets['empty'] = empty_card
+        if cards and list_widgets['empty']:
+            self.removeCard(list_widgets['empty'], list_widgets)
+            list_widgets['empty'] = None
+
+    def showPlaceholder(self, list_widgets: ListWidgets):
+        """Shows a message in the list while its items are loaded.
+        """
+        if list_widgets['placeholder']:
+            return
+        if list_widgets['empty']:
+            self.removeCard(list_widgets['empty'], list_widgets)
+            list_widgets['empty'] = None
+        placeholder = MsgCard(LOADING_MSG, self)
+        list_widgets['container'].items_layout.insertWidget(0, placeholder)
+        list_widgets['placeholder'] = placeholder
+
+    def hidePlaceholder(self, list_widgets: ListWidgets):
+        if list_widgets['placeholder']:
+            self.removeCard(list_widgets['placeholder'], list_widgets)
+            list_widgets['placeholder'] = None
+
+    def removeCard(self, card: QWidget, list_widgets: ListWidgets):
+        list_widgets['container'].items_layout.removeWidget(card)
+        card.deleteLater()
+
+    # Items comparison
+
+    def getItemKey(self, item: Base) -> Hashable:
+        """Returns the primary key of the item, or the item itself if it was not
+        stored yet.
+        """
+        identity = inspect(item).identity
+        return identity if identity else id(item)
+
+    def getItemVersion(self, item: Base) -> Any:
+        """Returns a value which changes whenever the card of the item should
+        be updated. By default, the values of its columns, which include the
+        'status_updated_at' of tasks.
+        """
+        return tuple(
+            getattr(item, column.key) for column in inspect(item).mapper.column_attrs
         )
-        self.update()
 
     # Attributes
 
@@ -91,7 +514,8 @@ class BaseListView(BaseView):
         get_item_widget: Callable[[Base], QWidget],
         create_btn_text: str = '',
         create_btn_action: Callable[[], None] = lambda: None,
-        items: List[Base] = []
+        items: List[Base] = [],
+        table: str = ''
     ):
         list_definition: ViewList = {
             'title': title,
@@ -99,12 +523,24 @@ class BaseListView(BaseView):
             'get_item_widget': get_item_widget,
             'create_btn_text': create_btn_text,
             'create_btn_action': create_btn_action,
-            'items': items
+            'items': items,
+            'table': table
         }
         self.setItemList(list_definition)
 
     # Abstract methods
 
     @abstractmethod
-    def getItems(self) -> list[Base]:
+    def getItems(
+        self,
+        db_session: Session,
+        index: int,
+        after: Optional[Base] = None,
+        limit: int = PAGE_SIZE,
+        before: Optional[Base] = None
+    ) -> list[Base]:
+        """Returns up to `limit` items of the list at `index`, starting after
+        the item `after` or, if `before` is given, ending before it.
+        Runs in a background thread (see loadItems).
+        """
         raise NotImplementedError    # pragma: no cover
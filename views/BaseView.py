@@ -20,7 +20,28 @@ class BaseView(QWidget):
     def showError(self, title, text):
         QMessageBox.critical(self, title, text, QMessageBox.Ok)
 
+    # Navigation
+
+    def activate(self):
+        """Called every time the view is shown, both after constructing it and
+        when it was kept by the window (see ViewStack). Resumes what was paused
+        by `deactivate`.
+        """
+        pass
+
+    def deactivate(self):
+        """Called when another view is shown in its place. The view is kept to
+        show it again later, so it should pause its timers and watchers.
+        """
+        pass
+
+    def canReuse(self) -> bool:
+        """Returns False when the view must be constructed again instead of
+        showing the kept one.
+        """
+        return True
+
     # Helper methods
 
     def getWindow(self) -> 'MainWindow':
-        return self.parent()    # type: ignore
+        return self.window()    # type: ignore
@@ -11,7 +11,7 @@ from components.ControllerStatus import ControllerStatus
 from components.Joystick import Joystick
 from components.Terminal import Terminal
 from components.ToolBar import ToolBar
-from config import SERIAL_BAUDRATE
+from config import SERIAL_BAUDRATE, STREAMING_MODE
 from core.grbl.grblController import GrblController
 from core.grbl.types import GrblSettings, ParserState, Status
 from core.utils.serial import SerialService
@@ -49,15 +49,20 @@ class ControlView(BaseView):
 
         # GRBL SYNC
         self.grbl_sync = GrblSync(self.grbl_controller)
-        self.grbl_sync.new_message.connect(self.write_to_terminal)
+        self.grbl_sync.new_messages.connect(self.write_messages_to_terminal)
         self.grbl_sync.new_status.connect(self.update_device_status)
         self.grbl_sync.failed.connect(self.failed_command)
         self.grbl_sync.finished.connect(self.finished_command)
 
         # FILE SENDER
-        self.file_streamer = FileStreamer(self.grbl_controller)
+        self.file_streamer = FileStreamer(self.grbl_controller, STREAMING_MODE)
         self.file_streamer.sent_line.connect(self.update_already_read_lines)
         self.file_streamer.finished.connect(self.finished_file_stream)
+        # GRBL responses are handled in the logs reader thread, not the GUI one
+        self.grbl_sync.new_messages.connect(
+            self.file_streamer.handle_responses,
+            Qt.DirectConnection     # type: ignore
+        )
 
     # SETUP METHODS
 
@@ -166,13 +171,34 @@ class ControlView(BaseView):
 
     # EVENTS
 
-    def backToMenu(self):
-        """Removes the tool bar from the main window and goes back to the main menu
+    def activate(self):
+        """Adds the tool bars to the main window again, and resumes the
+        status of the device
         """
-        self.disconnect_device()
-        self.getWindow().removeToolBar(self.tool_bar_files)
-        if not self.device_busy:
-            self.getWindow().removeToolBar(self.tool_bar_grbl)
+        for tool_bar in self.get_tool_bars():
+            self.getWindow().addToolBar(Qt.TopToolBarArea, tool_bar)
+            tool_bar.show()
+        self.grbl_sync.resume_status()
+
+    def deactivate(self):
+        """Removes the tool bars from the main window and pauses the status of
+        the device. The connection with the device is kept, so the file being
+        sent, if any, goes on.
+        """
+        self.grbl_sync.pause_status()
+        for tool_bar in self.get_tool_bars():
+            self.getWindow().removeToolBar(tool_bar)
+
+    def canReuse(self) -> bool:
+        # The layout depends on the worker's activity
+        return self.device_busy == CncWorkerMonitor.is_worker_running()
+
+    def get_tool_bars(self) -> list[ToolBar]:
+        if self.device_busy:
+            return [self.tool_bar_files]
+        return [self.tool_bar_files, self.tool_bar_grbl]
+
+    def backToMenu(self):
         self.getWindow().backToMenu()
 
     def closeEvent(self, event: QCloseEvent):
@@ -245,6 +271,13 @@ class ControlView(BaseView):
         self.status_monitor.setEnabled(enable)
         self.control_panel.setEnabled(enable)
         self.terminal.setEnabled(enable)
+        self.terminal.set_input_enabled(enable)
+
+    def enable_manual_commands(self, enable: bool = True):
+        """Allows or blocks the commands sent by the user (actions, jog and terminal).
+        """
+        self.control_panel.setEnabled(enable)
+        self.terminal.set_input_enabled(enable)
 
     # GRBL ACTIONS
 
@@ -307,6 +340,10 @@ class ControlView(BaseView):
         self.file_streamer.set_file(file_path)
         self.file_streamer.start()
 
+        # Responses to other commands would be taken as the ones of the file
+        if self.file_streamer.is_exclusive():
+            self.enable_manual_commands(False)
+
     def pause_file_stream(self):
         # Pause/Resume file streaming
         self.file_streamer.toggle_paused()
@@ -319,6 +356,7 @@ class ControlView(BaseView):
     def stop_file_stream(self):
         self.code_editor.setReadOnly(False)
         self.file_streamer.stop()
+        self.enable_manual_commands(self.connected)
 
     # Interaction with other widgets
 
@@ -352,21 +390,32 @@ class ControlView(BaseView):
     def write_to_terminal(self, text):
         self.terminal.display_text(text)
 
+    def write_messages_to_terminal(self, messages: list[str]):
+        self.terminal.display_lines(messages)
+
     def update_device_status(
             self,
             status: Status,
             parserstate: ParserState
     ):
-        self.status_monitor.set_status(status)
-        self.status_monitor.set_feedrate(parserstate['feedrate'])
-        self.status_monitor.set_spindle(parserstate['spindle'])
-        self.status_monitor.set_tool(parserstate['tool'])
+        """Updates the status widgets. Both arguments may include
+        only the fields which changed since the last update.
+        """
+        if status:
+            self.status_monitor.set_status(status)
+        if 'feedrate' in parserstate:
+            self.status_monitor.set_feedrate(parserstate['feedrate'])
+        if 'spindle' in parserstate:
+            self.status_monitor.set_spindle(parserstate['spindle'])
+        if 'tool' in parserstate:
+            self.status_monitor.set_tool(parserstate['tool'])
 
     def update_already_read_lines(self, count: int):
         self.code_editor.markProcessedLines(count)
 
     def finished_file_stream(self):
         self.code_editor.setReadOnly(False)
+        self.enable_manual_commands(self.connected)
         self.showInfo(
             'Archivo enviado',
             'Se terminó de enviar el archivo para su ejecución, por favor espere a que termine.'
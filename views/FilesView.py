@@ -1,11 +1,13 @@
 from components.cards.FileCard import FileCard
 from components.dialogs.FileDataDialog import FileDataDialog
 from config import USER_ID
-from core.database.base import Session as SessionLocal
+from core.database.models import File
 from core.database.repositories.fileRepository import DuplicatedFileError, \
-    DuplicatedFileNameError, DatabaseError, FileRepository
+    DuplicatedFileNameError, DatabaseError
 from core.utils.files import InvalidFile, FileSystemError
 from core.utils.fileManager import FileManager
+from helpers.catalogCache import CatalogCache, FILES_CATALOG
+from helpers.pagination import get_files_page, PAGE_SIZE
 from views.BaseListView import BaseListView
 from typing import TYPE_CHECKING
 
@@ -21,17 +23,21 @@ class FilesView(BaseListView):
             'Aún no hay archivos almacenados',
             self.createFileCard,
             'Subir archivo',
-            self.createFile
+            self.createFile,
+            table=File.__tablename__
         )
         self.refreshLayout()
 
     def createFileCard(self, item):
         return FileCard(item, self)
 
-    def getItems(self):
-        db_session = SessionLocal()
-        repository = FileRepository(db_session)
-        return repository.get_all_files()
+    def getItems(self, db_session, index, after=None, limit=PAGE_SIZE, before=None):
+        return get_files_page(
+            db_session,
+            after.id if after else None,
+            limit,
+            before.id if before else None
+        )
 
     def createFile(self):
         fileDialog = FileDataDialog()
@@ -62,4 +68,5 @@ class FilesView(BaseListView):
             )
             return
 
+        CatalogCache.invalidate(FILES_CATALOG)
         self.refreshLayout()
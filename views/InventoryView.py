@@ -2,11 +2,15 @@ from components.cards.MaterialCard import MaterialCard
 from components.dialogs.MaterialDataDialog import MaterialDataDialog
 from components.cards.ToolCard import ToolCard
 from components.dialogs.ToolDataDialog import ToolDataDialog
-from core.database.base import Session as SessionLocal
+from core.database.models import Material, Tool
 from core.database.repositories.materialRepository import MaterialRepository
 from core.database.repositories.toolRepository import ToolRepository
+from helpers.catalogCache import CatalogCache, MATERIALS_CATALOG, TOOLS_CATALOG
+from helpers.dbSession import session_scope
+from helpers.pagination import get_materials_page, get_tools_page, PAGE_SIZE
+from sqlalchemy.orm import Session
 from views.BaseListView import BaseListView
-from typing import TYPE_CHECKING
+from typing import Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from MainWindow import MainWindow   # pragma: no cover
@@ -21,14 +25,16 @@ class InventoryView(BaseListView):
             'Aún no hay herramientas configuradas',
             self.createToolCard,
             'Agregar herramienta',
-            self.createTool
+            self.createTool,
+            table=Tool.__tablename__
         )
         self.setItemListFromValues(
             'MATERIALES',
             'Aún no hay materiales configurados',
             self.createMaterialCard,
             'Agregar material',
-            self.createMaterial
+            self.createMaterial,
+            table=Material.__tablename__
         )
         self.refreshLayout()
 
@@ -38,20 +44,38 @@ class InventoryView(BaseListView):
     def createMaterialCard(self, item):
         return MaterialCard(item, self)
 
-    def getItems(self):
-        if self.current_index == 0:
-            return self.getTools()
-        return self.getMaterials()
+    def getItems(self, db_session, index, after=None, limit=PAGE_SIZE, before=None):
+        if index == 0:
+            return self.getTools(db_session, after, limit, before)
+        return self.getMaterials(db_session, after, limit, before)
 
-    def getTools(self):
-        db_session = SessionLocal()
-        repository = ToolRepository(db_session)
-        return repository.get_all_tools()
+    def getTools(
+        self,
+        db_session: Session,
+        after: Optional[Tool] = None,
+        limit: int = PAGE_SIZE,
+        before: Optional[Tool] = None
+    ):
+        return get_tools_page(
+            db_session,
+            after.id if after else None,
+            limit,
+            before.id if before else None
+        )
 
-    def getMaterials(self):
-        db_session = SessionLocal()
-        repository = MaterialRepository(db_session)
-        return repository.get_all_materials()
+    def getMaterials(
+        self,
+        db_session: Session,
+        after: Optional[Material] = None,
+        limit: int = PAGE_SIZE,
+        before: Optional[Material] = None
+    ):
+        return get_materials_page(
+            db_session,
+            after.id if after else None,
+            limit,
+            before.id if before else None
+        )
 
     def createTool(self):
         toolDialog = ToolDataDialog()
@@ -60,15 +84,16 @@ class InventoryView(BaseListView):
 
         name, description = toolDialog.getInputs()
         try:
-            db_session = SessionLocal()
-            repository = ToolRepository(db_session)
-            repository.create_tool(name, description)
+            with session_scope() as db_session:
+                repository = ToolRepository(db_session)
+                repository.create_tool(name, description)
         except Exception as error:
             self.showError(
                 'Error de base de datos',
                 str(error)
             )
             return
+        CatalogCache.invalidate(TOOLS_CATALOG)
         self.refreshLayout()
 
     def createMaterial(self):
@@ -78,13 +103,14 @@ class InventoryView(BaseListView):
 
         name, description = materialDialog.getInputs()
         try:
-            db_session = SessionLocal()
-            repository = MaterialRepository(db_session)
-            repository.create_material(name, description)
+            with session_scope() as db_session:
+                repository = MaterialRepository(db_session)
+                repository.create_material(name, description)
         except Exception as error:
             self.showError(
                 'Error de base de datos',
                 str(error)
             )
             return
+        CatalogCache.invalidate(MATERIALS_CATALOG)
         self.refreshLayout()
@@ -1,29 +1,35 @@
 from PyQt5.QtWidgets import QWidget, QGridLayout
 from PyQt5.QtCore import Qt
 from components.buttons.MainMenuButton import MainMenuButton
-from views.ControlView import ControlView
-from views.FilesView import FilesView
-from views.InventoryView import InventoryView
-from views.MonitorView import MonitorView
-from views.UsersView import UsersView
-from views.TasksView import TasksView
+import importlib
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from MainWindow import MainWindow   # pragma: no cover
 
 
+def load_view(name: str) -> type:
+    """Returns the class of the view with the given name, importing its module
+    (named as the view) the first time it's needed.
+
+    Views are imported when they're opened, so their dependencies
+    don't delay the first paint of the window.
+    """
+    module = importlib.import_module(f'views.{name}')
+    return getattr(module, name)
+
+
 class MainMenu(QWidget):
     def __init__(self, parent: 'MainWindow'):
         super(MainMenu, self).__init__(parent)
 
         # Buttons
-        btn_tasks = self.createButton('Tareas', 'tasks.svg', TasksView)
-        btn_monitor = self.createButton('Monitoreo', 'monitor.svg', MonitorView)
-        btn_files = self.createButton('Archivos', 'files.svg', FilesView)
-        btn_control = self.createButton('Control y\ncalibración', 'control.svg', ControlView)
-        btn_users = self.createButton('Usuarios', 'users.svg', UsersView)
-        btn_inventory = self.createButton('Inventario', 'inventory.svg', InventoryView)
+        btn_tasks = self.createButton('Tareas', 'tasks.svg', 'TasksView')
+        btn_monitor = self.createButton('Monitoreo', 'monitor.svg', 'MonitorView')
+        btn_files = self.createButton('Archivos', 'files.svg', 'FilesView')
+        btn_control = self.createButton('Control y\ncalibración', 'control.svg', 'ControlView')
+        btn_users = self.createButton('Usuarios', 'users.svg', 'UsersView')
+        btn_inventory = self.createButton('Inventario', 'inventory.svg', 'InventoryView')
 
         # Menu layout
         layout = QGridLayout()
@@ -39,5 +45,5 @@ class MainMenu(QWidget):
     def createButton(self, label, icon, viewLink):
         return MainMenuButton(label, icon, viewLink, parent=self)
 
-    def redirectToView(self, view):
-        self.parent().changeView(view)
+    def redirectToView(self, view_name):
+        self.window().changeView(load_view(view_name))
@@ -1,14 +1,19 @@
 from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QCloseEvent
-from PyQt5.QtWidgets import QGridLayout, QSizePolicy, QSpacerItem, QFileDialog
+from PyQt5.QtWidgets import QGridLayout, QSizePolicy, QSpacerItem, QFileDialog, \
+    QProgressDialog
 from components.buttons.MenuButton import MenuButton
 from components.ControllerStatus import ControllerStatus
+from components.dialogs.LogsExportDialog import LogsExportDialog
+from components.LogsFilterBar import LogsFilterBar
 from components.TaskProgress import TaskProgress
 from components.text.LogsViewer import LogsViewer
 from components.ToolBar import ToolBar
+from config import GRBL_LOGS_FILE
 from core.grbl.types import Status, ParserState
 from helpers.cncWorkerMonitor import CncWorkerMonitor
-from typing import TYPE_CHECKING
+from helpers.logsExporter import LogsExporter
+from typing import Optional, TYPE_CHECKING
 from views.BaseView import BaseView
 
 if TYPE_CHECKING:
@@ -21,6 +26,9 @@ class MonitorView(BaseView):
 
         # STATE MANAGEMENT
         self.device_busy = CncWorkerMonitor.is_worker_running()
+        self.logs_exporter = LogsExporter(GRBL_LOGS_FILE, self)
+        self.logs_exporter.finished.connect(self.on_logs_exported)
+        self.export_progress: Optional[QProgressDialog] = None
 
         # UI
         self.setup_ui()
@@ -43,6 +51,9 @@ class MonitorView(BaseView):
         self.status_monitor = ControllerStatus(parent=self)
         self.task_progress = TaskProgress(parent=self)
         self.logs_viewer = LogsViewer(parent=self)
+        self.logs_filter_bar = LogsFilterBar(parent=self)
+        self.logs_filter_bar.filter_changed.connect(self.logs_viewer.set_filter)
+        self.logs_filter_bar.setVisible(False)
 
         ############################################
         # 0      STATUS      |                     #
@@ -50,8 +61,10 @@ class MonitorView(BaseView):
         # 1     PROGRESS     |        LOGS         #
         #   ---------------- |                     #
         # 2                  |                     #
+        #   ---------------- |                     #
+        # 3                  |     LOGS_FILTER     #
         #   -------------------------------------- #
-        # 3               BTN_BACK                 #
+        # 4               BTN_BACK                 #
         ############################################
 
         self.createToolBars()
@@ -61,6 +74,7 @@ class MonitorView(BaseView):
             self.status_monitor.setEnabled(False)
             self.task_progress.setEnabled(False)
         layout.addWidget(self.logs_viewer, 0, 1, 4, 1)
+        layout.addWidget(self.logs_filter_bar, 4, 1)
 
         self.placeholder = QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding)
         layout.addItem(self.placeholder, 2, 0)
@@ -74,14 +88,17 @@ class MonitorView(BaseView):
     def connect_worker(self):
         """Synchronizes the status monitor with the CNC worker.
         """
-        if self.device_busy:
-            self.getWindow().worker_monitor.task_new_status.connect(self.update_task_status)
+        if not self.device_busy:
+            return
+        worker_monitor = self.getWindow().worker_monitor
+        if worker_monitor:
+            worker_monitor.task_new_status.connect(self.update_task_status)
 
     def createToolBars(self):
         """Adds the tool bars to the Main window
         """
         options = [
-            ('Ver logs', lambda: None, True),
+            ('Ver logs', self.toggle_logs_filter, True),
             ('Exportar', self.export_logs, False),
             ('Pausar', self.pause_logs, True),
         ]
@@ -91,13 +108,29 @@ class MonitorView(BaseView):
 
     # EVENTS
 
-    def backToMenu(self):
+    def activate(self):
+        self.getWindow().addToolBar(Qt.TopToolBarArea, self.tool_bar)
+        self.tool_bar.show()
+        if not self.pause_button.isChecked():
+            self.logs_viewer.resume()
+
+    def deactivate(self):
+        """Hides the tool bar and stops following the logs until the view
+        is shown again. Exports in progress go on in background.
+        """
         self.getWindow().removeToolBar(self.tool_bar)
-        self.logs_viewer.stop()
+        self.logs_viewer.pause()
+
+    def canReuse(self) -> bool:
+        # The layout depends on the worker's activity
+        return self.device_busy == CncWorkerMonitor.is_worker_running()
+
+    def backToMenu(self):
         self.getWindow().backToMenu()
 
     def closeEvent(self, event: QCloseEvent):
         self.logs_viewer.stop()
+        self.logs_exporter.stop()
         return super().closeEvent(event)
 
     # UI METHODS
@@ -132,17 +165,71 @@ class MonitorView(BaseView):
         self.status_monitor.set_spindle(spindle)
         self.status_monitor.set_tool(tool_index)
 
+    def toggle_logs_filter(self):
+        """Shows or hides the inputs to filter and search the logs.
+        Hiding them shows every log again.
+        """
+        visible = self.logs_button.isChecked()
+        self.logs_filter_bar.setVisible(visible)
+
+        if visible:
+            self.logs_filter_bar.set_types(self.logs_viewer.index.get_types())
+            return
+        self.logs_filter_bar.clear()
+
     def pause_logs(self):
         self.logs_viewer.toggle_paused()
 
     def export_logs(self):
+        export_dialog = LogsExportDialog(parent=self)
+        if not export_dialog.exec():
+            return
+        logs_filter, compress = export_dialog.getInputs()
+
         file_path, _ = QFileDialog.getSaveFileName(
             self,
             "Exportar registro de actividad",
             "C:\\",
-            "Log files (*.log *.csv *.txt)"
+            "Log files (*.log *.csv *.txt *.gz)"
         )
         if not file_path:
             return
 
-        self.logs_viewer.export_logs(file_path)
+        # The export runs in background, showing its progress
+        self.close_export_progress()
+        self.export_progress = QProgressDialog(
+            'Exportando registro de actividad...',
+            'Cancelar',
+            0,
+            100,
+            self
+        )
+        self.export_progress.setWindowTitle('Exportar')
+        self.export_progress.setMinimumDuration(0)
+        self.export_progress.canceled.connect(self.cancel_export)
+        self.logs_exporter.progress.connect(self.export_progress.setValue)
+        self.export_progress.show()
+
+        self.logs_exporter.start(file_path, logs_filter, compress)
+
+    def cancel_export(self):
+        # The exporter doesn't notify the end of cancelled exports
+        self.logs_exporter.stop()
+        self.close_export_progress()
+
+    def close_export_progress(self):
+        if not self.export_progress:
+            return
+        self.logs_exporter.progress.disconnect(self.export_progress.setValue)
+        self.export_progress.canceled.disconnect(self.cancel_export)
+        self.export_progress.reset()
+        self.export_progress.deleteLater()
+        self.export_progress = None
+
+    def on_logs_exported(self, completed: bool, result: str):
+        self.close_export_progress()
+
+        if not completed:
+            self.showError('Error al exportar', result)
+            return
+        self.showInfo('Exportar', f'Registro de actividad exportado en: {result}')
@@ -1,12 +1,12 @@
 from components.cards.TaskCard import TaskCard
 from components.dialogs.TaskDataDialog import TaskDataDialog
 from config import USER_ID
-from core.database.base import Session as SessionLocal
-from core.database.repositories.fileRepository import FileRepository
-from core.database.repositories.materialRepository import MaterialRepository
+from core.database.models import File, Material, Task, TASK_IN_PROGRESS_STATUS, Tool
 from core.database.repositories.taskRepository import TaskRepository
-from core.database.repositories.toolRepository import ToolRepository
-from helpers.cncWorkerMonitor import CncWorkerMonitor
+from helpers.catalogCache import CatalogCache
+from helpers.cncWorkerMonitor import CncWorkerMonitor, WorkerSnapshot
+from helpers.dbSession import session_scope
+from helpers.pagination import get_tasks_page, PAGE_SIZE
 from views.BaseListView import BaseListView
 from typing import TYPE_CHECKING
 
@@ -18,21 +18,20 @@ class TasksView(BaseListView):
     def __init__(self, parent: 'MainWindow'):
         super(TasksView, self).__init__(parent)
 
-        try:
-            self.getAssets()
-        except Exception as error:
-            self.showError(
-                'Error de base de datos',
-                str(error)
-            )
-            return
+        # Loaded along with the tasks
+        self.files: list[dict] = []
+        self.tools: list[dict] = []
+        self.materials: list[dict] = []
+        self.device_available = False
+        self.worker_snapshot: WorkerSnapshot = {'paused': False, 'states': {}}
 
         self.setItemListFromValues(
             'TAREAS',
             'La cola de tareas está vacía',
             self.createTaskCard,
             'Crear tarea',
-            self.createTask
+            self.createTask,
+            table=Task.__tablename__
         )
         self.refreshLayout()
 
@@ -43,18 +42,60 @@ class TasksView(BaseListView):
             self.files,
             self.tools,
             self.materials,
-            parent=self
+            parent=self,
+            worker_snapshot=self.worker_snapshot
         )
 
-    def getItems(self):
-        db_session = SessionLocal()
-        repository = TaskRepository(db_session)
-        tasks = repository.get_all_tasks_from_user(USER_ID, status='all')
+    def getItems(self, db_session, index, after=None, limit=PAGE_SIZE, before=None):
+        return get_tasks_page(
+            db_session,
+            USER_ID,
+            after.id if after else None,
+            limit,
+            before.id if before else None
+        )
 
+    def loadItems(self, db_session, limits, starts):
+        assets = self.getAssets(db_session)
         # Check if there is a task in progress
-        self.device_available = CncWorkerMonitor.is_device_available()
+        device_available = CncWorkerMonitor.is_device_available()
+        items_lists = super().loadItems(db_session, limits, starts)
+        worker_snapshot = self.getWorkerSnapshot(items_lists[0])
+        return assets, device_available, worker_snapshot, items_lists
+
+    def loadPage(self, db_session, index, after, before=None):
+        page = super().loadPage(db_session, index, after, before)
+        return self.getWorkerSnapshot(page), page
+
+    def getWorkerSnapshot(self, tasks) -> WorkerSnapshot:
+        """Queries the state in the worker of all the tasks at once,
+        so their cards don't query it one by one.
+        """
+        return CncWorkerMonitor.get_worker_snapshot([task.id for task in tasks])
+
+    def on_items_loaded(self, result):
+        assets, self.device_available, self.worker_snapshot, items_lists = result
+        self.files, self.materials, self.tools = assets
+        super().on_items_loaded(items_lists)
+
+    def on_page_loaded(self, result):
+        worker_snapshot, page = result
+        self.worker_snapshot['states'].update(worker_snapshot['states'])
+        super().on_page_loaded(page)
+
+    def applyChange(self, table, operation, row_id):
+        # Cards of tasks show the names of their files, tools and materials
+        if table in (File.__tablename__, Tool.__tablename__, Material.__tablename__):
+            self.changes_timer.start()
+            return
+        super().applyChange(table, operation, row_id)
 
-        return tasks
+    def getItemVersion(self, task):
+        # Cards of tasks in progress show the progress in the worker
+        if task.status == TASK_IN_PROGRESS_STATUS:
+            return object()
+        # Actions available in cards depend on the device status
+        return (super().getItemVersion(task), self.device_available)
 
     def createTask(self):
         taskDialog = TaskDataDialog(self.files, self.tools, self.materials)
@@ -63,9 +104,9 @@ class TasksView(BaseListView):
 
         file_id, tool_id, material_id, name, note = taskDialog.getInputs()
         try:
-            db_session = SessionLocal()
-            repository = TaskRepository(db_session)
-            repository.create_task(USER_ID, file_id, tool_id, material_id, name, note)
+            with session_scope() as db_session:
+                repository = TaskRepository(db_session)
+                repository.create_task(USER_ID, file_id, tool_id, material_id, name, note)
         except Exception as error:
             self.showError(
                 'Error de base de datos',
@@ -74,27 +115,11 @@ class TasksView(BaseListView):
             return
         self.refreshLayout()
 
-    def getAssets(self):
-        db_session = SessionLocal()
-        files_repository = FileRepository(db_session)
-        materials_repository = MaterialRepository(db_session)
-        tools_repository = ToolRepository(db_session)
-
-        self.files = [
-            {
-                'id': file.id,
-                'name': file.file_name
-            } for file in files_repository.get_all_files_from_user(USER_ID)
-        ]
-        self.materials = [
-            {
-                'id': material.id,
-                'name': material.name
-            } for material in materials_repository.get_all_materials()
-        ]
-        self.tools = [
-            {
-                'id': tool.id,
-                'name': tool.name
-            } for tool in tools_repository.get_all_tools()
-        ]
+    def getAssets(self, db_session):
+        """Returns the files, materials and tools to choose for the tasks,
+        which are cached between views (see CatalogCache).
+        """
+        files = CatalogCache.get_files(db_session)
+        materials = CatalogCache.get_materials(db_session)
+        tools = CatalogCache.get_tools(db_session)
+        return files, materials, tools
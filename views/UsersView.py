@@ -1,7 +1,9 @@
 from components.cards.UserCard import UserCard
 from components.dialogs.UserDataDialog import UserDataDialog
-from core.database.base import Session as SessionLocal
+from core.database.models import User
 from core.database.repositories.userRepository import UserRepository
+from helpers.dbSession import session_scope
+from helpers.pagination import get_users_page, PAGE_SIZE
 from views.BaseListView import BaseListView
 from typing import TYPE_CHECKING
 
@@ -17,17 +19,21 @@ class UsersView(BaseListView):
             '',
             self.createUserCard,
             'Crear usuario',
-            self.createUser
+            self.createUser,
+            table=User.__tablename__
         )
         self.refreshLayout()
 
     def createUserCard(self, user):
         return UserCard(user, self)
 
-    def getItems(self):
-        db_session = SessionLocal()
-        repository = UserRepository(db_session)
-        return repository.get_all_users()
+    def getItems(self, db_session, index, after=None, limit=PAGE_SIZE, before=None):
+        return get_users_page(
+            db_session,
+            after.id if after else None,
+            limit,
+            before.id if before else None
+        )
 
     def createUser(self):
         userDialog = UserDataDialog()
@@ -36,9 +42,9 @@ class UsersView(BaseListView):
 
         name, email, password, role = userDialog.getInputs()
         try:
-            db_session = SessionLocal()
-            repository = UserRepository(db_session)
-            repository.create_user(name, email, password, role)
+            with session_scope() as db_session:
+                repository = UserRepository(db_session)
+                repository.create_user(name, email, password, role)
         except Exception as error:
             self.showError(
                 'Error de base de datos',